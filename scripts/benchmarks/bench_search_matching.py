@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Benchmark: ABS search result matching on the golden metadata samples.
+
+Turns the golden Audible samples (tests/fixtures/golden_samples_generated.json)
+into search results and folder names, then times the per-pair loop
+match_search_results() used before batch scoring against the current
+match_search_results() and match_search_results_batch(). Every variant must
+return the same SearchMatch for every folder; the script exits non-zero if
+they differ.
+
+Scenarios:
+  per-folder  each folder against the ~10 results a search would return
+  batch       every folder against the whole result pool at once
+
+Usage:
+  python scripts/benchmarks/bench_search_matching.py
+  python scripts/benchmarks/bench_search_matching.py --pool 400 --repeat 5
+
+With numpy installed (pip install shelfr[fast]) scoring runs through
+rapidfuzz.process.cdist; without it the batch path still normalizes each
+string once but scores pair by pair.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from shelfr.abs.asin import (
+    _VOLUME_CLOSE_MISMATCH_PENALTY,
+    _VOLUME_MATCH_BONUS,
+    SearchMatch,
+    _extract_core_title,
+    _extract_volume_number,
+    _normalize_for_matching,
+    is_valid_asin,
+    match_search_results,
+    match_search_results_batch,
+)
+from shelfr.utils.fuzzy import similarity_ratio
+
+logger = logging.getLogger("bench_search_matching")
+
+GOLDEN = Path(__file__).parents[2] / "tests" / "fixtures" / "golden_samples_generated.json"
+
+Folder = tuple[str, str | None]
+
+
+def load_samples(limit: int) -> tuple[list[dict[str, Any]], list[Folder]]:
+    """Search results and matching folder (title, author) pairs from the golden samples."""
+    data = json.loads(GOLDEN.read_text(encoding="utf-8"))
+    results: list[dict[str, Any]] = []
+    folders: list[Folder] = []
+    for key, samples in data.items():
+        if key.startswith("_"):
+            continue
+        for sample in samples:
+            if not sample.get("title") or not sample.get("asin"):
+                continue
+            series = sample.get("seriesPrimary") or {}
+            author = ", ".join(a["name"] for a in sample.get("authors", [])) or None
+            results.append(
+                {
+                    "asin": sample["asin"],
+                    "title": sample["title"],
+                    "author": author,
+                    "language": "English",
+                    "series": [{"series": series.get("name"), "sequence": series.get("position")}]
+                    if series
+                    else None,
+                }
+            )
+            # Folder names carry the volume, not the subtitle
+            title = sample["title"]
+            if series.get("position"):
+                title = f"{title} Vol. {series['position']}"
+            folders.append((title, author))
+    return results[:limit], folders[:limit]
+
+
+def legacy_match(
+    results: list[dict[str, Any]],
+    folder_title: str,
+    folder_author: str | None = None,
+    confidence_threshold: float = 0.75,
+    prefer_english: bool = True,
+) -> SearchMatch | None:
+    """match_search_results() as it was before batch scoring (one pair at a time)."""
+    if not results:
+        return None
+
+    folder_volume = _extract_volume_number(folder_title)
+    folder_title_norm = _normalize_for_matching(folder_title)
+    folder_title_core = _extract_core_title(folder_title)
+    folder_author_norm = _normalize_for_matching(folder_author or "")
+    if folder_author_norm == "unknown":
+        folder_author_norm = ""
+
+    best_match: SearchMatch | None = None
+    best_score = 0.0
+
+    for result in results:
+        result_title = result.get("title", "")
+        result_author = result.get("author", "")
+        result_asin = result.get("asin", "")
+        result_language = result.get("language", "")
+
+        if not result_asin or not is_valid_asin(result_asin):
+            continue
+
+        result_volume = _extract_volume_number(result_title)
+
+        series_seq: int | None = None
+        series_list = result.get("series")
+        if series_list and isinstance(series_list, list) and len(series_list) > 0:
+            first_series = series_list[0]
+            if isinstance(first_series, dict):
+                seq = first_series.get("sequence")
+                if seq:
+                    with contextlib.suppress(ValueError, TypeError):
+                        series_seq = int(float(seq))
+
+        if result_volume is None and series_seq is not None:
+            result_volume = series_seq
+
+        result_title_norm = _normalize_for_matching(result_title)
+        result_title_core = _extract_core_title(result_title)
+        title_score_norm = similarity_ratio(folder_title_norm, result_title_norm) / 100.0
+        title_score_core = similarity_ratio(folder_title_core, result_title_core) / 100.0
+        title_score = max(title_score_norm, title_score_core)
+
+        author_score = 1.0
+        if folder_author_norm:
+            result_author_norm = _normalize_for_matching(result_author)
+            author_score = similarity_ratio(folder_author_norm, result_author_norm) / 100.0
+
+        combined_score = (title_score * 0.7) + (author_score * 0.3)
+
+        volume_match_bonus = 0.0
+        if folder_volume is not None and result_volume is not None:
+            if folder_volume == result_volume:
+                volume_match_bonus = _VOLUME_MATCH_BONUS
+            elif abs(folder_volume - result_volume) <= 2:
+                volume_match_bonus = _VOLUME_CLOSE_MISMATCH_PENALTY
+        combined_score += volume_match_bonus
+
+        if prefer_english and result_language and result_language.lower() == "english":
+            combined_score *= 1.05
+        if prefer_english and result_language and result_language.lower() not in ("english", ""):
+            combined_score *= 0.8
+
+        # The old loop built its debug line for every candidate, logged or not
+        logger.debug(
+            f"Match candidate: {result_title!r} by {result_author!r} "
+            f"(ASIN={result_asin}, lang={result_language}, "
+            f"vol={result_volume}, score={combined_score:.2f}, "
+            f"title_norm={title_score_norm:.2f}, title_core={title_score_core:.2f}, "
+            f"vol_bonus={volume_match_bonus:+.2f})"
+        )
+
+        if combined_score > best_score:
+            best_score = combined_score
+            series_name = None
+            series_seq_str = None
+            if series_list and isinstance(series_list, list) and len(series_list) > 0:
+                first_series = series_list[0]
+                if isinstance(first_series, dict):
+                    series_name = first_series.get("series")
+                    series_seq_str = first_series.get("sequence")
+            best_match = SearchMatch(
+                asin=result_asin,
+                title=result_title,
+                author=result_author,
+                confidence=max(0.0, min(1.0, combined_score)),
+                language=result_language,
+                series=series_name,
+                sequence=series_seq_str,
+            )
+
+    if best_match and best_match.confidence >= confidence_threshold:
+        return best_match
+    return None
+
+
+def time_it(fn: Callable[[], list[SearchMatch | None]], repeat: int) -> tuple[float, Any]:
+    timings = []
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), output
+
+
+def run(
+    name: str, variants: list[tuple[str, Callable[[], list[SearchMatch | None]]]], repeat: int
+) -> bool:
+    print(f"\n{name}")
+    print(f"{'variant':<32} {'median':>10} {'matched':>8} {'speedup':>8}")
+    baseline_seconds = None
+    baseline_output = None
+    identical = True
+    for label, fn in variants:
+        seconds, output = time_it(fn, repeat)
+        baseline_seconds = baseline_seconds or seconds
+        if baseline_output is None:
+            baseline_output = output
+        elif output != baseline_output:
+            identical = False
+            print(f"  !! {label} returned different matches than the legacy loop")
+        matched = sum(match is not None for match in output)
+        print(f"{label:<32} {seconds:>9.3f}s {matched:>8,} {baseline_seconds / seconds:>7.1f}x")
+    return identical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pool", type=int, default=1000, help="Golden samples to use")
+    parser.add_argument("--per-search", type=int, default=10, help="Results per search")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (median)")
+    args = parser.parse_args()
+
+    # The matchers log every best match at INFO
+    logging.disable(logging.INFO)
+    results, folders = load_samples(args.pool)
+    try:
+        import numpy  # noqa: F401
+
+        backend = "rapidfuzz.process.cdist"
+    except ImportError:
+        backend = "pairwise (numpy not installed)"
+    print(f"{len(folders):,} folders, {len(results):,} results, scoring: {backend}")
+
+    # A search returns the book plus its neighbours (same author/series, mostly)
+    per = args.per_search
+    searches = [
+        results[max(0, i - per // 2) : max(0, i - per // 2) + per] for i in range(len(folders))
+    ]
+
+    ok = run(
+        f"per-folder ({per} results per search)",
+        [
+            (
+                "legacy loop",
+                lambda: [
+                    legacy_match(r, t, a) for r, (t, a) in zip(searches, folders, strict=True)
+                ],
+            ),
+            (
+                "match_search_results",
+                lambda: [
+                    match_search_results(r, t, a)
+                    for r, (t, a) in zip(searches, folders, strict=True)
+                ],
+            ),
+        ],
+        args.repeat,
+    )
+    ok &= run(
+        f"batch ({len(folders):,} folders x {len(results):,} results)",
+        [
+            ("legacy loop", lambda: [legacy_match(results, t, a) for t, a in folders]),
+            ("match_search_results_batch", lambda: match_search_results_batch(results, folders)),
+        ],
+        1,
+    )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
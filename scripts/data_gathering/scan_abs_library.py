@@ -15,6 +15,7 @@ import contextlib
 import json
 import re
 import subprocess
+import sys
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -33,6 +34,13 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
+# Shares shelfr's MediaInfo probe cache, so files already probed by shelfr
+# (or a previous scan) aren't probed again
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from shelfr.metadata.mediainfo.batch import BATCH_THRESHOLD, probe_many  # noqa: E402
+from shelfr.metadata.mediainfo.cache import open_probe_cache, probe_key  # noqa: E402
+
 console = Console()
 
 # Audio file extensions to detect "leaf" folders
@@ -106,7 +114,13 @@ class FolderInfo:
 
 
 def get_mediainfo_json(file_path: Path) -> dict[str, Any] | None:
-    """Get mediainfo for a single file as JSON."""
+    """Get mediainfo for a single file as JSON (from the probe cache when unchanged)."""
+    cache = open_probe_cache()
+    cached = cache.get(file_path)
+    if cached is not None:
+        return cached
+
+    key = probe_key(file_path)
     try:
         result = subprocess.run(
             ["mediainfo", "--Output=JSON", str(file_path)],
@@ -116,6 +130,7 @@ def get_mediainfo_json(file_path: Path) -> dict[str, Any] | None:
         )
         if result.returncode == 0:
             data: dict[str, Any] = json.loads(result.stdout)
+            cache.put(file_path, data, key)
             return data
     except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
         pass  # Skip files with mediainfo errors - missing tool or invalid output
@@ -204,12 +219,19 @@ def get_folder_mediainfo(folder: Path, audio_files: list[str]) -> MediaInfo:
     channels_set = set()
     file_details = []
 
+    # Multi-file books: one mediainfo call per chunk of files instead of per file
+    batched: dict[Path, dict[str, Any] | None] = {}
+    if len(audio_files) > BATCH_THRESHOLD:
+        batched = probe_many(
+            [folder / name for name in audio_files], binary="mediainfo", cache=open_probe_cache()
+        )
+
     for audio_file in audio_files:
         file_path = folder / audio_file
         if not file_path.exists():
             continue
 
-        mi_json = get_mediainfo_json(file_path)
+        mi_json = batched.get(file_path) if batched else get_mediainfo_json(file_path)
         if mi_json is None:
             continue
         parsed = parse_mediainfo(mi_json)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from shelfr.abs.asin import (
     AUDIO_EXTENSIONS,
     AsinEntry,
+    AsinIndex,
     AsinSource,
     SearchMatch,
     asin_exists,
@@ -16,6 +17,7 @@ from shelfr.abs.asin import (
     is_valid_asin,
     match_search_results,
     resolve_asin_via_abs_search,
+    resolve_asin_via_library_index,
 )
 from shelfr.abs.cleanup import (
     CLEANUP_ELIGIBLE_STATUSES,
@@ -72,6 +74,7 @@ __all__ = [
     # ASIN extraction and in-memory index
     "AUDIO_EXTENSIONS",
     "AsinEntry",
+    "AsinIndex",
     "AsinSource",
     "SearchMatch",
     "asin_exists",
@@ -83,6 +86,7 @@ __all__ = [
     "is_valid_asin",
     "match_search_results",
     "resolve_asin_via_abs_search",
+    "resolve_asin_via_library_index",
     # Cleanup
     "CLEANUP_ELIGIBLE_STATUSES",
     "CleanupError",
@@ -22,12 +22,17 @@ import json
 import logging
 import re
 import shutil
+import sqlite3
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from shelfr.config import get_settings
+from shelfr.metadata.mediainfo.batch import BATCH_THRESHOLD, probe_many
+from shelfr.metadata.mediainfo.cache import cached_probe
+from shelfr.metadata.mediainfo.mp4 import native_mediainfo
 
 if TYPE_CHECKING:
     from shelfr.abs.client import AbsClient
@@ -237,6 +242,7 @@ class AsinResolution:
         source_detail: Additional detail (e.g., which file contained the ASIN)
         resolved_author: Author name from search result (only for abs_search source)
         resolved_title: Title from search result (only for abs_search source)
+        confidence: Match confidence (0-1) for fuzzy sources (abs_search, library_index)
     """
 
     asin: str | None
@@ -244,6 +250,7 @@ class AsinResolution:
     source_detail: str | None = None
     resolved_author: str | None = None
     resolved_title: str | None = None
+    confidence: float | None = None
 
     @property
     def found(self) -> bool:
@@ -459,28 +466,43 @@ def extract_asin_from_mediainfo(
     if not audio_file.exists() or not audio_file.is_file():
         return None
 
-    # Get binary from config if not provided
-    if binary is None:
-        binary = _get_mediainfo_binary()
+    # MP4/M4B tags are read in-process; mediainfo is only run for other files
+    data = native_mediainfo(audio_file)
+    if data is None:
+        # Get binary from config if not provided
         if binary is None:
+            binary = _get_mediainfo_binary()
+            if binary is None:
+                return None
+        mediainfo_binary = binary
+
+        def probe() -> dict[str, Any] | None:
+            try:
+                result = subprocess.run(
+                    [mediainfo_binary, "--Output=JSON", str(audio_file)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=timeout,
+                )
+                probed: dict[str, Any] = json.loads(result.stdout)
+            except subprocess.TimeoutExpired:
+                logger.warning("mediainfo timed out for: %s", audio_file.name)
+                return None
+            except (subprocess.SubprocessError, json.JSONDecodeError, OSError) as e:
+                logger.debug("Failed to run mediainfo on %s: %s", audio_file.name, e)
+                return None
+            return probed
+
+        data = cached_probe(audio_file, probe)
+        if data is None:
             return None
 
-    try:
-        result = subprocess.run(
-            [binary, "--Output=JSON", str(audio_file)],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=timeout,
-        )
-        data = json.loads(result.stdout)
-    except subprocess.TimeoutExpired:
-        logger.warning("mediainfo timed out for: %s", audio_file.name)
-        return None
-    except (subprocess.SubprocessError, json.JSONDecodeError, OSError) as e:
-        logger.debug("Failed to run mediainfo on %s: %s", audio_file.name, e)
-        return None
+    return _asin_from_mediainfo_data(data)
 
+
+def _asin_from_mediainfo_data(data: dict[str, Any]) -> str | None:
+    """Find a valid ASIN in parsed mediainfo JSON (see extract_asin_from_mediainfo)."""
     # mediainfo JSON structure: {"media": {"track": [...]}}
     # General track contains metadata fields
     # ASIN can be at track level OR nested in track.extra dict
@@ -526,8 +548,9 @@ def extract_asin_from_mediainfo(
                 return str(extra_cdek)
 
         # Fallback: search all string values for ASIN pattern
-        # This catches ASINs in unusual fields
-        for key, value in track.items():
+        # This catches ASINs in unusual fields (incl. freeform tags in extra)
+        fields = {**extra, **track} if isinstance(extra, dict) else track
+        for key, value in fields.items():
             if (
                 isinstance(value, str)
                 and value.startswith("B0")
@@ -580,14 +603,26 @@ def resolve_asin_from_folder_with_mediainfo(
     if not folder.is_dir():
         return result
 
-    # Probe audio files for embedded ASIN
-    for f in folder.iterdir():
-        if not f.is_file():
-            continue
-        if f.suffix.lower() not in AUDIO_EXTENSIONS:
-            continue
+    audio_files = [
+        f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
+    ]
+
+    # Multi-file books: one mediainfo process per chunk of files instead of per file
+    probed: dict[Path, dict[str, Any] | None] = {}
+    if len(audio_files) > BATCH_THRESHOLD:
+        native = {f: native_mediainfo(f) for f in audio_files}
+        probed = probe_many(
+            [f for f, data in native.items() if data is None], binary=mediainfo_binary
+        )
+        probed.update((f, data) for f, data in native.items() if data is not None)
 
-        asin = extract_asin_from_mediainfo(f, binary=mediainfo_binary)
+    # Probe audio files for embedded ASIN
+    for f in audio_files:
+        if probed:
+            data = probed.get(f)
+            asin = _asin_from_mediainfo_data(data) if data else None
+        else:
+            asin = extract_asin_from_mediainfo(f, binary=mediainfo_binary)
         if asin:
             logger.info(
                 "Resolved ASIN %s from embedded metadata: %s",
@@ -603,77 +638,253 @@ def resolve_asin_from_folder_with_mediainfo(
     return AsinResolution(asin=None, source="unknown")
 
 
+def resolve_asin_from_folder_cached(
+    folder: Path,
+    parsed_asin: str | None = None,
+) -> AsinResolution:
+    """resolve_asin_from_folder_with_mediainfo() through the per-folder resolution cache.
+
+    An unchanged folder (same audio files and sidecars) gets its earlier
+    result back without reading sidecars or probing files. See
+    shelfr.abs.resolution_cache.
+
+    Args:
+        folder: Path to the folder to search
+        parsed_asin: ASIN already parsed from folder name (optimization)
+
+    Returns:
+        AsinResolution with ASIN and source info, or source="unknown" if not found
+    """
+    from shelfr.abs.resolution_cache import cached_resolution
+
+    # Nothing to save when the folder name already has it
+    if parsed_asin and is_valid_asin(parsed_asin):
+        return resolve_asin_from_folder(folder, parsed_asin)
+
+    return cached_resolution(
+        folder,
+        "local",
+        lambda: resolve_asin_from_folder_with_mediainfo(folder, parsed_asin),
+        # Without mediainfo a miss says nothing about the files' tags
+        cache_misses=_get_mediainfo_binary() is not None,
+    )
+
+
 # =============================================================================
 # In-memory ASIN index for duplicate detection
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AsinEntry:
-    """Entry in the in-memory ASIN index."""
+    """Entry in the in-memory ASIN index (slots: one per indexed book)."""
 
     asin: str
     path: str  # Host path to the book folder
     library_item_id: str
     title: str
     author: str | None
+    series: str | None = None  # ABS seriesName, e.g. "Series #3"
+
+
+# ABS joins series as "Name #seq, Other #seq"; the first one is used for matching
+_SERIES_RE = re.compile(r"^(?P<name>.+?)\s*#(?P<sequence>[^,]+)")
+
+
+def _split_series(series: str | None) -> tuple[str, str | None]:
+    """Split an ABS seriesName into the first series name and its sequence."""
+    if not series:
+        return "", None
+    match = _SERIES_RE.match(series)
+    if match:
+        return match.group("name").strip(), match.group("sequence").strip()
+    return series.strip(), None
+
+
+def index_keys(title: str, author: str | None, series: str | None) -> tuple[str, str, str]:
+    """Secondary index keys for a book: (author, series, core title), normalized."""
+    return (
+        _normalize_for_matching(author or ""),
+        _normalize_for_matching(_split_series(series)[0]),
+        _extract_core_title(title),
+    )
+
+
+class AsinIndex(dict[str, AsinEntry]):
+    """ASIN index holding every copy of a book, with secondary lookup keys.
+
+    As a mapping it is the index build_asin_index() has always returned:
+    ASIN → first copy (in library listing order). On top of that it keeps
+    all copies per ASIN, and the books per normalized author, series name
+    and core title for matching folders that carry no ASIN.
+
+    add(), remove() and the lookups are safe to call from several threads
+    (parallel import_batch()).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.RLock()
+        self._copies: dict[str, list[AsinEntry]] = {}
+        self._by_author: dict[str, list[AsinEntry]] = {}
+        self._by_series: dict[str, list[AsinEntry]] = {}
+        self._by_title: dict[str, list[AsinEntry]] = {}
+
+    def add(self, entry: AsinEntry, keys: tuple[str, str, str] | None = None) -> None:
+        """Add a copy of a book; ``keys`` are its index_keys() when already known."""
+        author_key, series_key, title_key = keys or index_keys(
+            entry.title, entry.author, entry.series
+        )
+        with self._lock:
+            self._copies.setdefault(entry.asin, []).append(entry)
+            self.setdefault(entry.asin, entry)
+            for table, key in (
+                (self._by_author, author_key),
+                (self._by_series, series_key),
+                (self._by_title, title_key),
+            ):
+                if key:
+                    table.setdefault(key, []).append(entry)
+
+    def remove(self, entry: AsinEntry) -> None:
+        """Drop one copy; the ASIN maps to the next copy if there is one."""
+        with self._lock:
+            copies = self._copies.get(entry.asin, [])
+            if entry in copies:
+                copies.remove(entry)
+            for table in (self._by_author, self._by_series, self._by_title):
+                for bucket in table.values():
+                    if entry in bucket:
+                        bucket.remove(entry)
+            if copies:
+                self[entry.asin] = copies[0]
+            else:
+                self._copies.pop(entry.asin, None)
+                self.pop(entry.asin, None)
+
+    def copies(self, asin: str) -> list[AsinEntry]:
+        """Every copy of ``asin`` in the library (first copy first)."""
+        with self._lock:
+            return list(self._copies.get(asin, ()))
+
+    @property
+    def copy_count(self) -> int:
+        """Number of indexed copies, duplicates included."""
+        with self._lock:
+            return sum(len(copies) for copies in self._copies.values())
+
+    def candidates(self, title: str, author: str | None = None) -> list[AsinEntry]:
+        """Books sharing the core title, series name or author of a folder."""
+        author_key = _normalize_for_matching(author or "")
+        title_core = _extract_core_title(title)
+        title_norm = _normalize_for_matching(title)
+        found: dict[str, AsinEntry] = {}
+        with self._lock:
+            for table, key in (
+                (self._by_title, title_core),
+                (self._by_series, title_core),
+                (self._by_series, title_norm),
+                (self._by_author, "" if author_key == "unknown" else author_key),
+            ):
+                if key:
+                    for entry in table.get(key, ()):
+                        found.setdefault(entry.library_item_id, entry)
+        return list(found.values())
+
+    def match(
+        self,
+        title: str,
+        author: str | None = None,
+        confidence_threshold: float = 0.75,
+    ) -> SearchMatch | None:
+        """Fuzzy-match a folder against the library, scored like an ABS search.
+
+        Only books with the same volume as the folder (or both without one)
+        are considered: unlike an ABS search, the library usually lacks the
+        folder's own volume, so the volume bonus alone would let a different
+        volume of the series win.
+        """
+        results: list[dict[str, Any]] = []
+        for entry in self.candidates(title, author):
+            series_name, sequence = _split_series(entry.series)
+            results.append(
+                {
+                    "asin": entry.asin,
+                    "title": entry.title,
+                    "author": entry.author or "",
+                    "series": [{"series": series_name, "sequence": sequence}]
+                    if series_name
+                    else None,
+                }
+            )
+        return match_search_results(
+            results,
+            folder_title=title,
+            folder_author=author,
+            confidence_threshold=confidence_threshold,
+            prefer_english=False,
+            same_volume_only=True,
+        )
 
 
 def build_asin_index(
     client: AbsClient,
     library_id: str,
-) -> dict[str, AsinEntry]:
-    """Build in-memory ASIN index from ABS library.
+) -> AsinIndex:
+    """Build the ASIN index for an ABS library.
 
-    Fetches all items from ABS (cached per session) and builds a dict
-    for O(1) ASIN lookups. This replaces SQLite for duplicate detection.
+    Fetches all items from ABS (cached per session) and indexes every copy
+    of each ASIN, plus normalized author/series/title keys. When the
+    persistent library index (``audiobookshelf.index_db``) is available it
+    is synced with the listing first, so only added or changed items are
+    re-normalized, and the index is loaded from it.
 
     Args:
         client: AbsClient instance (will use cached items if available)
         library_id: ABS library ID to index
 
     Returns:
-        Dict mapping ASIN to AsinEntry for all books with ASINs
+        AsinIndex mapping ASIN to its first AsinEntry, with all copies kept
     """
-    items = client.get_library_items_cached(library_id)
-    index: dict[str, AsinEntry] = {}
-    no_asin_count = 0
-    duplicate_count = 0
-
-    for item in items:
-        # Get ASIN from the item (metadata, folder name, or file name)
-        asin = item.asin  # AbsLibraryItem already has this parsed
+    from shelfr.abs.library_index import get_library_index
 
-        # If not in metadata, try extracting from path
-        if not asin:
-            asin = extract_asin(item.path)
-
-        if not asin:
-            no_asin_count += 1
-            continue
-
-        # Skip if we've seen this ASIN (keep first occurrence)
-        if asin in index:
-            logger.debug(f"Duplicate ASIN {asin} found, keeping first at {index[asin].path}")
-            duplicate_count += 1
-            continue
-
-        index[asin] = AsinEntry(
-            asin=asin,
-            path=item.path,
-            library_item_id=item.id,
-            title=item.title,
-            author=item.author_name,
-        )
+    items = client.get_library_items_cached(library_id)
+    index: AsinIndex | None = None
+
+    store = get_library_index()
+    if store is not None:
+        try:
+            store.sync(client.host, library_id, items)
+            index = store.load(client.host, library_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Library index {store.path} unavailable, indexing in memory: {e}")
+
+    if index is None:
+        index = AsinIndex()
+        for item in items:
+            # AbsLibraryItem has the metadata ASIN parsed; fall back to the path
+            asin = item.asin or extract_asin(item.path)
+            if asin:
+                index.add(
+                    AsinEntry(
+                        asin=asin,
+                        path=item.path,
+                        library_item_id=item.id,
+                        title=item.title,
+                        author=item.author_name,
+                        series=item.series_name,
+                    )
+                )
 
     # Log detailed breakdown: indexed + no_asin + duplicates should equal total items
     total = len(items)
     indexed = len(index)
+    copies = index.copy_count
     logger.info(
         "Built ASIN index: %d indexed, %d without ASIN, %d duplicate ASINs (total: %d items)",
         indexed,
-        no_asin_count,
-        duplicate_count,
+        total - copies,
+        copies - indexed,
         total,
     )
     return index
@@ -698,6 +909,22 @@ def asin_exists(
     return False, None
 
 
+def asin_copies(asin_index: dict[str, AsinEntry], asin: str) -> list[AsinEntry]:
+    """Every copy of ``asin`` in the index (a plain dict holds one at most)."""
+    if isinstance(asin_index, AsinIndex):
+        return asin_index.copies(asin)
+    entry = asin_index.get(asin)
+    return [entry] if entry else []
+
+
+def remove_asin_copy(asin_index: dict[str, AsinEntry], entry: AsinEntry) -> None:
+    """Drop one copy of a book from the index (e.g. after it was archived)."""
+    if isinstance(asin_index, AsinIndex):
+        asin_index.remove(entry)
+    else:
+        asin_index.pop(entry.asin, None)
+
+
 # =============================================================================
 # Phase 5: ABS Metadata Search for ASIN Resolution
 # =============================================================================
@@ -806,12 +1033,77 @@ def _extract_core_title(s: str) -> str:
     return result.lower()
 
 
+@dataclass(slots=True)
+class _Candidate:
+    """A search result with everything match_search_results() needs, computed once."""
+
+    asin: str
+    title: str
+    author: str | None
+    language: str | None
+    volume: int | None
+    series: str | None
+    sequence: str | None
+    title_norm: str
+    title_core: str
+    author_norm: str
+
+
+def _search_candidates(results: list[dict[str, Any]]) -> list[_Candidate]:
+    """Search results with a valid ASIN, parsed and normalized for scoring."""
+    candidates: list[_Candidate] = []
+    for result in results:
+        result_asin = result.get("asin", "")
+
+        # Skip results without valid ASIN
+        if not result_asin or not is_valid_asin(result_asin):
+            continue
+
+        result_title = result.get("title", "")
+        result_author = result.get("author", "")
+
+        # Series sequence is the fallback volume when the title has none
+        series_name = None
+        series_seq_str = None
+        series_seq: int | None = None
+        series_list = result.get("series")
+        if series_list and isinstance(series_list, list) and len(series_list) > 0:
+            first_series = series_list[0]
+            if isinstance(first_series, dict):
+                series_name = first_series.get("series")
+                series_seq_str = first_series.get("sequence")
+                if series_seq_str:
+                    with contextlib.suppress(ValueError, TypeError):
+                        series_seq = int(float(series_seq_str))
+
+        result_volume = _extract_volume_number(result_title)
+        if result_volume is None:
+            result_volume = series_seq
+
+        candidates.append(
+            _Candidate(
+                asin=result_asin,
+                title=result_title,
+                author=result_author,
+                language=result.get("language", ""),
+                volume=result_volume,
+                series=series_name,
+                sequence=series_seq_str,
+                title_norm=_normalize_for_matching(result_title),
+                title_core=_extract_core_title(result_title),
+                author_norm=_normalize_for_matching(result_author),
+            )
+        )
+    return candidates
+
+
 def match_search_results(
     results: list[dict[str, Any]],
     folder_title: str,
     folder_author: str | None = None,
     confidence_threshold: float = 0.75,
     prefer_english: bool = True,
+    same_volume_only: bool = False,
 ) -> SearchMatch | None:
     """Find the best matching search result for a folder.
 
@@ -829,155 +1121,156 @@ def match_search_results(
         folder_author: Author extracted from folder name (optional)
         confidence_threshold: Minimum confidence (0-1) to accept a match
         prefer_english: If True, prefer English results over translations
+        same_volume_only: If True, skip results whose volume differs from the
+            folder's (including one side having a volume and the other not)
 
     Returns:
         SearchMatch if a good match found, None otherwise
     """
-    from shelfr.utils.fuzzy import similarity_ratio
-
-    if not results:
-        return None
-
-    # Extract volume number from folder title
-    folder_volume = _extract_volume_number(folder_title)
-
-    # Normalize folder title for fuzzy matching
-    folder_title_norm = _normalize_for_matching(folder_title)
-    folder_title_core = _extract_core_title(folder_title)
-    folder_author_norm = _normalize_for_matching(folder_author or "")
-
-    # Skip "Unknown" as author for matching purposes
-    if folder_author_norm == "unknown":
-        folder_author_norm = ""
+    return match_search_results_batch(
+        results,
+        [(folder_title, folder_author)],
+        confidence_threshold=confidence_threshold,
+        prefer_english=prefer_english,
+        same_volume_only=same_volume_only,
+    )[0]
 
-    best_match: SearchMatch | None = None
-    best_score = 0.0
 
-    for result in results:
-        result_title = result.get("title", "")
-        result_author = result.get("author", "")
-        result_asin = result.get("asin", "")
-        result_language = result.get("language", "")
+def match_search_results_batch(
+    results: list[dict[str, Any]],
+    folders: list[tuple[str, str | None]],
+    confidence_threshold: float = 0.75,
+    prefer_english: bool = True,
+    same_volume_only: bool = False,
+) -> list[SearchMatch | None]:
+    """Match several folders against one set of search results.
 
-        # Skip results without valid ASIN
-        if not result_asin or not is_valid_asin(result_asin):
-            continue
+    Same scoring as match_search_results(), but every title and author is
+    normalized once and the fuzzy scores come from one similarity_matrix()
+    call per comparison (title, core title, author) instead of per pair.
 
-        # Extract volume number from result
-        result_volume = _extract_volume_number(result_title)
+    Args:
+        results: Search results from AbsClient.search_books()
+        folders: (title, author) extracted from each folder name
+        confidence_threshold: Minimum confidence (0-1) to accept a match
+        prefer_english: If True, prefer English results over translations
+        same_volume_only: If True, skip results whose volume differs from the
+            folder's (including one side having a volume and the other not)
 
-        # Get series sequence as fallback volume
-        series_seq: int | None = None
-        series_list = result.get("series")
-        if series_list and isinstance(series_list, list) and len(series_list) > 0:
-            first_series = series_list[0]
-            if isinstance(first_series, dict):
-                seq = first_series.get("sequence")
-                if seq:
-                    with contextlib.suppress(ValueError, TypeError):
-                        series_seq = int(float(seq))
+    Returns:
+        SearchMatch or None for each folder, in order
+    """
+    from shelfr.utils.fuzzy import similarity_matrix
 
-        # Use series sequence if no volume in title
-        if result_volume is None and series_seq is not None:
-            result_volume = series_seq
+    candidates = _search_candidates(results) if results else []
+    if not candidates:
+        return [None] * len(folders)
 
-        # Calculate title similarity using multiple methods
-        result_title_norm = _normalize_for_matching(result_title)
-        result_title_core = _extract_core_title(result_title)
-
-        # Score 1: Standard normalized comparison
-        title_score_norm = similarity_ratio(folder_title_norm, result_title_norm) / 100.0
-
-        # Score 2: Core title comparison (handles subtitles better)
-        title_score_core = similarity_ratio(folder_title_core, result_title_core) / 100.0
-
-        # Use the better of the two title scores
-        title_score = max(title_score_norm, title_score_core)
-
-        # Calculate author similarity (if we have author to compare)
-        author_score = 1.0  # Default to perfect if no author to compare
-        if folder_author_norm:
-            result_author_norm = _normalize_for_matching(result_author)
-            author_score = similarity_ratio(folder_author_norm, result_author_norm) / 100.0
-
-        # Combined score (title weighted more heavily)
-        combined_score = (title_score * 0.7) + (author_score * 0.3)
-
-        # Volume number matching - bonus for exact match, penalty for close mismatch
-        # Only apply penalty if volumes are close (±2) to avoid penalizing wrong series
-        # Don't penalize if result has no volume (different book structure)
-        volume_match_bonus = 0.0
-        if folder_volume is not None and result_volume is not None:
-            if folder_volume == result_volume:
-                # Exact match - significant bonus
-                volume_match_bonus = _VOLUME_MATCH_BONUS
-            elif abs(folder_volume - result_volume) <= 2:
-                # Close mismatch (e.g., Vol 7 vs Vol 8) - penalty to prefer exact
-                volume_match_bonus = _VOLUME_CLOSE_MISMATCH_PENALTY
-            # If volumes differ by >2, no penalty - likely different series
-
-        combined_score += volume_match_bonus
-
-        # Bonus for English (if preferred)
-        if prefer_english and result_language and result_language.lower() == "english":
-            combined_score *= 1.05  # 5% bonus
-            # Note: Don't cap here - we need the full score for comparison
-            # to allow volume bonus to break ties
-
-        # Penalty for non-English (to avoid Spanish translations, etc.)
-        if prefer_english and result_language and result_language.lower() not in ("english", ""):
-            combined_score *= 0.8  # 20% penalty
-
-        # Keep raw score for comparison (allows volume bonus to break ties)
-        # but cap the displayed/stored confidence at 1.0
-        comparison_score = combined_score
-        display_confidence = max(0.0, min(1.0, combined_score))
+    # Normalize folder titles/authors for fuzzy matching
+    folder_volumes = [_extract_volume_number(title) for title, _ in folders]
+    folder_title_norms = [_normalize_for_matching(title) for title, _ in folders]
+    folder_title_cores = [_extract_core_title(title) for title, _ in folders]
+    # Skip "Unknown" as author for matching purposes
+    folder_author_norms = [
+        "" if norm == "unknown" else norm
+        for norm in (_normalize_for_matching(author or "") for _, author in folders)
+    ]
+
+    # Score 1: Standard normalized comparison
+    norm_scores = similarity_matrix(folder_title_norms, [c.title_norm for c in candidates])
+    # Score 2: Core title comparison (handles subtitles better)
+    core_scores = similarity_matrix(folder_title_cores, [c.title_core for c in candidates])
+    author_scores = similarity_matrix(folder_author_norms, [c.author_norm for c in candidates])
+
+    # Language bonus/penalty per result (English preferred, translations penalized)
+    language_factors: list[float | None] = []
+    for candidate in candidates:
+        language = candidate.language.lower() if candidate.language else ""
+        if prefer_english and language == "english":
+            language_factors.append(1.05)  # 5% bonus
+        elif prefer_english and language:
+            language_factors.append(0.8)  # 20% penalty
+        else:
+            language_factors.append(None)
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    matches: list[SearchMatch | None] = []
+    for i, (folder_title, _) in enumerate(folders):
+        folder_volume = folder_volumes[i]
+        has_author = bool(folder_author_norms[i])
+        best: _Candidate | None = None
+        best_score = 0.0
+
+        for j, candidate in enumerate(candidates):
+            if same_volume_only and candidate.volume != folder_volume:
+                continue
 
-        logger.debug(
-            f"Match candidate: {result_title!r} by {result_author!r} "
-            f"(ASIN={result_asin}, lang={result_language}, "
-            f"vol={result_volume}, score={comparison_score:.2f}, "
-            f"title_norm={title_score_norm:.2f}, title_core={title_score_core:.2f}, "
-            f"vol_bonus={volume_match_bonus:+.2f})"
-        )
+            title_score_norm = norm_scores[i][j] / 100.0
+            title_score_core = core_scores[i][j] / 100.0
+            # Use the better of the two title scores
+            title_score = max(title_score_norm, title_score_core)
+            # Default to perfect if no author to compare
+            author_score = author_scores[i][j] / 100.0 if has_author else 1.0
+
+            # Combined score (title weighted more heavily)
+            combined_score = (title_score * 0.7) + (author_score * 0.3)
+
+            # Volume number matching - bonus for exact match, penalty for close mismatch
+            # Only apply penalty if volumes are close (±2) to avoid penalizing wrong series
+            # Don't penalize if result has no volume (different book structure)
+            volume_match_bonus = 0.0
+            if folder_volume is not None and candidate.volume is not None:
+                if folder_volume == candidate.volume:
+                    volume_match_bonus = _VOLUME_MATCH_BONUS
+                elif abs(folder_volume - candidate.volume) <= 2:
+                    volume_match_bonus = _VOLUME_CLOSE_MISMATCH_PENALTY
+            combined_score += volume_match_bonus
+
+            # Not capped here: the raw score lets the volume bonus break ties
+            factor = language_factors[j]
+            if factor is not None:
+                combined_score *= factor
+
+            if debug:
+                logger.debug(
+                    f"Match candidate: {candidate.title!r} by {candidate.author!r} "
+                    f"(ASIN={candidate.asin}, lang={candidate.language}, "
+                    f"vol={candidate.volume}, score={combined_score:.2f}, "
+                    f"title_norm={title_score_norm:.2f}, title_core={title_score_core:.2f}, "
+                    f"vol_bonus={volume_match_bonus:+.2f})"
+                )
 
-        if comparison_score > best_score:
-            best_score = comparison_score
+            if combined_score > best_score:
+                best_score = combined_score
+                best = candidate
 
-            # Extract series info
-            series_name = None
-            series_seq_str = None
-            if series_list and isinstance(series_list, list) and len(series_list) > 0:
-                first_series = series_list[0]
-                if isinstance(first_series, dict):
-                    series_name = first_series.get("series")
-                    series_seq_str = first_series.get("sequence")
+        if best is None:
+            matches.append(None)
+            continue
 
-            best_match = SearchMatch(
-                asin=result_asin,
-                title=result_title,
-                author=result_author,
-                confidence=display_confidence,  # Use capped value for stored confidence
-                language=result_language,
-                series=series_name,
-                sequence=series_seq_str,
+        # Cap the stored confidence at 1.0 (the raw score was only for comparison)
+        confidence = max(0.0, min(1.0, best_score))
+        if confidence < confidence_threshold:
+            logger.debug(
+                f"Best match below threshold for {folder_title!r}: {best.title!r} "
+                f"(confidence={confidence:.2f} < {confidence_threshold})"
             )
+            matches.append(None)
+            continue
 
-    # Only return if above threshold
-    if best_match and best_match.confidence >= confidence_threshold:
-        logger.info(
-            f"Best match: {best_match.title!r} (ASIN={best_match.asin}, "
-            f"confidence={best_match.confidence:.2f})"
-        )
-        return best_match
-
-    if best_match:
-        logger.debug(
-            f"Best match below threshold: {best_match.title!r} "
-            f"(confidence={best_match.confidence:.2f} < {confidence_threshold})"
+        logger.info(f"Best match: {best.title!r} (ASIN={best.asin}, confidence={confidence:.2f})")
+        matches.append(
+            SearchMatch(
+                asin=best.asin,
+                title=best.title,
+                author=best.author,
+                confidence=confidence,
+                language=best.language,
+                series=best.series,
+                sequence=best.sequence,
+            )
         )
-
-    return None
+    return matches
 
 
 def resolve_asin_via_abs_search(
@@ -985,6 +1278,8 @@ def resolve_asin_via_abs_search(
     title: str,
     author: str | None = None,
     confidence_threshold: float = 0.75,
+    *,
+    folder: Path | None = None,
 ) -> AsinResolution:
     """Resolve ASIN by searching ABS metadata providers.
 
@@ -1001,11 +1296,24 @@ def resolve_asin_via_abs_search(
         title: Book title to search for
         author: Author name (improves match accuracy)
         confidence_threshold: Minimum confidence (0-1) to accept a match
+        folder: Book folder being resolved; when given, a match is cached for
+            it in the resolution cache and reused while the folder is unchanged
 
     Returns:
         AsinResolution with ASIN if found, source="abs_search"
         Also includes resolved_author and resolved_title from the search result.
     """
+    if folder is not None:
+        from shelfr.abs.resolution_cache import cached_resolution
+
+        return cached_resolution(
+            folder,
+            "abs_search",
+            lambda: resolve_asin_via_abs_search(client, title, author, confidence_threshold),
+            min_confidence=confidence_threshold,
+            cache_misses=False,
+        )
+
     try:
         results = client.search_books(title=title, author=author, provider="audible")
     except (AbsConnectionError, AbsApiError) as exc:
@@ -1026,6 +1334,45 @@ def resolve_asin_via_abs_search(
             source_detail=f"{match.title} (confidence={match.confidence:.0%})",
             resolved_author=match.author,
             resolved_title=match.title,
+            confidence=match.confidence,
+        )
+
+    return AsinResolution(asin=None, source="unknown")
+
+
+def resolve_asin_via_library_index(
+    asin_index: dict[str, AsinEntry],
+    title: str,
+    author: str | None = None,
+    confidence_threshold: float = 0.75,
+) -> AsinResolution:
+    """Resolve ASIN by fuzzy-matching against books already in the library.
+
+    Runs before resolve_asin_via_abs_search(): a folder without ASIN that is
+    a copy of a library book resolves locally, without a network call, and
+    then goes through the usual duplicate/trump checks.
+
+    Args:
+        asin_index: ASIN index from build_asin_index() (plain dicts never match)
+        title: Book title from the folder name
+        author: Author from the folder name (improves match accuracy)
+        confidence_threshold: Minimum confidence (0-1) to accept a match
+
+    Returns:
+        AsinResolution with ASIN if found, source="library_index"
+    """
+    if not isinstance(asin_index, AsinIndex):
+        return AsinResolution(asin=None, source="unknown")
+
+    match = asin_index.match(title, author, confidence_threshold)
+    if match:
+        return AsinResolution(
+            asin=match.asin,
+            source="library_index",
+            source_detail=f"{match.title} (confidence={match.confidence:.0%})",
+            resolved_author=match.author,
+            resolved_title=match.title,
+            confidence=match.confidence,
         )
 
     return AsinResolution(asin=None, source="unknown")
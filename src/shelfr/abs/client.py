@@ -3,30 +3,65 @@
 Provides methods to interact with an Audiobookshelf server including:
 - Connection testing (ping/authorize)
 - Library listing
-- Library item retrieval (with in-memory caching)
+- Library item retrieval (with in-memory caching and a persistent snapshot)
 - Library scanning
 """
 
 from __future__ import annotations
 
 import logging
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from shelfr.schemas.abs import (
+    iter_library_items,
     validate_authorize_response,
     validate_libraries_response,
-    validate_library_items_response,
+    validate_library_items_page,
 )
 from shelfr.utils.retry import NETWORK_EXCEPTIONS, retry_with_backoff
+from shelfr.utils.singleflight import SingleFlight
 
 if TYPE_CHECKING:
     from shelfr.config import AudiobookshelfConfig
 
 logger = logging.getLogger(__name__)
 
+# Items per page when listing a library
+DEFAULT_PAGE_SIZE = 500
+
+# Pages fetched at once after the first page has returned the library total
+DEFAULT_PAGE_WORKERS = 4
+
+# Metadata searches in flight at once per ABS host
+DEFAULT_SEARCH_CONCURRENCY = 4
+
+# Concurrent identical searches share one request: (host, provider, title, author)
+_search_flight: SingleFlight[list[dict[str, Any]] | None] = SingleFlight()
+
+_search_slots: dict[str, threading.BoundedSemaphore] = {}
+_search_slots_lock = threading.Lock()
+
+
+def _search_slot(host: str, limit: int) -> threading.BoundedSemaphore:
+    """Semaphore capping concurrent searches against ``host`` (created with ``limit``)."""
+    with _search_slots_lock:
+        slot = _search_slots.get(host)
+        if slot is None:
+            slot = _search_slots[host] = threading.BoundedSemaphore(max(1, limit))
+        return slot
+
+
+def _intern(value: str | None) -> str | None:
+    """sys.intern() for optional strings."""
+    return sys.intern(value) if value else value
+
 
 class AbsAuthError(Exception):
     """Raised when authentication with Audiobookshelf fails."""
@@ -78,9 +113,14 @@ class AbsLibrary:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AbsLibraryItem:
-    """Library item (book/podcast) from ABS."""
+    """Library item (book/podcast) from ABS.
+
+    Large libraries keep tens of thousands of these in memory, so the class
+    uses slots, and values shared by many items (library ID, media type,
+    author, narrator, series) are interned to one string object each.
+    """
 
     id: str
     library_id: str
@@ -100,6 +140,13 @@ class AbsLibraryItem:
     added_at: int
     updated_at: int
 
+    def __post_init__(self) -> None:
+        self.library_id = sys.intern(self.library_id)
+        self.media_type = sys.intern(self.media_type)
+        self.author_name = _intern(self.author_name)
+        self.narrator_name = _intern(self.narrator_name)
+        self.series_name = _intern(self.series_name)
+
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> AbsLibraryItem:
         """Create from API response dict."""
@@ -144,6 +191,9 @@ class AbsClient:
         host: str,
         api_key: str,
         timeout: float = 30.0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_workers: int = DEFAULT_PAGE_WORKERS,
+        search_concurrency: int = DEFAULT_SEARCH_CONCURRENCY,
     ) -> None:
         """Initialize the client.
 
@@ -151,11 +201,18 @@ class AbsClient:
             host: Audiobookshelf server URL (e.g., "http://localhost:13378")
             api_key: API token for authentication
             timeout: Request timeout in seconds
+            page_size: Items per request when listing a whole library
+            page_workers: Library pages fetched at once after the first
+            search_concurrency: Searches in flight at once against this host,
+                shared by every client in the process
         """
         # Normalize host URL (remove trailing slash)
         self.host = host.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.page_size = page_size
+        self.page_workers = page_workers
+        self.search_concurrency = search_concurrency
         self._client: httpx.Client | None = None
         # In-memory cache: {library_id: [AbsLibraryItem, ...]}
         # Populated on first access per library, cleared on close()
@@ -175,6 +232,9 @@ class AbsClient:
             host=config.host,
             api_key=config.api_key,
             timeout=float(config.timeout_seconds),
+            page_size=config.page_size,
+            page_workers=config.page_workers,
+            search_concurrency=config.search_concurrency,
         )
 
     def _get_client(self) -> httpx.Client:
@@ -381,71 +441,89 @@ class AbsClient:
 
         data = response.json()
 
-        # Validate response structure using Pydantic schema
-        validated = validate_library_items_response(data)
-
-        items = []
-        for item_schema in validated.results:
-            items.append(
-                AbsLibraryItem(
-                    id=item_schema.id,
-                    library_id=item_schema.library_id,
-                    path=item_schema.path,
-                    rel_path=item_schema.rel_path,
-                    is_missing=item_schema.is_missing,
-                    media_type=item_schema.media_type,
-                    title=item_schema.title,
-                    subtitle=item_schema.subtitle,
-                    author_name=item_schema.author_name,
-                    narrator_name=item_schema.narrator_name,
-                    series_name=item_schema.series_name,
-                    asin=item_schema.asin,
-                    isbn=item_schema.isbn,
-                    duration=item_schema.duration,
-                    size=item_schema.size,
-                    added_at=item_schema.added_at,
-                    updated_at=item_schema.updated_at,
-                )
+        # Validate the envelope, then each item on its own: the raw item and its
+        # Pydantic model are dropped as soon as the compact record exists
+        total = validate_library_items_page(data).total
+        items = [
+            AbsLibraryItem(
+                id=item_schema.id,
+                library_id=item_schema.library_id,
+                path=item_schema.path,
+                rel_path=item_schema.rel_path,
+                is_missing=item_schema.is_missing,
+                media_type=item_schema.media_type,
+                title=item_schema.title,
+                subtitle=item_schema.subtitle,
+                author_name=item_schema.author_name,
+                narrator_name=item_schema.narrator_name,
+                series_name=item_schema.series_name,
+                asin=item_schema.asin,
+                isbn=item_schema.isbn,
+                duration=item_schema.duration,
+                size=item_schema.size,
+                added_at=item_schema.added_at,
+                updated_at=item_schema.updated_at,
             )
+            for item_schema in iter_library_items(data)
+        ]
 
-        total = validated.total
         logger.debug(f"Fetched page with {len(items)} items (library total: {total})")
         return items, total
 
     def get_all_library_items(
         self,
         library_id: str,
-        batch_size: int = 100,
+        batch_size: int | None = None,
+        workers: int | None = None,
     ) -> list[AbsLibraryItem]:
         """Get all items from a library, handling pagination automatically.
 
+        The first page is fetched alone to learn the library total; the
+        remaining pages are then fetched concurrently. Each page request keeps
+        get_library_items()' retries, and the first error (e.g. AbsAuthError)
+        is raised as before.
+
         Args:
             library_id: ID of the library to query
-            batch_size: Number of items to fetch per request
+            batch_size: Number of items to fetch per request (default: page_size)
+            workers: Pages fetched at once (default: page_workers)
 
         Returns:
-            Complete list of all items in the library
+            Complete list of all items in the library, in page order
         """
-        all_items: list[AbsLibraryItem] = []
-        page = 0
-        total = 0
-
-        while True:
-            items, total = self.get_library_items(
-                library_id,
-                limit=batch_size,
-                page=page,
-            )
-            all_items.extend(items)
-
-            # Log progress as "fetched so far / total"
-            logger.info(f"Fetched {len(all_items)}/{total} items from library")
-
-            if len(all_items) >= total or not items:
-                break
-            page += 1
-
-        return all_items
+        batch_size = batch_size or self.page_size
+        workers = max(1, workers or self.page_workers)
+
+        all_items, total = self.get_library_items(library_id, limit=batch_size, page=0)
+        logger.info(f"Fetched {len(all_items)}/{total} items from library")
+        if len(all_items) >= total or not all_items:
+            return all_items
+
+        # Page count comes from the total reported by page 0
+        pages = range(1, -(-total // batch_size))
+
+        def fetch(page: int) -> list[AbsLibraryItem]:
+            items, _ = self.get_library_items(library_id, limit=batch_size, page=page)
+            return items
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(pages)), thread_name_prefix="abs-pages"
+        ) as pool:
+            # map() yields in page order regardless of completion order
+            for items in pool.map(fetch, pages):
+                all_items.extend(items)
+                logger.info(f"Fetched {len(all_items)}/{total} items from library")
+
+        # Items added while paging shift later pages; keep the first copy
+        seen: set[str] = set()
+        unique: list[AbsLibraryItem] = []
+        for item in all_items:
+            if item.id not in seen:
+                seen.add(item.id)
+                unique.append(item)
+        if len(unique) != len(all_items):
+            logger.debug(f"Dropped {len(all_items) - len(unique)} items repeated across pages")
+        return unique
 
     @retry_with_backoff(max_attempts=2, base_delay=1.0, exceptions=NETWORK_EXCEPTIONS)
     def get_item_details(self, item_id: str) -> dict[str, Any]:
@@ -505,6 +583,10 @@ class AbsClient:
         This is the preferred method for import operations - fetch once, use many.
         Cache is cleared when client is closed or force_refresh=True.
 
+        With the persistent library snapshot enabled, the first call per
+        session only fetches items changed since the last run (see
+        shelfr.abs.snapshot).
+
         Args:
             library_id: ID of the library to query
             force_refresh: If True, bypass cache and fetch fresh data
@@ -513,8 +595,20 @@ class AbsClient:
             List of all items in the library (from cache if available)
         """
         if force_refresh or library_id not in self._library_cache:
-            logger.info(f"Fetching all items from library {library_id}")
-            items = self.get_all_library_items(library_id)
+            from shelfr.abs.snapshot import get_library_snapshot, refresh_snapshot
+
+            items: list[AbsLibraryItem] | None = None
+            snapshot = get_library_snapshot()
+            if snapshot is not None:
+                try:
+                    items = refresh_snapshot(self, snapshot, library_id, full=force_refresh)
+                except sqlite3.Error as e:
+                    logger.warning(
+                        f"Library snapshot {snapshot.path} unavailable, fetching all items: {e}"
+                    )
+            if items is None:
+                logger.info(f"Fetching all items from library {library_id}")
+                items = self.get_all_library_items(library_id)
             self._library_cache[library_id] = items
             logger.info(f"Cached {len(items)} items for library {library_id}")
         else:
@@ -539,7 +633,6 @@ class AbsClient:
     # Metadata Search (Phase 5)
     # =========================================================================
 
-    @retry_with_backoff(max_attempts=3, base_delay=2.0, exceptions=NETWORK_EXCEPTIONS)
     def search_books(
         self,
         title: str,
@@ -551,6 +644,10 @@ class AbsClient:
         Uses ABS as a proxy to search Audible (or other providers) for book metadata.
         This is useful for resolving ASINs for books that don't have them in folder/file names.
 
+        Results are cached on disk (see shelfr.abs.search_cache). Identical
+        searches running concurrently share one request, and at most
+        ``search_concurrency`` searches per ABS server are sent at once.
+
         Args:
             title: Book title to search for
             author: Optional author name to narrow results
@@ -577,6 +674,38 @@ class AbsClient:
                 }
             ]
         """
+        from shelfr.abs.search_cache import get_search_cache, normalize_query
+
+        cache = get_search_cache()
+        if cache is not None:
+            cached = cache.get(self.host, provider, title, author)
+            if cached is not None:
+                logger.debug(f"ABS search cache hit: title={title!r}, author={author!r}")
+                return cached
+
+        def fetch() -> list[dict[str, Any]] | None:
+            # Another thread may have stored this search since our cache lookup
+            if cache is not None:
+                cached = cache.get(self.host, provider, title, author)
+                if cached is not None:
+                    return cached
+            results = self._search_books_request(title, author, provider)
+            if cache is not None and results is not None:
+                cache.put(self.host, provider, title, author, results)
+            return results
+
+        key = (self.host, provider, normalize_query(title), normalize_query(author))
+        results = _search_flight.do(key, fetch)
+        return [] if results is None else results
+
+    @retry_with_backoff(max_attempts=3, base_delay=2.0, exceptions=NETWORK_EXCEPTIONS)
+    def _search_books_request(
+        self,
+        title: str,
+        author: str | None,
+        provider: str,
+    ) -> list[dict[str, Any]] | None:
+        """One /api/search/books request (None for an unexpected response)."""
         logger.debug(f"Searching ABS for books: title={title!r}, author={author!r}")
 
         params: dict[str, str] = {
@@ -587,7 +716,8 @@ class AbsClient:
             params["author"] = author
 
         try:
-            response = self._request("GET", "/api/search/books", params=params)
+            with _search_slot(self.host, self.search_concurrency):
+                response = self._request("GET", "/api/search/books", params=params)
         except httpx.ConnectError as e:
             raise AbsConnectionError(f"Failed to connect to {self.host}: {e}") from e
         except httpx.TimeoutException as e:
@@ -598,7 +728,7 @@ class AbsClient:
         # API returns a list directly
         if not isinstance(results, list):
             logger.warning(f"Unexpected search response type: {type(results)}")
-            return []
+            return None
 
         logger.debug(f"Search returned {len(results)} results")
         return results
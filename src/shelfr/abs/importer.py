@@ -11,12 +11,16 @@ See docs/UNKNOWN_ASIN_HANDLING.md for unknown ASIN handling design (Phase 1+).
 
 from __future__ import annotations
 
+import contextlib
 import fnmatch
 import json
 import logging
 import os
 import re
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -27,11 +31,14 @@ import httpx
 
 from shelfr.abs.asin import (
     AsinEntry,
+    asin_copies,
     asin_exists,
     extract_asin,
     normalize_asin_to_preferred_region,
-    resolve_asin_from_folder_with_mediainfo,
+    remove_asin_copy,
+    resolve_asin_from_folder_cached,
     resolve_asin_via_abs_search,
+    resolve_asin_via_library_index,
 )
 from shelfr.abs.cleanup import (
     CLEANUP_ELIGIBLE_STATUSES,
@@ -52,7 +59,9 @@ from shelfr.abs.trumping import (
 )
 from shelfr.config import ConfigurationError
 from shelfr.metadata import fetch_audnex_book
+from shelfr.utils.keyed_lock import KeyedLock
 from shelfr.utils.naming import build_mam_file_name, build_mam_folder_name, clean_series_name
+from shelfr.utils.walk import walk_audio_folders
 
 if TYPE_CHECKING:
     from shelfr.abs.client import AbsClient
@@ -162,7 +171,7 @@ class ImportResult:
 
 @dataclass
 class BatchImportResult:
-    """Result of a batch import operation."""
+    """Result of a batch import operation (results in staging folder order)."""
 
     results: list[ImportResult] = field(default_factory=list)
     success_count: int = 0
@@ -1062,6 +1071,7 @@ def handle_unknown_asin(
             error=f"Move failed: {e}",
             parsed=ctx.parsed,
         )
+    _folder_index.note_created(target_path)
 
     # Rename files (respects multi-file protection from Phase 1)
     rename_files_in_folder(target_path, ctx.parsed)
@@ -1100,6 +1110,87 @@ def _normalize_for_comparison(name: str) -> str:
     return result.strip()
 
 
+def _series_folder_key(name: str) -> str:
+    """Comparison key of a series folder name (cleaned, then normalized)."""
+    return _normalize_for_comparison(clean_series_name(name) or name)
+
+
+# A listing taken within this long of its directory's mtime may miss a change
+# made in the same timestamp tick (ext3/HFS+ have 1s mtimes)
+_MTIME_RESOLUTION_NS = 1_000_000_000
+
+
+@dataclass(slots=True)
+class _FolderListing:
+    """Subfolders of one directory by comparison key (first folder per key)."""
+
+    mtime_ns: int
+    folders: dict[str, Path]
+    racy: bool
+
+
+class _FolderIndex:
+    """Cached comparison key → folder maps for the library root and author folders.
+
+    Every imported book looks up its author folder in the library root and
+    its series folder in the author folder. Each directory is listed and
+    normalized once, then reused while its mtime is unchanged, so folders
+    added or removed outside shelfr are still seen. Folders created by the
+    import itself are added in place (note_created()), so a batch doesn't
+    re-list the library root after each new author.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # directory -> key function -> listing
+        self._listings: dict[Path, dict[Callable[[str], str], _FolderListing]] = {}
+
+    def lookup(self, directory: Path, key_fn: Callable[[str], str], key: str) -> Path | None:
+        """First subfolder of ``directory`` whose ``key_fn(name)`` equals ``key``."""
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            listing = self._listings.get(directory, {}).get(key_fn)
+        if listing is None or listing.racy or listing.mtime_ns != mtime_ns:
+            listing = self._scan(directory, key_fn, mtime_ns)
+            with self._lock:
+                self._listings.setdefault(directory, {})[key_fn] = listing
+        return listing.folders.get(key)
+
+    @staticmethod
+    def _scan(directory: Path, key_fn: Callable[[str], str], mtime_ns: int) -> _FolderListing:
+        """List ``directory`` (whose mtime was just read as ``mtime_ns``)."""
+        racy = time.time_ns() - mtime_ns < _MTIME_RESOLUTION_NS
+        folders: dict[str, Path] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        folders.setdefault(key_fn(entry.name), Path(entry.path))
+        except OSError as e:
+            logger.debug("Failed to list %s: %s", directory, e)
+            racy = True
+        return _FolderListing(mtime_ns=mtime_ns, folders=folders, racy=racy)
+
+    def note_created(self, folder: Path) -> None:
+        """Add a folder the import created (and any new parents) to cached listings."""
+        with self._lock:
+            for child in (folder, *folder.parents):
+                for key_fn, listing in self._listings.get(child.parent, {}).items():
+                    if listing.racy:
+                        continue
+                    listing.folders.setdefault(key_fn(child.name), child)
+                    try:
+                        listing.mtime_ns = child.parent.stat().st_mtime_ns
+                    except OSError:
+                        listing.racy = True
+
+
+_folder_index = _FolderIndex()
+
+
 def _find_matching_author_folder(library_root: Path, author: str) -> Path | None:
     """Find existing author folder with case-insensitive/normalized matching.
 
@@ -1110,17 +1201,12 @@ def _find_matching_author_folder(library_root: Path, author: str) -> Path | None
     Returns:
         Path to existing author folder if found, else None
     """
-    if not library_root.exists():
-        return None
-
-    normalized_author = _normalize_for_comparison(author)
-    for folder in library_root.iterdir():
-        if not folder.is_dir():
-            continue
-        if _normalize_for_comparison(folder.name) == normalized_author:
-            logger.debug("Matched author '%s' to existing folder '%s'", author, folder.name)
-            return folder
-    return None
+    folder = _folder_index.lookup(
+        library_root, _normalize_for_comparison, _normalize_for_comparison(author)
+    )
+    if folder is not None:
+        logger.debug("Matched author '%s' to existing folder '%s'", author, folder.name)
+    return folder
 
 
 def _find_matching_series_folder(
@@ -1145,19 +1231,14 @@ def _find_matching_series_folder(
     if not author_folder.exists():
         return None, None
 
-    # Clean and normalize the input series name
+    # Clean and normalize the input series name, match against cleaned folder names
     cleaned_series = clean_series_name(series, book_title) or series
-    normalized_series = _normalize_for_comparison(cleaned_series)
-
-    for folder in author_folder.iterdir():
-        if not folder.is_dir():
-            continue
-        # Try normalized match against cleaned folder name
-        folder_cleaned = clean_series_name(folder.name) or folder.name
-        if _normalize_for_comparison(folder_cleaned) == normalized_series:
-            logger.debug("Matched series '%s' to existing folder '%s'", series, folder.name)
-            return folder, cleaned_series
-    return None, cleaned_series
+    folder = _folder_index.lookup(
+        author_folder, _series_folder_key, _normalize_for_comparison(cleaned_series)
+    )
+    if folder is not None:
+        logger.debug("Matched series '%s' to existing folder '%s'", series, folder.name)
+    return folder, cleaned_series
 
 
 def _same_filesystem(path1: Path, path2: Path) -> bool:
@@ -1471,7 +1552,7 @@ def import_single(
     # Phase 3+4: Enhanced ASIN resolution - try multiple sources before giving up
     # Includes mediainfo probe for embedded ASIN (Phase 4)
     if not asin:
-        resolution = resolve_asin_from_folder_with_mediainfo(staging_folder, parsed_asin=None)
+        resolution = resolve_asin_from_folder_cached(staging_folder, parsed_asin=None)
         if resolution.found:
             asin = resolution.asin
             # Update parsed object so downstream functions (build_target_path, rename_files)
@@ -1484,6 +1565,24 @@ def import_single(
                 resolution.source_detail or "N/A",
             )
 
+    # Local match against the library index: a copy of a book that is already
+    # in the library resolves without a network call (then hits duplicate checks)
+    if not asin:
+        resolution = resolve_asin_via_library_index(
+            asin_index, parsed.title or folder_name, parsed.author, abs_search_confidence
+        )
+        if resolution.found:
+            asin = resolution.asin
+            parsed.asin = asin
+            if resolution.resolved_author and (not parsed.author or parsed.author == "Unknown"):
+                parsed.author = resolution.resolved_author
+            logger.info(
+                "Resolved ASIN %s from %s (%s)",
+                asin,
+                resolution.source,
+                resolution.source_detail or "N/A",
+            )
+
     # Phase 5: ABS Metadata Search - search Audiobookshelf's Audible provider
     # as final resolution step before marking as unknown
     if not asin and abs_client is not None:
@@ -1496,7 +1595,11 @@ def import_single(
             abs_search_confidence * 100,
         )
         resolution = resolve_asin_via_abs_search(
-            abs_client, search_title, search_author, abs_search_confidence
+            abs_client,
+            search_title,
+            search_author,
+            abs_search_confidence,
+            folder=staging_folder,
         )
         if resolution.found:
             asin = resolution.asin
@@ -1516,6 +1619,9 @@ def import_single(
     # Still no ASIN → delegate to unknown ASIN handler
     if not asin:
         ctx = classify_unknown_asin(staging_folder, parsed)
+        # Homebrew goes to its author folder, everything else under Unknown/
+        is_homebrew = ctx.content_type == UnknownAsinContentType.HOMEBREW
+        _hold_destination(_destination_key(parsed.author if is_homebrew else None))
         return handle_unknown_asin(
             ctx,
             library_root,
@@ -1524,26 +1630,31 @@ def import_single(
             dry_run=dry_run,
         )
 
+    # Copies of one book in a parallel batch take turns on duplicate/trump checks
+    _hold_destination(("asin", asin))
+
     # Check for duplicates (we have ASIN) - do this BEFORE Audnex enrichment
     # to avoid unnecessary network calls for books we'll skip anyway
-    is_dup, existing_path = asin_exists(asin_index, asin)
-
-    # Guard against stale ABS index entries pointing to missing folders
+    # The library may hold several copies; compare against the first one on disk
+    copies = asin_copies(asin_index, asin)
+    existing_entry: AsinEntry | None = None
+    existing_path: str | None = None
     existing_folder_for_index: Path | None = None
-    if is_dup and existing_path:
-        existing_folder_for_index = (
-            path_mapper.to_host(existing_path) if path_mapper else Path(existing_path)
+    for entry in copies:
+        folder = path_mapper.to_host(entry.path) if path_mapper else Path(entry.path)
+        if folder.exists():
+            existing_entry, existing_path, existing_folder_for_index = entry, entry.path, folder
+            break
+        # Guard against stale ABS index entries pointing to missing folders
+        logger.warning(
+            "ABS index has ASIN %s at %s but folder is missing; "
+            "skipping duplicate/trump checks. Trigger an ABS rescan to clear stale entries.",
+            asin,
+            folder,
         )
-
-        if not existing_folder_for_index.exists():
-            logger.warning(
-                "ABS index has ASIN %s at %s but folder is missing; "
-                "skipping duplicate/trump checks. Trigger an ABS rescan to clear stale entries.",
-                asin,
-                existing_folder_for_index,
-            )
-            is_dup = False
-            existing_folder_for_index = None
+    is_dup = existing_entry is not None
+    if len(copies) > 1:
+        logger.info("ASIN %s has %d copies in the library", asin, len(copies))
 
     # ─────────────────────────────────────────────────────────────────────
     # Trumping: Quality-based replacement check (runs BEFORE duplicate_policy)
@@ -1551,18 +1662,13 @@ def import_single(
     trump_decision: TrumpDecision | None = None
     trump_reason: str | None = None
 
-    if is_dup and trump_prefs and trump_prefs.enabled:
-        existing_entry = asin_index[asin]
-        # Convert container path to host path if path_mapper provided
-        existing_folder = (
-            existing_folder_for_index
-            if existing_folder_for_index is not None
-            else (
-                path_mapper.to_host(existing_entry.path)
-                if path_mapper
-                else Path(existing_entry.path)
-            )
-        )
+    if (
+        existing_entry is not None
+        and existing_folder_for_index is not None
+        and trump_prefs
+        and trump_prefs.enabled
+    ):
+        existing_folder = existing_folder_for_index
 
         # v1: Skip trumping entirely for multi-file layouts
         # Fall through to duplicate_policy handling instead
@@ -1608,7 +1714,7 @@ def import_single(
                     # Remove from index so duplicate check below doesn't trigger
                     # (the existing folder is now archived)
                     if not dry_run:
-                        del asin_index[asin]
+                        remove_asin_copy(asin_index, existing_entry)
                     # Mark as no longer duplicate so we proceed with import
                     is_dup = False
                     # Continue with normal import flow below
@@ -1697,7 +1803,11 @@ def import_single(
                 if result is not None:
                     return result
 
-    # Build target path (preserves nested structure if present)
+    # Build target path (preserves nested structure if present); the author is
+    # final now, so books bound for one author folder take turns from here on
+    _hold_destination(
+        _destination_key(_staging_author(staging_folder, staging_root) or parsed.author)
+    )
     target_path = build_target_path(library_root, parsed, staging_folder, staging_root)
 
     # Check if target already exists on disk
@@ -1789,6 +1899,7 @@ def import_single(
             status="failed",
             error=f"Move failed: {e}",
         )
+    _folder_index.note_created(target_path)
 
     # Rename files to match clean MAM naming convention
     rename_files_in_folder(target_path, parsed)
@@ -1915,10 +2026,21 @@ def import_batch(
     metadata_json_fallback: bool = True,
     generate_opf_sidecar: bool = False,
     progress_callback: Callable[[int, int, Path], None] | None = None,
+    workers: int = 1,
     dry_run: bool = False,
 ) -> BatchImportResult:
     """Import multiple audiobooks from staging to library.
 
+    With ``workers`` > 1 books are imported on a thread pool, so Audnex
+    lookups, ABS searches, MediaInfo probes and moves of different books
+    overlap. Once import_single() knows a book's ASIN, copies of that book
+    take turns, so they never race on the same duplicate/trump decision;
+    once it knows the final author (after ASIN resolution and Audnex
+    enrichment), books bound for the same author folder take turns, so
+    author and series folders are matched and created exactly as in a
+    sequential run (see _hold_destination()). Results and counts come back
+    in ``staging_folders`` order either way.
+
     Args:
         staging_folders: List of staging folders to import
         library_root: ABS library root
@@ -1941,23 +2063,27 @@ def import_batch(
         metadata_json_fallback: If True, generate metadata.json even without ASIN (default True)
         generate_opf_sidecar: If True, generate metadata.opf for ABS (default False)
         progress_callback: Optional callback(current, total, folder) for progress updates
+            (before each book sequentially; as each book finishes in parallel)
+        workers: Books imported at once (default 1: one after another)
         dry_run: If True, don't actually move files
 
     Returns:
         BatchImportResult with all results and counts
+
+    Raises:
+        ValueError: If workers is < 1.
     """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
     batch_result = BatchImportResult()
     total = len(staging_folders)
 
-    for i, folder in enumerate(staging_folders):
-        # Call progress callback before processing each folder
-        if progress_callback:
-            progress_callback(i, total, folder)
-
+    def import_one(folder: Path) -> ImportResult:
         # Get source path for cleanup if mapping provided
         source_path = source_paths.get(folder) if source_paths else None
 
-        result = import_single(
+        return import_single(
             staging_folder=folder,
             library_root=library_root,
             asin_index=asin_index,
@@ -1979,11 +2105,86 @@ def import_batch(
             generate_opf_sidecar=generate_opf_sidecar,
             dry_run=dry_run,
         )
-        batch_result.add(result)
 
+    if workers == 1 or total < 2:
+        for i, folder in enumerate(staging_folders):
+            # Call progress callback before processing each folder
+            if progress_callback:
+                progress_callback(i, total, folder)
+            batch_result.add(import_one(folder))
+        return batch_result
+
+    locks = KeyedLock()
+
+    def import_locked(folder: Path) -> ImportResult:
+        with contextlib.ExitStack() as held:
+            _worker_locks.held = (locks, held)
+            try:
+                return import_one(folder)
+            finally:
+                _worker_locks.held = None
+
+    results: dict[int, ImportResult] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(workers, total), thread_name_prefix="abs-import"
+    ) as pool:
+        futures = {
+            pool.submit(import_locked, folder): i for i, folder in enumerate(staging_folders)
+        }
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if progress_callback:
+                    progress_callback(len(results), total, staging_folders[i])
+        except BaseException:
+            # Like a sequential run: stop at the first error, books not yet started stay staged
+            for future in futures:
+                future.cancel()
+            raise
+
+    for i in range(total):
+        batch_result.add(results[i])
     return batch_result
 
 
+# (KeyedLock, ExitStack) of the parallel import_batch() book on this thread
+_worker_locks = threading.local()
+
+
+def _hold_destination(key: Hashable) -> None:
+    """Hold ``key`` until the current book of a parallel import_batch() is done.
+
+    import_single() calls this as soon as it knows what a book will touch, so
+    books that can't collide still overlap. Keys are taken in one order (ASIN,
+    then author folder) and released together, so workers can't deadlock.
+    Does nothing outside a parallel import_batch().
+    """
+    held = getattr(_worker_locks, "held", None)
+    if held is not None:
+        locks, stack = held
+        stack.enter_context(locks.hold(key))
+
+
+def _staging_author(staging_folder: Path, staging_root: Path | None) -> str | None:
+    """Author folder of the staging layout (Author/Book or Author/Series/Book)."""
+    if staging_root and staging_folder != staging_root:
+        with contextlib.suppress(ValueError):
+            parts = staging_folder.relative_to(staging_root).parts
+            if len(parts) >= 2:
+                return parts[0]
+    return None
+
+
+def _destination_key(author: str | None) -> tuple[str, str]:
+    """Lock key for the library folder a book with ``author`` is moved into.
+
+    Normalized the way existing author folders are matched, so books that
+    would share an author folder share a key; no author means Unknown/.
+    """
+    return ("author", _normalize_for_comparison(author or "Unknown"))
+
+
 def trigger_scan_safe(client: AbsClient, library_id: str) -> bool:
     """Trigger ABS library scan, returning False on failure.
 
@@ -2023,36 +2224,10 @@ def discover_staged_books(staging_root: Path, *, recursive: bool = True) -> list
     if not staging_root.exists() or not staging_root.is_dir():
         return []
 
-    staged: list[Path] = []
-
-    # Audio extensions to look for
-    audio_exts = {".m4b", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".wav"}
-
-    def has_audio_files(directory: Path) -> bool:
-        """Check if directory directly contains audio files."""
-        try:
-            for child in directory.iterdir():
-                if child.is_file() and child.suffix.lower() in audio_exts:
-                    return True
-        except PermissionError:
-            pass
-        return False
-
-    def search_directory(directory: Path) -> None:
-        """Recursively search for audiobook folders."""
-        try:
-            for item in directory.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # If this directory has audio files, it's an audiobook folder
-                if has_audio_files(item):
-                    staged.append(item)
-                elif recursive:
-                    # Otherwise, search deeper
-                    search_directory(item)
-        except PermissionError:
-            pass
-
-    search_directory(staging_root)
-    return sorted(staged)
+    folders = walk_audio_folders(
+        staging_root,
+        AUDIO_EXTENSIONS,
+        max_depth=None if recursive else 1,
+        stop_at_match=True,
+    )
+    return sorted(folder.path for folder in folders)
@@ -0,0 +1,226 @@
+"""
+Persistent ASIN index of Audiobookshelf libraries.
+
+build_asin_index() indexes every library item by ASIN (all copies, not just
+the first) and by normalized author, series name and core title, so that
+``shelfr abs import`` can find duplicates, trump candidates and - for
+folders without ASIN - likely matches in the library without searching
+Audible. The index is stored in SQLite at ``audiobookshelf.index_db`` and
+synced with each library listing incrementally: items whose ``updatedAt``
+is unchanged keep their row (and their normalized keys), new or edited
+items are re-indexed and items gone from the listing are removed.
+
+Schema:
+    entries(host, library_id, item_id,    - item identity (primary key)
+            added_at, updated_at,         - listing order and change detection
+            asin,                         - metadata or path ASIN (NULL if none)
+            path, title, author, series,  - AsinEntry fields
+            author_key, series_key,       - index_keys(), indexed
+            title_key)
+
+Connections are opened per operation (see shelfr.utils.sqlite_cache).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from shelfr.abs.asin import AsinEntry, AsinIndex, extract_asin, index_keys
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache, settings_section
+
+if TYPE_CHECKING:
+    from shelfr.abs.client import AbsLibraryItem
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        host TEXT NOT NULL,
+        library_id TEXT NOT NULL,
+        item_id TEXT NOT NULL,
+        added_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        asin TEXT,
+        path TEXT NOT NULL,
+        title TEXT NOT NULL,
+        author TEXT,
+        series TEXT,
+        author_key TEXT NOT NULL,
+        series_key TEXT NOT NULL,
+        title_key TEXT NOT NULL,
+        PRIMARY KEY (host, library_id, item_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_asin ON entries (host, library_id, asin)",
+    "CREATE INDEX IF NOT EXISTS entries_author ON entries (host, library_id, author_key)",
+    "CREATE INDEX IF NOT EXISTS entries_series ON entries (host, library_id, series_key)",
+    "CREATE INDEX IF NOT EXISTS entries_title ON entries (host, library_id, title_key)",
+    """
+    CREATE TABLE IF NOT EXISTS libraries (
+        host TEXT NOT NULL,
+        library_id TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (host, library_id)
+    )
+    """,
+)
+
+# AsinEntry fields, then its index_keys()
+_ENTRY_COLUMNS = "asin, path, item_id, title, author, series, author_key, series_key, title_key"
+
+
+@dataclass
+class IndexSyncStats:
+    """What a sync changed."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+class LibraryIndex(SqliteCache):
+    """ASIN and title/author/series index per ABS server and library, in SQLite."""
+
+    schema = _SCHEMA
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def sync(self, host: str, library_id: str, items: list[AbsLibraryItem]) -> IndexSyncStats:
+        """Bring a library's index in line with a full listing of its items."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            known = dict(
+                conn.execute(
+                    "SELECT item_id, updated_at FROM entries WHERE host = ? AND library_id = ?",
+                    (host, library_id),
+                ).fetchall()
+            )
+            stats = IndexSyncStats()
+            rows = []
+            for item in items:
+                previous = known.pop(item.id, None)
+                if previous == item.updated_at:
+                    stats.unchanged += 1
+                    continue
+                if previous is None:
+                    stats.added += 1
+                else:
+                    stats.updated += 1
+                rows.append(
+                    (
+                        host,
+                        library_id,
+                        item.id,
+                        item.added_at,
+                        item.updated_at,
+                        item.asin or extract_asin(item.path),
+                        item.path,
+                        item.title,
+                        item.author_name,
+                        item.series_name,
+                        *index_keys(item.title, item.author_name, item.series_name),
+                    )
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries (host, library_id, item_id, added_at, "
+                "updated_at, asin, path, title, author, series, author_key, series_key, "
+                f"title_key) VALUES ({', '.join('?' * 13)})",
+                rows,
+            )
+            # Whatever was not in the listing has left the library
+            conn.executemany(
+                "DELETE FROM entries WHERE host = ? AND library_id = ? AND item_id = ?",
+                ((host, library_id, item_id) for item_id in known),
+            )
+            stats.removed = len(known)
+            conn.execute(
+                "INSERT OR REPLACE INTO libraries (host, library_id, synced_at) VALUES (?, ?, ?)",
+                (host, library_id, time.time()),
+            )
+            conn.execute("COMMIT")
+
+        logger.debug(
+            f"Library index {library_id}: {stats.added} added, {stats.updated} updated, "
+            f"{stats.removed} removed, {stats.unchanged} unchanged"
+        )
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def load(self, host: str, library_id: str) -> AsinIndex:
+        """In-memory AsinIndex of a library (first copy = most recently added)."""
+        index = AsinIndex()
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM entries "
+                "WHERE host = ? AND library_id = ? AND asin IS NOT NULL "
+                "ORDER BY added_at DESC, item_id",
+                (host, library_id),
+            ).fetchall()
+        for row in rows:
+            index.add(AsinEntry(*row[:6]), keys=row[6:])
+        return index
+
+    def copies(self, host: str, library_id: str, asin: str) -> list[AsinEntry]:
+        """Every copy of ``asin`` in a library."""
+        return self._entries(host, library_id, "asin", asin)
+
+    def by_author(self, host: str, library_id: str, author: str) -> list[AsinEntry]:
+        """Books whose normalized author matches ``author``."""
+        return self._entries(host, library_id, "author_key", index_keys("", author, None)[0])
+
+    def by_series(self, host: str, library_id: str, series: str) -> list[AsinEntry]:
+        """Books whose (first) series name matches ``series``."""
+        return self._entries(host, library_id, "series_key", index_keys("", None, series)[1])
+
+    def by_title(self, host: str, library_id: str, title: str) -> list[AsinEntry]:
+        """Books whose core title matches that of ``title``."""
+        return self._entries(host, library_id, "title_key", index_keys(title, None, None)[2])
+
+    def _entries(self, host: str, library_id: str, column: str, value: str) -> list[AsinEntry]:
+        if not value or not self.path.exists():
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM entries "
+                f"WHERE host = ? AND library_id = ? AND {column} = ? AND asin IS NOT NULL "
+                "ORDER BY added_at DESC, item_id",
+                (host, library_id, value),
+            ).fetchall()
+        return [AsinEntry(*row[:6]) for row in rows]
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+
+def _open_library_index() -> LibraryIndex:
+    """Index at the configured ``audiobookshelf.index_db``."""
+    config = settings_section("audiobookshelf")
+    assert config is not None  # only opened once SharedCache.get() found the config
+    return LibraryIndex(Path(config.index_db).expanduser())
+
+
+_shared = SharedCache("audiobookshelf", "index_enabled", _open_library_index)
+
+
+def get_library_index() -> LibraryIndex | None:
+    """
+    Shared library index used by build_asin_index().
+
+    Returns:
+        The index at ``audiobookshelf.index_db``, or None when
+        ``audiobookshelf.index_enabled`` is false or no config can be loaded.
+    """
+    return _shared.get()
@@ -23,7 +23,7 @@ from pydantic import ValidationError
 
 from shelfr.abs.asin import (
     is_valid_asin,
-    resolve_asin_from_folder_with_mediainfo,
+    resolve_asin_from_folder_cached,
     resolve_asin_via_abs_search,
 )
 from shelfr.abs.importer import ParsedFolderName, parse_mam_folder_name
@@ -39,6 +39,7 @@ from shelfr.schemas.abs_metadata import AbsMetadataJson
 from shelfr.utils.fuzzy import is_suspicious_change, similarity_ratio
 from shelfr.utils.naming import build_mam_folder_name, format_volume_number
 from shelfr.utils.paths import safe_dirname
+from shelfr.utils.walk import walk_audio_folders
 
 if TYPE_CHECKING:
     from shelfr.abs.client import AbsClient
@@ -182,24 +183,19 @@ def discover_rename_candidates(
     """
     import fnmatch
 
-    candidates: list[Path] = []
+    if not source_dir.is_dir():
+        return []
 
-    for root, dirs, _files in os.walk(source_dir):
-        root_path = Path(root)
+    folders = walk_audio_folders(source_dir, AUDIO_EXTS, stop_at_match=False, include_root=True)
 
-        # Only consider dirs that match pattern
-        if pattern != "*" and not fnmatch.fnmatch(root_path.name, pattern):
-            continue
-
-        # Must have audio files
-        if not has_audio_files(root_path):
-            continue
-
-        # Skip if any subdir also has audio (not a leaf)
-        if any(has_audio_files(root_path / d) for d in dirs):
-            continue
-
-        candidates.append(root_path)
+    # Skip folders with a direct subfolder that also has audio (not a leaf)
+    parents = {folder.path.parent for folder in folders}
+    candidates = [
+        folder.path
+        for folder in folders
+        if folder.path not in parents
+        and (pattern == "*" or fnmatch.fnmatch(folder.path.name, pattern))
+    ]
 
     return sorted(candidates)
 
@@ -372,8 +368,9 @@ def resolve_asin_cascade(
             candidate = dataclasses.replace(candidate, asin_source="folder_name")
         return candidate
 
-    # Phase 3+4: Local resolution (folder name, filenames, metadata.json, mediainfo)
-    resolution = resolve_asin_from_folder_with_mediainfo(
+    # Phase 3+4: Local resolution (folder name, filenames, metadata.json, mediainfo),
+    # reused from the resolution cache while the folder is unchanged
+    resolution = resolve_asin_from_folder_cached(
         candidate.source_path,
         parsed_asin=candidate.parsed.asin if candidate.parsed else None,
     )
@@ -399,6 +396,7 @@ def resolve_asin_cascade(
                 title=title,
                 author=author,
                 confidence_threshold=abs_search_confidence,
+                folder=candidate.source_path,
             )
             if search_result.found and search_result.asin:
                 candidate.parsed = dataclasses.replace(candidate.parsed, asin=search_result.asin)
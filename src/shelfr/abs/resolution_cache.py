@@ -0,0 +1,280 @@
+"""
+Per-folder cache of ASIN resolutions.
+
+``shelfr abs rename`` and ``abs import`` resolve the ASIN of every folder
+whose name carries none: audio file names, ``*.metadata.json`` sidecars,
+MediaInfo probes and finally an ABS metadata search. The outcome only
+changes when the folder does, so it is stored in SQLite at
+``cache_dir()/asin_resolution.db`` keyed by folder path and checked against
+a directory signature - the names, sizes and mtimes of the audio files and
+JSON sidecars. Repeat runs over an unchanged library skip resolution.
+
+Two stages are cached per folder:
+
+- ``local``: resolve_asin_from_folder_with_mediainfo(). Misses are cached
+  too (nothing in the folder has an ASIN), but only when MediaInfo was
+  available to look inside the files.
+- ``abs_search``: resolve_asin_via_abs_search(). Only hits are cached, with
+  their confidence; a hit below the caller's threshold counts as a miss.
+
+Schema:
+    resolutions(path, stage,            - folder and cascade stage (primary key)
+                signature,              - folder_signature() at resolution time
+                asin, source,           - AsinResolution fields
+                source_detail, confidence,  - 1.0 for exact sources
+                resolved_author, resolved_title,
+                resolved_at)
+
+Managed with ``shelfr cache stats|prune|clear``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from shelfr.abs.asin import AUDIO_EXTENSIONS, AsinResolution
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resolutions (
+    path TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    asin TEXT,
+    source TEXT NOT NULL,
+    source_detail TEXT,
+    confidence REAL,
+    resolved_author TEXT,
+    resolved_title TEXT,
+    resolved_at REAL NOT NULL,
+    PRIMARY KEY (path, stage)
+)
+"""
+
+# Files whose names or contents feed the resolution cascade
+_SIGNATURE_SUFFIXES = (*AUDIO_EXTENSIONS, ".json")
+
+
+def folder_signature(folder: Path) -> str | None:
+    """
+    Digest of the audio files and JSON sidecars in a folder.
+
+    Covers each file's name, size and mtime, so renaming, replacing or
+    retagging a file (or adding a sidecar) changes the signature.
+
+    Returns:
+        Hex digest, or None if the folder can't be read.
+    """
+    entries: list[str] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(_SIGNATURE_SUFFIXES):
+                    continue
+                with contextlib.suppress(OSError):
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append(f"{entry.name}\0{stat.st_size}\0{stat.st_mtime_ns}")
+    except OSError:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    for line in sorted(entries):
+        digest.update(line.encode("utf-8", "surrogateescape"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@dataclass
+class ResolutionCacheStats:
+    """Summary of the resolution cache (for ``shelfr cache stats``)."""
+
+    entries: int = 0
+    resolved: int = 0
+    size_bytes: int = 0
+
+
+class ResolutionCache(SqliteCache):
+    """ASIN resolutions per folder and cascade stage, stored in SQLite."""
+
+    schema = (_SCHEMA,)
+
+    # -------------------------------------------------------------------------
+    # Lookup and store
+    # -------------------------------------------------------------------------
+
+    def get(self, folder: Path, stage: str, signature: str) -> AsinResolution | None:
+        """Cached resolution of a folder, or None if missing or the folder changed."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT signature, asin, source, source_detail, confidence, "
+                    "resolved_author, resolved_title FROM resolutions "
+                    "WHERE path = ? AND stage = ?",
+                    (str(folder), stage),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"ASIN resolution cache read failed ({self.path}): {e}")
+            return None
+        if row is None or row[0] != signature:
+            return None
+        return AsinResolution(
+            asin=row[1],
+            source=row[2],
+            source_detail=row[3],
+            confidence=row[4],
+            resolved_author=row[5],
+            resolved_title=row[6],
+        )
+
+    def put(self, folder: Path, stage: str, signature: str, resolution: AsinResolution) -> None:
+        """Store the resolution of a folder."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO resolutions (path, stage, signature, asin, source, "
+                    "source_detail, confidence, resolved_author, resolved_title, resolved_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        str(folder),
+                        stage,
+                        signature,
+                        resolution.asin,
+                        resolution.source,
+                        resolution.source_detail,
+                        # Exact sources (folder, filename, metadata, mediainfo) are certain
+                        1.0
+                        if resolution.found and resolution.confidence is None
+                        else resolution.confidence,
+                        resolution.resolved_author,
+                        resolution.resolved_title,
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"ASIN resolution cache write failed ({self.path}): {e}")
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> ResolutionCacheStats:
+        """Number of cached resolutions (and of those with an ASIN), and database size."""
+        if not self.path.exists():
+            return ResolutionCacheStats()
+        with self._connect() as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM resolutions").fetchone()
+            (resolved,) = conn.execute(
+                "SELECT COUNT(*) FROM resolutions WHERE asin IS NOT NULL"
+            ).fetchone()
+        return ResolutionCacheStats(
+            entries=entries, resolved=resolved, size_bytes=self.size_bytes()
+        )
+
+    def prune(self, *, dry_run: bool = False) -> int:
+        """Remove resolutions of folders that are gone or changed. Returns the count."""
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            rows = conn.execute("SELECT path, stage, signature FROM resolutions").fetchall()
+            signatures: dict[str, str | None] = {}
+            stale = []
+            for path, stage, signature in rows:
+                if path not in signatures:
+                    signatures[path] = folder_signature(Path(path))
+                if signatures[path] != signature:
+                    stale.append((path, stage))
+            if not dry_run:
+                conn.executemany("DELETE FROM resolutions WHERE path = ? AND stage = ?", stale)
+        return len(stale)
+
+    def clear(self, *, dry_run: bool = False) -> int:
+        """Remove every resolution. Returns the number removed (or that would be)."""
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM resolutions").fetchone()
+            if not dry_run:
+                conn.execute("DELETE FROM resolutions")
+        return int(count)
+
+
+# =============================================================================
+# Cached resolution
+# =============================================================================
+
+
+def cached_resolution(
+    folder: Path,
+    stage: str,
+    resolve: Callable[[], AsinResolution],
+    *,
+    min_confidence: float | None = None,
+    cache_misses: bool = True,
+) -> AsinResolution:
+    """
+    Run one stage of the ASIN cascade for a folder, through the cache.
+
+    Args:
+        folder: Book folder being resolved
+        stage: Cascade stage ("local" or "abs_search")
+        resolve: Runs the stage when there is no usable cached result
+        min_confidence: Treat cached hits below this confidence as misses
+        cache_misses: Also remember that the stage found nothing
+
+    Returns:
+        The cached or freshly computed resolution.
+    """
+    cache = get_resolution_cache()
+    signature = folder_signature(folder) if cache is not None else None
+    if cache is None or signature is None:
+        return resolve()
+
+    hit = cache.get(folder, stage, signature)
+    if hit is not None and (
+        min_confidence is None
+        or not hit.found
+        or (hit.confidence is not None and hit.confidence >= min_confidence)
+    ):
+        logger.debug(f"ASIN resolution cache hit ({stage}) for {folder.name}: {hit.asin}")
+        return hit
+
+    resolution = resolve()
+    if resolution.found or cache_misses:
+        cache.put(folder, stage, signature, resolution)
+    return resolution
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+
+def open_resolution_cache() -> ResolutionCache:
+    """Cache in the configured cache dir, whether or not it is enabled."""
+    from shelfr.paths import cache_dir
+
+    return ResolutionCache(cache_dir() / "asin_resolution.db")
+
+
+_shared = SharedCache("audiobookshelf", "resolution_cache_enabled", open_resolution_cache)
+
+
+def get_resolution_cache() -> ResolutionCache | None:
+    """
+    Shared resolution cache used by ABS rename and import.
+
+    Returns:
+        The cache, or None when ``audiobookshelf.resolution_cache_enabled``
+        is false or no config can be loaded.
+    """
+    return _shared.get()
@@ -0,0 +1,203 @@
+"""
+Disk cache for Audiobookshelf metadata searches.
+
+``AbsClient.search_books`` asks ABS to search Audible (or another provider)
+for a title and author. ASIN resolution repeats the same searches on every
+run of ``shelfr abs import`` and ``abs rename``, so results are stored in
+SQLite at ``cache_dir()/abs_search.db`` for
+``audiobookshelf.search_cache_ttl_hours``.
+
+Entries are keyed by ABS host, provider and the normalized (case-folded,
+whitespace-collapsed) title and author. Empty result lists are cached too:
+"no match" is an answer. Errors are never cached.
+
+Schema:
+    searches(host, provider, title, author,  - normalized query (primary key)
+             results,                        - search results as JSON
+             fetched_at)
+
+Managed with ``shelfr cache stats|prune|clear``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache, settings_section
+
+logger = logging.getLogger(__name__)
+
+# audiobookshelf.search_cache_ttl_hours when no config can be loaded
+DEFAULT_TTL_HOURS = 168
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    host TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    results TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (host, provider, title, author)
+)
+"""
+
+
+def normalize_query(value: str | None) -> str:
+    """Case-folded, whitespace-collapsed form of a search term ("" for None)."""
+    return " ".join(value.casefold().split()) if value else ""
+
+
+@dataclass
+class SearchCacheStats:
+    """Summary of the search cache (for ``shelfr cache stats``)."""
+
+    entries: int = 0
+    expired: int = 0
+    size_bytes: int = 0
+
+
+class SearchCache(SqliteCache):
+    """ABS search results per normalized query, stored in SQLite."""
+
+    schema = (_SCHEMA,)
+
+    def __init__(self, path: Path, *, ttl: float) -> None:
+        super().__init__(path)
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(host: str, provider: str, title: str, author: str | None) -> tuple[str, ...]:
+        return (host, provider, normalize_query(title), normalize_query(author))
+
+    # -------------------------------------------------------------------------
+    # Lookup and store
+    # -------------------------------------------------------------------------
+
+    def get(
+        self, host: str, provider: str, title: str, author: str | None
+    ) -> list[dict[str, Any]] | None:
+        """Fresh cached results for a search, or None."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT results, fetched_at FROM searches "
+                    "WHERE host = ? AND provider = ? AND title = ? AND author = ?",
+                    self._key(host, provider, title, author),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"ABS search cache read failed ({self.path}): {e}")
+            return None
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        try:
+            results: list[dict[str, Any]] = json.loads(row[0])
+        except ValueError:
+            return None
+        return results
+
+    def put(
+        self,
+        host: str,
+        provider: str,
+        title: str,
+        author: str | None,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Store the results of a search."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO searches "
+                    "(host, provider, title, author, results, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        *self._key(host, provider, title, author),
+                        json.dumps(results, ensure_ascii=False),
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"ABS search cache write failed ({self.path}): {e}")
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> SearchCacheStats:
+        """Number of cached and expired searches, and database size."""
+        if not self.path.exists():
+            return SearchCacheStats()
+        with self._connect() as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM searches").fetchone()
+            (expired,) = conn.execute(
+                "SELECT COUNT(*) FROM searches WHERE fetched_at <= ?", (time.time() - self.ttl,)
+            ).fetchone()
+        return SearchCacheStats(entries=entries, expired=expired, size_bytes=self.size_bytes())
+
+    def prune(self, *, dry_run: bool = False) -> int:
+        """Remove expired searches. Returns the number removed (or that would be)."""
+        if not self.path.exists():
+            return 0
+        cutoff = time.time() - self.ttl
+        with self._connect() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM searches WHERE fetched_at <= ?", (cutoff,)
+            ).fetchone()
+            if not dry_run:
+                conn.execute("DELETE FROM searches WHERE fetched_at <= ?", (cutoff,))
+        return int(count)
+
+    def clear(self, *, dry_run: bool = False) -> int:
+        """Remove every search. Returns the number removed (or that would be)."""
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM searches").fetchone()
+            if not dry_run:
+                conn.execute("DELETE FROM searches")
+        return int(count)
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+
+def open_search_cache() -> SearchCache:
+    """
+    Cache in the configured cache dir and TTL, whether or not it is enabled.
+
+    Without a loadable config the default TTL is used, so ``shelfr cache``
+    works for the other caches' settings alone.
+    """
+    from shelfr.paths import cache_dir
+
+    config = settings_section("audiobookshelf")
+    ttl_hours = config.search_cache_ttl_hours if config is not None else DEFAULT_TTL_HOURS
+    return SearchCache(cache_dir() / "abs_search.db", ttl=ttl_hours * 3600)
+
+
+_shared = SharedCache(
+    "audiobookshelf",
+    "search_cache_enabled",
+    open_search_cache,
+    identity=lambda cache: (cache.path, cache.ttl),
+)
+
+
+def get_search_cache() -> SearchCache | None:
+    """
+    Shared search cache used by AbsClient.search_books().
+
+    Returns:
+        The cache, or None when ``audiobookshelf.search_cache_enabled`` is
+        false or no config can be loaded.
+    """
+    return _shared.get()
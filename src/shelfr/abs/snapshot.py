@@ -0,0 +1,274 @@
+"""
+Persistent snapshot of Audiobookshelf library listings.
+
+Listing a large library means hundreds of page requests, and every
+``shelfr abs import``, ``abs trump`` and ``abs rename`` run needs the whole
+listing to build its ASIN index. The snapshot keeps each library's items in
+SQLite at ``cache_dir()/abs_library.db`` and brings them up to date
+incrementally:
+
+1. Page through the library sorted by ``updatedAt`` descending and stop at
+   the first item older than the snapshot's high-water mark (the newest
+   ``updatedAt`` seen). Added and edited items are upserted.
+2. Compare the item count with the ``total`` the server reported. Deleted
+   items don't show up in step 1, so a mismatch triggers a full re-listing.
+
+Schema:
+    items(host, library_id, id,        - item identity (primary key)
+          added_at, updated_at,        - for ordering and the high-water mark
+          data)                        - AbsLibraryItem fields as JSON
+    libraries(host, library_id,        - one row per snapshotted library
+              refreshed_at)
+
+Connections are opened per operation (see shelfr.utils.sqlite_cache).
+
+Managed with ``shelfr cache stats|clear``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from shelfr.abs.client import AbsLibraryItem
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache
+
+if TYPE_CHECKING:
+    from shelfr.abs.client import AbsClient
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS items (
+        host TEXT NOT NULL,
+        library_id TEXT NOT NULL,
+        id TEXT NOT NULL,
+        added_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (host, library_id, id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS libraries (
+        host TEXT NOT NULL,
+        library_id TEXT NOT NULL,
+        refreshed_at REAL NOT NULL,
+        PRIMARY KEY (host, library_id)
+    )
+    """,
+)
+
+
+@dataclass
+class SnapshotStats:
+    """Summary of the library snapshot (for ``shelfr cache stats``)."""
+
+    libraries: int = 0
+    items: int = 0
+    size_bytes: int = 0
+
+
+class LibrarySnapshot(SqliteCache):
+    """Library items per ABS server and library, stored in SQLite."""
+
+    schema = _SCHEMA
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def exists(self, host: str, library_id: str) -> bool:
+        """Whether ``library_id`` on ``host`` has been snapshotted."""
+        if not self.path.exists():
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM libraries WHERE host = ? AND library_id = ?", (host, library_id)
+            ).fetchone()
+        return row is not None
+
+    def items(self, host: str, library_id: str) -> list[AbsLibraryItem]:
+        """Snapshotted items, newest first (the order of a fresh listing)."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM items WHERE host = ? AND library_id = ? "
+                "ORDER BY added_at DESC, id",
+                (host, library_id),
+            ).fetchall()
+        return [AbsLibraryItem(**json.loads(data)) for (data,) in rows]
+
+    def count(self, host: str, library_id: str) -> int:
+        """Number of snapshotted items."""
+        with self._connect() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM items WHERE host = ? AND library_id = ?", (host, library_id)
+            ).fetchone()
+        return int(count)
+
+    def high_water(self, host: str, library_id: str) -> int:
+        """Newest ``updatedAt`` in the snapshot (0 if empty)."""
+        with self._connect() as conn:
+            (value,) = conn.execute(
+                "SELECT MAX(updated_at) FROM items WHERE host = ? AND library_id = ?",
+                (host, library_id),
+            ).fetchone()
+        return int(value or 0)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def replace(self, host: str, library_id: str, items: list[AbsLibraryItem]) -> None:
+        """Replace the snapshot of a library with a full listing."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM items WHERE host = ? AND library_id = ?", (host, library_id))
+            self._write(conn, host, library_id, items)
+            conn.execute("COMMIT")
+
+    def upsert(self, host: str, library_id: str, items: list[AbsLibraryItem]) -> None:
+        """Add or update items in a library's snapshot."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._write(conn, host, library_id, items)
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _write(
+        conn: sqlite3.Connection, host: str, library_id: str, items: list[AbsLibraryItem]
+    ) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO items (host, library_id, id, added_at, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    host,
+                    library_id,
+                    item.id,
+                    item.added_at,
+                    item.updated_at,
+                    json.dumps(dataclasses.asdict(item), ensure_ascii=False),
+                )
+                for item in items
+            ),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO libraries (host, library_id, refreshed_at) VALUES (?, ?, ?)",
+            (host, library_id, time.time()),
+        )
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> SnapshotStats:
+        """Number of snapshotted libraries and items, and database size."""
+        if not self.path.exists():
+            return SnapshotStats()
+        with self._connect() as conn:
+            (libraries,) = conn.execute("SELECT COUNT(*) FROM libraries").fetchone()
+            (items,) = conn.execute("SELECT COUNT(*) FROM items").fetchone()
+        return SnapshotStats(libraries=libraries, items=items, size_bytes=self.size_bytes())
+
+    def clear(self, *, dry_run: bool = False) -> int:
+        """Remove every snapshot. Returns the number of items removed (or that would be)."""
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM items").fetchone()
+            if not dry_run:
+                conn.execute("DELETE FROM items")
+                conn.execute("DELETE FROM libraries")
+        return int(count)
+
+
+# =============================================================================
+# Refresh
+# =============================================================================
+
+
+def refresh_snapshot(
+    client: AbsClient,
+    snapshot: LibrarySnapshot,
+    library_id: str,
+    *,
+    full: bool = False,
+) -> list[AbsLibraryItem]:
+    """
+    Bring a library's snapshot up to date and return its items.
+
+    Args:
+        client: Client for the ABS server
+        snapshot: Snapshot store
+        library_id: ABS library ID
+        full: Re-list the whole library instead of fetching changes
+
+    Returns:
+        All items in the library, newest first.
+    """
+    host = client.host
+    if full or not snapshot.exists(host, library_id):
+        logger.info(f"Listing all items of library {library_id} for the snapshot")
+        items = client.get_all_library_items(library_id)
+        snapshot.replace(host, library_id, items)
+        return items
+
+    high_water = snapshot.high_water(host, library_id)
+    changed: list[AbsLibraryItem] = []
+    page = 0
+    while True:
+        items, total = client.get_library_items(
+            library_id, limit=client.page_size, page=page, sort="updatedAt", desc=True
+        )
+        # Items updated at the high-water mark itself are fetched again (same-ms edits)
+        newer = [item for item in items if item.updated_at >= high_water]
+        changed.extend(newer)
+        if len(newer) < len(items) or not items or (page + 1) * client.page_size >= total:
+            break
+        page += 1
+
+    if changed:
+        snapshot.upsert(host, library_id, changed)
+    count = snapshot.count(host, library_id)
+    if count != total:
+        # Deletions don't surface in the updatedAt listing; the count gives them away
+        logger.info(
+            f"Snapshot of library {library_id} has {count} items, server has {total}; re-listing"
+        )
+        return refresh_snapshot(client, snapshot, library_id, full=True)
+
+    logger.info(f"Library snapshot {library_id}: {len(changed)} changed items, {count} total")
+    return snapshot.items(host, library_id)
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+
+def open_library_snapshot() -> LibrarySnapshot:
+    """Snapshot in the configured cache dir, whether or not it is enabled."""
+    from shelfr.paths import cache_dir
+
+    return LibrarySnapshot(cache_dir() / "abs_library.db")
+
+
+_shared = SharedCache("audiobookshelf", "snapshot_enabled", open_library_snapshot)
+
+
+def get_library_snapshot() -> LibrarySnapshot | None:
+    """
+    Shared library snapshot.
+
+    Returns:
+        The snapshot, or None when ``audiobookshelf.snapshot_enabled`` is
+        false or no config can be loaded.
+    """
+    return _shared.get()
@@ -19,6 +19,7 @@ import logging
 import re
 import shutil
 import subprocess
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum, auto
@@ -27,6 +28,9 @@ from typing import TYPE_CHECKING, Any
 
 from shelfr.abs.asin import AUDIO_EXTENSIONS
 from shelfr.config import get_settings
+from shelfr.metadata.mediainfo.batch import BATCH_THRESHOLD, probe_many
+from shelfr.metadata.mediainfo.cache import cached_probe, get_probe_cache
+from shelfr.metadata.mediainfo.mp4 import native_mediainfo
 
 if TYPE_CHECKING:
     from shelfr.config import TrumpingConfig
@@ -265,6 +269,33 @@ def _get_mediainfo_binary() -> str | None:
     return None
 
 
+def _probe_with_mediainfo(probe_file: Path) -> dict[str, Any] | None:
+    """Run mediainfo on a file (via the probe cache); None if unavailable or failed."""
+    # Reuse existing mediainfo binary detection
+    binary = _get_mediainfo_binary()
+    if binary is None:
+        logger.warning("mediainfo not available, quality metadata unavailable")
+        return None
+
+    # Same pattern as extract_asin_from_mediainfo
+    def probe() -> dict[str, Any] | None:
+        try:
+            result = subprocess.run(
+                [binary, "--Output=JSON", str(probe_file)],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30,
+            )
+            probed: dict[str, Any] = json.loads(result.stdout)
+        except (subprocess.SubprocessError, json.JSONDecodeError) as e:
+            logger.debug("Failed to probe %s: %s", probe_file.name, e)
+            return None
+        return probed
+
+    return cached_probe(probe_file, probe)
+
+
 def _parse_bitrate(track: dict[str, Any]) -> int | None:
     """Parse bitrate from mediainfo track, converting to kbps."""
     # mediainfo returns BitRate in bps as string: "128000"
@@ -348,6 +379,44 @@ def _extract_ripper_tag(folder_name: str) -> str | None:
     return match.group(1) if match else None
 
 
+def prefetch_trumpable_meta(folders: Iterable[Path]) -> int:
+    """Probe the audio files of many folders at once, ahead of extract_trumpable_meta().
+
+    Collects the audio file of each single-file folder that can't be read
+    in-process and probes them with probe_many(), which fills the probe
+    cache that extract_trumpable_meta() reads. Does nothing for a handful of
+    files, or when the probe cache is disabled.
+
+    Args:
+        folders: Audiobook folders about to be compared
+
+    Returns:
+        Number of files probed (0 if nothing was batched)
+    """
+    if get_probe_cache() is None:
+        return 0
+
+    files: list[Path] = []
+    for folder in dict.fromkeys(folders):
+        if not folder.is_dir():
+            continue
+        audio_files = [
+            f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
+        ]
+        if len(audio_files) == 1 and native_mediainfo(audio_files[0]) is None:
+            files.append(audio_files[0])
+
+    if len(files) <= BATCH_THRESHOLD:
+        return 0
+    binary = _get_mediainfo_binary()
+    if binary is None:
+        return 0
+
+    probe_many(files, binary=binary)
+    logger.debug("Prefetched mediainfo for %d files", len(files))
+    return len(files)
+
+
 def extract_trumpable_meta(folder: Path, asin: str) -> TrumpableMeta:
     """Extract quality metadata from audio files in folder.
 
@@ -396,29 +465,11 @@ def extract_trumpable_meta(folder: Path, asin: str) -> TrumpableMeta:
     # Single file - proceed with full metadata extraction
     probe_file = audio_files[0]
 
-    # Reuse existing mediainfo binary detection
-    binary = _get_mediainfo_binary()
-    if binary is None:
-        logger.warning("mediainfo not available, quality metadata unavailable")
-        return TrumpableMeta(
-            asin=asin,
-            format=probe_file.suffix.lower().lstrip("."),
-            source_path=folder,
-            ripper_tag=ripper_tag,
-        )
-
-    # Run mediainfo (same pattern as extract_asin_from_mediainfo)
-    try:
-        result = subprocess.run(
-            [binary, "--Output=JSON", str(probe_file)],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
-        )
-        data = json.loads(result.stdout)
-    except (subprocess.SubprocessError, json.JSONDecodeError) as e:
-        logger.debug("Failed to probe %s: %s", probe_file.name, e)
+    # MP4/M4B headers are read in-process; other files (or unreadable ones) go to mediainfo
+    data = native_mediainfo(probe_file)
+    if data is None:
+        data = _probe_with_mediainfo(probe_file)
+    if data is None:
         return TrumpableMeta(
             asin=asin,
             format=probe_file.suffix.lower().lstrip("."),
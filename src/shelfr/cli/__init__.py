@@ -46,7 +46,9 @@ from shelfr.cli._app import (
 )
 from shelfr.cli._context import RuntimeContext, get_runtime_context
 from shelfr.cli._helpers import ArgsNamespace, get_args
+from shelfr.cli.cache import make_cache_app
 from shelfr.cli.edit import make_edit_app
+from shelfr.cli.metadata import make_metadata_app
 from shelfr.cli.mkbrr import make_mkbrr_app
 
 # Create main app and sub-apps
@@ -58,6 +60,8 @@ abs_app = make_abs_app()
 mam_app = make_mam_app()
 edit_app = make_edit_app()
 mkbrr_app = make_mkbrr_app()
+cache_app = make_cache_app()
+metadata_app = make_metadata_app()
 
 # Register sub-apps
 app.add_typer(state_app, name="state", rich_help_panel=STATE_COMMANDS)
@@ -67,6 +71,8 @@ app.add_typer(abs_app, name="abs", rich_help_panel=ABS_COMMANDS)
 app.add_typer(mam_app, name="mam")
 app.add_typer(edit_app, name="edit", rich_help_panel=TOOLS_COMMANDS)
 app.add_typer(mkbrr_app, name="mkbrr", rich_help_panel=TOOLS_COMMANDS)
+app.add_typer(cache_app, name="cache", rich_help_panel=TOOLS_COMMANDS)
+app.add_typer(metadata_app, name="metadata", rich_help_panel=TOOLS_COMMANDS)
 
 # Register main callback (handles --version, --verbose, --config, --dry-run)
 create_main_callback(app)
@@ -83,11 +89,13 @@ from shelfr.cli.abs import (  # noqa: E402
     register_abs_commands,
     register_abs_deprecated_aliases,
 )
+from shelfr.cli.cache import register_cache_commands  # noqa: E402
 from shelfr.cli.core import register_core_commands  # noqa: E402
 from shelfr.cli.diagnostics import register_diagnostics_commands  # noqa: E402
 from shelfr.cli.edit import register_edit_commands  # noqa: E402
 from shelfr.cli.libation import register_libation_commands  # noqa: E402
 from shelfr.cli.mam import register_mam_commands  # noqa: E402
+from shelfr.cli.metadata import register_metadata_commands  # noqa: E402
 from shelfr.cli.mkbrr import register_mkbrr_commands  # noqa: E402
 from shelfr.cli.state import register_state_commands  # noqa: E402
 from shelfr.cli.tools import register_tools_commands  # noqa: E402
@@ -102,6 +110,8 @@ register_tools_commands(tools_app)
 register_mam_commands(mam_app)
 register_edit_commands(edit_app)
 register_mkbrr_commands(mkbrr_app)
+register_cache_commands(cache_app)
+register_metadata_commands(metadata_app)
 
 
 # =============================================================================
@@ -328,6 +328,16 @@ def setup_logging(verbose: bool, config_path: Path) -> None:
 # =============================================================================
 
 
+def close_http_clients() -> None:
+    """Close pooled HTTP clients opened while a command ran."""
+    import sys
+
+    # Only if the command used it - importing it here would slow down every command
+    audnex_http = sys.modules.get("shelfr.metadata.audnex.http")
+    if audnex_http is not None:
+        audnex_http.close_audnex_clients()
+
+
 def create_main_callback(app: typer.Typer) -> None:
     """Register the main callback on the app."""
 
@@ -394,3 +404,6 @@ def create_main_callback(app: typer.Typer) -> None:
 
         # Setup logging
         setup_logging(verbose, config)
+
+        # Shared HTTP connection pools live as long as the command
+        ctx.call_on_close(close_http_clients)
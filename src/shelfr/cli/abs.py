@@ -122,6 +122,12 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
             bool,
             typer.Option("--no-opf", help="Disable metadata.opf sidecar generation."),
         ] = False,
+        workers: Annotated[
+            int | None,
+            typer.Option(
+                "--workers", min=1, max=32, help="Books imported at once (default: config)."
+            ),
+        ] = None,
     ) -> None:
         """Import staged audiobooks to Audiobookshelf.
 
@@ -131,6 +137,7 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
           shelfr abs import                    # Import all staged
           shelfr abs import /path/to/book      # Import specific folder
           shelfr abs import -d skip            # Skip duplicates
+          shelfr abs import --workers 8        # Import 8 books at a time
         """
         from shelfr.commands import cmd_abs_import
 
@@ -148,6 +155,7 @@ def register_abs_commands(abs_app: typer.Typer) -> None:
             no_cleanup=no_cleanup,
             no_metadata=no_metadata,
             opf=True if opf else (False if no_opf else None),
+            workers=workers,
             command="abs import",
         )
         result = cmd_abs_import(args)
@@ -0,0 +1,260 @@
+"""Cache CLI commands (sub-app).
+
+Commands: cache stats, cache prune, cache clear
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from shelfr.cli._context import get_runtime_context
+from shelfr.console import console, print_dry_run, print_error, print_info, print_success
+from shelfr.ui.formatting import format_file_size
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Epilog for cache sub-app
+# =============================================================================
+
+CACHE_EPILOG = """
+[bold cyan]Common Tasks:[/]
+  shelfr cache stats                 [dim]# Entries, expired entries, disk usage[/]
+  shelfr cache prune                 [dim]# Remove expired entries and stale probes[/]
+  shelfr cache clear --endpoint book [dim]# Drop cached book lookups[/]
+  shelfr cache clear -e mediainfo    [dim]# Drop cached MediaInfo probes[/]
+  shelfr cache clear -e abs          [dim]# Drop ABS library snapshots[/]
+  shelfr cache clear -e abs-search   [dim]# Drop cached ABS metadata searches[/]
+  shelfr cache clear -e asin         [dim]# Drop cached folder ASIN resolutions[/]
+"""
+
+
+def make_cache_app() -> typer.Typer:
+    """Create the cache sub-app."""
+    return typer.Typer(
+        name="cache",
+        help="Inspect and clean the Audnex, MediaInfo and ABS library caches",
+        epilog=CACHE_EPILOG,
+        rich_markup_mode="rich",
+        no_args_is_help=True,
+    )
+
+
+def register_cache_commands(cache_app: typer.Typer) -> None:
+    """Register cache commands on the cache sub-app."""
+
+    @cache_app.callback(invoke_without_command=True)
+    def cache_callback(ctx: typer.Context) -> None:
+        """Inspect and clean the Audnex, MediaInfo and ABS library caches.
+
+        [bold]Commands:[/]
+          shelfr cache stats   Show cached entries and disk usage
+          shelfr cache prune   Remove expired entries and stale probes
+          shelfr cache clear   Remove all entries
+        [dim]Configured under audnex:, mediainfo: and audiobookshelf: in config.yaml.[/]
+        """
+        if ctx.invoked_subcommand is None:
+            console.print(ctx.get_help())
+            raise typer.Exit(0)
+
+    # =========================================================================
+    # stats command
+    # =========================================================================
+
+    @cache_app.command("stats")
+    def cache_stats(
+        ctx: typer.Context,
+        json_output: Annotated[
+            bool,
+            typer.Option("--json", "-j", help="Output as JSON."),
+        ] = False,
+    ) -> None:
+        """Show cached Audnex entries per endpoint, MediaInfo probes, ABS snapshots and disk usage.
+
+        [bold]Examples:[/]
+          shelfr cache stats
+          shelfr cache stats --json
+        """
+        from shelfr.abs.resolution_cache import open_resolution_cache
+        from shelfr.abs.search_cache import open_search_cache
+        from shelfr.abs.snapshot import open_library_snapshot
+        from shelfr.metadata.audnex.cache import open_audnex_cache
+        from shelfr.metadata.mediainfo.cache import open_probe_cache
+
+        get_runtime_context(ctx.obj)  # Loads settings from --config
+        cache = open_audnex_cache()
+        stats = cache.stats()
+        probes = open_probe_cache()
+        probe_stats = probes.stats()
+        snapshot = open_library_snapshot()
+        snapshot_stats = snapshot.stats()
+        searches = open_search_cache()
+        search_stats = searches.stats()
+        resolutions = open_resolution_cache()
+        resolution_stats = resolutions.stats()
+
+        if json_output:
+            output_data = {
+                "path": str(cache.root),
+                "entries": stats.entries,
+                "negative": stats.negative,
+                "expired": stats.expired,
+                "invalid": stats.invalid,
+                "size_bytes": stats.size_bytes,
+                "by_endpoint": stats.by_endpoint,
+                "mediainfo": {
+                    "path": str(probes.path),
+                    "entries": probe_stats.entries,
+                    "size_bytes": probe_stats.size_bytes,
+                },
+                "abs": {
+                    "path": str(snapshot.path),
+                    "libraries": snapshot_stats.libraries,
+                    "items": snapshot_stats.items,
+                    "size_bytes": snapshot_stats.size_bytes,
+                },
+                "abs_search": {
+                    "path": str(searches.path),
+                    "entries": search_stats.entries,
+                    "expired": search_stats.expired,
+                    "size_bytes": search_stats.size_bytes,
+                },
+                "asin_resolution": {
+                    "path": str(resolutions.path),
+                    "entries": resolution_stats.entries,
+                    "resolved": resolution_stats.resolved,
+                    "size_bytes": resolution_stats.size_bytes,
+                },
+            }
+            console.print_json(json.dumps(output_data, indent=2))
+            return
+
+        table = Table(title="Audnex Cache", show_header=True, header_style="bold")
+        table.add_column("Endpoint", style="cyan")
+        table.add_column("Entries", justify="right")
+        for endpoint, count in stats.by_endpoint.items():
+            table.add_row(endpoint, str(count))
+        console.print(table)
+
+        console.print(f"  Path:     {cache.root}")
+        console.print(f"  Entries:  {stats.entries} ({stats.negative} not found)")
+        console.print(f"  Expired:  {stats.expired}")
+        if stats.invalid:
+            console.print(f"  Invalid:  {stats.invalid}")
+        console.print(f"  Size:     {format_file_size(stats.size_bytes)}")
+        console.print(
+            f"  MediaInfo: {probe_stats.entries} probes, "
+            f"{format_file_size(probe_stats.size_bytes)} ({probes.path})"
+        )
+        console.print(
+            f"  ABS:       {snapshot_stats.items} items in {snapshot_stats.libraries} "
+            f"library snapshot(s), {format_file_size(snapshot_stats.size_bytes)} "
+            f"({snapshot.path})"
+        )
+        console.print(
+            f"  Searches:  {search_stats.entries} ABS searches ({search_stats.expired} expired), "
+            f"{format_file_size(search_stats.size_bytes)} ({searches.path})"
+        )
+        console.print(
+            f"  ASINs:     {resolution_stats.entries} folder resolutions "
+            f"({resolution_stats.resolved} with ASIN), "
+            f"{format_file_size(resolution_stats.size_bytes)} ({resolutions.path})"
+        )
+
+    # =========================================================================
+    # prune command
+    # =========================================================================
+
+    @cache_app.command("prune")
+    def cache_prune(ctx: typer.Context) -> None:
+        """Remove expired and unreadable entries.
+
+        Fresh entries are kept. Expired entries would otherwise be
+        revalidated with Audnex on their next lookup. MediaInfo probes of
+        files that were deleted or changed, expired ABS searches and ASIN
+        resolutions of changed or missing folders are removed too.
+
+        [bold]Tip:[/] Use [cyan]shelfr --dry-run cache prune[/] to preview.
+        """
+        from shelfr.abs.resolution_cache import open_resolution_cache
+        from shelfr.abs.search_cache import open_search_cache
+        from shelfr.metadata.audnex.cache import open_audnex_cache
+        from shelfr.metadata.mediainfo.cache import open_probe_cache
+
+        runtime = get_runtime_context(ctx.obj)
+        removed = open_audnex_cache().prune(dry_run=runtime.dry_run)
+        removed += open_probe_cache().prune(dry_run=runtime.dry_run)
+        removed += open_search_cache().prune(dry_run=runtime.dry_run)
+        removed += open_resolution_cache().prune(dry_run=runtime.dry_run)
+
+        if runtime.dry_run:
+            print_dry_run(f"Would remove {removed} expired cache entries")
+        elif removed:
+            print_success(f"Removed {removed} expired cache entries")
+        else:
+            print_info("No expired cache entries")
+
+    # =========================================================================
+    # clear command
+    # =========================================================================
+
+    @cache_app.command("clear")
+    def cache_clear(
+        ctx: typer.Context,
+        endpoint: Annotated[
+            str | None,
+            typer.Option(
+                "--endpoint",
+                "-e",
+                help="Only clear one endpoint: book, chapters, author, mediainfo, abs, "
+                "abs-search or asin.",
+            ),
+        ] = None,
+    ) -> None:
+        """Remove all cached Audnex responses, MediaInfo probes and ABS data.
+
+        The next lookup of each ASIN goes to Audnex again, the next look at
+        each audio file runs MediaInfo again, and the next ABS command lists
+        its library in full, repeats its metadata searches and resolves
+        every folder's ASIN from scratch.
+
+        [bold]Examples:[/]
+          shelfr cache clear
+          shelfr cache clear --endpoint chapters
+          shelfr cache clear --endpoint mediainfo
+          shelfr cache clear --endpoint abs
+          shelfr cache clear --endpoint asin
+        """
+        from shelfr.abs.resolution_cache import open_resolution_cache
+        from shelfr.abs.search_cache import open_search_cache
+        from shelfr.abs.snapshot import open_library_snapshot
+        from shelfr.metadata.audnex.cache import AUDNEX_ENDPOINTS, open_audnex_cache
+        from shelfr.metadata.mediainfo.cache import open_probe_cache
+
+        valid = (*AUDNEX_ENDPOINTS, "mediainfo", "abs", "abs-search", "asin")
+        if endpoint is not None and endpoint not in valid:
+            print_error(f"Unknown endpoint '{endpoint}'. Valid: {', '.join(valid)}")
+            raise typer.Exit(1)
+
+        runtime = get_runtime_context(ctx.obj)
+        removed = 0
+        if endpoint not in ("mediainfo", "abs", "abs-search", "asin"):
+            removed += open_audnex_cache().clear(endpoint, dry_run=runtime.dry_run)
+        if endpoint in (None, "mediainfo"):
+            removed += open_probe_cache().clear(dry_run=runtime.dry_run)
+        if endpoint in (None, "abs"):
+            removed += open_library_snapshot().clear(dry_run=runtime.dry_run)
+        if endpoint in (None, "abs-search"):
+            removed += open_search_cache().clear(dry_run=runtime.dry_run)
+        if endpoint in (None, "asin"):
+            removed += open_resolution_cache().clear(dry_run=runtime.dry_run)
+
+        if runtime.dry_run:
+            print_dry_run(f"Would remove {removed} cache entries")
+        else:
+            print_success(f"Removed {removed} cache entries")
@@ -31,6 +31,20 @@ def register_core_commands(app: typer.Typer) -> None:
             bool,
             typer.Option("--skip-metadata", help="Skip metadata fetching step."),
         ] = False,
+        stream: Annotated[
+            bool,
+            typer.Option(
+                "--stream",
+                help="Start processing releases while the library walk is still running.",
+            ),
+        ] = False,
+        pipeline: Annotated[
+            bool,
+            typer.Option(
+                "--pipeline",
+                help="Overlap releases across stages (see the pipeline section in config.yaml).",
+            ),
+        ] = False,
         no_run_lock: Annotated[
             bool,
             typer.Option(
@@ -55,6 +69,8 @@ def register_core_commands(app: typer.Typer) -> None:
           shelfr run               [dim]# Full pipeline[/]
           shelfr --dry-run run     [dim]# Preview without changes[/]
           shelfr run --skip-scan   [dim]# Skip Libation scan[/]
+          shelfr run --stream      [dim]# Process releases as they are discovered[/]
+          shelfr run --pipeline    [dim]# Fetch metadata for one release while another hashes[/]
 
         [bold cyan]Tips:[/]
           - Always run [green]shelfr check[/] first to verify your setup
@@ -78,6 +94,8 @@ def register_core_commands(app: typer.Typer) -> None:
             ctx,
             skip_scan=skip_scan,
             skip_metadata=skip_metadata,
+            stream=stream,
+            pipeline=pipeline,
             no_run_lock=no_run_lock,
             command="run",
         )
@@ -0,0 +1,193 @@
+"""Metadata CLI commands (sub-app).
+
+Commands: metadata prefetch
+"""
+
+from __future__ import annotations
+
+import logging
+from enum import StrEnum
+from typing import Annotated
+
+import typer
+
+from shelfr.cli._context import get_runtime_context
+from shelfr.console import (
+    console,
+    print_dry_run,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+)
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Epilog for metadata sub-app
+# =============================================================================
+
+METADATA_EPILOG = """
+[bold cyan]Common Tasks:[/]
+  shelfr metadata prefetch              [dim]# Warm the Audnex cache before a run/import[/]
+  shelfr metadata prefetch B0DK9T5P28   [dim]# Prefetch specific ASINs[/]
+"""
+
+
+class PrefetchSource(StrEnum):
+    """Where `metadata prefetch` finds ASINs."""
+
+    PENDING = "pending"  # Unprocessed releases in the Libation library
+    STAGED = "staged"  # Book folders waiting for `abs import`
+    ALL = "all"
+
+
+def make_metadata_app() -> typer.Typer:
+    """Create the metadata sub-app."""
+    return typer.Typer(
+        name="metadata",
+        help="Audiobook metadata tools (Audnex)",
+        epilog=METADATA_EPILOG,
+        rich_markup_mode="rich",
+        no_args_is_help=True,
+    )
+
+
+def _collect_asins(source: PrefetchSource) -> list[str]:
+    """ASINs of pending releases and/or staged import folders, in discovery order."""
+    from shelfr.config import get_settings
+
+    asins: list[str] = []
+    if source in (PrefetchSource.PENDING, PrefetchSource.ALL):
+        from shelfr.discovery import get_new_releases
+
+        asins.extend(release.asin for release in get_new_releases() if release.asin)
+
+    if source in (PrefetchSource.STAGED, PrefetchSource.ALL):
+        from shelfr.abs.asin import extract_asin, resolve_asin_from_folder_cached
+        from shelfr.abs.importer import discover_staged_books
+
+        for folder in discover_staged_books(get_settings().paths.library_root):
+            # Same local cascade as `abs import` (names, sidecars, tags), cached per folder
+            resolution = resolve_asin_from_folder_cached(folder, extract_asin(folder.name))
+            if resolution.asin:
+                asins.append(resolution.asin)
+
+    return list(dict.fromkeys(asins))
+
+
+def register_metadata_commands(metadata_app: typer.Typer) -> None:
+    """Register metadata commands on the metadata sub-app."""
+
+    @metadata_app.callback(invoke_without_command=True)
+    def metadata_callback(ctx: typer.Context) -> None:
+        """Audiobook metadata tools (Audnex).
+
+        [bold]Commands:[/]
+          shelfr metadata prefetch   Warm the Audnex cache for pending books
+        """
+        if ctx.invoked_subcommand is None:
+            console.print(ctx.get_help())
+            raise typer.Exit(0)
+
+    # =========================================================================
+    # prefetch command
+    # =========================================================================
+
+    @metadata_app.command("prefetch")
+    def metadata_prefetch(
+        ctx: typer.Context,
+        asins: Annotated[
+            list[str] | None,
+            typer.Argument(metavar="[ASIN]...", help="ASINs to prefetch (default: --source)."),
+        ] = None,
+        source: Annotated[
+            PrefetchSource,
+            typer.Option(
+                "--source",
+                "-s",
+                help="Pending Libation releases, staged ABS import folders, or both.",
+            ),
+        ] = PrefetchSource.ALL,
+        concurrency: Annotated[
+            int,
+            typer.Option("--concurrency", "-n", help="ASINs looked up at once.", min=1, max=32),
+        ] = 4,
+        rate: Annotated[
+            float,
+            typer.Option("--rate", "-r", help="Maximum Audnex requests per second.", min=0.1),
+        ] = 5.0,
+        chapters: Annotated[
+            bool,
+            typer.Option("--chapters/--no-chapters", help="Also prefetch chapter data."),
+        ] = True,
+    ) -> None:
+        """Warm the Audnex cache before a run or import.
+
+        Looks up book (and chapter) data for every pending release and staged
+        import folder concurrently, with rate limiting, so the pipeline that
+        follows reads it from the cache. Rate-limited requests are retried
+        after Audnex's Retry-After.
+
+        [bold]Examples:[/]
+          shelfr metadata prefetch
+          shelfr metadata prefetch --source staged --rate 2
+          shelfr metadata prefetch B0DK9T5P28 B0CNTY7LVH
+        """
+        import asyncio
+
+        from shelfr.metadata.audnex.cache import get_audnex_cache
+        from shelfr.metadata.audnex.http import aclose_audnex_async_client
+        from shelfr.metadata.audnex.prefetch import prefetch_audnex
+        from shelfr.ui.progress import progress_context
+
+        runtime = get_runtime_context(ctx.obj)
+        targets = list(dict.fromkeys(a.upper() for a in asins)) if asins else None
+        if targets is None:
+            try:
+                targets = _collect_asins(source)
+            except Exception as e:
+                print_error(f"Could not discover books: {e}")
+                raise typer.Exit(1) from e
+
+        if not targets:
+            print_info("No ASINs to prefetch")
+            return
+
+        if runtime.dry_run:
+            print_dry_run(f"Would prefetch Audnex metadata for {len(targets)} ASIN(s)")
+            return
+
+        if get_audnex_cache() is None:
+            print_warning("audnex.cache_enabled is false - prefetched data won't be kept")
+
+        async def run() -> None:
+            try:
+                with progress_context("Prefetching Audnex metadata", total=len(targets)) as (
+                    progress,
+                    task,
+                ):
+                    result = await prefetch_audnex(
+                        targets,
+                        concurrency=concurrency,
+                        rate=rate,
+                        chapters=chapters,
+                        progress=lambda asin: progress.update(task, advance=1),
+                    )
+            finally:
+                await aclose_audnex_async_client()
+
+            print_success(
+                f"Prefetched {len(result.found)} of {len(targets)} ASIN(s) "
+                f"({result.requests} requests, {result.cache_hits} already cached)"
+            )
+            if result.not_found:
+                print_warning(f"Not found on Audnex: {', '.join(result.not_found)}")
+            if result.rate_limited:
+                print_info(f"Rate limited {result.rate_limited} time(s); retried after backoff")
+            for asin, error in result.failed.items():
+                print_error(f"{asin}: {error}")
+            if result.failed:
+                raise typer.Exit(1)
+
+        asyncio.run(run())
@@ -133,6 +133,16 @@ Libation Management:
         action="store_true",
         help="Skip metadata fetching step",
     )
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Start processing releases while the library walk is still running",
+    )
+    run_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap releases across stages (see the pipeline section in config.yaml)",
+    )
     run_parser.add_argument(
         "--no-run-lock",
         action="store_true",
@@ -98,6 +98,8 @@ def cmd_abs_check_duplicate(args: argparse.Namespace) -> int:
             host=abs_config.host,
             api_key=abs_config.api_key,
             timeout=abs_config.timeout_seconds,
+            page_size=abs_config.page_size,
+            page_workers=abs_config.page_workers,
         ) as client:
             asin_index = build_asin_index(client, target_library.id)
 
@@ -137,6 +137,9 @@ def cmd_abs_import(args: argparse.Namespace) -> int:
             host=abs_config.host,
             api_key=abs_config.api_key,
             timeout=abs_config.timeout_seconds,
+            page_size=abs_config.page_size,
+            page_workers=abs_config.page_workers,
+            search_concurrency=abs_config.search_concurrency,
         )
         # Test connection first
         user = client.authorize()
@@ -255,6 +258,11 @@ def cmd_abs_import(args: argparse.Namespace) -> int:
     elif import_settings.generate_opf_sidecar:
         print_info("OPF sidecar generation enabled (config)")
 
+    # Handle --workers CLI override
+    workers = getattr(args, "workers", None) or import_settings.workers
+    if workers > 1:
+        print_info(f"Importing {workers} books at a time")
+
     if args.dry_run:
         print_dry_run(f"Would import {len(staging_folders)} book(s)")
 
@@ -341,6 +349,7 @@ def cmd_abs_import(args: argparse.Namespace) -> int:
                 metadata_json_fallback=import_settings.metadata_json_fallback,
                 generate_opf_sidecar=import_settings.generate_opf_sidecar,
                 progress_callback=progress_callback,
+                workers=workers,
                 dry_run=args.dry_run,
             )
 
@@ -79,6 +79,7 @@ def cmd_abs_rename(args: argparse.Namespace) -> int:
                     host=abs_config.host,
                     api_key=abs_config.api_key,
                     timeout=abs_config.timeout_seconds,
+                    search_concurrency=abs_config.search_concurrency,
                 )
                 print_info("ABS search enabled")
             except (ConnectionError, TimeoutError, OSError) as e:
@@ -106,6 +106,9 @@ def cmd_abs_resolve_asins(args: argparse.Namespace) -> int:
             host=abs_config.host,
             api_key=abs_config.api_key,
             timeout=abs_config.timeout_seconds,
+            page_size=abs_config.page_size,
+            page_workers=abs_config.page_workers,
+            search_concurrency=abs_config.search_concurrency,
         ) as client:
             # Process folders (using with statement for proper cleanup)
             print_step(2, 3, "Searching for ASINs")
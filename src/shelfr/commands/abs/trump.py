@@ -37,6 +37,7 @@ def cmd_abs_trump_check(args: argparse.Namespace) -> int:
         decide_trump,
         extract_trumpable_meta,
         is_multi_file_layout,
+        prefetch_trumpable_meta,
     )
     from shelfr.config import reload_settings
     from shelfr.console import (
@@ -109,6 +110,8 @@ def cmd_abs_trump_check(args: argparse.Namespace) -> int:
             host=abs_config.host,
             api_key=abs_config.api_key,
             timeout=abs_config.timeout_seconds,
+            page_size=abs_config.page_size,
+            page_workers=abs_config.page_workers,
         )
         asin_index = build_asin_index(client, target_library.id)
         client.close()
@@ -125,6 +128,17 @@ def cmd_abs_trump_check(args: argparse.Namespace) -> int:
     print_step(3, 3, "Analyzing trumping decisions")
     console.print()
 
+    # Probe both sides of every duplicate in batches rather than one mediainfo call each
+    compare_folders = list(staging_folders)
+    for folder in staging_folders:
+        parsed = parse_mam_folder_name(folder.name)
+        if parsed and parsed.asin and parsed.asin in asin_index:
+            existing_path = asin_index[parsed.asin].path
+            compare_folders.append(
+                path_mapper.to_host(existing_path) if path_mapper else Path(existing_path)
+            )
+    prefetch_trumpable_meta(compare_folders)
+
     replaced_count = 0
     kept_existing_count = 0
     rejected_count = 0
@@ -412,6 +412,9 @@ def cmd_run(args: argparse.Namespace) -> int:
                 skip_metadata=args.skip_metadata,
                 dry_run=args.dry_run,
                 verbose=args.verbose,
+                stream=getattr(args, "stream", False),
+                # Flag forces it on; otherwise config.yaml pipeline.enabled decides
+                pipeline=getattr(args, "pipeline", False) or None,
             )
     except StateLockError as e:
         set_console_quiet(False)
@@ -21,8 +21,9 @@ from shelfr.utils.state import (
     get_stats,
     is_failed,
     is_processed,
-    load_state,
     prune_stale_entries,
+    read_state,
+    state_batch,
     update_state,
 )
 
@@ -50,7 +51,7 @@ def cmd_state_list(args: argparse.Namespace) -> int:
         StateLockError: If unable to acquire state file lock.
         OSError: If state file cannot be read due to permissions or IO error.
     """
-    state = load_state()
+    state = read_state()
     stats = get_stats()
 
     # Determine what to show
@@ -135,6 +136,13 @@ def cmd_state_prune(args: argparse.Namespace) -> int:
     """Prune stale entries from state."""
     dry_run = args.dry_run
 
+    # Scan and prune under one state batch instead of re-reading per step
+    with state_batch():
+        return _prune_stale(dry_run)
+
+
+def _prune_stale(dry_run: bool) -> int:
+    """Report stale entries and remove them unless ``dry_run``."""
     # Find stale entries
     stale = find_stale_entries()
 
@@ -214,7 +222,7 @@ def cmd_state_clear(args: argparse.Namespace) -> int:
             del state["processed"][identifier]
             logger.info("Cleared processed state for: %s", identifier)
 
-    update_state(_clear)
+    update_state(_clear, keys=[identifier])
     print_success(f"Cleared processed state for: {identifier}")
     print_info("The release will be fully re-processed on next run")
 
@@ -225,7 +233,8 @@ def cmd_state_export(args: argparse.Namespace) -> int:
     """Export state to JSON file."""
     from pathlib import Path
 
-    state = load_state()
+    # Shallow copy: json can't serialize the read-only view itself
+    state = dict(read_state())
     output_path = args.output
 
     if output_path:
@@ -38,7 +38,7 @@ def cmd_status(args: argparse.Namespace) -> int:
     """Show status."""
     from shelfr.config import reload_settings
     from shelfr.ui.banner import print_banner
-    from shelfr.utils.state import get_stats, load_state
+    from shelfr.utils.state import get_stats, read_state
 
     print_banner(console)
     print_header("Status")
@@ -80,7 +80,7 @@ def cmd_status(args: argparse.Namespace) -> int:
         print_directory_status("Torrents", torrent_out, False)
 
     # Recent processed/failed
-    state = load_state()
+    state = read_state()
     processed = state.get("processed", {})
     failed = state.get("failed", {})
 
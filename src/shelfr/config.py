@@ -11,7 +11,7 @@ Settings are loaded from three sources:
    - mkbrr: image, preset, host_data_root, container_data_root, etc.
    - qbittorrent: category, tags, auto_start
    - audnex: base_url, timeout_seconds
-   - mediainfo: binary
+   - mediainfo: binary, cache_enabled, native_mp4
    - filters: remove_book_numbers, transliterate_japanese
    - environment: can override any .env variable (see below)
 
@@ -153,6 +153,14 @@ class AudnexConfig:
     # Preferred ASIN region - when ASIN found in different region, use ABS search
     # to find the preferred region's ASIN. Set to None to disable normalization.
     preferred_asin_region: str | None = DEFAULT_ASIN_REGION
+    # Book lookups: regions queried at once (1 = one after another), and the
+    # delay before starting the next one while earlier regions are pending
+    hedge_regions: int = 1
+    hedge_delay_ms: int = 0
+    # Disk cache of book/chapter/author responses (see metadata/audnex/cache.py)
+    cache_enabled: bool = True
+    cache_ttl_days: float = 30  # Then revalidated with ETag/Last-Modified
+    cache_negative_ttl_hours: float = 24  # How long a 404 is remembered
 
 
 @dataclass
@@ -160,6 +168,32 @@ class MediaInfoConfig:
     """MediaInfo settings (from config.yaml mediainfo section)."""
 
     binary: str = "mediainfo"
+    cache_enabled: bool = True  # Reuse probes of unchanged files (cache_dir/mediainfo.db)
+    native_mp4: bool = True  # Read MP4/M4B headers in-process for trumping/ASIN/format checks
+
+
+@dataclass
+class PipelineStageConfig:
+    """Worker threads and queue bound for one pipeline stage."""
+
+    workers: int = 1
+    queue_size: int = 2  # Releases allowed to wait for this stage
+
+
+@dataclass
+class PipelineConfig:
+    """Pipelined executor settings (from config.yaml pipeline section).
+
+    When enabled, `shelfr run` overlaps releases: each stage runs on its own
+    worker threads, so one release's metadata fetch can run while another's
+    torrent is being hashed.
+    """
+
+    enabled: bool = False
+    staging: PipelineStageConfig = field(default_factory=PipelineStageConfig)
+    metadata: PipelineStageConfig = field(default_factory=lambda: PipelineStageConfig(workers=2))
+    torrent: PipelineStageConfig = field(default_factory=PipelineStageConfig)
+    upload: PipelineStageConfig = field(default_factory=PipelineStageConfig)
 
 
 @dataclass
@@ -445,6 +479,8 @@ class AudiobookshelfImportConfig:
     metadata_json_fallback: bool = True
     # Generate metadata.opf sidecar for Audiobookshelf (Calibre-compatible OPF)
     generate_opf_sidecar: bool = False
+    # Books imported at once (1 = one after another)
+    workers: int = 1
 
 
 @dataclass
@@ -459,6 +495,17 @@ class AudiobookshelfConfig:
     api_key: str = ""
     # Connection timeout
     timeout_seconds: int = 30
+    # Items per library page request
+    page_size: int = 500
+    # Library pages fetched at once after the first
+    page_workers: int = 4
+    # Keep library listings on disk and refresh them incrementally by updatedAt
+    snapshot_enabled: bool = True
+    # Cache metadata searches (title/author -> results) on disk
+    search_cache_enabled: bool = True
+    search_cache_ttl_hours: int = 168
+    # Searches in flight at once per ABS server (across threads)
+    search_concurrency: int = 4
     # Whether ABS runs in Docker (requires path mapping)
     docker_mode: bool = True
     # Container-to-host path mappings
@@ -467,8 +514,12 @@ class AudiobookshelfConfig:
     libraries: list[AudiobookshelfLibrary] = field(default_factory=list)
     # Import settings
     import_settings: AudiobookshelfImportConfig = field(default_factory=AudiobookshelfImportConfig)
+    # Persistent ASIN/title/author index of library items (see abs/library_index.py)
+    index_enabled: bool = True
     # Index database path
     index_db: str = "./data/abs_index.db"
+    # Reuse ASIN resolutions of unchanged folders (see abs/resolution_cache.py)
+    resolution_cache_enabled: bool = True
 
 
 @dataclass
@@ -499,6 +550,7 @@ class Settings:
     categories: CategoriesConfig
     naming: NamingConfig
     audiobookshelf: AudiobookshelfConfig = field(default_factory=AudiobookshelfConfig)
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
 
 
 def validate_url(url: str, field_name: str) -> None:
@@ -723,6 +775,34 @@ def validate_settings(settings: Settings) -> list[str]:
     return warnings
 
 
+def _parse_pipeline_config(data: dict[str, Any]) -> PipelineConfig:
+    """Parse pipelined executor config from YAML data.
+
+    Args:
+        data: Dict from YAML pipeline section
+
+    Returns:
+        PipelineConfig with values from YAML or defaults
+    """
+    defaults = PipelineConfig()
+
+    def stage(name: str) -> PipelineStageConfig:
+        default: PipelineStageConfig = getattr(defaults, name)
+        stage_data = data.get(name) or {}
+        return PipelineStageConfig(
+            workers=stage_data.get("workers", default.workers),
+            queue_size=stage_data.get("queue_size", default.queue_size),
+        )
+
+    return PipelineConfig(
+        enabled=data.get("enabled", False),
+        staging=stage("staging"),
+        metadata=stage("metadata"),
+        torrent=stage("torrent"),
+        upload=stage("upload"),
+    )
+
+
 def _parse_trumping_config(data: dict[str, Any]) -> TrumpingConfig:
     """Parse trumping config from YAML data.
 
@@ -1134,12 +1214,19 @@ def load_settings(
         timeout_seconds=audnex_data.get("timeout_seconds", 30),
         regions=validated_regions,
         preferred_asin_region=validated_preferred,
+        hedge_regions=audnex_data.get("hedge_regions", 1),
+        hedge_delay_ms=audnex_data.get("hedge_delay_ms", 0),
+        cache_enabled=audnex_data.get("cache_enabled", True),
+        cache_ttl_days=audnex_data.get("cache_ttl_days", 30),
+        cache_negative_ttl_hours=audnex_data.get("cache_negative_ttl_hours", 24),
     )
 
     # Parse MediaInfo config
     mediainfo_data = yaml_config.get("mediainfo", {})
     mediainfo = MediaInfoConfig(
         binary=mediainfo_data.get("binary", "mediainfo"),
+        cache_enabled=mediainfo_data.get("cache_enabled", True),
+        native_mp4=mediainfo_data.get("native_mp4", True),
     )
 
     # Parse Libation config
@@ -1241,6 +1328,12 @@ def load_settings(
         host=env_settings.abs.host,
         api_key=env_settings.abs.api_key,
         timeout_seconds=abs_data.get("timeout_seconds", 30),
+        page_size=abs_data.get("page_size", 500),
+        page_workers=abs_data.get("page_workers", 4),
+        snapshot_enabled=abs_data.get("snapshot_enabled", True),
+        search_cache_enabled=abs_data.get("search_cache_enabled", True),
+        search_cache_ttl_hours=abs_data.get("search_cache_ttl_hours", 168),
+        search_concurrency=abs_data.get("search_concurrency", 4),
         docker_mode=abs_data.get("docker_mode", True),
         path_map=abs_path_map,
         libraries=abs_libraries,
@@ -1257,8 +1350,11 @@ def load_settings(
             generate_metadata_json=abs_import_data.get("generate_metadata_json", True),
             metadata_json_fallback=abs_import_data.get("metadata_json_fallback", True),
             generate_opf_sidecar=abs_import_data.get("generate_opf_sidecar", False),
+            workers=abs_import_data.get("workers", 1),
         ),
+        index_enabled=abs_data.get("index_enabled", True),
         index_db=abs_data.get("index_db", "./data/abs_index.db"),
+        resolution_cache_enabled=abs_data.get("resolution_cache_enabled", True),
     )
 
     # Parse environment section (YAML overrides pydantic-settings values)
@@ -1286,6 +1382,7 @@ def load_settings(
         categories=categories,
         naming=naming,
         audiobookshelf=audiobookshelf,
+        pipeline=_parse_pipeline_config(yaml_config.get("pipeline") or {}),
     )
 
     # Comprehensive validation if requested
@@ -18,9 +18,12 @@ Additional metadata comes from metadata.json if present.
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
+import os
 import re
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -30,6 +33,7 @@ from shelfr.config import get_settings
 from shelfr.models import AudiobookRelease, ReleaseStatus
 from shelfr.utils.fuzzy import find_duplicates, similarity_ratio
 from shelfr.utils.state import get_processed_identifiers
+from shelfr.utils.walk import AudioFolder, iter_audio_folders
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,12 @@ FOLDER_PATTERN = re.compile(
     r"(?:\s+\[(?P<source>[^\]]+)\])?$"  # [Source]
 )
 
+# Libation book folders are recognized by their .m4b files
+LIBRARY_AUDIO_EXTENSIONS = frozenset({".m4b"})
+
+# Threads used to list author folders in parallel (helps on network shares)
+DISCOVERY_WALK_WORKERS = 4
+
 
 @dataclass
 class LibationMetadata:
@@ -157,6 +167,14 @@ def find_metadata_file(audiobook_dir: Path) -> Path | None:
     return None
 
 
+def _metadata_file_from_names(audiobook_dir: Path, file_names: Sequence[str]) -> Path | None:
+    """Pick the *.metadata.json file from an existing directory listing."""
+    for name in file_names:
+        if name.endswith(".metadata.json"):
+            return audiobook_dir / name
+    return None
+
+
 def load_metadata_json(metadata_path: Path) -> LibationMetadata | None:
     """
     Load and parse Libation's *.metadata.json file.
@@ -271,48 +289,57 @@ def is_audiobook_dir(path: Path) -> bool:
     return any(item.is_file() and item.suffix.lower() == ".m4b" for item in path.iterdir())
 
 
-def find_audiobook_dirs(library_root: Path) -> list[Path]:
+def iter_audiobook_folders(library_root: Path, *, workers: int = 1) -> Iterator[AudioFolder]:
     """
-    Find all directories containing audiobooks in the library.
+    Yield audiobook folders in the library, with their file listings.
 
-    Walks the tree and returns paths to directories containing .m4b files.
-    """
-    audiobook_dirs = []
+    Structure: Author/Series/Book or Author/Book. The first folder on each
+    path (up to three levels deep) that contains .m4b files is the book.
+
+    Args:
+        library_root: Path to library root
+        workers: Threads used to walk author folders in parallel
 
+    Yields:
+        Audiobook folders in directory-listing order, as they are found
+    """
     if not library_root.exists():
         logger.error(f"Library root does not exist: {library_root}")
-        return []
+        return
 
-    # Walk the tree to find audiobook directories
-    # Structure: Author/Series/Book or Author/Book
-    for author_dir in library_root.iterdir():
-        if not author_dir.is_dir():
-            continue
+    yield from iter_audio_folders(
+        library_root,
+        LIBRARY_AUDIO_EXTENSIONS,
+        max_depth=3,
+        stop_at_match=True,
+        workers=workers,
+    )
 
-        # Check if this level has audiobooks (no series subfolder)
-        if is_audiobook_dir(author_dir):
-            audiobook_dirs.append(author_dir)
-            continue
 
-        # Look one level deeper (series or book level)
-        for series_or_book_dir in author_dir.iterdir():
-            if not series_or_book_dir.is_dir():
-                continue
+def find_audiobook_folders(library_root: Path, *, workers: int = 1) -> list[AudioFolder]:
+    """
+    Find all audiobook folders in the library, with their file listings.
 
-            if is_audiobook_dir(series_or_book_dir):
-                audiobook_dirs.append(series_or_book_dir)
-                continue
+    List form of iter_audiobook_folders().
+    """
+    folders = list(iter_audiobook_folders(library_root, workers=workers))
+    logger.debug(f"Found {len(folders)} audiobook directories")
+    return folders
 
-            # Look one more level (book level under series)
-            for book_dir in series_or_book_dir.iterdir():
-                if is_audiobook_dir(book_dir):
-                    audiobook_dirs.append(book_dir)
 
-    logger.debug(f"Found {len(audiobook_dirs)} audiobook directories")
-    return audiobook_dirs
+def find_audiobook_dirs(library_root: Path) -> list[Path]:
+    """
+    Find all directories containing audiobooks in the library.
+
+    Walks the tree and returns paths to directories containing .m4b files.
+    """
+    return [folder.path for folder in find_audiobook_folders(library_root)]
 
 
-def build_release_from_dir(audiobook_dir: Path) -> AudiobookRelease:
+def build_release_from_dir(
+    audiobook_dir: Path,
+    file_names: Sequence[str] | None = None,
+) -> AudiobookRelease:
     """
     Build an AudiobookRelease from an audiobook directory.
 
@@ -322,6 +349,8 @@ def build_release_from_dir(audiobook_dir: Path) -> AudiobookRelease:
 
     Args:
         audiobook_dir: Path to the audiobook directory containing .m4b files
+        file_names: Names of the regular files in the directory, if already
+            listed (e.g. by the discovery walker); listed here otherwise
 
     Returns:
         AudiobookRelease with extracted metadata
@@ -331,8 +360,11 @@ def build_release_from_dir(audiobook_dir: Path) -> AudiobookRelease:
     # Parse folder name for fallback values
     folder_info = parse_folder_name(audiobook_dir.name)
 
+    if file_names is None:
+        file_names = [item.name for item in audiobook_dir.iterdir() if item.is_file()]
+
     # Find and load *.metadata.json (e.g., "BookTitle {ASIN.XXX}.metadata.json")
-    metadata_path = find_metadata_file(audiobook_dir)
+    metadata_path = _metadata_file_from_names(audiobook_dir, file_names)
     libation_meta = load_metadata_json(metadata_path) if metadata_path else None
 
     if libation_meta:
@@ -383,10 +415,9 @@ def build_release_from_dir(audiobook_dir: Path) -> AudiobookRelease:
     allowed_exts = {ext.lower() for ext in settings.mam.allowed_extensions}
 
     release.files = [
-        item
-        for item in audiobook_dir.iterdir()
-        if item.is_file()
-        and (item.suffix.lower() in allowed_exts or item.name.lower() == "cover.jpg")
+        audiobook_dir / name
+        for name in file_names
+        if os.path.splitext(name)[1].lower() in allowed_exts or name.lower() == "cover.jpg"
     ]
 
     # Find main m4b
@@ -397,15 +428,189 @@ def build_release_from_dir(audiobook_dir: Path) -> AudiobookRelease:
     return release
 
 
-def scan_library(library_root: Path | None = None) -> list[AudiobookRelease]:
+# =============================================================================
+# Discovery Cache - Reuse releases built from unchanged book folders
+# =============================================================================
+
+DISCOVERY_CACHE_VERSION = 1
+
+# AudiobookRelease fields restored from the discovery cache
+_CACHED_RELEASE_FIELDS = (
+    "asin",
+    "title",
+    "author",
+    "narrator",
+    "series",
+    "series_position",
+    "year",
+)
+
+
+def _dir_signature(audiobook_dir: Path, metadata_name: str | None) -> list[Any] | None:
     """
-    Scan Libation library and return all audiobook releases found.
+    Identify the state of a book folder for cache validation.
+
+    Adding, removing or renaming files changes the folder mtime; the metadata
+    file's size/mtime catches in-place edits that don't touch the folder.
+    """
+    try:
+        dir_mtime = os.stat(audiobook_dir).st_mtime_ns
+        if metadata_name is None:
+            return [dir_mtime, None, None, None]
+        meta_stat = os.stat(audiobook_dir / metadata_name)
+    except OSError:
+        return None
+    return [dir_mtime, metadata_name, meta_stat.st_size, meta_stat.st_mtime_ns]
+
+
+class DiscoveryCache:
+    """
+    Persistent cache of releases built by build_release_from_dir().
+
+    Entries are keyed by book folder path and validated against the folder
+    mtime plus the size/mtime of its *.metadata.json, so unchanged folders
+    cost two stat() calls instead of a directory listing and a JSON parse.
+    One cache file is kept per library root under the shelfr cache directory.
+    """
+
+    def __init__(self, path: Path, allowed_extensions: list[str]) -> None:
+        self.path = path
+        self.allowed_extensions = sorted(ext.lower() for ext in allowed_extensions)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_library(cls, library_root: Path) -> DiscoveryCache:
+        """Open the cache file for a library root."""
+        from shelfr.paths import cache_dir
+
+        settings = get_settings()
+        root_key = hashlib.sha1(str(library_root.resolve()).encode()).hexdigest()[:16]
+        cache = cls(
+            cache_dir() / "discovery" / f"{root_key}.json",
+            list(settings.mam.allowed_extensions),
+        )
+        cache.load()
+        return cache
+
+    def load(self) -> None:
+        """Load entries from disk; a missing, corrupt or outdated cache starts empty."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable discovery cache {self.path}: {e}")
+            return
+
+        if (
+            data.get("version") != DISCOVERY_CACHE_VERSION
+            or data.get("allowed_extensions") != self.allowed_extensions
+        ):
+            logger.debug(f"Discarding outdated discovery cache: {self.path}")
+            self._dirty = True
+            return
+        self._entries = data.get("entries", {})
+
+    def get(self, audiobook_dir: Path) -> AudiobookRelease | None:
+        """Get the cached release for a folder, or None if missing or stale."""
+        key = str(audiobook_dir)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict) or _dir_signature(
+            audiobook_dir, entry.get("metadata")
+        ) != entry.get("signature"):
+            self.misses += 1
+            return None
+
+        release = AudiobookRelease()
+        release.source_dir = audiobook_dir
+        release.discovered_at = datetime.now()
+        release.status = ReleaseStatus.DISCOVERED
+        try:
+            for name in _CACHED_RELEASE_FIELDS:
+                setattr(release, name, entry["release"].get(name))
+            release.files = [audiobook_dir / name for name in entry["release"]["files"]]
+            main_m4b = entry["release"].get("main_m4b")
+        except (KeyError, TypeError, AttributeError):
+            self.misses += 1
+            return None
+        release.main_m4b = audiobook_dir / main_m4b if main_m4b else None
+        self.hits += 1
+        return release
+
+    def signature(self, audiobook_dir: Path, file_names: Sequence[str]) -> list[Any] | None:
+        """Compute a folder's signature before building its release."""
+        metadata_path = _metadata_file_from_names(audiobook_dir, file_names)
+        return _dir_signature(audiobook_dir, metadata_path.name if metadata_path else None)
+
+    def put(self, release: AudiobookRelease, signature: list[Any] | None) -> None:
+        """Store a freshly built release under the signature taken before building it."""
+        if release.source_dir is None or signature is None:
+            return
+        key = str(release.source_dir)
+        self._seen.add(key)
+        fields: dict[str, Any] = {name: getattr(release, name) for name in _CACHED_RELEASE_FIELDS}
+        fields["files"] = [f.name for f in release.files]
+        fields["main_m4b"] = release.main_m4b.name if release.main_m4b else None
+        self._entries[key] = {"signature": signature, "metadata": signature[1], "release": fields}
+        self._dirty = True
+
+    def save(self, *, prune: bool = True) -> None:
+        """
+        Write the cache.
+
+        Args:
+            prune: Drop folders that weren't seen in this scan. Only valid
+                after a complete walk; pass False when the scan stopped early.
+        """
+        stale = self._entries.keys() - self._seen if prune else set()
+        for key in stale:
+            del self._entries[key]
+        if not (self._dirty or stale):
+            return
+
+        data = {
+            "version": DISCOVERY_CACHE_VERSION,
+            "allowed_extensions": self.allowed_extensions,
+            "entries": self._entries,
+        }
+        temp_file = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_file, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write discovery cache {self.path}: {e}")
+            return
+        self._dirty = False
+
+
+def iter_releases(
+    library_root: Path | None = None,
+    *,
+    new_only: bool = False,
+    use_cache: bool = True,
+) -> Iterator[AudiobookRelease]:
+    """
+    Yield audiobook releases from the Libation library as they are found.
+
+    The walk is lazy: the first release is available as soon as its folder
+    has been listed, so callers can start processing while the rest of the
+    library is still being scanned. Releases for folders that haven't
+    changed since the last scan come from the DiscoveryCache; only new or
+    changed folders are parsed.
 
     Args:
         library_root: Path to library root. Uses config default if None.
+        new_only: Skip releases already recorded as processed in state.
+        use_cache: Reuse and update the persistent discovery cache.
 
-    Returns:
-        List of AudiobookRelease objects for all found audiobooks.
+    Yields:
+        AudiobookRelease objects in directory-listing order.
     """
     if library_root is None:
         settings = get_settings()
@@ -413,17 +618,67 @@ def scan_library(library_root: Path | None = None) -> list[AudiobookRelease]:
 
     logger.info(f"Scanning library: {library_root}")
 
-    audiobook_dirs = find_audiobook_dirs(library_root)
+    processed = get_processed_identifiers() if new_only else set()
+    cache: DiscoveryCache | None = None
+    complete = False
+
+    try:
+        for folder in iter_audiobook_folders(library_root, workers=DISCOVERY_WALK_WORKERS):
+            if use_cache and cache is None:
+                cache = DiscoveryCache.for_library(library_root)
+
+            audiobook_dir = folder.path
+            try:
+                release = cache.get(audiobook_dir) if cache else None
+                if release is None:
+                    signature = cache.signature(audiobook_dir, folder.files) if cache else None
+                    release = build_release_from_dir(audiobook_dir, folder.files)
+                    if cache:
+                        cache.put(release, signature)
+            except Exception as e:
+                logger.warning(f"Error processing {audiobook_dir}: {e}")
+                continue
 
-    releases = []
-    for audiobook_dir in audiobook_dirs:
-        try:
-            release = build_release_from_dir(audiobook_dir)
-            releases.append(release)
             logger.debug(f"Found: {release.display_name} (ASIN: {release.asin})")
-        except Exception as e:
-            logger.warning(f"Error processing {audiobook_dir}: {e}")
 
+            if new_only:
+                # Check by ASIN (preferred) or source_dir path
+                identifier = release.asin or str(release.source_dir)
+                if identifier in processed:
+                    logger.debug(f"Skipping (already processed): {release.display_name}")
+                    continue
+
+                # Also check by path in case ASIN changed
+                if str(release.source_dir) in processed:
+                    logger.debug(f"Skipping (path already processed): {release.display_name}")
+                    continue
+
+            yield release
+        complete = True
+    finally:
+        if cache:
+            cache.save(prune=complete)
+            logger.debug(f"Discovery cache: {cache.hits} reused, {cache.misses} rebuilt")
+
+
+def scan_library(
+    library_root: Path | None = None,
+    *,
+    use_cache: bool = True,
+) -> list[AudiobookRelease]:
+    """
+    Scan Libation library and return all audiobook releases found.
+
+    List form of iter_releases().
+
+    Args:
+        library_root: Path to library root. Uses config default if None.
+        use_cache: Reuse and update the persistent discovery cache.
+
+    Returns:
+        List of AudiobookRelease objects for all found audiobooks.
+    """
+    releases = list(iter_releases(library_root, use_cache=use_cache))
     logger.info(f"Found {len(releases)} audiobook(s) in library")
     return releases
 
@@ -444,29 +699,7 @@ def get_new_releases(
     Returns:
         List of unprocessed AudiobookRelease objects.
     """
-    # Get all releases
-    all_releases = scan_library(library_root)
-
-    # Get already processed identifiers
-    processed = get_processed_identifiers()
-
-    # Filter to new releases
-    new_releases = []
-    for release in all_releases:
-        # Check by ASIN (preferred) or source_dir path
-        identifier = release.asin or str(release.source_dir)
-
-        if identifier in processed:
-            logger.debug(f"Skipping (already processed): {release.display_name}")
-            continue
-
-        # Also check by path in case ASIN changed
-        if str(release.source_dir) in processed:
-            logger.debug(f"Skipping (path already processed): {release.display_name}")
-            continue
-
-        new_releases.append(release)
-
+    new_releases = list(iter_releases(library_root, new_only=True))
     logger.info(f"Found {len(new_releases)} new (unprocessed) release(s)")
     return new_releases
 
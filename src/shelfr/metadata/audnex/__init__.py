@@ -9,6 +9,10 @@ Public API:
     fetch_audnex_author: Fetch author metadata by ASIN
     fetch_audnex_chapters: Fetch chapter data by ASIN
     save_audnex_json: Save Audnex response to JSON file
+    get_audnex_client: Shared pooled HTTP/2 client (sync)
+    get_audnex_async_client: Shared pooled HTTP/2 client (async)
+    close_audnex_clients: Close the shared clients
+    prefetch_audnex: Async batch lookup that warms the response cache
 """
 
 from __future__ import annotations
@@ -32,6 +36,18 @@ from shelfr.metadata.audnex.client import (
 from shelfr.metadata.audnex.client import (
     save_audnex_json as save_audnex_json,
 )
+from shelfr.metadata.audnex.http import (
+    close_audnex_clients as close_audnex_clients,
+)
+from shelfr.metadata.audnex.http import (
+    get_audnex_async_client as get_audnex_async_client,
+)
+from shelfr.metadata.audnex.http import (
+    get_audnex_client as get_audnex_client,
+)
+from shelfr.metadata.audnex.prefetch import (
+    prefetch_audnex as prefetch_audnex,
+)
 
 __all__ = [
     # Public API
@@ -39,6 +55,10 @@ __all__ = [
     "fetch_audnex_book",
     "fetch_audnex_chapters",
     "save_audnex_json",
+    "get_audnex_client",
+    "get_audnex_async_client",
+    "close_audnex_clients",
+    "prefetch_audnex",
     # Private (for testing/backward compat)
     "_fetch_audnex_book_region",
     "_fetch_audnex_chapters_region",
@@ -0,0 +1,334 @@
+"""
+Disk cache for Audnex API responses.
+
+Book, chapter and author responses are stored one JSON file per
+(endpoint, ASIN, region) under ``cache_dir()/audnex``. Re-running an import
+or rename for books that were already looked up costs a file read instead of
+an HTTP round trip.
+
+- Entries are fresh for ``audnex.cache_ttl_days``. Once expired, the stored
+  ETag/Last-Modified are sent back to Audnex; a 304 renews the entry without
+  re-downloading the body.
+- A 404 is cached as a negative entry for ``audnex.cache_negative_ttl_hours``,
+  so region fallback doesn't re-probe regions an ASIN isn't sold in.
+- Errors (401/403/429/5xx, timeouts) are never cached.
+
+Managed with ``shelfr cache stats|prune|clear``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from shelfr.config import get_settings
+from shelfr.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+AUDNEX_CACHE_VERSION = 1
+
+# Cached Audnex endpoints: /books/{asin}, /books/{asin}/chapters, /authors/{asin}
+AUDNEX_ENDPOINTS = ("book", "chapters", "author")
+
+
+@dataclass
+class AudnexCacheEntry:
+    """One cached Audnex response (``data`` is None for a cached 404)."""
+
+    endpoint: str
+    asin: str
+    region: str
+    status: int
+    data: dict[str, Any] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def negative(self) -> bool:
+        """True for a cached "not found"."""
+        return self.status == 404
+
+    def is_fresh(self, ttl: float, negative_ttl: float, now: float | None = None) -> bool:
+        """Whether the entry can be used without asking Audnex."""
+        age = (time.time() if now is None else now) - self.fetched_at
+        return age < (negative_ttl if self.negative else ttl)
+
+    def revalidation_headers(self) -> dict[str, str]:
+        """Conditional request headers for an expired positive entry."""
+        if self.negative:
+            return {}
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON form written to disk."""
+        return {
+            "version": AUDNEX_CACHE_VERSION,
+            "endpoint": self.endpoint,
+            "asin": self.asin,
+            "region": self.region,
+            "status": self.status,
+            "data": self.data,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> AudnexCacheEntry | None:
+        """Parse a cache file's JSON; None if it's from another version or malformed."""
+        if raw.get("version") != AUDNEX_CACHE_VERSION:
+            return None
+        try:
+            return cls(
+                endpoint=str(raw["endpoint"]),
+                asin=str(raw["asin"]),
+                region=str(raw["region"]),
+                status=int(raw["status"]),
+                data=raw.get("data"),
+                etag=raw.get("etag"),
+                last_modified=raw.get("last_modified"),
+                fetched_at=float(raw["fetched_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True)
+class AudnexCacheStats:
+    """Summary of the cache contents for ``shelfr cache stats``."""
+
+    entries: int = 0
+    negative: int = 0
+    expired: int = 0
+    invalid: int = 0
+    size_bytes: int = 0
+    by_endpoint: dict[str, int] = field(default_factory=dict)
+
+
+class AudnexCache:
+    """
+    Audnex responses on disk, one file per (endpoint, ASIN, region).
+
+    Safe to share between threads: each entry is written to a temp file and
+    renamed into place, so readers never see a partial file.
+    """
+
+    def __init__(self, root: Path, *, ttl: float, negative_ttl: float) -> None:
+        self.root = root
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, endpoint: str, asin: str, region: str) -> Path:
+        """File holding the entry for an (endpoint, ASIN, region)."""
+        return self.root / endpoint / region.lower() / f"{asin.upper()}.json"
+
+    # -------------------------------------------------------------------------
+    # Lookup and store
+    # -------------------------------------------------------------------------
+
+    def get(self, endpoint: str, asin: str, region: str) -> AudnexCacheEntry | None:
+        """
+        Stored entry, fresh or expired (None if there is none).
+
+        Fresh entries count as hits; expired or missing ones as misses.
+        """
+        entry = self._read(self.path_for(endpoint, asin, region))
+        fresh = entry is not None and self.is_fresh(entry)
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry
+
+    def is_fresh(self, entry: AudnexCacheEntry, now: float | None = None) -> bool:
+        """Whether an entry can be used without asking Audnex."""
+        return entry.is_fresh(self.ttl, self.negative_ttl, now)
+
+    def put(
+        self,
+        endpoint: str,
+        asin: str,
+        region: str,
+        data: dict[str, Any],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> AudnexCacheEntry:
+        """Store a 200 response."""
+        entry = AudnexCacheEntry(
+            endpoint, asin, region, 200, data, etag=etag, last_modified=last_modified
+        )
+        self._write(entry)
+        return entry
+
+    def put_missing(self, endpoint: str, asin: str, region: str) -> AudnexCacheEntry:
+        """Store a 404 as a negative entry."""
+        entry = AudnexCacheEntry(endpoint, asin, region, 404)
+        self._write(entry)
+        return entry
+
+    def renew(self, entry: AudnexCacheEntry) -> AudnexCacheEntry:
+        """Mark an entry fresh again after Audnex answered 304 Not Modified."""
+        entry.fetched_at = time.time()
+        self._write(entry)
+        return entry
+
+    def _read(self, path: Path) -> AudnexCacheEntry | None:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable Audnex cache entry {path}: {e}")
+            return None
+        return AudnexCacheEntry.from_dict(raw) if isinstance(raw, dict) else None
+
+    def _write(self, entry: AudnexCacheEntry) -> None:
+        path = self.path_for(entry.endpoint, entry.asin, entry.region)
+        temp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(entry.to_dict(), ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_file, path)
+        except OSError as e:
+            logger.warning(f"Could not write Audnex cache entry {path}: {e}")
+            temp_file.unlink(missing_ok=True)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _files(self, endpoint: str | None = None) -> Iterator[Path]:
+        endpoints = (endpoint,) if endpoint else AUDNEX_ENDPOINTS
+        for name in endpoints:
+            yield from sorted((self.root / name).glob("*/*.json"))
+
+    def stats(self) -> AudnexCacheStats:
+        """Count entries per endpoint, negative and expired entries, and disk usage."""
+        now = time.time()
+        entries = negative = expired = invalid = size = 0
+        by_endpoint = dict.fromkeys(AUDNEX_ENDPOINTS, 0)
+        for path in self._files():
+            try:
+                size += path.stat().st_size
+            except OSError:
+                continue
+            entry = self._read(path)
+            if entry is None:
+                invalid += 1
+                continue
+            entries += 1
+            by_endpoint[path.parent.parent.name] += 1
+            negative += entry.negative
+            expired += not self.is_fresh(entry, now)
+        return AudnexCacheStats(
+            entries=entries,
+            negative=negative,
+            expired=expired,
+            invalid=invalid,
+            size_bytes=size,
+            by_endpoint=by_endpoint,
+        )
+
+    def prune(self, *, dry_run: bool = False) -> int:
+        """
+        Remove expired and unreadable entries.
+
+        Args:
+            dry_run: Only count what would be removed
+
+        Returns:
+            Number of entries removed (or that would be removed)
+        """
+        now = time.time()
+        removed = 0
+        for path in self._files():
+            entry = self._read(path)
+            if entry is not None and self.is_fresh(entry, now):
+                continue
+            removed += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+        return removed
+
+    def clear(self, endpoint: str | None = None, *, dry_run: bool = False) -> int:
+        """
+        Remove every entry, or only one endpoint's.
+
+        Returns:
+            Number of entries removed (or that would be removed)
+        """
+        removed = 0
+        for path in self._files(endpoint):
+            removed += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+        return removed
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+_cache: AudnexCache | None = None
+_cache_lock = threading.Lock()
+
+
+def open_audnex_cache() -> AudnexCache:
+    """Cache for the configured cache dir and TTLs, whether or not caching is enabled."""
+    from shelfr.paths import cache_dir
+
+    config = get_settings().audnex
+    return AudnexCache(
+        cache_dir() / "audnex",
+        ttl=config.cache_ttl_days * 86400,
+        negative_ttl=config.cache_negative_ttl_hours * 3600,
+    )
+
+
+def get_audnex_cache() -> AudnexCache | None:
+    """
+    Shared cache used by the Audnex client.
+
+    Returns:
+        The cache, or None when ``audnex.cache_enabled`` is false or no
+        config can be loaded.
+    """
+    global _cache
+    try:
+        enabled = get_settings().audnex.cache_enabled
+    except (FileNotFoundError, ConfigurationError) as e:
+        logger.debug(f"Audnex cache unavailable without settings: {e}")
+        return None
+    if not enabled:
+        return None
+
+    candidate = open_audnex_cache()
+    with _cache_lock:
+        # Rebuilt when the cache dir or TTLs change (config reload, tests)
+        if (
+            _cache is None
+            or _cache.root != candidate.root
+            or _cache.ttl != candidate.ttl
+            or _cache.negative_ttl != candidate.negative_ttl
+        ):
+            _cache = candidate
+        return _cache
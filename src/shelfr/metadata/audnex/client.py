@@ -7,13 +7,23 @@ Audnex API: https://api.audnex.us
 - GET /authors/{asin} - Get author info
 
 All functions support region fallback - they try configured regions in order
-until one succeeds. Some ASINs are region-specific.
+until one succeeds. Some ASINs are region-specific. The region an ASIN was
+found in is remembered, so its chapter lookup goes there first, and book
+lookups can probe several regions at once (audnex.hedge_regions).
+
+Requests go through one pooled HTTP/2 client (shelfr.metadata.audnex.http)
+and responses are cached on disk per (endpoint, ASIN, region); see
+shelfr.metadata.audnex.cache.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +31,8 @@ import httpx
 from pydantic import ValidationError
 
 from shelfr.config import get_settings
+from shelfr.metadata.audnex.cache import AudnexCache, AudnexCacheEntry, get_audnex_cache
+from shelfr.metadata.audnex.http import get_audnex_client
 from shelfr.schemas.audnex import validate_audnex_book, validate_audnex_chapters
 from shelfr.utils.circuit_breaker import CircuitOpenError, audnex_breaker
 from shelfr.utils.retry import NETWORK_EXCEPTIONS, retry_with_backoff
@@ -28,6 +40,44 @@ from shelfr.utils.retry import NETWORK_EXCEPTIONS, retry_with_backoff
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+
+def _cache_lookup(
+    endpoint: str, asin: str, region: str
+) -> tuple[AudnexCache | None, AudnexCacheEntry | None]:
+    """Cache and stored entry for a request (entry is None on a cold cache)."""
+    cache = get_audnex_cache()
+    if cache is None:
+        return None, None
+    return cache, cache.get(endpoint, asin, region)
+
+
+def _cache_response(
+    cache: AudnexCache | None,
+    endpoint: str,
+    asin: str,
+    region: str,
+    response: httpx.Response,
+    data: dict[str, Any],
+) -> None:
+    """Store a 200 response with its validators for later revalidation."""
+    if cache is None:
+        return
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    cache.put(
+        endpoint,
+        asin,
+        region,
+        data,
+        etag=etag if isinstance(etag, str) else None,
+        last_modified=last_modified if isinstance(last_modified, str) else None,
+    )
+
+
 # =============================================================================
 # Book Metadata
 # =============================================================================
@@ -67,16 +117,28 @@ def _fetch_audnex_book_region(
     url = f"{base_url}/books/{asin}"
     params = {"region": region}
 
+    cache, cached = _cache_lookup("book", asin, region)
+    if cache and cached and cache.is_fresh(cached):
+        logger.debug(f"Audnex cache hit: book {asin} (region={region})")
+        return cached.data
+    headers = cached.revalidation_headers() if cached else {}
+
     logger.debug(f"Fetching Audnex metadata: {url} (region={region})")
 
     # Circuit breaker protects against cascading failures
     # Only network-level errors trip the breaker (not 404s which are normal)
-    with audnex_breaker, httpx.Client(timeout=timeout, http2=True) as client:
-        response = client.get(url, params=params)
+    with audnex_breaker:
+        response = get_audnex_client().get(url, params=params, headers=headers, timeout=timeout)
+
+        # Expired entry still current - keep the cached body
+        if response.status_code == 304 and cache and cached:
+            return cache.renew(cached).data
 
         # 404/500 are authoritative "not found" - don't retry
         if response.status_code == 404:
             logger.debug(f"ASIN {asin} not found in region {region}")
+            if cache:
+                cache.put_missing("book", asin, region)
             return None
 
         if response.status_code == 500:
@@ -105,6 +167,7 @@ def _fetch_audnex_book_region(
                 f"Audnex book response validation warning for {asin}: {validation_error}"
             )
 
+        _cache_response(cache, "book", asin, region, response, data)
         return data
 
 
@@ -145,30 +208,125 @@ def fetch_audnex_book(
         logger.warning(f"ASIN {asin} not found in region {region}")
         return None, None
 
-    # Try each configured region in order
-    regions = settings.audnex.regions
-    for r in regions:
+    regions = _regions_for(asin, settings.audnex.regions)
+
+    def _try_region(r: str) -> dict[str, Any] | None:
         try:
-            data = _fetch_audnex_book_region(
+            return _fetch_audnex_book_region(
                 asin, r, settings.audnex.base_url, settings.audnex.timeout_seconds
             )
         except CircuitOpenError:
             # Circuit open - skip to next region
             logger.debug(f"Circuit open for region {r}, trying next")
-            continue
         except Exception as e:
             # After retries exhausted, try next region
             logger.debug(f"Failed to fetch book {asin} from region {r}: {e}")
-            continue
-
-        if data:
-            logger.info(f"Fetched Audnex metadata for ASIN: {asin} (region={r})")
-            return data, r
+        return None
+
+    width = min(settings.audnex.hedge_regions, len(regions))
+    if width > 1:
+        data, found = _probe_regions_hedged(
+            regions, _try_region, width=width, delay=settings.audnex.hedge_delay_ms / 1000
+        )
+    else:
+        # Try each configured region in order
+        data, found = None, None
+        for r in regions:
+            data = _try_region(r)
+            if data:
+                found = r
+                break
+
+    if data and found:
+        logger.info(f"Fetched Audnex metadata for ASIN: {asin} (region={found})")
+        _remember_region(asin, found)
+        return data, found
 
     logger.warning(f"ASIN {asin} not found in any configured region: {regions}")
     return None, None
 
 
+def _probe_regions_hedged(
+    regions: list[str],
+    try_region: Callable[[str], dict[str, Any] | None],
+    *,
+    width: int,
+    delay: float,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Query up to ``width`` regions at once and return the first hit by priority.
+
+    The next region starts ``delay`` seconds after the previous one, or as
+    soon as an in-flight request finishes, whichever comes first. A region's
+    answer is only used once every region ahead of it has come back empty,
+    so the result matches the sequential lookup, just without waiting for
+    each 404 in turn.
+
+    Args:
+        regions: Regions in priority order
+        try_region: Fetch for one region; returns None for not found/failed
+        width: Maximum regions in flight
+        delay: Seconds before hedging with the next region (0 = at once)
+
+    Returns:
+        Tuple of (data, region) for the winning region, or (None, None).
+    """
+    pool = ThreadPoolExecutor(max_workers=width, thread_name_prefix="audnex-region")
+    futures: list[Future[dict[str, Any] | None]] = []
+
+    def launch() -> None:
+        futures.append(pool.submit(try_region, regions[len(futures)]))
+
+    try:
+        for index, region in enumerate(regions):
+            while len(futures) <= index:
+                launch()
+            head = futures[index]
+            while not head.done():
+                in_flight = [f for f in futures if not f.done()]
+                can_hedge = len(futures) < len(regions) and len(in_flight) < width
+                wait(in_flight, timeout=delay if can_hedge else None, return_when=FIRST_COMPLETED)
+                if can_hedge and not head.done():
+                    launch()
+            data = head.result()
+            if data:
+                return data, region
+        return None, None
+    finally:
+        # Lower-priority requests still running are left to finish on their own
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# Region Memory
+# =============================================================================
+
+# Most recent ASINs whose winning region is remembered
+REGION_MEMORY_SIZE = 4096
+
+_winning_regions: OrderedDict[str, str] = OrderedDict()
+_winning_regions_lock = threading.Lock()
+
+
+def _remember_region(asin: str, region: str) -> None:
+    """Record the region an ASIN was found in."""
+    key = asin.upper()
+    with _winning_regions_lock:
+        _winning_regions[key] = region
+        _winning_regions.move_to_end(key)
+        while len(_winning_regions) > REGION_MEMORY_SIZE:
+            _winning_regions.popitem(last=False)
+
+
+def _regions_for(asin: str, regions: list[str]) -> list[str]:
+    """Configured regions, with the region this ASIN was last found in first."""
+    with _winning_regions_lock:
+        known = _winning_regions.get(asin.upper())
+    if known is None or known not in regions:
+        return list(regions)
+    return [known, *(r for r in regions if r != known)]
+
+
 # =============================================================================
 # Author Metadata
 # =============================================================================
@@ -191,23 +349,35 @@ def fetch_audnex_author(asin: str, region: str | None = None) -> dict[str, Any]
         url = f"{settings.audnex.base_url}/authors/{asin}"
         params = {"region": r}
 
+        cache, cached = _cache_lookup("author", asin, r)
+        if cache and cached and cache.is_fresh(cached):
+            logger.debug(f"Audnex cache hit: author {asin} (region={r})")
+            return cached.data
+        headers = cached.revalidation_headers() if cached else {}
+
         logger.debug(f"Fetching Audnex author: {url} (region={r})")
 
         try:
             # Circuit breaker protects against cascading failures
-            with (
-                audnex_breaker,
-                httpx.Client(timeout=settings.audnex.timeout_seconds, http2=True) as client,
-            ):
-                response = client.get(url, params=params)
+            with audnex_breaker:
+                response = get_audnex_client().get(
+                    url, params=params, headers=headers, timeout=settings.audnex.timeout_seconds
+                )
+
+                # Expired entry still current - keep the cached body
+                if response.status_code == 304 and cache and cached:
+                    return cache.renew(cached).data
 
                 if response.status_code in (404, 500):
                     # Expected "not found" - keep at debug level
                     logger.debug(f"Author ASIN {asin} not found in region {r}")
+                    if response.status_code == 404 and cache:
+                        cache.put_missing("author", asin, r)
                     return None
 
                 response.raise_for_status()
                 data: dict[str, Any] = response.json()
+                _cache_response(cache, "author", asin, r, response, data)
                 return data
 
         except CircuitOpenError:
@@ -246,11 +416,12 @@ def fetch_audnex_author(asin: str, region: str | None = None) -> dict[str, Any]
             logger.info(f"Fetched Audnex author: {asin} (region={region})")
         return data
 
-    # Try each configured region in order
-    for r in settings.audnex.regions:
+    # Try each configured region in order (last winning region first)
+    for r in _regions_for(asin, settings.audnex.regions):
         data = _try_region(r)
         if data:
             logger.info(f"Fetched Audnex author: {asin} (region={r})")
+            _remember_region(asin, r)
             return data
 
     logger.warning(f"Author ASIN {asin} not found in any configured region")
@@ -296,15 +467,27 @@ def _fetch_audnex_chapters_region(
     url = f"{base_url}/books/{asin}/chapters"
     params = {"region": region}
 
+    cache, cached = _cache_lookup("chapters", asin, region)
+    if cache and cached and cache.is_fresh(cached):
+        logger.debug(f"Audnex cache hit: chapters {asin} (region={region})")
+        return cached.data
+    headers = cached.revalidation_headers() if cached else {}
+
     logger.debug(f"Fetching Audnex chapters: {url} (region={region})")
 
     # Circuit breaker protects against cascading failures
-    with audnex_breaker, httpx.Client(timeout=timeout, http2=True) as client:
-        response = client.get(url, params=params)
+    with audnex_breaker:
+        response = get_audnex_client().get(url, params=params, headers=headers, timeout=timeout)
+
+        # Expired entry still current - keep the cached body
+        if response.status_code == 304 and cache and cached:
+            return cache.renew(cached).data
 
         # 404/500 are authoritative "not found" - don't retry
         if response.status_code == 404:
             logger.debug(f"Chapters for {asin} not found in region {region}")
+            if cache:
+                cache.put_missing("chapters", asin, region)
             return None
 
         if response.status_code == 500:
@@ -333,6 +516,7 @@ def _fetch_audnex_chapters_region(
                 f"Audnex chapters response validation warning for {asin}: {validation_error}"
             )
 
+        _cache_response(cache, "chapters", asin, region, response, data)
         return data
 
 
@@ -371,8 +555,8 @@ def fetch_audnex_chapters(asin: str, region: str | None = None) -> dict[str, Any
             )
         return data
 
-    # Try each configured region in order
-    regions = settings.audnex.regions
+    # Try each configured region in order (the book's region first)
+    regions = _regions_for(asin, settings.audnex.regions)
     for r in regions:
         try:
             data = _fetch_audnex_chapters_region(
@@ -390,6 +574,7 @@ def fetch_audnex_chapters(asin: str, region: str | None = None) -> dict[str, Any
             logger.info(
                 f"Fetched {chapter_count} chapters from Audnex for ASIN: {asin} (region={r})"
             )
+            _remember_region(asin, r)
             return data
 
     logger.warning(f"Chapters for ASIN {asin} not found in any configured region")
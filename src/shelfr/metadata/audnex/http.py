@@ -0,0 +1,99 @@
+"""
+Shared HTTP clients for the Audnex API.
+
+One pooled HTTP/2 client per process instead of a new ``httpx.Client`` per
+request: lookups across hundreds of ASINs reuse one TLS connection and
+multiplex over it instead of paying a handshake per region attempt.
+
+- get_audnex_client(): sync client, safe to share between threads.
+- get_audnex_async_client(): async client for the running event loop.
+- close_audnex_clients(): closes both; the CLI calls it when a command ends.
+
+Request timeouts are passed per request so a reloaded config applies
+without rebuilding the pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool for api.audnex.us. HTTP/2 multiplexes concurrent requests
+# over one connection; the extra connections cover HTTP/1.1 fallback.
+AUDNEX_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=4,
+    keepalive_expiry=60.0,
+)
+
+# Default timeout; callers pass audnex.timeout_seconds per request
+AUDNEX_DEFAULT_TIMEOUT = 30.0
+
+_lock = threading.Lock()
+_client: httpx.Client | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_audnex_client() -> httpx.Client:
+    """Shared sync client (created on first use)."""
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(http2=True, limits=AUDNEX_LIMITS, timeout=AUDNEX_DEFAULT_TIMEOUT)
+            logger.debug("Opened shared Audnex HTTP client")
+        return _client
+
+
+def get_audnex_async_client() -> httpx.AsyncClient:
+    """
+    Shared async client for the running event loop.
+
+    Connections belong to the loop that opened them, so a new loop (another
+    ``asyncio.run()``) gets a new client.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    with _lock:
+        if _async_client is None or _async_loop is not loop or _async_client.is_closed:
+            _async_client = httpx.AsyncClient(
+                http2=True, limits=AUDNEX_LIMITS, timeout=AUDNEX_DEFAULT_TIMEOUT
+            )
+            _async_loop = loop
+            logger.debug("Opened shared async Audnex HTTP client")
+        return _async_client
+
+
+async def aclose_audnex_async_client() -> None:
+    """Close the async client from within its event loop."""
+    global _async_client, _async_loop
+    with _lock:
+        client, _async_client, _async_loop = _async_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+def close_audnex_clients() -> None:
+    """
+    Close the shared clients and their pooled connections.
+
+    An async client still open is dropped rather than awaited: its loop has
+    usually finished by the time this runs.
+    """
+    global _client, _async_client, _async_loop
+    with _lock:
+        client, _client = _client, None
+        _async_client, _async_loop = None, None
+    if client is not None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Error closing Audnex HTTP client: {e}")
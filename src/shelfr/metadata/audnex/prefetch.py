@@ -0,0 +1,313 @@
+"""
+Async batch prefetch of Audnex metadata into the response cache.
+
+prefetch_audnex() looks up many ASINs concurrently on the shared async client
+and stores the answers in the Audnex disk cache, so the (sequential) import
+or upload pipeline that follows gets its book and chapter data from disk.
+
+Requests are paced by a token bucket. Rate limiting is retried instead of
+dropped: a 429/503 pauses the whole bucket for the server's Retry-After,
+and an open circuit breaker pauses it until the breaker's recovery timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from shelfr.config import get_settings
+from shelfr.metadata.audnex.cache import AudnexCache, get_audnex_cache
+from shelfr.metadata.audnex.client import _regions_for, _remember_region
+from shelfr.metadata.audnex.http import get_audnex_async_client
+from shelfr.utils.circuit_breaker import CircuitOpenError, audnex_breaker
+from shelfr.utils.retry import NETWORK_EXCEPTIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 5.0  # Requests per second
+
+# Attempts per request (rate limiting, breaker pauses and network errors)
+MAX_ATTEMPTS = 4
+
+# Backoff when Audnex rate limits without a Retry-After header
+DEFAULT_RETRY_AFTER = 5.0
+
+# Longest pause taken from a Retry-After header
+MAX_RETRY_AFTER = 300.0
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``rate`` requests per second, bursts up to ``burst``.
+
+    pause() stops all acquirers until a point in time, for a server's
+    Retry-After or an open circuit breaker.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for ``seconds`` (extends, never shortens, a pause)."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP date).
+
+    Returns:
+        Seconds (capped at MAX_RETRY_AFTER), or None if missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+# =============================================================================
+# Prefetch
+# =============================================================================
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of a prefetch batch."""
+
+    found: dict[str, str] = field(default_factory=dict)  # ASIN -> region
+    not_found: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)  # ASIN -> error
+    requests: int = 0
+    cache_hits: int = 0
+    rate_limited: int = 0
+
+
+class _PrefetchError(Exception):
+    """A lookup that failed after all attempts (not a "not found")."""
+
+
+class _Prefetcher:
+    """State shared by the lookups of one prefetch batch."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        cache: AudnexCache | None,
+        bucket: TokenBucket,
+        *,
+        base_url: str,
+        timeout: float,
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.bucket = bucket
+        self.base_url = base_url
+        self.timeout = timeout
+        self.result = PrefetchResult()
+
+    async def lookup(self, endpoint: str, asin: str, region: str) -> dict[str, Any] | None:
+        """
+        Data for one (endpoint, ASIN, region), from cache or Audnex.
+
+        Returns:
+            The response, or None when Audnex says it doesn't exist there.
+
+        Raises:
+            _PrefetchError: If every attempt failed or Audnex refused access.
+        """
+        cached = self.cache.get(endpoint, asin, region) if self.cache else None
+        if self.cache and cached and self.cache.is_fresh(cached):
+            self.result.cache_hits += 1
+            return cached.data
+        headers = cached.revalidation_headers() if cached else {}
+
+        path = f"books/{asin}/chapters" if endpoint == "chapters" else f"{endpoint}s/{asin}"
+        url = f"{self.base_url}/{path}"
+        error = "no attempts made"
+
+        for attempt in range(MAX_ATTEMPTS):
+            await self.bucket.acquire()
+            try:
+                with audnex_breaker:
+                    response = await self.client.get(
+                        url, params={"region": region}, headers=headers, timeout=self.timeout
+                    )
+            except CircuitOpenError as e:
+                # Breaker open: hold the whole batch until it half-opens
+                self.bucket.pause(e.retry_after)
+                error = str(e)
+                continue
+            except NETWORK_EXCEPTIONS as e:
+                error = f"{type(e).__name__}: {e}"
+                await asyncio.sleep(min(2**attempt, 10))
+                continue
+
+            self.result.requests += 1
+            status = response.status_code
+
+            if status == 304 and self.cache and cached:
+                return self.cache.renew(cached).data
+            if status == 200:
+                data: dict[str, Any] = response.json()
+                if self.cache:
+                    self.cache.put(
+                        endpoint,
+                        asin,
+                        region,
+                        data,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                return data
+            if status == 404:
+                if self.cache:
+                    self.cache.put_missing(endpoint, asin, region)
+                return None
+            if status == 500:
+                # Audnex answers 500 for some ASINs missing in a region
+                return None
+            if status in (429, 503):
+                self.result.rate_limited += 1
+                wait = parse_retry_after(response.headers.get("Retry-After"))
+                self.bucket.pause(wait if wait is not None else DEFAULT_RETRY_AFTER * 2**attempt)
+                logger.debug(f"Audnex rate limited {asin} (region={region}), pausing")
+                error = f"HTTP {status}"
+                continue
+            if status in (401, 403):
+                raise _PrefetchError(f"HTTP {status}")
+            error = f"HTTP {status}"
+            await asyncio.sleep(min(2**attempt, 10))
+
+        raise _PrefetchError(error)
+
+    async def prefetch(self, asin: str, regions: list[str], *, chapters: bool) -> None:
+        """Look up one ASIN's book (and chapters) across regions."""
+        try:
+            found = None
+            for region in _regions_for(asin, regions):
+                if await self.lookup("book", asin, region):
+                    found = region
+                    break
+            if found is None:
+                self.result.not_found.append(asin)
+                return
+
+            _remember_region(asin, found)
+            self.result.found[asin] = found
+            if chapters:
+                for region in _regions_for(asin, regions):
+                    if await self.lookup("chapters", asin, region):
+                        break
+        except _PrefetchError as e:
+            logger.warning(f"Audnex prefetch failed for {asin}: {e}")
+            self.result.failed[asin] = str(e)
+
+
+async def prefetch_audnex(
+    asins: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    chapters: bool = True,
+    progress: Callable[[str], None] | None = None,
+) -> PrefetchResult:
+    """
+    Warm the Audnex cache for many ASINs.
+
+    Book data is looked up across the configured regions (last winning region
+    first); chapters are then fetched for every book that was found. Fresh
+    cache entries cost no request.
+
+    Args:
+        asins: ASINs to look up (duplicates are skipped)
+        concurrency: ASINs looked up at once
+        rate: Maximum requests per second across the batch
+        chapters: Also prefetch chapter data
+        progress: Called with each ASIN when its lookups are done
+
+    Returns:
+        Which ASINs were found (and in which region), not found or failed.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    settings = get_settings()
+    unique = list(dict.fromkeys(asin.upper() for asin in asins))
+    prefetcher = _Prefetcher(
+        get_audnex_async_client(),
+        get_audnex_cache(),
+        TokenBucket(rate),
+        base_url=settings.audnex.base_url,
+        timeout=settings.audnex.timeout_seconds,
+    )
+    regions = list(settings.audnex.regions)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(asin: str) -> None:
+        async with semaphore:
+            await prefetcher.prefetch(asin, regions, chapters=chapters)
+        if progress is not None:
+            progress(asin)
+
+    await asyncio.gather(*(run(asin) for asin in unique))
+
+    result = prefetcher.result
+    logger.info(
+        f"Audnex prefetch: {len(result.found)} found, {len(result.not_found)} not found, "
+        f"{len(result.failed)} failed ({result.requests} requests, "
+        f"{result.cache_hits} cache hits, {result.rate_limited} rate limited)"
+    )
+    return result
@@ -0,0 +1,173 @@
+"""
+Batched MediaInfo probing.
+
+``mediainfo`` accepts many files per call and prints a JSON array with one
+object per file. probe_many() splits its paths into chunks, runs one
+mediainfo process per chunk on a small worker pool, matches the output back
+to the inputs by ``media["@ref"]`` and stores each result in the probe
+cache. Process start-up is then paid once per chunk instead of once per
+file, which dominates for multi-file MP3 books and library-wide scans.
+
+Files already in the probe cache are not probed, and hardlinked paths to the
+same file are probed once.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from shelfr.config import get_settings
+from shelfr.exceptions import ConfigurationError
+from shelfr.metadata.mediainfo.cache import ProbeCache, ProbeKey, get_probe_cache, probe_key
+
+logger = logging.getLogger(__name__)
+
+# Files per mediainfo call
+DEFAULT_CHUNK_SIZE = 32
+
+# mediainfo processes running at once
+DEFAULT_WORKERS = 4
+
+# Callers with more files than this use probe_many(); fewer are probed one by one
+BATCH_THRESHOLD = 4
+
+# Seconds allowed per file in a chunk (a chunk of n files gets n times this)
+TIMEOUT_PER_FILE = 30
+
+
+def _configured_binary() -> str:
+    """mediainfo.binary from config, or "mediainfo" without one."""
+    try:
+        return get_settings().mediainfo.binary
+    except (FileNotFoundError, ConfigurationError):
+        return "mediainfo"
+
+
+def _split_output(stdout: str, chunk: list[Path]) -> dict[Path, dict[str, Any] | None]:
+    """
+    Per-file MediaInfo documents from a (multi-file) JSON output.
+
+    Documents are matched to paths by ``media["@ref"]``; if mediainfo
+    rewrote the paths but returned one document per file, by position.
+    """
+    parsed = json.loads(stdout)
+    documents = [
+        d for d in (parsed if isinstance(parsed, list) else [parsed]) if isinstance(d, dict)
+    ]
+    by_ref: dict[str, dict[str, Any]] = {}
+    for document in documents:
+        media = document.get("media")
+        if isinstance(media, dict) and isinstance(media.get("@ref"), str):
+            by_ref[media["@ref"]] = document
+
+    results: dict[Path, dict[str, Any] | None] = {path: by_ref.get(str(path)) for path in chunk}
+    if (
+        None in results.values()
+        and len(documents) == len(chunk)
+        and not by_ref.keys() & {str(path) for path in chunk}
+    ):
+        results = dict(zip(chunk, documents, strict=True))
+    return results
+
+
+def _probe_chunk(binary: str, chunk: list[Path]) -> dict[Path, dict[str, Any] | None]:
+    """
+    Run one mediainfo process on a chunk of files.
+
+    If the call fails as a whole (one unreadable file can make mediainfo
+    exit non-zero), the chunk is retried one file at a time.
+    """
+    try:
+        result = subprocess.run(
+            [binary, "--Output=JSON", *(str(path) for path in chunk)],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=TIMEOUT_PER_FILE * len(chunk),
+        )
+        return _split_output(result.stdout, chunk)
+    except (subprocess.SubprocessError, json.JSONDecodeError, OSError) as e:
+        if len(chunk) == 1:
+            logger.debug(f"mediainfo failed for {chunk[0].name}: {e}")
+            return {chunk[0]: None}
+        logger.debug(f"mediainfo failed for a chunk of {len(chunk)} files, retrying singly: {e}")
+        results: dict[Path, dict[str, Any] | None] = {}
+        for path in chunk:
+            results.update(_probe_chunk(binary, [path]))
+        return results
+
+
+def probe_many(
+    paths: Iterable[Path],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    binary: str | None = None,
+    cache: ProbeCache | None = None,
+) -> dict[Path, dict[str, Any] | None]:
+    """
+    MediaInfo for many files, with one mediainfo process per chunk.
+
+    Args:
+        paths: Files to probe (duplicates are probed once)
+        chunk_size: Files per mediainfo call
+        workers: mediainfo processes running at once
+        binary: mediainfo binary (default: mediainfo.binary from config)
+        cache: Probe cache to read and fill (default: the shared cache, if enabled)
+
+    Returns:
+        Parsed MediaInfo JSON per path, in input order; None for files that
+        are missing or couldn't be probed.
+
+    Raises:
+        ValueError: If chunk_size or workers is < 1.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    unique = list(dict.fromkeys(paths))
+    if cache is None:
+        cache = get_probe_cache()
+
+    results: dict[Path, dict[str, Any] | None] = {}
+    # One representative path per file identity (hardlinks share one probe)
+    by_key: dict[ProbeKey, list[Path]] = {}
+    for path in unique:
+        key = probe_key(path)
+        if key is None:
+            results[path] = None
+            continue
+        cached = cache.get(path) if cache is not None else None
+        if cached is not None:
+            results[path] = cached
+        else:
+            by_key.setdefault(key, []).append(path)
+
+    # Representative path -> its identity
+    pending = {aliases[0]: key for key, aliases in by_key.items()}
+    if pending:
+        order = list(pending)
+        chunks = [order[i : i + chunk_size] for i in range(0, len(order), chunk_size)]
+        logger.debug(f"Probing {len(pending)} files with mediainfo in {len(chunks)} call(s)")
+        probe = partial(_probe_chunk, binary or _configured_binary())
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(chunks)), thread_name_prefix="mediainfo"
+        ) as pool:
+            for chunk_results in pool.map(probe, chunks):
+                for path, data in chunk_results.items():
+                    key = pending[path]
+                    for alias in by_key[key]:
+                        results[alias] = data
+                    if data is not None and cache is not None:
+                        cache.put(path, data, key)
+
+    return {path: results.get(path) for path in unique}
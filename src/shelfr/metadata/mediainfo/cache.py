@@ -0,0 +1,233 @@
+"""
+Persistent cache of MediaInfo probes.
+
+Parsed MediaInfo JSON is stored in SQLite at ``cache_dir()/mediainfo.db``,
+keyed by the file's identity rather than its path: (st_dev, st_ino, size,
+mtime_ns). A hardlinked seed copy and library copy share an inode, so the
+file is probed once however many names it has and however many commands
+look at it. Rewriting the file (retagging, re-encoding) changes its size or
+mtime and therefore its key.
+
+Schema:
+    probes(dev, ino, size, mtime_ns,  - file identity (primary key)
+           path,                        - last path probed, used by prune()
+           data,                        - zlib-compressed MediaInfo JSON
+           probed_at)
+
+Connections are opened per operation, so the cache is safe to use from
+worker threads and processes. The cache is best effort: database errors are
+logged and treated as a miss.
+
+Managed with ``shelfr cache stats|prune|clear``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    data BLOB NOT NULL,
+    probed_at REAL NOT NULL,
+    PRIMARY KEY (dev, ino, size, mtime_ns)
+)
+"""
+
+# (st_dev, st_ino, st_size, st_mtime_ns)
+ProbeKey = tuple[int, int, int, int]
+
+
+def probe_key(path: Path) -> ProbeKey | None:
+    """Identity of a file for the probe cache, or None if it can't be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@dataclass
+class ProbeCacheStats:
+    """Summary of the probe cache (for ``shelfr cache stats``)."""
+
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class ProbeCache(SqliteCache):
+    """MediaInfo JSON per file identity, stored in SQLite."""
+
+    schema = (_SCHEMA,)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def get(self, path: Path) -> dict[str, Any] | None:
+        """Cached MediaInfo for ``path``, or None if it hasn't been probed as-is."""
+        key = probe_key(path)
+        if key is None:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT data FROM probes WHERE dev = ? AND ino = ? AND size = ? "
+                    "AND mtime_ns = ?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"MediaInfo cache read failed ({self.path}): {e}")
+            return None
+        if row is None:
+            return None
+        try:
+            data: dict[str, Any] = json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError) as e:
+            logger.debug(f"Discarding unreadable MediaInfo cache entry for {path.name}: {e}")
+            return None
+        return data
+
+    def put(self, path: Path, data: dict[str, Any], key: ProbeKey | None = None) -> bool:
+        """
+        Store MediaInfo for ``path``.
+
+        Args:
+            path: The probed file
+            data: Parsed MediaInfo JSON
+            key: Identity taken before probing. If the file changed while it
+                was probed, nothing is stored.
+
+        Returns:
+            True if the entry was stored.
+        """
+        current = probe_key(path)
+        if current is None or (key is not None and key != current):
+            logger.debug(f"Not caching MediaInfo for {path.name}: file changed while probing")
+            return False
+        blob = zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO probes "
+                    "(dev, ino, size, mtime_ns, path, data, probed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*current, str(path), blob, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"MediaInfo cache write failed ({self.path}): {e}")
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> ProbeCacheStats:
+        """Number of cached probes and database size."""
+        if not self.path.exists():
+            return ProbeCacheStats()
+        with self._connect() as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM probes").fetchone()
+        return ProbeCacheStats(entries=entries, size_bytes=self.size_bytes())
+
+    def prune(self, *, dry_run: bool = False) -> int:
+        """
+        Remove entries whose file is gone or has changed since it was probed.
+
+        Only the last probed path of each entry is checked, so an entry whose
+        other hardlinks still exist is re-probed once when next used.
+
+        Returns:
+            Number of entries removed (or that would be removed).
+        """
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            rows = conn.execute("SELECT dev, ino, size, mtime_ns, path FROM probes").fetchall()
+            stale = [tuple(row[:4]) for row in rows if probe_key(Path(row[4])) != tuple(row[:4])]
+            if stale and not dry_run:
+                conn.executemany(
+                    "DELETE FROM probes WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+                    stale,
+                )
+        return len(stale)
+
+    def clear(self, *, dry_run: bool = False) -> int:
+        """Remove every entry. Returns the number removed (or that would be)."""
+        if not self.path.exists():
+            return 0
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM probes").fetchone()
+            if not dry_run:
+                conn.execute("DELETE FROM probes")
+        return int(count)
+
+
+# =============================================================================
+# Shared instance
+# =============================================================================
+
+
+def open_probe_cache() -> ProbeCache:
+    """Cache in the configured cache dir, whether or not caching is enabled."""
+    from shelfr.paths import cache_dir
+
+    return ProbeCache(cache_dir() / "mediainfo.db")
+
+
+_shared = SharedCache("mediainfo", "cache_enabled", open_probe_cache)
+
+
+def get_probe_cache() -> ProbeCache | None:
+    """
+    Shared probe cache.
+
+    Returns:
+        The cache, or None when ``mediainfo.cache_enabled`` is false or no
+        config can be loaded.
+    """
+    return _shared.get()
+
+
+def cached_probe(path: Path, probe: Callable[[], dict[str, Any] | None]) -> dict[str, Any] | None:
+    """
+    MediaInfo for ``path`` from the cache, or from ``probe()`` (then cached).
+
+    Args:
+        path: File to probe
+        probe: Runs MediaInfo on ``path``; returns the parsed JSON or None
+
+    Returns:
+        The parsed MediaInfo JSON, or None if probing failed (not cached).
+    """
+    cache = get_probe_cache()
+    if cache is None:
+        return probe()
+
+    data = cache.get(path)
+    if data is not None:
+        logger.debug(f"MediaInfo cache hit: {path.name}")
+        return data
+
+    key = probe_key(path)
+    data = probe()
+    if data is not None:
+        cache.put(path, data, key)
+    return data
@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from shelfr.config import get_settings
+from shelfr.metadata.mediainfo.cache import cached_probe
+from shelfr.metadata.mediainfo.mp4 import native_mediainfo
 from shelfr.utils.permissions import fix_ownership
 from shelfr.utils.retry import SUBPROCESS_EXCEPTIONS, retry_with_backoff
 
@@ -262,7 +264,8 @@ def detect_audio_format_from_file(file_path: Path) -> AudioFormat | None:
     """
     Detect audio format directly from a file.
 
-    Convenience wrapper that runs mediainfo and extracts format.
+    Convenience wrapper that reads MP4/M4B headers in-process (see mp4.py)
+    or runs mediainfo, and extracts format.
 
     Args:
         file_path: Path to audio file (m4b, mp3, etc.)
@@ -270,7 +273,7 @@ def detect_audio_format_from_file(file_path: Path) -> AudioFormat | None:
     Returns:
         AudioFormat or None if detection fails.
     """
-    mediainfo_data = run_mediainfo(file_path)
+    mediainfo_data = native_mediainfo(file_path) or run_mediainfo(file_path)
     return detect_audio_format(mediainfo_data)
 
 
@@ -303,6 +306,9 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
     Args:
         file_path: Path to audio file (typically .m4b)
 
+    Results are kept in the probe cache (see metadata/mediainfo/cache.py), so
+    a file is only probed again once it changes.
+
     Returns:
         Parsed MediaInfo JSON or None on error.
 
@@ -319,6 +325,11 @@ def run_mediainfo(file_path: Path) -> dict[str, Any] | None:
         logger.error(f"File not found for mediainfo: {file_path}")
         return None
 
+    return cached_probe(file_path, lambda: _probe_mediainfo(file_path, binary))
+
+
+def _probe_mediainfo(file_path: Path, binary: str) -> dict[str, Any] | None:
+    """Run the mediainfo binary on a file (uncached)."""
     cmd = [
         binary,
         "--Output=JSON",
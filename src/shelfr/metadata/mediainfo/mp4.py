@@ -0,0 +1,744 @@
+"""
+In-process MP4/M4B header reader.
+
+Reads the ``moov`` box of an MP4 file with a few seeks (``mdat`` is skipped,
+not read) and returns a dict shaped like ``mediainfo --Output=JSON``, with
+the fields shelfr consumes:
+
+- General: Format, FileExtension, FileSize, Duration, OverallBitRate,
+  MenuCount and the iTunes tags (``©nam``, ``©ART``, ``----`` freeform atoms,
+  Audible's ``CDEK`` etc. in ``extra``)
+- Audio: Format, Format_AdditionalFeatures, Format_Commercial_IfAny,
+  CodecID (mp4a-40-2, mp4a-40-42, ec-3, ...), BitRate, BitRate_Mode,
+  Channels, ChannelLayout, SamplingRate, Duration, Language
+- Menu: chapters from the QuickTime chapter track, or Nero ``chpl``
+
+so detect_audio_format(), _extract_audio_info(),
+_parse_chapters_from_mediainfo(), extract_trumpable_meta() and
+extract_asin_from_mediainfo() work on it unchanged. Trumping and ASIN checks
+over thousands of folders then cost a header read per book instead of a
+mediainfo process each.
+
+The full report saved with a release (run_mediainfo) still comes from the
+mediainfo binary.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from shelfr import __version__
+from shelfr.config import get_settings
+from shelfr.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Containers read natively (anything else goes to mediainfo)
+MP4_EXTENSIONS = frozenset({".m4b", ".m4a", ".mp4"})
+
+# A moov this large is not an audiobook header; let mediainfo deal with it
+MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+# Chapter titles read from a QuickTime chapter track
+MAX_CHAPTERS = 2000
+
+# MPEG-4 audio object types (ISO/IEC 14496-3) -> MediaInfo Format_AdditionalFeatures
+AAC_PROFILES = {1: "Main", 2: "LC", 3: "SSR", 4: "LTP", 5: "HE-AAC", 29: "HE-AACv2"}
+AOT_USAC = 42
+
+AAC_SAMPLE_RATES = (
+    96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000, 7350,
+)  # fmt: skip
+
+# AAC channelConfiguration -> (channels, layout)
+AAC_CHANNELS = {
+    1: (1, "C"),
+    2: (2, "L R"),
+    3: (3, "C L R"),
+    4: (4, "C L R Cb"),
+    5: (5, "C L R Ls Rs"),
+    6: (6, "C L R Ls Rs LFE"),
+    7: (8, "C L R Ls Rs Lw Rw LFE"),
+}
+
+# (E-)AC-3 acmod -> layout without LFE (LFE goes after C when present)
+DOLBY_ACMOD = ("L R", "C", "L R", "L R C", "L R S", "L R C S", "L R Ls Rs", "L R C Ls Rs")
+
+# E-AC-3 dependent substream chan_loc bits (MSB first) -> channels added
+EC3_CHAN_LOC = (2, 2, 1, 1, 2, 2, 2, 1, 1)
+
+AC3_BITRATES = (
+    32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384, 448, 512, 576, 640,
+)  # fmt: skip
+
+# iTunes atoms -> MediaInfo General fields
+ITUNES_FIELDS = {
+    "©nam": "Title",
+    "©alb": "Album",
+    "©ART": "Performer",
+    "aART": "Album_Performer",
+    "©wrt": "Composer",
+    "©gen": "Genre",
+    "©day": "Recorded_Date",
+    "©cmt": "Comment",
+    "©too": "Encoded_Application",
+    "©pub": "Publisher",
+    "cprt": "Copyright",
+    "desc": "Description",
+}
+
+# ISO 639-2/T (mdhd) -> ISO 639-1, as MediaInfo reports it
+LANGUAGES = {
+    "eng": "en",
+    "deu": "de",
+    "ger": "de",
+    "fra": "fr",
+    "fre": "fr",
+    "spa": "es",
+    "ita": "it",
+    "jpn": "ja",
+    "nld": "nl",
+    "dut": "nl",
+    "por": "pt",
+    "rus": "ru",
+    "zho": "zh",
+    "chi": "zh",
+    "swe": "sv",
+    "dan": "da",
+    "nor": "no",
+    "fin": "fi",
+    "pol": "pl",
+}
+
+
+# =============================================================================
+# Box walking
+# =============================================================================
+
+
+def _boxes(data: bytes, start: int = 0, end: int | None = None) -> Iterator[tuple[str, int, int]]:
+    """Child boxes in ``data[start:end]`` as (type, payload start, payload end)."""
+    end = len(data) if end is None else end
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, pos)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", data, pos + 8)
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise ValueError(f"Truncated {kind!r} box at offset {pos}")
+        yield kind.decode("latin-1"), pos + header, pos + size
+        pos += size
+
+
+def _find(data: bytes, path: str, start: int = 0, end: int | None = None) -> tuple[int, int] | None:
+    """Payload range of the box at ``path`` ("mdia/minf/stbl"), first match per level."""
+    for kind in path.split("/"):
+        for child, child_start, child_end in _boxes(data, start, end):
+            if child == kind:
+                start, end = child_start, child_end
+                break
+        else:
+            return None
+    return start, end if end is not None else len(data)
+
+
+def _read_moov(f: BinaryIO) -> bytes:
+    """Seek over the top-level boxes and return the moov payload."""
+    f.seek(0, 2)
+    file_size = f.tell()
+    pos = 0
+    first = True
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        header = f.read(16)
+        size, kind = struct.unpack_from(">I4s", header)
+        length = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", header, 8)
+            length = 16
+        elif size == 0:
+            size = file_size - pos
+        if first and kind != b"ftyp":
+            raise ValueError("Not an MP4 file (no ftyp box)")
+        first = False
+        if size < length:
+            raise ValueError(f"Invalid {kind!r} box size at offset {pos}")
+        if kind == b"moov":
+            if size > MAX_MOOV_SIZE:
+                raise ValueError(f"moov box too large ({size} bytes)")
+            f.seek(pos + length)
+            moov = f.read(size - length)
+            if len(moov) != size - length:
+                raise ValueError("Truncated moov box")
+            return moov
+        pos += size
+    raise ValueError("No moov box")
+
+
+class _Bits:
+    """MSB-first bit reader for codec config records."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def read(self, count: int) -> int:
+        value = 0
+        for _ in range(count):
+            byte = self.data[self.pos >> 3]
+            value = (value << 1) | ((byte >> (7 - (self.pos & 7))) & 1)
+            self.pos += 1
+        return value
+
+    @property
+    def remaining(self) -> int:
+        return len(self.data) * 8 - self.pos
+
+
+# =============================================================================
+# Sample tables
+# =============================================================================
+
+
+@dataclass
+class _Track:
+    """What the reader needs from one trak box."""
+
+    track_id: int = 0
+    handler: str = ""
+    timescale: int = 0
+    duration: int = 0
+    language: str | None = None
+    chapter_refs: list[int] = field(default_factory=list)
+    stbl: tuple[int, int] | None = None
+
+    @property
+    def seconds(self) -> float:
+        return self.duration / self.timescale if self.timescale else 0.0
+
+
+def _uint32_table(data: bytes, start: int, count: int, width: int = 1) -> array[int]:
+    """``count * width`` big-endian uint32 values."""
+    table = array("I")
+    table.frombytes(data[start : start + 4 * count * width])
+    if sys.byteorder == "little":
+        table.byteswap()
+    return table
+
+
+def _sample_sizes(moov: bytes, stbl: tuple[int, int]) -> list[int] | int:
+    """Per-sample sizes, or the total size when every sample is the same size."""
+    stsz = _find(moov, "stsz", *stbl)
+    if stsz is None:
+        return 0
+    sample_size, count = struct.unpack_from(">II", moov, stsz[0] + 4)
+    if sample_size:
+        return int(sample_size * count)
+    sizes: list[int] = _uint32_table(moov, stsz[0] + 12, count).tolist()
+    return sizes
+
+
+def _stream_size(moov: bytes, stbl: tuple[int, int]) -> int:
+    sizes = _sample_sizes(moov, stbl)
+    return sizes if isinstance(sizes, int) else sum(sizes)
+
+
+def _sample_times(moov: bytes, stbl: tuple[int, int]) -> list[int]:
+    """Start time of each sample, in track timescale units."""
+    stts = _find(moov, "stts", *stbl)
+    if stts is None:
+        return []
+    (count,) = struct.unpack_from(">I", moov, stts[0] + 4)
+    table = _uint32_table(moov, stts[0] + 8, count, 2)
+    times: list[int] = []
+    now = 0
+    for i in range(0, len(table), 2):
+        for _ in range(table[i]):
+            times.append(now)
+            now += table[i + 1]
+            if len(times) > MAX_CHAPTERS:
+                return times
+    return times
+
+
+def _sample_offsets(moov: bytes, stbl: tuple[int, int], count: int) -> list[int]:
+    """File offsets of the first ``count`` samples (stsc + stco/co64 + stsz)."""
+    stsc = _find(moov, "stsc", *stbl)
+    stco = _find(moov, "stco", *stbl)
+    co64 = _find(moov, "co64", *stbl)
+    sizes = _sample_sizes(moov, stbl)
+    if stsc is None or isinstance(sizes, int):
+        return []
+
+    if stco is not None:
+        (chunks,) = struct.unpack_from(">I", moov, stco[0] + 4)
+        chunk_offsets = _uint32_table(moov, stco[0] + 8, chunks).tolist()
+    elif co64 is not None:
+        (chunks,) = struct.unpack_from(">I", moov, co64[0] + 4)
+        chunk_offsets = list(struct.unpack_from(f">{chunks}Q", moov, co64[0] + 8))
+    else:
+        return []
+
+    (runs,) = struct.unpack_from(">I", moov, stsc[0] + 4)
+    stsc_table = _uint32_table(moov, stsc[0] + 8, runs, 3)
+
+    offsets: list[int] = []
+    sample = 0
+    for run in range(runs):
+        first_chunk = stsc_table[run * 3]
+        per_chunk = stsc_table[run * 3 + 1]
+        last_chunk = stsc_table[(run + 1) * 3] - 1 if run + 1 < runs else len(chunk_offsets)
+        for chunk in range(first_chunk, last_chunk + 1):
+            offset = chunk_offsets[chunk - 1]
+            for _ in range(per_chunk):
+                if sample >= count or sample >= len(sizes):
+                    return offsets
+                offsets.append(offset)
+                offset += sizes[sample]
+                sample += 1
+    return offsets
+
+
+# =============================================================================
+# Audio sample entries
+# =============================================================================
+
+
+def _descriptors(data: bytes, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """MPEG-4 descriptors in ``data[start:end]`` as (tag, payload start, payload end)."""
+    pos = start
+    while pos + 2 <= end:
+        tag = data[pos]
+        pos += 1
+        size = 0
+        for _ in range(4):
+            byte = data[pos]
+            pos += 1
+            size = (size << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                break
+        yield tag, pos, min(pos + size, end)
+        pos += size
+
+
+def _parse_esds(data: bytes, start: int, end: int, audio: dict[str, Any]) -> int | None:
+    """Fill codec details from an esds box; returns the AAC channel configuration."""
+    for tag, es_start, es_end in _descriptors(data, start + 4, end):
+        if tag != 0x03:
+            continue
+        flags = data[es_start + 2]
+        pos = es_start + 3
+        if flags & 0x80:
+            pos += 2
+        if flags & 0x40:
+            pos += 1 + data[pos]
+        if flags & 0x20:
+            pos += 2
+        for dtag, dc_start, dc_end in _descriptors(data, pos, es_end):
+            if dtag != 0x04:
+                continue
+            object_type = data[dc_start]
+            max_bitrate, avg_bitrate = struct.unpack_from(">II", data, dc_start + 5)
+            if avg_bitrate:
+                audio["BitRate_Mode"] = "CBR" if max_bitrate == avg_bitrate else "VBR"
+                audio["BitRate_Nominal"] = str(avg_bitrate)
+            if object_type in (0x69, 0x6B):
+                audio["Format"] = "MPEG Audio"
+                audio["CodecID"] = f"mp4a-{object_type:02X}"
+                return None
+            for stag, asc_start, asc_end in _descriptors(data, dc_start + 13, dc_end):
+                if stag == 0x05:
+                    return _parse_audio_specific_config(data[asc_start:asc_end], audio)
+    return None
+
+
+def _parse_audio_specific_config(config: bytes, audio: dict[str, Any]) -> int | None:
+    """AAC profile, output sample rate and channel configuration."""
+    bits = _Bits(config)
+
+    def object_type() -> int:
+        aot = bits.read(5)
+        return 32 + bits.read(6) if aot == 31 else aot
+
+    def sample_rate() -> int | None:
+        index = bits.read(4)
+        if index == 15:
+            return bits.read(24)
+        return AAC_SAMPLE_RATES[index] if index < len(AAC_SAMPLE_RATES) else None
+
+    aot = object_type()
+    if aot == AOT_USAC:
+        audio.update(Format="USAC", CodecID="mp4a-40-42", Format_Commercial_IfAny="xHE-AAC")
+        return None
+
+    rate = sample_rate()
+    channel_config = bits.read(4)
+    profile = aot
+    if aot in (5, 29) and bits.remaining >= 4:
+        # Explicit SBR: the extension rate is the output rate
+        rate = sample_rate()
+        base = object_type()
+        profile = aot if base == 2 else base
+
+    audio["Format"] = "AAC"
+    audio["CodecID"] = f"mp4a-40-{aot}"
+    if profile in AAC_PROFILES:
+        audio["Format_AdditionalFeatures"] = AAC_PROFILES[profile]
+    if rate:
+        audio["SamplingRate"] = str(rate)
+    return channel_config
+
+
+def _parse_dolby(kind: str, payload: bytes, audio: dict[str, Any]) -> None:
+    """Format, bitrate and channels from a dac3/dec3 box."""
+    bits = _Bits(payload)
+    if kind == "ac-3":
+        audio.update(Format="AC-3", CodecID="ac-3", Format_Commercial_IfAny="Dolby Digital")
+        bits.read(2 + 5 + 3)  # fscod, bsid, bsmod
+        acmod, lfeon, bit_rate_code = bits.read(3), bits.read(1), bits.read(5)
+        if bit_rate_code < len(AC3_BITRATES):
+            audio["BitRate"] = str(AC3_BITRATES[bit_rate_code] * 1000)
+        extra_channels = 0
+    else:
+        audio.update(Format="E-AC-3", CodecID="ec-3", Format_Commercial_IfAny="Dolby Digital Plus")
+        data_rate = bits.read(13)
+        substreams = bits.read(3) + 1
+        acmod = lfeon = extra_channels = 0
+        for index in range(substreams):
+            bits.read(2 + 5 + 1 + 1 + 3)  # fscod, bsid, reserved, asvc, bsmod
+            sub_acmod, sub_lfeon = bits.read(3), bits.read(1)
+            bits.read(3)
+            if index == 0:
+                acmod, lfeon = sub_acmod, sub_lfeon
+            if bits.read(4):  # num_dep_sub
+                chan_loc = bits.read(9)
+                if index == 0:
+                    extra_channels = sum(
+                        n for i, n in enumerate(EC3_CHAN_LOC) if chan_loc & (1 << (8 - i))
+                    )
+            else:
+                bits.read(1)
+        if data_rate:
+            audio["BitRate"] = str(data_rate * 1000)
+        if bits.remaining - (bits.remaining % 8) >= 16:
+            bits.read(bits.remaining % 8)
+            bits.read(7)
+            if bits.read(1):  # flag_ec3_extension_type_a: Joint Object Coding (Atmos)
+                audio["Format_AdditionalFeatures"] = "JOC"
+                audio["Format_Commercial_IfAny"] = "Dolby Digital Plus with Dolby Atmos"
+                audio.setdefault("extra", {})["ComplexityIndex"] = str(bits.read(8))
+
+    audio["BitRate_Mode"] = "CBR"
+    audio["Channels"] = str(len(DOLBY_ACMOD[acmod].split()) + lfeon + extra_channels)
+    speakers = DOLBY_ACMOD[acmod].split()
+    if lfeon:
+        speakers.insert(speakers.index("C") + 1 if "C" in speakers else len(speakers), "LFE")
+    audio["ChannelLayout"] = " ".join(speakers)
+
+
+def _parse_sample_entry(moov: bytes, stbl: tuple[int, int], audio: dict[str, Any]) -> None:
+    """Codec details of the first stsd entry."""
+    stsd = _find(moov, "stsd", *stbl)
+    if stsd is None:
+        return
+    entries = list(_boxes(moov, stsd[0] + 8, stsd[1]))
+    if not entries:
+        return
+    kind, start, end = entries[0]
+
+    version = struct.unpack_from(">H", moov, start + 8)[0]
+    channels = struct.unpack_from(">H", moov, start + 16)[0]
+    rate = struct.unpack_from(">I", moov, start + 24)[0] >> 16
+    children = start + 28
+    if version == 1:
+        children += 16
+    elif version == 2:
+        rate = int(struct.unpack_from(">d", moov, start + 32)[0])
+        channels = struct.unpack_from(">I", moov, start + 40)[0]
+        children += 36
+
+    audio["Format"] = kind.strip()
+    audio["CodecID"] = kind.strip()
+    audio["Channels"] = str(channels)
+    audio["SamplingRate"] = str(rate)
+
+    for child, child_start, child_end in _boxes(moov, children, end):
+        if child == "esds":
+            channel_config = _parse_esds(moov, child_start, child_end, audio)
+            if channel_config in AAC_CHANNELS:
+                count, layout = AAC_CHANNELS[channel_config]
+                audio["Channels"] = str(count)
+                audio["ChannelLayout"] = layout
+        elif child in ("dac3", "dec3"):
+            _parse_dolby("ac-3" if child == "dac3" else "ec-3", moov[child_start:child_end], audio)
+        elif child == "alac" and kind == "alac":
+            audio["Format"] = "ALAC"
+        elif child == "dfLa":
+            audio["Format"] = "FLAC"
+        elif child == "dOps":
+            audio["Format"] = "Opus"
+
+
+# =============================================================================
+# Tracks, tags and chapters
+# =============================================================================
+
+
+def _parse_trak(moov: bytes, start: int, end: int) -> _Track:
+    track = _Track()
+    tkhd = _find(moov, "tkhd", start, end)
+    if tkhd is not None:
+        version = moov[tkhd[0]]
+        (track.track_id,) = struct.unpack_from(">I", moov, tkhd[0] + (20 if version else 12))
+
+    mdhd = _find(moov, "mdia/mdhd", start, end)
+    if mdhd is not None:
+        version = moov[mdhd[0]]
+        if version == 1:
+            track.timescale, track.duration = struct.unpack_from(">IQ", moov, mdhd[0] + 20)
+            packed = struct.unpack_from(">H", moov, mdhd[0] + 32)[0]
+        else:
+            track.timescale, track.duration = struct.unpack_from(">II", moov, mdhd[0] + 12)
+            packed = struct.unpack_from(">H", moov, mdhd[0] + 20)[0]
+        code = "".join(chr(((packed >> shift) & 0x1F) + 0x60) for shift in (10, 5, 0))
+        if code.isalpha() and code != "und":
+            track.language = LANGUAGES.get(code, code)
+
+    hdlr = _find(moov, "mdia/hdlr", start, end)
+    if hdlr is not None:
+        track.handler = moov[hdlr[0] + 8 : hdlr[0] + 12].decode("latin-1")
+
+    chap = _find(moov, "tref/chap", start, end)
+    if chap is not None:
+        track.chapter_refs = _uint32_table(moov, chap[0], (chap[1] - chap[0]) // 4).tolist()
+
+    track.stbl = _find(moov, "mdia/minf/stbl", start, end)
+    return track
+
+
+def _data_value(moov: bytes, start: int, end: int, atom: str) -> str | None:
+    """Text or integer payload of an ilst item's data box."""
+    data = _find(moov, "data", start, end)
+    if data is None:
+        return None
+    (type_code,) = struct.unpack_from(">I", moov, data[0])
+    payload = moov[data[0] + 8 : data[1]]
+    if atom in ("trkn", "disk") and len(payload) >= 6:
+        number, total = struct.unpack_from(">HH", payload, 2)
+        return f"{number}/{total}" if total else str(number)
+    if type_code & 0xFFFFFF == 1:
+        return payload.decode("utf-8", errors="replace")
+    if type_code & 0xFFFFFF == 2:
+        return payload.decode("utf-16-be", errors="replace")
+    if type_code & 0xFFFFFF in (21, 22) and 1 <= len(payload) <= 8:
+        return str(int.from_bytes(payload, "big", signed=type_code & 0xFFFFFF == 21))
+    return None
+
+
+def _parse_tags(moov: bytes, general: dict[str, Any]) -> None:
+    """iTunes metadata (udta/meta/ilst) into General fields and ``extra``."""
+    meta = _find(moov, "udta/meta")
+    if meta is None:
+        return
+    # meta is a full box (4 bytes version/flags) in MP4, a plain box in QuickTime
+    first = moov[meta[0] + 4 : meta[0] + 8]
+    start = meta[0] if first in (b"hdlr", b"ilst", b"free") else meta[0] + 4
+    ilst = _find(moov, "ilst", start, meta[1])
+    if ilst is None:
+        return
+
+    extra: dict[str, str] = {}
+    for atom, item_start, item_end in _boxes(moov, *ilst):
+        if atom == "covr":
+            general["Cover"] = "Yes"
+            continue
+        if atom == "----":
+            name = _find(moov, "name", item_start, item_end)
+            value = _data_value(moov, item_start, item_end, atom)
+            if name is not None and value is not None:
+                key = moov[name[0] + 4 : name[1]].decode("utf-8", errors="replace")
+                extra[key] = value
+            continue
+        value = _data_value(moov, item_start, item_end, atom)
+        if value is None:
+            continue
+        if atom in ITUNES_FIELDS:
+            general[ITUNES_FIELDS[atom]] = value
+        elif atom == "trkn":
+            general["Track_Position"] = value
+        elif not atom.startswith("©"):
+            # Audible atoms (CDEK, CDET, AACR, ...) keep their name, as in MediaInfo
+            extra[atom.strip()] = value
+    if extra:
+        general["extra"] = extra
+
+
+def _chapters_from_track(f: BinaryIO, moov: bytes, track: _Track) -> list[tuple[float, str]]:
+    """Chapter titles from a QuickTime text track (sample = 2-byte length + text)."""
+    if track.stbl is None or not track.timescale:
+        return []
+    times = _sample_times(moov, track.stbl)[:MAX_CHAPTERS]
+    offsets = _sample_offsets(moov, track.stbl, len(times))
+    chapters: list[tuple[float, str]] = []
+    for when, offset in zip(times, offsets, strict=False):
+        f.seek(offset)
+        header = f.read(2)
+        if len(header) < 2:
+            break
+        (length,) = struct.unpack(">H", header)
+        raw = f.read(length)
+        if raw.startswith(b"\xfe\xff"):
+            title = raw[2:].decode("utf-16-be", errors="replace")
+        else:
+            title = raw.decode("utf-8", errors="replace")
+        chapters.append((when / track.timescale, title))
+    return chapters
+
+
+def _chapters_from_chpl(moov: bytes) -> list[tuple[float, str]]:
+    """Chapters from a Nero chpl box (start in 100 ns units)."""
+    chpl = _find(moov, "udta/chpl")
+    if chpl is None:
+        return []
+    pos = chpl[0] + 4
+    if moov[chpl[0]]:
+        pos += 4
+    count = moov[pos]
+    pos += 1
+    chapters: list[tuple[float, str]] = []
+    for _ in range(count):
+        (start,) = struct.unpack_from(">Q", moov, pos)
+        length = moov[pos + 8]
+        title = moov[pos + 9 : pos + 9 + length].decode("utf-8", errors="replace")
+        chapters.append((start / 10_000_000, title))
+        pos += 9 + length
+    return chapters
+
+
+def _menu_key(seconds: float) -> str:
+    """MediaInfo chapter key: 3723.5 -> "_01_02_03_500"."""
+    millis = round(seconds * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"_{hours:02d}_{minutes:02d}_{secs:02d}_{millis:03d}"
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def read_mp4_mediainfo(path: Path) -> dict[str, Any] | None:
+    """
+    MediaInfo-shaped JSON for an MP4/M4B file, read in-process.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        ``{"media": {"@ref": ..., "track": [General, Audio, Menu?]}}``, or
+        None if the file is not an MP4 with an audio track or can't be parsed.
+    """
+    try:
+        with open(path, "rb") as f:
+            moov = _read_moov(f)
+            file_size = path.stat().st_size
+
+            mvhd = _find(moov, "mvhd")
+            if mvhd is None:
+                raise ValueError("No mvhd box")
+            if moov[mvhd[0]] == 1:
+                timescale, duration = struct.unpack_from(">IQ", moov, mvhd[0] + 20)
+            else:
+                timescale, duration = struct.unpack_from(">II", moov, mvhd[0] + 12)
+            seconds = duration / timescale if timescale else 0.0
+
+            tracks = [_parse_trak(moov, s, e) for kind, s, e in _boxes(moov) if kind == "trak"]
+            sound = next((t for t in tracks if t.handler == "soun"), None)
+            if sound is None or sound.stbl is None:
+                logger.debug(f"No audio track in {path.name}")
+                return None
+
+            chapters: list[tuple[float, str]] = []
+            for ref in sound.chapter_refs:
+                chapter_track = next((t for t in tracks if t.track_id == ref), None)
+                if chapter_track is not None:
+                    chapters = _chapters_from_track(f, moov, chapter_track)
+                    break
+            if not chapters:
+                chapters = _chapters_from_chpl(moov)
+
+            audio: dict[str, Any] = {"@type": "Audio", "ID": str(sound.track_id)}
+            _parse_sample_entry(moov, sound.stbl, audio)
+            stream_size = _stream_size(moov, sound.stbl)
+    except (OSError, ValueError, IndexError, struct.error) as e:
+        logger.debug(f"Native MP4 read failed for {path.name}: {e}")
+        return None
+
+    audio_seconds = sound.seconds or seconds
+    audio["Duration"] = f"{audio_seconds:.3f}"
+    if stream_size:
+        audio["StreamSize"] = str(stream_size)
+        if "BitRate" not in audio and audio_seconds:
+            audio["BitRate"] = str(round(stream_size * 8 / audio_seconds))
+    if "BitRate" not in audio and "BitRate_Nominal" in audio:
+        audio["BitRate"] = audio["BitRate_Nominal"]
+    if sound.language:
+        audio["Language"] = sound.language
+
+    general: dict[str, Any] = {
+        "@type": "General",
+        "AudioCount": "1",
+        "FileExtension": path.suffix.lstrip(".").lower(),
+        "Format": "MPEG-4",
+        "FileSize": str(file_size),
+        "Duration": f"{seconds:.3f}",
+    }
+    if seconds:
+        general["OverallBitRate"] = str(round(file_size * 8 / seconds))
+    if chapters:
+        general["MenuCount"] = "1"
+    _parse_tags(moov, general)
+
+    track_list: list[dict[str, Any]] = [general, audio]
+    if chapters:
+        menu: dict[str, str] = {}
+        for start, title in chapters:
+            menu.setdefault(_menu_key(start), title)
+        track_list.append({"@type": "Menu", "extra": menu})
+
+    return {
+        "creatingLibrary": {"name": "shelfr", "version": __version__},
+        "media": {"@ref": str(path), "track": track_list},
+    }
+
+
+def native_mediainfo(path: Path) -> dict[str, Any] | None:
+    """
+    Read an MP4/M4B in-process when ``mediainfo.native_mp4`` allows it.
+
+    Returns:
+        MediaInfo-shaped JSON, or None for other containers, when disabled,
+        or when the file can't be read natively (callers then run mediainfo).
+    """
+    if path.suffix.lower() not in MP4_EXTENSIONS:
+        return None
+    try:
+        enabled = get_settings().mediainfo.native_mp4
+    except (FileNotFoundError, ConfigurationError):
+        enabled = True  # Pure file read: no config needed
+    if not enabled:
+        return None
+    return read_mp4_mediainfo(path)
@@ -29,6 +29,8 @@ from shelfr.schemas.config import (
     MediaInfoSchema,
     MkbrrSchema,
     PathsSchema,
+    PipelineSchema,
+    PipelineStageSchema,
     QBittorrentSchema,
     validate_config_yaml,
 )
@@ -63,6 +65,8 @@ __all__ = [
     "MediaInfoSchema",
     "MkbrrSchema",
     "PathsSchema",
+    "PipelineSchema",
+    "PipelineStageSchema",
     "QBittorrentSchema",
     "validate_config_yaml",
     # mkbrr Data
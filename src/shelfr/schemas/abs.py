@@ -7,6 +7,7 @@ new fields from API without breaking (forward compatibility).
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -173,10 +174,9 @@ class AbsLibraryItemSchema(BaseModel):
         return self.media.duration
 
 
-class AbsLibraryItemsResponse(BaseModel):
-    """Response from GET /api/libraries/{id}/items."""
+class AbsLibraryItemsPage(BaseModel):
+    """Paging envelope of GET /api/libraries/{id}/items (everything but results)."""
 
-    results: list[AbsLibraryItemSchema]
     total: int = 0
     limit: int = 0
     page: int = 0
@@ -191,6 +191,12 @@ class AbsLibraryItemsResponse(BaseModel):
     model_config = {"extra": "ignore", "populate_by_name": True}
 
 
+class AbsLibraryItemsResponse(AbsLibraryItemsPage):
+    """Response from GET /api/libraries/{id}/items."""
+
+    results: list[AbsLibraryItemSchema]
+
+
 class AbsUserPermissions(BaseModel):
     """User permissions from ABS."""
 
@@ -269,6 +275,45 @@ def validate_library_items_response(data: dict[str, Any]) -> AbsLibraryItemsResp
     return AbsLibraryItemsResponse.model_validate(data)
 
 
+def validate_library_items_page(data: dict[str, Any]) -> AbsLibraryItemsPage:
+    """Validate the paging envelope of a library items API response.
+
+    Args:
+        data: Raw API response dict
+
+    Returns:
+        Validated AbsLibraryItemsPage (items are read with iter_library_items)
+
+    Raises:
+        pydantic.ValidationError: If response doesn't match schema
+    """
+    return AbsLibraryItemsPage.model_validate(data)
+
+
+def iter_library_items(data: dict[str, Any]) -> Iterator[AbsLibraryItemSchema]:
+    """Validate the items of a library items API response one at a time.
+
+    Each raw item is released from ``data`` once validated, so a page never
+    holds the raw JSON and every validated model at once.
+
+    Args:
+        data: Raw API response dict (its ``results`` are consumed)
+
+    Yields:
+        Validated AbsLibraryItemSchema per item
+
+    Raises:
+        ValueError: If the response has no results list
+        pydantic.ValidationError: If an item doesn't match schema
+    """
+    results = data.get("results")
+    if not isinstance(results, list):
+        raise ValueError("Library items response has no results list")
+    for i, raw in enumerate(results):
+        results[i] = None
+        yield AbsLibraryItemSchema.model_validate(raw)
+
+
 def validate_authorize_response(data: dict[str, Any]) -> AbsAuthorizeResponse:
     """Validate and parse authorize API response.
 
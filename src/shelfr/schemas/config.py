@@ -138,6 +138,13 @@ class AudnexSchema(BaseModel):
     # to find the preferred region's ASIN. Set to null/None to disable.
     # Valid: us, uk, au, ca, de, es, fr, in, it, jp, or null
     preferred_asin_region: str | None = Field(default=DEFAULT_ASIN_REGION)
+    # Hedged region probing for book lookups
+    hedge_regions: int = Field(default=1, ge=1, le=10)
+    hedge_delay_ms: int = Field(default=0, ge=0, le=10000)
+    # Disk cache of book/chapter/author responses
+    cache_enabled: bool = True
+    cache_ttl_days: float = Field(default=30, ge=0, le=365)
+    cache_negative_ttl_hours: float = Field(default=24, ge=0, le=24 * 30)
 
     @field_validator("base_url")
     @classmethod
@@ -173,6 +180,27 @@ class MediaInfoSchema(BaseModel):
     """MediaInfo settings."""
 
     binary: str = "mediainfo"
+    cache_enabled: bool = True
+    native_mp4: bool = True
+
+
+class PipelineStageSchema(BaseModel):
+    """Worker count and queue bound for one pipeline stage."""
+
+    workers: int = Field(default=1, ge=1, le=32, description="Worker threads for this stage")
+    queue_size: int = Field(
+        default=2, ge=1, le=256, description="Releases allowed to wait for this stage"
+    )
+
+
+class PipelineSchema(BaseModel):
+    """Pipelined executor settings for `shelfr run`."""
+
+    enabled: bool = False
+    staging: PipelineStageSchema = Field(default_factory=PipelineStageSchema)
+    metadata: PipelineStageSchema = Field(default_factory=lambda: PipelineStageSchema(workers=2))
+    torrent: PipelineStageSchema = Field(default_factory=PipelineStageSchema)
+    upload: PipelineStageSchema = Field(default_factory=PipelineStageSchema)
 
 
 class AudiobookshelfPathMapSchema(BaseModel):
@@ -433,6 +461,9 @@ class AudiobookshelfImportSchema(BaseModel):
         le=1.0,
         description="Minimum confidence threshold for ABS search matches (0.0-1.0)",
     )
+    workers: int = Field(
+        default=1, ge=1, le=32, description="Books imported at once (1 = one after another)"
+    )
 
     @field_validator("duplicate_policy")
     @classmethod
@@ -488,6 +519,18 @@ class AudiobookshelfSchema(BaseModel):
 
     enabled: bool = Field(default=False, description="Enable ABS integration")
     timeout_seconds: int = Field(default=30, ge=5, le=120)
+    page_size: int = Field(default=500, ge=10, le=5000, description="Items per library page")
+    page_workers: int = Field(
+        default=4, ge=1, le=16, description="Library pages fetched at once after the first"
+    )
+    snapshot_enabled: bool = Field(
+        default=True, description="Keep library listings on disk, refreshed by updatedAt"
+    )
+    search_cache_enabled: bool = Field(default=True, description="Cache metadata searches")
+    search_cache_ttl_hours: int = Field(default=168, ge=1, le=8760)
+    search_concurrency: int = Field(
+        default=4, ge=1, le=32, description="Searches in flight at once per ABS server"
+    )
     docker_mode: bool = Field(default=True, description="Whether ABS runs in Docker")
     path_map: list[AudiobookshelfPathMapSchema] = Field(
         default_factory=list, description="Container-to-host path mappings"
@@ -500,7 +543,13 @@ class AudiobookshelfSchema(BaseModel):
         alias="import",
         description="Import behavior settings",
     )
+    index_enabled: bool = Field(
+        default=True, description="Keep a persistent ASIN/title/author index of library items"
+    )
     index_db: str = Field(default="./data/abs_index.db", description="Index database path")
+    resolution_cache_enabled: bool = Field(
+        default=True, description="Reuse ASIN resolutions of unchanged folders"
+    )
 
     model_config = {"populate_by_name": True}  # Allow both 'import' and 'import_settings'
 
@@ -592,6 +641,7 @@ class ConfigSchema(BaseModel):
     qbittorrent: QBittorrentSchema = Field(default_factory=QBittorrentSchema)
     audnex: AudnexSchema = Field(default_factory=AudnexSchema)
     mediainfo: MediaInfoSchema = Field(default_factory=MediaInfoSchema)
+    pipeline: PipelineSchema = Field(default_factory=PipelineSchema)
     filters: FiltersSchema = Field(default_factory=FiltersSchema)
     libation: LibationSchema = Field(default_factory=LibationSchema)
     audiobookshelf: AudiobookshelfSchema = Field(default_factory=AudiobookshelfSchema)
@@ -5,6 +5,7 @@ These components provide Rich table displays for releases, status, and other dat
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from rich.panel import Panel
@@ -14,6 +15,7 @@ from shelfr.ui.core import console
 
 if TYPE_CHECKING:
     from shelfr.libation import LibationStatus
+    from shelfr.utils.trace import StageTiming
 
 
 def print_release_table(
@@ -168,12 +170,17 @@ def render_libation_status(
     console.print(panel)
 
 
-def print_workflow_summary(stats: dict[str, int], duration: float | None = None) -> None:
+def print_workflow_summary(
+    stats: dict[str, int],
+    duration: float | None = None,
+    timings: Mapping[str, StageTiming] | None = None,
+) -> None:
     """Print workflow completion summary as a table.
 
     Args:
         stats: Dict with keys like "discovered", "staged", "metadata", etc.
         duration: Optional total duration in seconds
+        timings: Optional per-stage span statistics (adds a p50/p95 table)
     """
     table = Table(title="Workflow Summary", show_header=True, header_style="bold")
     table.add_column("Stage", style="cyan")
@@ -197,6 +204,23 @@ def print_workflow_summary(stats: dict[str, int], duration: float | None = None)
 
     console.print(table)
 
+    if timings:
+        timing_table = Table(title="Stage Timings", show_header=True, header_style="bold")
+        timing_table.add_column("Stage", style="cyan")
+        timing_table.add_column("Runs", justify="right")
+        timing_table.add_column("p50", justify="right")
+        timing_table.add_column("p95", justify="right")
+        timing_table.add_column("Total", justify="right")
+        for name, timing in timings.items():
+            timing_table.add_row(
+                name,
+                str(timing.count),
+                f"{timing.p50:.2f}s",
+                f"{timing.p95:.2f}s",
+                f"{timing.total:.1f}s",
+            )
+        console.print(timing_table)
+
     if duration is not None:
         console.print(f"[dim]Completed in {duration:.1f}s[/]")
 
@@ -9,8 +9,10 @@ Provides fuzzy matching for:
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from rapidfuzz import fuzz, process
 
@@ -245,6 +247,65 @@ def find_matches(
     return [(match, score) for match, score, _ in results]
 
 
+# =============================================================================
+# Batch Scoring
+# =============================================================================
+
+# Below this many pairs cdist runs on one thread (starting workers costs more)
+_CDIST_PARALLEL_PAIRS = 10_000
+
+
+@functools.cache
+def _numpy() -> Any | None:
+    """numpy if installed (rapidfuzz's cdist needs it), looked up once."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def similarity_matrix(queries: list[str], choices: list[str]) -> list[list[float]]:
+    """
+    similarity_ratio() of every query against every choice.
+
+    Strings are expected lowercased already (as the ``_normalize_*`` helpers
+    return them). With numpy installed (``pip install shelfr[fast]``) the
+    matrix comes from ``rapidfuzz.process.cdist`` in C++, on all cores for
+    large inputs; without it the same scorer runs pair by pair.
+
+    Args:
+        queries: Row strings
+        choices: Column strings
+
+    Returns:
+        ``matrix[i][j]`` = similarity of ``queries[i]`` and ``choices[j]`` (0-100)
+    """
+    if not queries or not choices:
+        return [[] for _ in queries]
+
+    np = _numpy()
+    if np is None:
+        return [[fuzz.token_sort_ratio(q, c) if q and c else 0.0 for c in choices] for q in queries]
+
+    pairs = len(queries) * len(choices)
+    rows: list[list[float]] = process.cdist(
+        queries,
+        choices,
+        scorer=fuzz.token_sort_ratio,
+        dtype=np.float64,
+        workers=-1 if pairs >= _CDIST_PARALLEL_PAIRS else 1,
+    ).tolist()
+    # similarity_ratio() scores empty strings 0, token_sort_ratio("", "") is 100
+    empty_columns = [j for j, c in enumerate(choices) if not c]
+    for q, row in zip(queries, rows, strict=True):
+        if not q:
+            row[:] = [0.0] * len(choices)
+        for j in empty_columns:
+            row[j] = 0.0
+    return rows
+
+
 # =============================================================================
 # Duplicate Detection
 # =============================================================================
@@ -0,0 +1,60 @@
+"""Per-key mutual exclusion.
+
+Threads holding different keys run concurrently; threads holding the same
+key take turns. A key's lock exists only while someone holds or waits for
+it, so an unbounded key space (paths, names) doesn't accumulate locks.
+
+Usage:
+    locks = KeyedLock()
+
+    def place(book: Book) -> None:
+        with locks.hold(book.author.casefold()):
+            create_author_folder_and_move(book)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections.abc import Hashable, Iterator
+
+
+class KeyedLock:
+    """Thread-safe: one holder per key at a time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # key -> (lock, holders + waiters)
+        self._locks: dict[Hashable, tuple[threading.Lock, int]] = {}
+
+    @contextlib.contextmanager
+    def hold(self, key: Hashable) -> Iterator[None]:
+        """
+        Hold ``key`` for the duration of the ``with`` block.
+
+        Not reentrant: holding a key again from the same thread deadlocks.
+
+        Args:
+            key: What to serialize on
+        """
+        with self._lock:
+            lock, users = self._locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._locks[key] = (lock, users + 1)
+
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._locks[key]
+                if users == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, users - 1)
+
+    def in_use(self) -> int:
+        """Number of keys held or waited for."""
+        with self._lock:
+            return len(self._locks)
@@ -0,0 +1,152 @@
+"""Bounded multi-stage thread pipeline.
+
+Each stage gets its own input queue and worker threads. An item moves on to
+the next stage as soon as a worker is done with it, so different items can be
+in different stages at once: release N+1's Audnex fetch runs while release
+N's torrent is being hashed.
+
+Queues are bounded, which gives backpressure: a slow stage holds upstream
+stages at most ``queue_size`` items ahead of it instead of letting them
+stage the whole library before the first upload.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()  # Queue sentinel: no more items for this worker
+
+
+@dataclass(frozen=True)
+class Stage(Generic[T]):
+    """
+    One pipeline stage.
+
+    ``func`` runs the stage for an item and returns True to pass it on to the
+    next stage, or False when the item is finished (e.g. it failed and has
+    already been recorded as such).
+    """
+
+    name: str
+    func: Callable[[T], bool]
+    workers: int = 1
+    queue_size: int = 1
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError(f"Stage {self.name!r}: workers must be >= 1, got {self.workers}")
+        if self.queue_size < 1:
+            raise ValueError(f"Stage {self.name!r}: queue_size must be >= 1, got {self.queue_size}")
+
+
+class StagePipeline(Generic[T]):
+    """
+    Run items through a fixed sequence of stages on worker threads.
+
+    Items enter in the order the input iterable yields them. Within a stage
+    with one worker that order is kept; with several workers items may
+    overtake each other, so stage functions must not rely on ordering
+    across items.
+
+    If a stage function raises, the pipeline stops taking new items, lets
+    in-flight items drain without running further stages, and re-raises the
+    first error from run(). Stage functions that want per-item failure
+    handling should catch their own exceptions and return False.
+    """
+
+    def __init__(self, stages: Sequence[Stage[T]]) -> None:
+        if not stages:
+            raise ValueError("StagePipeline needs at least one stage")
+        self.stages = list(stages)
+
+    def run(self, items: Iterable[T]) -> list[T]:
+        """
+        Feed ``items`` through every stage and wait for them to finish.
+
+        Iteration of ``items`` happens on the calling thread and blocks while
+        the first stage's queue is full.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            Items that left the pipeline (finished or stopped early), in input
+            order. Items skipped because another item raised are not included.
+        """
+        stages = self.stages
+        queues: list[queue.Queue[Any]] = [queue.Queue(maxsize=s.queue_size) for s in stages]
+        finished: dict[int, T] = {}
+        errors: list[BaseException] = []
+        live_workers = [s.workers for s in stages]
+        lock = threading.Lock()
+        cancel = threading.Event()
+
+        def work(index: int) -> None:
+            stage = stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(stages) else None
+            try:
+                while True:
+                    entry = inbox.get()
+                    if entry is _DONE:
+                        break
+                    seq, item = entry
+                    if cancel.is_set():
+                        continue  # Drain so upstream puts never block forever
+                    try:
+                        keep_going = stage.func(item)
+                    except BaseException as e:
+                        logger.debug(f"Pipeline stage {stage.name!r} raised: {e}")
+                        with lock:
+                            errors.append(e)
+                        cancel.set()
+                        continue
+                    if keep_going and outbox is not None:
+                        outbox.put((seq, item))
+                    else:
+                        with lock:
+                            finished[seq] = item
+            finally:
+                # The last worker out closes the next stage's queue
+                with lock:
+                    live_workers[index] -= 1
+                    last = live_workers[index] == 0
+                if last and outbox is not None:
+                    for _ in range(stages[index + 1].workers):
+                        outbox.put(_DONE)
+
+        threads = [
+            threading.Thread(target=work, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+            for index, stage in enumerate(stages)
+            for n in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for seq, item in enumerate(items):
+                if cancel.is_set():
+                    break
+                queues[0].put((seq, item))
+        except BaseException:
+            cancel.set()
+            raise
+        finally:
+            # In-flight items finish their current stage before run() returns
+            for _ in range(stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+        return [finished[seq] for seq in sorted(finished)]
@@ -0,0 +1,70 @@
+"""Single-flight call deduplication.
+
+When several threads ask for the same thing at the same time, only the
+first one does the work; the others wait for it and share its result (or
+its exception). Once the call finishes the key is forgotten, so later
+callers run it again - combine with a cache to remember results.
+
+Usage:
+    flight: SingleFlight[list[dict]] = SingleFlight()
+
+    def search(title: str) -> list[dict]:
+        return flight.do(title.casefold(), lambda: http_search(title))
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Thread-safe: at most one call in flight per key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn()``, or wait for the call already running under ``key``.
+
+        Args:
+            key: Identity of the call
+            fn: The work; called by the first caller only
+
+        Returns:
+            The result of the (shared) call.
+
+        Raises:
+            Whatever the shared call raised.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of keys with a call running."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,115 @@
+"""
+Shared plumbing for the SQLite-backed caches.
+
+The MediaInfo probe cache, the ABS library snapshot and index, the ABS
+search cache and the ASIN resolution cache each keep one SQLite file. They
+open a connection per operation, so they are safe to use from worker
+threads and processes, and run in WAL mode so readers don't block the
+writer.
+
+Usage:
+    class ProbeCache(SqliteCache):
+        schema = ("CREATE TABLE IF NOT EXISTS probes (...)",)
+
+    _shared = SharedCache("mediainfo", "cache_enabled", open_probe_cache)
+
+    def get_probe_cache() -> ProbeCache | None:
+        return _shared.get()
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Generator, Hashable
+from pathlib import Path
+from typing import Any, ClassVar, Generic, TypeVar
+
+from shelfr.config import get_settings
+from shelfr.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for another writer before giving up
+BUSY_TIMEOUT_SECONDS = 10.0
+
+
+class SqliteCache:
+    """A store in one SQLite file; subclasses set ``schema``."""
+
+    # CREATE statements, run (idempotently) on every connection
+    schema: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @contextlib.contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection, creating the database on first use."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            yield conn
+        finally:
+            conn.close()
+
+    def size_bytes(self) -> int:
+        """Size of the database on disk, write-ahead log included."""
+        return sum(
+            p.stat().st_size
+            for p in (self.path, self.path.with_name(self.path.name + "-wal"))
+            if p.exists()
+        )
+
+
+def settings_section(name: str) -> Any | None:
+    """Section ``name`` of the loaded config, or None if no config can be loaded."""
+    try:
+        return getattr(get_settings(), name)
+    except (FileNotFoundError, ConfigurationError) as e:
+        logger.debug(f"No settings for {name}: {e}")
+        return None
+
+
+CacheT = TypeVar("CacheT", bound=SqliteCache)
+
+
+class SharedCache(Generic[CacheT]):
+    """
+    Process-wide instance of a cache, enabled by a config flag.
+
+    ``open`` builds the cache from the current config; the shared instance is
+    replaced when the new one differs in ``identity`` (its path by default),
+    i.e. when the cache dir or TTL changed (config reload, tests).
+    """
+
+    def __init__(
+        self,
+        section: str,
+        flag: str,
+        open: Callable[[], CacheT],
+        identity: Callable[[CacheT], Hashable] = lambda cache: cache.path,
+    ) -> None:
+        self.section = section
+        self.flag = flag
+        self._open = open
+        self._identity = identity
+        self._cache: CacheT | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> CacheT | None:
+        """The shared cache, or None when the flag is off or no config can be loaded."""
+        config = settings_section(self.section)
+        if config is None or not getattr(config, self.flag):
+            return None
+
+        candidate = self._open()
+        with self._lock:
+            if self._cache is None or self._identity(self._cache) != self._identity(candidate):
+                self._cache = candidate
+            return self._cache
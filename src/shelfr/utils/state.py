@@ -2,7 +2,14 @@
 State management for tracking processed releases.
 
 Uses a JSON file to persist state between runs with file locking
-to prevent concurrent access issues.
+to prevent concurrent access issues. Mutations are appended to a JSONL
+journal next to the snapshot (``processed.json.journal``) and folded back
+into the snapshot periodically, so a checkpoint does not rewrite the whole
+document. Parsed state is cached in-process and reused until the snapshot
+or journal changes on disk. Pointing ``paths.state_file`` at a
+``.db``/``.sqlite`` file switches to the SQLite (WAL) backend in
+``shelfr.utils.state_sqlite``, which stores one row per identifier so
+checkpoints cost a single-row transaction instead of a full rewrite.
 
 State Structure:
     {
@@ -32,15 +39,20 @@ State Structure:
 from __future__ import annotations
 
 import contextlib
+import copy
 import fcntl
 import json
 import logging
 import os
 import shutil
-from collections.abc import Callable, Generator
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator, Iterable, Mapping
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from shelfr.config import get_settings
@@ -49,6 +61,12 @@ from shelfr.models import AudiobookRelease, ReleaseStatus
 
 logger = logging.getLogger(__name__)
 
+# State file suffixes that select the SQLite backend instead of JSON
+SQLITE_STATE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+# Top-level state keys holding per-identifier entries
+STATE_BUCKETS = ("processed", "failed")
+
 
 def _get_state_file() -> Path:
     """Get the configured state file path."""
@@ -223,6 +241,21 @@ def _load_state_unsafe(state_file: Path) -> dict[str, Any]:
 
     Internal use only - use load_state() or update_state() instead.
 
+    Loads the snapshot (see _load_snapshot_unsafe) and replays any
+    journaled mutations on top of it.
+    """
+    data = _load_snapshot_unsafe(state_file)
+    records = _read_journal(state_file)
+    if records:
+        _apply_journal(data, records)
+        logger.debug(f"Replayed {len(records)} journaled state mutation(s)")
+    return data
+
+
+def _load_snapshot_unsafe(state_file: Path) -> dict[str, Any]:
+    """
+    Load the state snapshot from JSON file without locking.
+
     Recovery strategy:
     1. Try main state file
     2. If corrupt, try .bak backup
@@ -344,6 +377,9 @@ def _save_state_unsafe(state_file: Path, state: dict[str, Any]) -> None:
         # Step 3: Atomic rename (POSIX guarantee)
         os.replace(temp_file, state_file)
 
+        # Step 4: The snapshot now contains every journaled mutation
+        _journal_path(state_file).unlink(missing_ok=True)
+
         logger.debug(f"Saved state to {state_file}")
 
     except Exception as e:
@@ -355,7 +391,598 @@ def _save_state_unsafe(state_file: Path, state: dict[str, Any]) -> None:
         raise
 
 
-def update_state(fn: Callable[[dict[str, Any]], None]) -> None:
+# ============================================================================
+# Mutation Journal - Append-only log replayed on top of the JSON snapshot
+# ============================================================================
+
+# Compact the journal into the snapshot after this many mutation records
+JOURNAL_COMPACT_EVERY = 100
+
+
+def _journal_path(state_file: Path) -> Path:
+    """Get the journal path for a state file (e.g. processed.json.journal)."""
+    return state_file.with_suffix(state_file.suffix + ".journal")
+
+
+def _snapshot_signature(state_file: Path) -> list[int] | None:
+    """Identify the snapshot a journal was written against (size, mtime_ns)."""
+    try:
+        st = state_file.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_journal(state_file: Path) -> list[dict[str, Any]]:
+    """
+    Read journaled mutations that apply to the current snapshot.
+
+    The first line of the journal records the signature of the snapshot it
+    extends. If the snapshot has been rewritten since (compaction crashed
+    before removing the journal, or the file was edited by hand), the journal
+    is stale and ignored. A torn final record from a crash mid-append is
+    dropped.
+    """
+    journal = _journal_path(state_file)
+    try:
+        lines = journal.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+
+    if not lines:
+        return []
+
+    try:
+        header = json.loads(lines[0])
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring journal with corrupt header: {journal}")
+        return []
+
+    if header.get("snapshot") != _snapshot_signature(state_file):
+        logger.debug(f"Ignoring stale journal (snapshot changed): {journal}")
+        return []
+
+    records: list[dict[str, Any]] = []
+    for line_number, line in enumerate(lines[1:], start=2):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring torn journal record at {journal}:{line_number}")
+            break
+    return records
+
+
+def _apply_journal(state: dict[str, Any], records: list[dict[str, Any]]) -> None:
+    """Apply journal records in order (a null entry means delete)."""
+    for record in records:
+        bucket = state.setdefault(record["bucket"], {})
+        if record.get("entry") is None:
+            bucket.pop(record["identifier"], None)
+        else:
+            bucket[record["identifier"]] = record["entry"]
+
+
+def _append_journal(state_file: Path, records: list[dict[str, Any]]) -> int:
+    """
+    Append mutation records to the journal and fsync.
+
+    Starts a fresh journal (with a snapshot header) when none exists or the
+    existing one is stale.
+
+    Returns:
+        Number of records in the journal after appending
+    """
+    journal = _journal_path(state_file)
+    existing = _read_journal(state_file)
+    fresh = not existing
+    signature = _snapshot_signature(state_file)
+
+    with open(journal, "w" if fresh else "a", encoding="utf-8") as f:
+        if fresh:
+            f.write(json.dumps({"journal": 1, "snapshot": signature}) + "\n")
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    return len(existing) + len(records)
+
+
+def _diff_state(
+    before: dict[tuple[str, str], str],
+    state: dict[str, Any],
+    keys: set[str] | None,
+) -> list[dict[str, Any]]:
+    """Build journal records for entries that changed since ``before``."""
+    now = datetime.now().isoformat()
+    after: dict[tuple[str, str], Any] = {
+        (bucket, identifier): entry
+        for bucket in STATE_BUCKETS
+        for identifier, entry in state.get(bucket, {}).items()
+        if keys is None or identifier in keys
+    }
+    records = [
+        {"bucket": bucket, "identifier": identifier, "entry": entry, "ts": now}
+        for (bucket, identifier), entry in after.items()
+        if before.get((bucket, identifier)) != _entry_fingerprint(entry)
+    ]
+    records.extend(
+        {"bucket": bucket, "identifier": identifier, "entry": None, "ts": now}
+        for bucket, identifier in before.keys() - after.keys()
+    )
+    return records
+
+
+def _entry_fingerprint(entry: Any) -> str:
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True)
+
+
+def _fingerprint_state(state: dict[str, Any], keys: set[str] | None) -> dict[tuple[str, str], str]:
+    return {
+        (bucket, identifier): _entry_fingerprint(entry)
+        for bucket in STATE_BUCKETS
+        for identifier, entry in state.get(bucket, {}).items()
+        if keys is None or identifier in keys
+    }
+
+
+# ============================================================================
+# Read Cache - Parsed JSON state reused until the files change
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class _CachedState:
+    """Parsed state plus prebuilt identifier sets, valid for ``signature``."""
+
+    signature: tuple[tuple[int, int, int] | None, tuple[int, int, int] | None]
+    state: dict[str, Any]
+    identifiers: dict[str, frozenset[str]]
+
+
+_read_cache: dict[Path, _CachedState] = {}
+_read_cache_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _state_signature(
+    state_file: Path,
+) -> tuple[tuple[int, int, int] | None, tuple[int, int, int] | None]:
+    """Identify the on-disk state: (inode, size, mtime_ns) of snapshot and journal."""
+    return (_file_signature(state_file), _file_signature(_journal_path(state_file)))
+
+
+def _cache_state(state_file: Path, state: dict[str, Any]) -> _CachedState:
+    """
+    Cache ``state`` as the current contents of ``state_file``.
+
+    Must be called with the state lock held, right after the state was read
+    or written, so the recorded signature matches ``state``. The cache takes
+    ownership of ``state``; callers must not mutate it afterwards.
+    """
+    cached = _CachedState(
+        signature=_state_signature(state_file),
+        state=state,
+        identifiers={bucket: frozenset(state.get(bucket, {})) for bucket in STATE_BUCKETS},
+    )
+    with _read_cache_lock:
+        _read_cache[state_file] = cached
+    return cached
+
+
+def _lookup_cached_state(state_file: Path) -> _CachedState | None:
+    """Get the cached state if the files haven't changed since it was cached."""
+    with _read_cache_lock:
+        cached = _read_cache.get(state_file)
+    if cached is not None and cached.signature == _state_signature(state_file):
+        return cached
+    return None
+
+
+def _load_cached_unsafe(state_file: Path) -> _CachedState:
+    """Load state through the read cache (caller holds the state lock)."""
+    cached = _lookup_cached_state(state_file)
+    if cached is None:
+        cached = _cache_state(state_file, _load_state_unsafe(state_file))
+    return cached
+
+
+def _load_cached(state_file: Path) -> _CachedState:
+    """Load state through the read cache, only taking the lock on a miss."""
+    cached = _lookup_cached_state(state_file)
+    if cached is None:
+        with _locked_state_file(state_file):
+            cached = _load_cached_unsafe(state_file)
+    return cached
+
+
+def _working_copy(state: dict[str, Any], keys: set[str] | None) -> dict[str, Any]:
+    """
+    Copy cached state for mutation by an update_state() callback.
+
+    With ``keys``, only those entries are deep-copied; the callback contract
+    guarantees it doesn't touch anything else.
+    """
+    if keys is None:
+        return copy.deepcopy(state)
+    work = dict(state)
+    for bucket in STATE_BUCKETS:
+        entries = dict(state.get(bucket, {}))
+        for identifier in keys & entries.keys():
+            entries[identifier] = copy.deepcopy(entries[identifier])
+        work[bucket] = entries
+    return work
+
+
+# ============================================================================
+# State Stores - Pluggable persistence backends
+# ============================================================================
+
+
+class StateStore(ABC):
+    """
+    Persistence backend for processed/failed state.
+
+    Backends expose the whole-state dict used by ``update_state`` callbacks
+    plus per-entry lookups. The lookup defaults go through ``load()``;
+    backends with indexed storage override them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @abstractmethod
+    def load(self) -> dict[str, Any]:
+        """Load the full state dict."""
+
+    def view(self) -> Mapping[str, Any]:
+        """
+        Read-only view of the full state, for callers that only read.
+
+        Backends may share the entries with their read cache, so nothing in
+        the view may be mutated. Use load() for a copy to modify.
+        """
+        return MappingProxyType(self.load())
+
+    @abstractmethod
+    def update(
+        self,
+        fn: Callable[[dict[str, Any]], None],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Apply ``fn`` to the state atomically.
+
+        Args:
+            fn: Function that mutates the state dict in-place
+            keys: Identifiers ``fn`` reads or writes. When given, backends may
+                load only those entries; ``fn`` must not touch anything else.
+        """
+
+    @abstractmethod
+    def save(self, state: dict[str, Any]) -> None:
+        """Replace the stored state with ``state``."""
+
+    def get_entry(self, bucket: str, identifier: str) -> dict[str, Any] | None:
+        """Get a single entry from the "processed" or "failed" bucket."""
+        entry: dict[str, Any] | None = self.load().get(bucket, {}).get(identifier)
+        return entry
+
+    def contains(self, bucket: str, identifier: str) -> bool:
+        """Check whether the "processed" or "failed" bucket has an entry."""
+        return self.get_entry(bucket, identifier) is not None
+
+    def identifiers(self, bucket: str) -> set[str]:
+        """Get all identifiers in the "processed" or "failed" bucket."""
+        return set(self.load().get(bucket, {}).keys())
+
+    def count(self, bucket: str) -> int:
+        """Count entries in the "processed" or "failed" bucket."""
+        return len(self.load().get(bucket, {}))
+
+    def compact(self) -> None:
+        """Fold pending writes into the backend's primary storage (default: no-op)."""
+        return None
+
+    def flush(self) -> None:
+        """Persist buffered batch mutations (no-op outside a batch)."""
+        return None
+
+    @contextmanager
+    def batch(self) -> Generator[StateStore, None, None]:
+        """
+        Hold the state for a batch of operations and persist once at the end.
+
+        The default implementation does no batching and yields the store itself.
+        """
+        yield self
+
+
+class JsonStateStore(StateStore):
+    """
+    State stored as a single JSON document (default backend).
+
+    Updates append the changed entries to ``<state_file>.journal`` instead of
+    rewriting the document; the journal is folded back into the snapshot
+    every JOURNAL_COMPACT_EVERY records and by compact().
+
+    Reads go through a process-wide cache validated against the (inode, size,
+    mtime_ns) of the snapshot and journal, so repeated lookups don't re-parse
+    the file. Writes through this store refresh the cache.
+    """
+
+    def load(self) -> dict[str, Any]:
+        return copy.deepcopy(_load_cached(self.path).state)
+
+    def view(self) -> Mapping[str, Any]:
+        # Cached states are replaced on write, never mutated, so no copy is needed
+        return MappingProxyType(_load_cached(self.path).state)
+
+    def get_entry(self, bucket: str, identifier: str) -> dict[str, Any] | None:
+        entry: dict[str, Any] | None = _load_cached(self.path).state.get(bucket, {}).get(identifier)
+        return copy.deepcopy(entry)
+
+    def contains(self, bucket: str, identifier: str) -> bool:
+        return identifier in _load_cached(self.path).identifiers.get(bucket, frozenset())
+
+    def identifiers(self, bucket: str) -> set[str]:
+        return set(_load_cached(self.path).identifiers.get(bucket, frozenset()))
+
+    def count(self, bucket: str) -> int:
+        return len(_load_cached(self.path).identifiers.get(bucket, frozenset()))
+
+    def update(
+        self,
+        fn: Callable[[dict[str, Any]], None],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        key_set = set(keys) if keys is not None else None
+
+        with _locked_state_file(self.path):
+            state = _working_copy(_load_cached_unsafe(self.path).state, key_set)
+            before = _fingerprint_state(state, key_set)
+            fn(state)
+
+            records = _diff_state(before, state, key_set)
+            if not records:
+                return
+            if _append_journal(self.path, records) >= JOURNAL_COMPACT_EVERY:
+                _save_state_unsafe(self.path, state)
+            _cache_state(self.path, state)
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot (no-op when the journal is empty)."""
+        with _locked_state_file(self.path):
+            if _read_journal(self.path):
+                state = _load_cached_unsafe(self.path).state
+                _save_state_unsafe(self.path, state)
+                _cache_state(self.path, state)
+            else:
+                _journal_path(self.path).unlink(missing_ok=True)
+
+    def save(self, state: dict[str, Any]) -> None:
+        with _locked_state_file(self.path):
+            _save_state_unsafe(self.path, state)
+
+    @contextmanager
+    def batch(self) -> Generator[StateStore, None, None]:
+        with _locked_state_file(self.path):
+            state = copy.deepcopy(_load_cached_unsafe(self.path).state)
+            session = _JsonStateBatch(self.path, state)
+            try:
+                yield session
+            finally:
+                session.flush()
+                # The session is discarded, so the cache can own its state
+                _cache_state(self.path, state)
+
+
+class _JsonStateBatch(StateStore):
+    """
+    In-memory JSON state shared by everything inside a state_batch().
+
+    The caller holds the state file lock for the batch's lifetime. Updates
+    only touch the in-memory dict; flush() journals the entries that changed
+    since the previous flush with a single fsync.
+    """
+
+    def __init__(self, path: Path, state: dict[str, Any]) -> None:
+        super().__init__(path)
+        self._state = state
+        self._lock = threading.RLock()
+        # Pre-images of entries touched since the last flush
+        self._before: dict[tuple[str, str], str] = {}
+        self._touched: set[str] = set()
+        self._touched_all = False
+
+    def _remember(self, keys: set[str] | None) -> None:
+        """Record pre-images for entries about to be mutated for the first time."""
+        if self._touched_all:
+            return
+        if keys is None:
+            self._before = {**_fingerprint_state(self._state, None), **self._before}
+            self._touched_all = True
+            return
+        new_keys = keys - self._touched
+        if new_keys:
+            self._before.update(_fingerprint_state(self._state, new_keys))
+            self._touched |= new_keys
+
+    def load(self) -> dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._state)
+
+    def get_entry(self, bucket: str, identifier: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry: dict[str, Any] | None = self._state.get(bucket, {}).get(identifier)
+            return copy.deepcopy(entry)
+
+    def contains(self, bucket: str, identifier: str) -> bool:
+        with self._lock:
+            return identifier in self._state.get(bucket, {})
+
+    def identifiers(self, bucket: str) -> set[str]:
+        with self._lock:
+            return set(self._state.get(bucket, {}))
+
+    def count(self, bucket: str) -> int:
+        with self._lock:
+            return len(self._state.get(bucket, {}))
+
+    def update(
+        self,
+        fn: Callable[[dict[str, Any]], None],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        key_set = set(keys) if keys is not None else None
+
+        with self._lock:
+            self._remember(key_set)
+            if key_set is None:
+                rollback = copy.deepcopy(self._state)
+            else:
+                rollback = {
+                    bucket: {
+                        identifier: copy.deepcopy(self._state[bucket][identifier])
+                        for identifier in key_set
+                        if identifier in self._state.get(bucket, {})
+                    }
+                    for bucket in STATE_BUCKETS
+                }
+
+            try:
+                fn(self._state)
+            except BaseException:
+                # Leave the batch as if this update never happened
+                if key_set is None:
+                    self._state.clear()
+                    self._state.update(rollback)
+                else:
+                    for bucket in STATE_BUCKETS:
+                        entries = self._state.setdefault(bucket, {})
+                        for identifier in key_set:
+                            entries.pop(identifier, None)
+                        entries.update(rollback[bucket])
+                raise
+
+    def save(self, state: dict[str, Any]) -> None:
+        with self._lock:
+            self._remember(None)
+            self._state.clear()
+            self._state.update(copy.deepcopy(state))
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._touched and not self._touched_all:
+                return
+            records = _diff_state(
+                self._before, self._state, None if self._touched_all else self._touched
+            )
+            self._before = {}
+            self._touched = set()
+            self._touched_all = False
+
+            if records and _append_journal(self.path, records) >= JOURNAL_COMPACT_EVERY:
+                _save_state_unsafe(self.path, self._state)
+
+    def compact(self) -> None:
+        with self._lock:
+            self.flush()
+            if _read_journal(self.path):
+                _save_state_unsafe(self.path, self._state)
+
+
+# The batch session started by state_batch(), shared by all threads
+_active_batch: StateStore | None = None
+
+
+def get_state_store() -> StateStore:
+    """
+    Get the state store for the configured state file.
+
+    The backend is chosen by file suffix: ``.db``, ``.sqlite`` and
+    ``.sqlite3`` use SQLite (WAL), anything else uses JSON. Inside
+    state_batch() this returns the batch session.
+    """
+    state_file = _get_state_file()
+    batch = _active_batch
+    if batch is not None and batch.path == state_file:
+        return batch
+    if state_file.suffix.lower() in SQLITE_STATE_SUFFIXES:
+        from shelfr.utils.state_sqlite import SqliteStateStore
+
+        return SqliteStateStore(state_file)
+    return JsonStateStore(state_file)
+
+
+@contextmanager
+def state_batch() -> Generator[StateStore, None, None]:
+    """
+    Batch state operations: one lock, one parse, one flush.
+
+    Holds the state lock and the parsed state for the whole body. All state
+    functions called inside (from any thread) read and write the in-memory
+    state; changes are persisted once when the block exits, including when it
+    exits with an exception. Nested batches join the outer one. Other
+    processes block on the lock until the batch exits, so keep batches
+    short and never hold one across long external steps.
+
+    Call flush_state() before any step that cannot be retried (such as the
+    qBittorrent upload) so a crash never loses a checkpoint it depends on,
+    and again right after it so a crash never causes it to be repeated.
+
+    Example:
+        with state_batch():
+            for release in releases:
+                checkpoint_stage(release, "staged")
+    """
+    global _active_batch
+
+    outer = _active_batch
+    if outer is not None and outer.path == _get_state_file():
+        yield outer
+        return
+
+    with get_state_store().batch() as batch:
+        _active_batch = batch
+        try:
+            yield batch
+        finally:
+            _active_batch = outer
+
+
+def flush_state() -> None:
+    """Persist pending mutations of the active state_batch() (no-op outside one)."""
+    batch = _active_batch
+    if batch is not None:
+        batch.flush()
+
+
+def compact_state() -> None:
+    """
+    Compact pending journal records into the state snapshot.
+
+    Called at the end of a pipeline run so the on-disk JSON is complete and
+    human-readable again; safe to call at any time.
+    """
+    get_state_store().compact()
+
+
+def update_state(
+    fn: Callable[[dict[str, Any]], None],
+    *,
+    keys: Iterable[str] | None = None,
+) -> None:
     """
     Thread-safe state update with exclusive locking.
 
@@ -365,40 +992,45 @@ def update_state(fn: Callable[[dict[str, Any]], None]) -> None:
 
     Args:
         fn: Function that mutates the state dict in-place
+        keys: Optional identifiers that ``fn`` touches. Lets the SQLite
+            backend load and write only those rows.
 
     Example:
         def mark_as_done(state):
             state["processed"]["B0123ABC"] = {...}
 
-        update_state(mark_as_done)
+        update_state(mark_as_done, keys=["B0123ABC"])
     """
-    state_file = _get_state_file()
-
-    with _locked_state_file(state_file):
-        state = _load_state_unsafe(state_file)
-        fn(state)
-        _save_state_unsafe(state_file, state)
+    get_state_store().update(fn, keys=keys)
 
 
 def load_state() -> dict[str, Any]:
     """
-    Load state from the JSON file with locking.
+    Load state from the configured store with locking.
 
     Returns empty state if file doesn't exist.
     Validates state structure with Pydantic schema.
 
-    Note: For read-only access, this is safe. For modifications,
+    Note: This returns a private copy. For read-only access prefer
+    read_state() (no copy) or the lookup helpers; for modifications,
     use update_state() instead to ensure atomicity.
     """
-    state_file = _get_state_file()
+    return get_state_store().load()
 
-    with _locked_state_file(state_file):
-        return _load_state_unsafe(state_file)
+
+def read_state() -> Mapping[str, Any]:
+    """
+    Read-only view of the state from the configured store.
+
+    Unlike load_state() the JSON backend hands out its cached state without
+    copying it, so nothing in the view may be mutated.
+    """
+    return get_state_store().view()
 
 
 def save_state(state: dict[str, Any]) -> None:
     """
-    Save state to the JSON file atomically with locking.
+    Save state to the configured store atomically with locking.
 
     DEPRECATED: Prefer update_state() for modifications to ensure
     proper read-modify-write atomicity.
@@ -406,10 +1038,7 @@ def save_state(state: dict[str, Any]) -> None:
     Uses a temporary file and atomic rename to prevent corruption
     if the process crashes during write.
     """
-    state_file = _get_state_file()
-
-    with _locked_state_file(state_file):
-        _save_state_unsafe(state_file, state)
+    get_state_store().save(state)
 
 
 def is_processed(identifier: str) -> bool:
@@ -419,14 +1048,12 @@ def is_processed(identifier: str) -> bool:
     Args:
         identifier: ASIN or path-based identifier
     """
-    state = load_state()
-    return identifier in state.get("processed", {})
+    return get_state_store().contains("processed", identifier)
 
 
 def is_failed(identifier: str) -> bool:
     """Check if a release has previously failed."""
-    state = load_state()
-    return identifier in state.get("failed", {})
+    return get_state_store().contains("failed", identifier)
 
 
 def mark_processed(release: AudiobookRelease, infohash: str | None = None) -> None:
@@ -466,7 +1093,7 @@ def mark_processed(release: AudiobookRelease, infohash: str | None = None) -> No
         if identifier in state.get("failed", {}):
             del state["failed"][identifier]
 
-    update_state(_mark)
+    update_state(_mark, keys=[identifier])
     logger.info(f"Marked as processed: {release.display_name}")
 
 
@@ -510,20 +1137,18 @@ def mark_failed(
             "retry_count": existing.get("retry_count", 0) + 1,
         }
 
-    update_state(_mark)
+    update_state(_mark, keys=[identifier])
     logger.warning(f"Marked as failed: {release.display_name} - {error}")
 
 
 def get_processed_identifiers() -> set[str]:
     """Get all processed identifiers (ASINs and paths)."""
-    state = load_state()
-    return set(state.get("processed", {}).keys())
+    return get_state_store().identifiers("processed")
 
 
 def get_failed_identifiers() -> set[str]:
     """Get all failed identifiers."""
-    state = load_state()
-    return set(state.get("failed", {}).keys())
+    return get_state_store().identifiers("failed")
 
 
 def clear_failed(identifier: str) -> bool:
@@ -541,16 +1166,16 @@ def clear_failed(identifier: str) -> bool:
             removed = True
             logger.info(f"Cleared failed state for: {identifier}")
 
-    update_state(_clear)
+    update_state(_clear, keys=[identifier])
     return removed
 
 
 def get_stats() -> dict[str, int]:
     """Get count statistics from state."""
-    state = load_state()
+    store = get_state_store()
     return {
-        "processed": len(state.get("processed", {})),
-        "failed": len(state.get("failed", {})),
+        "processed": store.count("processed"),
+        "failed": store.count("failed"),
     }
 
 
@@ -588,7 +1213,7 @@ def find_stale_entries() -> list[tuple[str, str, str, str]]:
             print(f"{identifier}: {title} ({status}) missing {missing}")
     """
     stale: list[tuple[str, str, str, str]] = []
-    state = load_state()
+    state = read_state()
 
     for identifier, entry in state.get("processed", {}).items():
         status = entry.get("status", "COMPLETE")
@@ -632,7 +1257,7 @@ def prune_stale_entries(*, dry_run: bool = False) -> list[tuple[str, str]]:
                 del state["processed"][identifier]
                 logger.info(f"Pruned stale entry: {identifier}")
 
-    update_state(_prune)
+    update_state(_prune, keys=to_remove)
     return list(to_remove.items())
 
 
@@ -809,7 +1434,7 @@ def checkpoint_stage(
         if release.torrent_path:
             entry["torrent_path"] = str(release.torrent_path)
 
-    update_state(_checkpoint)
+    update_state(_checkpoint, keys=[identifier])
     logger.debug(f"Checkpointed {stage} for {release.display_name}")
 
 
@@ -824,8 +1449,7 @@ def get_checkpoint(identifier: str, stage: str) -> str | None:
     Returns:
         ISO datetime string if stage completed, None otherwise
     """
-    state = load_state()
-    entry = state.get("processed", {}).get(identifier)
+    entry = get_state_store().get_entry("processed", identifier)
 
     if not entry:
         return None
@@ -847,8 +1471,7 @@ def get_infohash(identifier: str) -> str | None:
     Returns:
         Infohash string or None
     """
-    state = load_state()
-    entry = state.get("processed", {}).get(identifier)
+    entry = get_state_store().get_entry("processed", identifier)
 
     if not entry:
         return None
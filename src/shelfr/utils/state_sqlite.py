@@ -0,0 +1,381 @@
+"""
+SQLite (WAL) backend for pipeline state.
+
+Selected when ``paths.state_file`` ends in ``.db``, ``.sqlite`` or
+``.sqlite3``. Each processed/failed entry is one row, so a checkpoint or
+``mark_processed`` is a single-row transaction instead of a rewrite of the
+whole JSON document.
+
+Schema:
+    meta(key, value)                      - schema version, migration info
+    entries(bucket, identifier, status,   - one row per entry, the full entry
+            infohash, data, updated_at)     dict is kept as JSON in ``data``
+
+On first open, an existing JSON state file next to the database (same stem,
+``.json`` suffix) is imported once, so switching backends keeps history.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Generator, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from shelfr.exceptions import StateCorruptionError, StateLockError
+from shelfr.utils.state import (
+    CURRENT_SCHEMA_VERSION,
+    STATE_BUCKETS,
+    StateStore,
+    _load_state_unsafe,
+    _locked_state_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for another writer before giving up
+BUSY_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    bucket TEXT NOT NULL CHECK (bucket IN ('processed', 'failed')),
+    identifier TEXT NOT NULL,
+    status TEXT,
+    infohash TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (bucket, identifier)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_status ON entries (bucket, status);
+CREATE INDEX IF NOT EXISTS idx_entries_infohash ON entries (infohash);
+"""
+
+
+def _dumps(entry: dict[str, Any]) -> str:
+    """Serialize an entry deterministically (used for storage and diffing)."""
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True)
+
+
+class SqliteStateStore(StateStore):
+    """
+    State stored in SQLite with write-ahead logging.
+
+    Connections are opened per operation, which keeps the store safe to use
+    from worker threads. WAL lets readers proceed while a writer commits.
+    """
+
+    @contextlib.contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection, creating the schema and importing JSON state on first use."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        except PermissionError as e:
+            raise StateLockError(
+                f"Cannot create state directory: {self.path.parent}\n"
+                "Check permissions or configure a valid state file path.",
+                lock_file=self.path,
+            ) from e
+
+        try:
+            # Batches share one connection across worker threads (guarded by a lock)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+        except sqlite3.Error as e:
+            raise StateCorruptionError(f"Cannot open state database {self.path}: {e}") from e
+
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # FULL keeps the per-commit durability of the JSON backend's fsync
+            conn.execute("PRAGMA synchronous=FULL")
+            if self._needs_init(conn):
+                self._initialize(conn)
+            yield conn
+        except sqlite3.DatabaseError as e:
+            if isinstance(e, sqlite3.OperationalError) and "locked" in str(e):
+                raise StateLockError(
+                    f"State database is locked: {self.path}", lock_file=self.path
+                ) from e
+            raise StateCorruptionError(
+                f"State database error.\n\n"
+                f"File: {self.path}\n"
+                f"Error: {e}\n\n"
+                f"Recovery options:\n"
+                f"1. Restore from external backup if available\n"
+                f"2. Export with 'sqlite3 {self.path} .dump' and rebuild\n\n"
+                f"WARNING: Deleting the database will lose all processed/failed state!"
+            ) from e
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _needs_init(conn: sqlite3.Connection) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+        ).fetchone()
+        if row is None:
+            return True
+        version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return version is None
+
+    def _initialize(self, conn: sqlite3.Connection) -> None:
+        """Create tables and run the one-shot JSON import."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in _SCHEMA.strip().split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            # Re-check under the write lock: another process may have won the race
+            done = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if done is None:
+                self._import_json_state(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(CURRENT_SCHEMA_VERSION),),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _import_json_state(self, conn: sqlite3.Connection) -> None:
+        """Import the v1/v2 JSON state file that sits next to the database, if any."""
+        json_file = self.path.with_suffix(".json")
+        if not json_file.exists() and not json_file.with_suffix(".json.bak").exists():
+            return
+
+        # Reuse the JSON loader for .bak recovery and v1 -> v2 migration
+        with _locked_state_file(json_file):
+            state = _load_state_unsafe(json_file)
+
+        count = self._write_state(conn, state)
+        now = datetime.now().isoformat()
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)",
+            (str(json_file),),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_at', ?)",
+            (now,),
+        )
+        logger.info(f"Migrated {count} state entries from {json_file} to {self.path}")
+
+    # ------------------------------------------------------------------
+    # Row helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection, bucket: str, identifier: str, entry: dict[str, Any]
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(bucket, identifier, status, infohash, data, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                bucket,
+                identifier,
+                entry.get("status"),
+                entry.get("infohash"),
+                _dumps(entry),
+                datetime.now().isoformat(),
+            ),
+        )
+
+    @staticmethod
+    def _read_rows(conn: sqlite3.Connection, keys: list[str] | None = None) -> dict[str, Any]:
+        state: dict[str, Any] = {
+            "version": CURRENT_SCHEMA_VERSION,
+            "processed": {},
+            "failed": {},
+        }
+        if keys is None:
+            rows = conn.execute("SELECT bucket, identifier, data FROM entries").fetchall()
+        else:
+            rows = []
+            # Stay well under SQLITE_MAX_VARIABLE_NUMBER
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        "SELECT bucket, identifier, data FROM entries "
+                        f"WHERE identifier IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        for bucket, identifier, data in rows:
+            state[bucket][identifier] = json.loads(data)
+        return state
+
+    def _write_state(self, conn: sqlite3.Connection, state: dict[str, Any]) -> int:
+        """Replace all rows with ``state``. Caller owns the transaction."""
+        conn.execute("DELETE FROM entries")
+        count = 0
+        for bucket in STATE_BUCKETS:
+            for identifier, entry in state.get(bucket, {}).items():
+                self._upsert(conn, bucket, identifier, entry)
+                count += 1
+        return count
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Generator[None, None, None]:
+        """Run the body as one write transaction."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ------------------------------------------------------------------
+    # StateStore API
+    # ------------------------------------------------------------------
+
+    def load(self) -> dict[str, Any]:
+        with self._connect() as conn:
+            return self._read_rows(conn)
+
+    def update(
+        self,
+        fn: Callable[[dict[str, Any]], None],
+        *,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        key_list = list(dict.fromkeys(keys)) if keys is not None else None
+
+        with self._connect() as conn, self._transaction(conn):
+            state = self._read_rows(conn, key_list)
+            before = {
+                (bucket, identifier): _dumps(entry)
+                for bucket in STATE_BUCKETS
+                for identifier, entry in state[bucket].items()
+            }
+
+            fn(state)
+
+            after = {
+                (bucket, identifier): entry
+                for bucket in STATE_BUCKETS
+                for identifier, entry in state.get(bucket, {}).items()
+            }
+            for (bucket, identifier), entry in after.items():
+                if before.get((bucket, identifier)) != _dumps(entry):
+                    self._upsert(conn, bucket, identifier, entry)
+            for bucket, identifier in before.keys() - after.keys():
+                conn.execute(
+                    "DELETE FROM entries WHERE bucket = ? AND identifier = ?",
+                    (bucket, identifier),
+                )
+
+    def save(self, state: dict[str, Any]) -> None:
+        with self._connect() as conn, self._transaction(conn):
+            self._write_state(conn, state)
+
+    @contextlib.contextmanager
+    def batch(self) -> Generator[StateStore, None, None]:
+        with self._connect() as conn:
+            session = _SqliteStateBatch(self.path, conn)
+            try:
+                yield session
+            finally:
+                session.close()
+
+    def get_entry(self, bucket: str, identifier: str) -> dict[str, Any] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM entries WHERE bucket = ? AND identifier = ?",
+                (bucket, identifier),
+            ).fetchone()
+        if row is None:
+            return None
+        entry: dict[str, Any] = json.loads(row[0])
+        return entry
+
+    def identifiers(self, bucket: str) -> set[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT identifier FROM entries WHERE bucket = ?", (bucket,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def count(self, bucket: str) -> int:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE bucket = ?", (bucket,)
+            ).fetchone()
+        return int(row[0])
+
+    def find_by_infohash(self, infohash: str) -> str | None:
+        """Get the processed identifier that uploaded ``infohash``, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT identifier FROM entries WHERE bucket = 'processed' AND infohash = ?",
+                (infohash,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def identifiers_with_status(self, status: str) -> set[str]:
+        """Get processed identifiers currently at ``status`` (e.g. "STAGED")."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT identifier FROM entries WHERE bucket = 'processed' AND status = ?",
+                (status,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+
+class _SqliteStateBatch(SqliteStateStore):
+    """
+    One long write transaction shared by everything inside a state_batch().
+
+    Each update runs in a savepoint so a failing update rolls back alone;
+    flush() commits (one WAL fsync) and opens the next transaction. Readers
+    in other processes keep seeing the last committed state.
+    """
+
+    def __init__(self, path: Path, conn: sqlite3.Connection) -> None:
+        super().__init__(path)
+        self._conn = conn
+        self._lock = threading.RLock()
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    @contextlib.contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._lock:
+            yield self._conn
+
+    @contextlib.contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Generator[None, None, None]:  # type: ignore[override]
+        conn.execute("SAVEPOINT state_update")
+        try:
+            yield
+            conn.execute("RELEASE state_update")
+        except BaseException:
+            conn.execute("ROLLBACK TO state_update")
+            conn.execute("RELEASE state_update")
+            raise
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.execute("COMMIT")
+            self._conn.execute("BEGIN IMMEDIATE")
+
+    def close(self) -> None:
+        """Commit the open transaction (called when the batch exits)."""
+        with self._lock:
+            self._conn.execute("COMMIT")
@@ -0,0 +1,250 @@
+"""Timed spans and per-run JSONL traces for the pipeline.
+
+full_run() opens a RunTrace for the run and the workflow wraps each stage
+(scan, liberate, discovery, validation, staging, metadata, torrent, upload)
+in span(). Every finished span is appended as one JSON line to
+``log_dir()/traces/run-<timestamp>.jsonl`` and its duration is kept for the
+per-stage p50/p95 shown in the run summary.
+
+Spans can be recorded from any thread (the pipelined executor, the streaming
+discovery feed). Outside a run, span() only measures time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+# Trace files kept in the traces directory (oldest are removed first)
+TRACE_RETENTION = 30
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Aggregated durations (seconds) for one stage across a run."""
+
+    count: int
+    total: float
+    p50: float
+    p95: float
+    max: float
+
+    def to_dict(self) -> dict[str, float]:
+        """Plain dict for JSON output and ProgressInfo.extra."""
+        return {
+            "count": self.count,
+            "total": round(self.total, 3),
+            "p50": round(self.p50, 3),
+            "p95": round(self.p95, 3),
+            "max": round(self.max, 3),
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Linear-interpolated percentile of ``values`` (pct in 0-100).
+
+    Returns 0.0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class Span:
+    """A timed section; ``duration`` is set when the span ends."""
+
+    name: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+    duration: float | None = None
+
+    def elapsed(self) -> float:
+        """Seconds since the span started (final duration once ended)."""
+        if self.duration is not None:
+            return self.duration
+        return time.perf_counter() - self._start
+
+
+class RunTrace:
+    """
+    Collects spans for one run and streams them to a JSONL file.
+
+    Use as a context manager: entering makes it the active trace that span()
+    records into, leaving closes the file. A trace file that can't be
+    written only logs a warning; timings are still aggregated in memory.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.run_id = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+        self._lock = threading.Lock()
+        self._durations: dict[str, list[float]] = {}
+        self._file: IO[str] | None = None
+        self._write_failed = False
+
+    @classmethod
+    def for_run(cls, trace_dir: Path | None = None, *, keep: int = TRACE_RETENTION) -> RunTrace:
+        """
+        Create a trace with a new file in ``trace_dir`` (default: log_dir()/traces).
+
+        Older trace files beyond ``keep`` are removed.
+        """
+        if trace_dir is None:
+            from shelfr.paths import log_dir
+
+            trace_dir = log_dir() / "traces"
+        trace = cls()
+        trace.path = trace_dir / f"run-{trace.run_id}.jsonl"
+        _prune_traces(trace_dir, keep=max(keep - 1, 0))
+        return trace
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """Time the block and record it as a span named ``name``."""
+        current = Span(name, attrs)
+        error: str | None = None
+        try:
+            yield current
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            current.duration = current.elapsed()
+            self.record(current, error=error)
+
+    def record(self, span: Span, *, error: str | None = None) -> None:
+        """Add a finished span to the stats and the trace file."""
+        duration = span.elapsed()
+        entry: dict[str, Any] = {
+            "run": self.run_id,
+            "span": span.name,
+            "start": round(span.started_at, 6),
+            "duration": round(duration, 6),
+            "ok": error is None,
+            "thread": threading.current_thread().name,
+        }
+        if error is not None:
+            entry["error"] = error
+        entry.update(span.attrs)
+
+        with self._lock:
+            self._durations.setdefault(span.name, []).append(duration)
+            self._write(entry)
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        """Append one line (call with the lock held)."""
+        if self.path is None or self._write_failed:
+            return
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(json.dumps(entry, default=str) + "\n")
+            self._file.flush()
+        except OSError as e:
+            logger.warning(f"Cannot write run trace {self.path}: {e}")
+            self._write_failed = True
+
+    # -------------------------------------------------------------------------
+    # Results
+    # -------------------------------------------------------------------------
+
+    def stage_timings(self) -> dict[str, StageTiming]:
+        """Per-stage count/total/p50/p95/max, in the order stages first ran."""
+        with self._lock:
+            snapshot = {name: list(values) for name, values in self._durations.items()}
+        return {
+            name: StageTiming(
+                count=len(values),
+                total=sum(values),
+                p50=percentile(values, 50),
+                p95=percentile(values, 95),
+                max=max(values),
+            )
+            for name, values in snapshot.items()
+        }
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> RunTrace:
+        global _active_trace
+        _active_trace = self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        global _active_trace
+        if _active_trace is self:
+            _active_trace = None
+        self.close()
+
+
+# Trace spans are recorded into (set by RunTrace.__enter__)
+_active_trace: RunTrace | None = None
+
+
+def active_trace() -> RunTrace | None:
+    """The trace of the run in progress, if any."""
+    return _active_trace
+
+
+@contextlib.contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span]:
+    """
+    Time a block as a named span of the active run trace.
+
+    Args:
+        name: Stage name ("staging", "metadata", ...)
+        **attrs: Extra fields for the trace line (release name, ASIN, ...)
+
+    Yields:
+        The span; ``elapsed()`` gives its duration so far
+    """
+    trace = _active_trace
+    if trace is None:
+        current = Span(name, attrs)
+        try:
+            yield current
+        finally:
+            current.duration = current.elapsed()
+        return
+    with trace.span(name, **attrs) as current:
+        yield current
+
+
+def _prune_traces(trace_dir: Path, *, keep: int) -> None:
+    """Delete all but the newest ``keep`` trace files."""
+    try:
+        traces = sorted(trace_dir.glob("run-*.jsonl"))
+    except OSError:
+        return
+    for old in traces[: max(len(traces) - keep, 0)]:
+        try:
+            old.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove old trace {old}: {e}")
@@ -0,0 +1,185 @@
+"""Single-pass directory walker for finding audiobook folders.
+
+Discovery (Libation library), ABS import (staging) and ABS rename all look
+for folders that directly contain audio files. This walker lists each
+directory exactly once with ``os.scandir`` and classifies children from the
+``DirEntry`` type info, so no per-file ``stat()`` calls are needed on
+filesystems that report entry types (ext4, xfs, btrfs, NFS, SMB).
+
+Each match comes back with its file listing, so callers don't have to list
+the folder again to find the audio, cover or metadata files.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFolder:
+    """A folder that directly contains audio files."""
+
+    path: Path
+    files: tuple[str, ...]  # Names of all regular files in the folder
+    audio_files: tuple[str, ...]  # Subset of files with an audio extension
+    subdirs: tuple[str, ...] = field(default=())  # Names of child directories
+
+    def file_paths(self) -> list[Path]:
+        """Get full paths for all files in the folder."""
+        return [self.path / name for name in self.files]
+
+
+def _scan(path: Path) -> tuple[list[str], list[os.DirEntry[str]]]:
+    """List a directory once, splitting regular files from subdirectories."""
+    files: list[str] = []
+    subdirs: list[os.DirEntry[str]] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    subdirs.append(entry)
+                elif entry.is_file():
+                    files.append(entry.name)
+            except OSError:
+                # Broken symlink or entry vanished mid-scan
+                continue
+    return files, subdirs
+
+
+def _walk(
+    path: Path,
+    depth: int,
+    extensions: Collection[str],
+    max_depth: int | None,
+    stop_at_match: bool,
+    visited: set[tuple[int, int]],
+) -> Iterator[AudioFolder]:
+    try:
+        files, subdirs = _scan(path)
+    except OSError as e:
+        logger.debug(f"Skipping unreadable directory {path}: {e}")
+        return
+
+    audio = tuple(name for name in files if os.path.splitext(name)[1].lower() in extensions)
+    if audio and depth > 0:
+        yield AudioFolder(path, tuple(files), audio, tuple(e.name for e in subdirs))
+        if stop_at_match:
+            return
+
+    if max_depth is not None and depth >= max_depth:
+        return
+
+    for entry in subdirs:
+        if entry.is_symlink() and not _first_visit(entry, visited):
+            continue
+        yield from _walk(Path(entry.path), depth + 1, extensions, max_depth, stop_at_match, visited)
+
+
+def _first_visit(entry: os.DirEntry[str], visited: set[tuple[int, int]]) -> bool:
+    """Track symlinked directories by (st_dev, st_ino) to avoid cycles."""
+    try:
+        st = entry.stat()
+    except OSError:
+        return False
+    key = (st.st_dev, st.st_ino)
+    if key in visited:
+        return False
+    visited.add(key)
+    return True
+
+
+def iter_audio_folders(
+    root: Path,
+    extensions: Collection[str],
+    *,
+    max_depth: int | None = None,
+    stop_at_match: bool = True,
+    include_root: bool = False,
+    workers: int = 1,
+) -> Iterator[AudioFolder]:
+    """
+    Yield folders under ``root`` that directly contain audio files.
+
+    Folders are yielded as soon as they are found, in depth-first,
+    directory-listing order regardless of ``workers``, so threaded and
+    sequential walks produce the same sequence.
+
+    Args:
+        root: Directory to walk
+        extensions: Lowercase audio extensions including the dot (".m4b")
+        max_depth: Deepest level to examine (1 = immediate children of root);
+            None walks the whole tree
+        stop_at_match: Don't descend into folders that already contain audio
+        include_root: Also report ``root`` itself if it contains audio
+        workers: Walk the root's subtrees on this many threads (useful on
+            network shares where each listing is a round trip)
+
+    Yields:
+        Matching folders with their file listings
+    """
+    try:
+        files, subdirs = _scan(root)
+    except OSError as e:
+        logger.warning(f"Cannot read directory {root}: {e}")
+        return
+
+    audio = tuple(name for name in files if os.path.splitext(name)[1].lower() in extensions)
+    if audio and include_root:
+        yield AudioFolder(root, tuple(files), audio, tuple(e.name for e in subdirs))
+        if stop_at_match:
+            return
+    if max_depth is not None and max_depth < 1:
+        return
+
+    def walk_subtree(entry: os.DirEntry[str]) -> Iterator[AudioFolder]:
+        return _walk(Path(entry.path), 1, extensions, max_depth, stop_at_match, set())
+
+    if workers <= 1 or len(subdirs) <= 1:
+        for entry in subdirs:
+            yield from walk_subtree(entry)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="walk")
+    try:
+        # Subtrees are walked to completion on the pool and yielded in order
+        for subtree in pool.map(lambda entry: list(walk_subtree(entry)), subdirs):
+            yield from subtree
+    finally:
+        # Don't keep walking if the consumer stopped early
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def walk_audio_folders(
+    root: Path,
+    extensions: Collection[str],
+    *,
+    max_depth: int | None = None,
+    stop_at_match: bool = True,
+    include_root: bool = False,
+    workers: int = 1,
+) -> list[AudioFolder]:
+    """
+    Find folders under ``root`` that directly contain audio files.
+
+    List form of iter_audio_folders(); see there for the arguments.
+
+    Returns:
+        Matching folders with their file listings
+    """
+    return list(
+        iter_audio_folders(
+            root,
+            extensions,
+            max_depth=max_depth,
+            stop_at_match=stop_at_match,
+            include_root=include_root,
+            workers=workers,
+        )
+    )
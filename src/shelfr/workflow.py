@@ -13,15 +13,20 @@ Coordinates all processing steps:
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from shelfr.config import get_settings
+from rich.markup import escape
+
+from shelfr.config import PipelineConfig, PipelineStageConfig, get_settings
 from shelfr.console import (
     console,
     format_mediainfo_stats,
@@ -53,15 +58,20 @@ from shelfr.metadata import fetch_metadata, generate_mam_json_for_release
 from shelfr.mkbrr import create_torrent
 from shelfr.models import AudiobookRelease, ProcessingResult, ReleaseStatus
 from shelfr.qbittorrent import upload_torrent
+from shelfr.utils.pipeline import Stage, StagePipeline
 from shelfr.utils.retry import NETWORK_EXCEPTIONS, retry_with_backoff
 from shelfr.utils.state import (
     checkpoint_stage,
+    compact_state,
+    flush_state,
     get_processed_identifiers,
     is_processed,
     mark_failed,
     mark_processed,
     should_skip_stage,
+    state_batch,
 )
+from shelfr.utils.trace import RunTrace, StageTiming, span
 from shelfr.validation import (
     ChapterIntegrityChecker,
     DiscoveryValidation,
@@ -119,6 +129,78 @@ class PipelineResult:
     skipped: int
     results: list[ProcessingResult]
     duration_seconds: float
+    # Per-stage span statistics (count, p50, p95, ...) for this run
+    stage_timings: dict[str, StageTiming] = field(default_factory=dict)
+    trace_path: Path | None = None  # JSONL span trace written for this run
+
+
+# =============================================================================
+# Streaming discovery
+# =============================================================================
+
+
+class ReleaseFeed:
+    """
+    Run a release generator on a background thread and hand releases over.
+
+    Lets full_run() stage release 1 while the library walk is still listing
+    folders. ``discovered`` counts releases found so far and ``done`` turns
+    True once the walk finishes, so progress totals can grow as the walk
+    progresses.
+
+    Use as a context manager; leaving the block early stops the walk.
+    """
+
+    _END = object()
+
+    def __init__(self, releases: Iterator[AudiobookRelease]) -> None:
+        self._releases = releases
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._produce, name="discovery", daemon=True)
+        self.discovered = 0
+        self.done = False
+
+    def _produce(self) -> None:
+        try:
+            with span("discovery", streamed=True):
+                for release in self._releases:
+                    if self._stop.is_set():
+                        break
+                    self.discovered += 1
+                    self._queue.put(release)
+        except BaseException as e:
+            self._error = e
+        finally:
+            # Closing the generator runs its cleanup (e.g. saving the cache)
+            close = getattr(self._releases, "close", None)
+            if close is not None:
+                close()
+            self.done = True
+            self._queue.put(self._END)
+
+    def __enter__(self) -> ReleaseFeed:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def __iter__(self) -> Iterator[AudiobookRelease]:
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                break
+            yield item
+        if self._error is not None:
+            raise self._error
+
+    @property
+    def total_label(self) -> str:
+        """Release total for display: "12" when the walk is done, "12+" while running."""
+        return f"{self.discovered}" if self.done else f"{self.discovered}+"
 
 
 # =============================================================================
@@ -163,59 +245,144 @@ def _upload_torrent_with_retry(
 # =============================================================================
 
 
-def process_single_release(
-    release: AudiobookRelease,
-    skip_metadata: bool = False,
-    preset: str | None = None,
-    progress_callback: ProgressCallback | None = None,
-    release_index: int = 0,
-    release_total: int = 0,
-) -> ProcessingResult:
+# Per-release stages, in order (also the pipelined executor's stages)
+PIPELINE_STAGES = ("staging", "metadata", "torrent", "upload")
+
+# Stages whose state reads and writes share one state_batch(). The others
+# wait on Audnex, mkbrr or qBittorrent and must not hold the state lock, so
+# other shelfr processes can read state while they run.
+_BATCHED_STAGES = frozenset({"staging"})
+
+
+# Serializes tagged per-release output from pipeline workers
+_output_lock = threading.Lock()
+
+
+def _print_for_release(label: str | None, printer: Callable[[str], None], message: str) -> None:
+    """Print a per-release line; with a label, tag it and serialize the output."""
+    if label is None:
+        printer(message)
+        return
+    with _output_lock:
+        printer(f"[cyan]{escape(label)}[/] {message}")
+
+
+def _release_label(index: int, release: AudiobookRelease) -> str:
+    """Tag for a release's lines in pipeline mode."""
+    return f"[{index}] {release.display_name}"
+
+
+class _ReleaseRun:
     """
-    Process a single release through the full pipeline.
+    One release's trip through the pipeline stages.
 
-    Steps:
-    1. Stage (hardlink + rename)
-    2. Fetch metadata (optional)
-    3. Create torrent
-    4. Upload to qBittorrent
-    5. Mark as processed
+    Holds what the stages hand to each other (the staging dir) so
+    they can run back to back in process_single_release() or on separate
+    worker threads in the pipelined executor.
 
-    Args:
-        release: AudiobookRelease to process
-        skip_metadata: Skip Audnex/MediaInfo fetching
-        preset: Override mkbrr preset
-        progress_callback: Optional callback for progress updates
-        release_index: Current release number (1-based) for progress
-        release_total: Total releases being processed
+    With ``batch_state``, the _BATCHED_STAGES run inside a state_batch().
+    The batch session is process-wide, so concurrent stage workers must not
+    open their own; the pipelined executor leaves it off.
 
-    Returns:
-        ProcessingResult with success/failure info
+    With ``output_label`` (pipeline mode), every line printed for the
+    release is tagged with the label, since lines from different releases
+    interleave and a release header would no longer say whose they are.
     """
-    settings = get_settings()
-    start_time = time.time()
 
-    def notify(stage: ProgressStage, message: str = "", **extra: Any) -> None:
+    def __init__(
+        self,
+        release: AudiobookRelease,
+        skip_metadata: bool = False,
+        preset: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+        release_index: int = 0,
+        release_total: int = 0,
+        batch_state: bool = False,
+        output_label: str | None = None,
+    ) -> None:
+        self.release = release
+        self.skip_metadata = skip_metadata
+        self.preset = preset
+        self.progress_callback = progress_callback
+        self.release_index = release_index
+        self.release_total = release_total
+        self.batch_state = batch_state
+        self.output_label = output_label
+        self.settings = get_settings()
+        self.start_time = time.time()
+        self.staging_dir: Path | None = None
+        self.result: ProcessingResult | None = None
+        self.timings: dict[str, float] = {}  # Seconds per stage for this release
+
+    def notify(self, stage: ProgressStage, message: str = "", **extra: Any) -> None:
         """Helper to send progress updates."""
-        if progress_callback:
-            progress_callback(
+        if self.progress_callback:
+            self.progress_callback(
                 ProgressInfo(
                     stage=stage,
-                    release_index=release_index,
-                    release_total=release_total,
-                    release_name=release.display_name,
+                    release_index=self.release_index,
+                    release_total=self.release_total,
+                    release_name=self.release.display_name,
                     message=message,
                     extra=extra,
                 )
             )
 
-    logger.debug(f"Processing: {release.display_name}")
+    def say(self, printer: Callable[[str], None], message: str) -> None:
+        """Print a line about this release (tagged in pipeline mode)."""
+        _print_for_release(self.output_label, printer, message)
+
+    @contextlib.contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record the block as a trace span and in this release's timings."""
+        with span(name, release=self.release.display_name, asin=self.release.asin) as current:
+            try:
+                yield
+            finally:
+                self.timings[name] = current.elapsed()
+
+    def run_stage(self, stage: str) -> bool:
+        """
+        Run one of PIPELINE_STAGES, turning an exception into a failed result.
+
+        Each step is timed as a trace span. Finishing the upload stage
+        completes the release.
+
+        Returns:
+            True if the release should continue to the next stage
+        """
+        steps: dict[str, list[tuple[str, Callable[[], None]]]] = {
+            "staging": [("validation", self.validate), ("staging", self.stage)],
+            "metadata": [] if self.skip_metadata else [("metadata", self.fetch_metadata)],
+            "torrent": [("torrent", self.create_torrent)],
+            "upload": [("upload", self.upload)],
+        }
+        batched = self.batch_state and stage in _BATCHED_STAGES
+        with state_batch() if batched else contextlib.nullcontext():
+            for name, step in steps[stage]:
+                try:
+                    with self.timed(name):
+                        step()
+                except Exception as e:
+                    self.fail(e)
+                    return False
+        if stage == PIPELINE_STAGES[-1]:
+            self.complete()
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # Stages
+    # -------------------------------------------------------------------------
+
+    def validate(self) -> None:
+        """Run discovery validation (duplicates, required files)."""
+        release = self.release
 
-    try:
         # ---------------------------------------------------------------------
         # 0. Discovery Validation (pre-flight checks)
         # ---------------------------------------------------------------------
-        notify(ProgressStage.VALIDATION, "Validating release...")
+        self.notify(ProgressStage.VALIDATION, "Validating release...")
         logger.debug("Step 0: Discovery validation")
 
         # Load processed identifiers for duplicate detection
@@ -228,7 +395,7 @@ def process_single_release(
             if check.passed:
                 logger.debug(f"  {check.icon} {check.name}: {check.message}")
             elif check.severity == "warning":
-                print_warning(f"Validation: {check.message}")
+                self.say(print_warning, f"Validation: {check.message}")
             else:
                 logger.warning(f"  {check.icon} {check.name}: {check.message}")
 
@@ -244,9 +411,15 @@ def process_single_release(
             )
 
         if discovery_result.warning_count > 0:
-            print_warning(f"Validation passed with {discovery_result.warning_count} warning(s)")
+            self.say(
+                print_warning, f"Validation passed with {discovery_result.warning_count} warning(s)"
+            )
         else:
-            print_success("Validation passed")
+            self.say(print_success, "Validation passed")
+
+    def stage(self) -> None:
+        """Hardlink the release into the seed directory (or resume from checkpoint)."""
+        release = self.release
 
         # ---------------------------------------------------------------------
         # 1. Stage
@@ -267,87 +440,99 @@ def process_single_release(
                 )
             release.status = ReleaseStatus.STAGED
         else:
-            notify(ProgressStage.STAGING, "Creating hardlinks...")
+            self.notify(ProgressStage.STAGING, "Creating hardlinks...")
             logger.debug("Step 1: Staging release")
             staging_dir = stage_release(release)
             # Show truncated path - full path available in logs via --verbose
             display_path = truncate_path(str(staging_dir), max_length=60)
-            print_success(f"Staged → {display_path}")
+            self.say(print_success, f"Staged → {display_path}")
             release.status = ReleaseStatus.STAGED
             checkpoint_stage(release, "staged")
 
+        self.staging_dir = staging_dir
+
+    def fetch_metadata(self) -> None:
+        """Fetch Audnex + MediaInfo metadata and validate it."""
+        release = self.release
+
         # ---------------------------------------------------------------------
         # 2. Metadata (optional)
         # ---------------------------------------------------------------------
-        if not skip_metadata:
-            if should_skip_stage(release, "metadata"):
-                logger.info("Skipping metadata (already completed)")
-                release.status = ReleaseStatus.METADATA_FETCHED
-            else:
-                notify(ProgressStage.METADATA, "Fetching Audnex + MediaInfo...")
-                logger.debug("Step 2: Fetching metadata")
-                audnex_data, mediainfo_data, audnex_chapters = _fetch_metadata_with_retry(
-                    asin=release.asin,
-                    m4b_path=release.main_m4b,
-                )
-                release.audnex_metadata = audnex_data
-                release.mediainfo_data = mediainfo_data
-                release.audnex_chapters = audnex_chapters
-                if audnex_data:
-                    print_success(f"Audnex metadata for {release.asin}")
-
-                    # Check if Audnex title differs significantly from Libation title
-                    from shelfr.utils.fuzzy import similarity_ratio
-
-                    audnex_title = audnex_data.get("title", "")
-                    libation_title = release.title or ""
-                    if audnex_title and libation_title:
-                        title_similarity = similarity_ratio(audnex_title, libation_title)
-                        if title_similarity < 70:
-                            print_warning(
-                                f"Title mismatch: Libation='{libation_title}' vs "
-                                f"Audnex='{audnex_title}' ({title_similarity:.0f}% similar)"
-                            )
-
-                if audnex_chapters:
-                    chapter_count = len(audnex_chapters.get("chapters", []))
-                    print_success(f"Audnex chapters: {chapter_count} chapters")
-                if mediainfo_data:
-                    stats = format_mediainfo_stats(mediainfo_data)
-                    if stats:
-                        print_success(f"MediaInfo: {stats}")
-                    else:
-                        print_success("MediaInfo extracted")
-                release.status = ReleaseStatus.METADATA_FETCHED
-                checkpoint_stage(release, "metadata")
-
-            # -----------------------------------------------------------------
-            # 2b. Metadata Validation
-            # -----------------------------------------------------------------
-            logger.debug("Step 2b: Metadata validation")
-            metadata_validator = MetadataValidation()
-            metadata_result = metadata_validator.validate(
-                release, audnex_data=audnex_data, mediainfo_data=mediainfo_data
+        if should_skip_stage(release, "metadata"):
+            logger.info("Skipping metadata (already completed)")
+            release.status = ReleaseStatus.METADATA_FETCHED
+        else:
+            self.notify(ProgressStage.METADATA, "Fetching Audnex + MediaInfo...")
+            logger.debug("Step 2: Fetching metadata")
+            audnex_data, mediainfo_data, audnex_chapters = _fetch_metadata_with_retry(
+                asin=release.asin,
+                m4b_path=release.main_m4b,
             )
+            release.audnex_metadata = audnex_data
+            release.mediainfo_data = mediainfo_data
+            release.audnex_chapters = audnex_chapters
+            if audnex_data:
+                self.say(print_success, f"Audnex metadata for {release.asin}")
+
+                # Check if Audnex title differs significantly from Libation title
+                from shelfr.utils.fuzzy import similarity_ratio
+
+                audnex_title = audnex_data.get("title", "")
+                libation_title = release.title or ""
+                if audnex_title and libation_title:
+                    title_similarity = similarity_ratio(audnex_title, libation_title)
+                    if title_similarity < 70:
+                        self.say(
+                            print_warning,
+                            f"Title mismatch: Libation='{libation_title}' vs "
+                            f"Audnex='{audnex_title}' ({title_similarity:.0f}% similar)",
+                        )
 
-            for check in metadata_result.checks:
-                if not check.passed and check.severity == "warning":
-                    print_warning(f"Metadata: {check.message}")
-
-            # -----------------------------------------------------------------
-            # 2c. Chapter Integrity Check
-            # -----------------------------------------------------------------
             if audnex_chapters:
-                logger.debug("Step 2c: Chapter integrity check")
-                chapter_checker = ChapterIntegrityChecker()
-                chapter_result = chapter_checker.validate(release, audnex_chapters)
-
-                for check in chapter_result.checks:
-                    if not check.passed:
-                        if check.severity == "warning":
-                            print_warning(f"Chapters: {check.message}")
-                        else:
-                            print_error(f"Chapters: {check.message}")
+                chapter_count = len(audnex_chapters.get("chapters", []))
+                self.say(print_success, f"Audnex chapters: {chapter_count} chapters")
+            if mediainfo_data:
+                stats = format_mediainfo_stats(mediainfo_data)
+                if stats:
+                    self.say(print_success, f"MediaInfo: {stats}")
+                else:
+                    self.say(print_success, "MediaInfo extracted")
+            release.status = ReleaseStatus.METADATA_FETCHED
+            checkpoint_stage(release, "metadata")
+
+        # ---------------------------------------------------------------------
+        # 2b. Metadata Validation
+        # ---------------------------------------------------------------------
+        logger.debug("Step 2b: Metadata validation")
+        metadata_validator = MetadataValidation()
+        metadata_result = metadata_validator.validate(
+            release, audnex_data=release.audnex_metadata, mediainfo_data=release.mediainfo_data
+        )
+
+        for check in metadata_result.checks:
+            if not check.passed and check.severity == "warning":
+                self.say(print_warning, f"Metadata: {check.message}")
+
+        # ---------------------------------------------------------------------
+        # 2c. Chapter Integrity Check
+        # ---------------------------------------------------------------------
+        if release.audnex_chapters:
+            logger.debug("Step 2c: Chapter integrity check")
+            chapter_checker = ChapterIntegrityChecker()
+            chapter_result = chapter_checker.validate(release, release.audnex_chapters)
+
+            for check in chapter_result.checks:
+                if not check.passed:
+                    if check.severity == "warning":
+                        self.say(print_warning, f"Chapters: {check.message}")
+                    else:
+                        self.say(print_error, f"Chapters: {check.message}")
+
+    def create_torrent(self) -> None:
+        """Create the torrent and MAM JSON, then run pre-upload validation."""
+        release = self.release
+        settings = self.settings
+        staging_dir = self._require_staging_dir()
 
         # ---------------------------------------------------------------------
         # 3. Create torrent
@@ -367,13 +552,13 @@ def process_single_release(
                 )
             release.status = ReleaseStatus.TORRENT_CREATED
         else:
-            notify(ProgressStage.TORRENT, "Creating torrent file...")
+            self.notify(ProgressStage.TORRENT, "Creating torrent file...")
             logger.debug("Step 3: Creating torrent")
 
             mkbrr_result = create_torrent(
                 content_path=staging_dir,
                 output_dir=release_output_dir,
-                preset=preset or settings.mkbrr.preset,
+                preset=self.preset or settings.mkbrr.preset,
             )
 
             if not mkbrr_result.success:
@@ -396,7 +581,7 @@ def process_single_release(
             release.torrent_path = mkbrr_result.torrent_path
             release.status = ReleaseStatus.TORRENT_CREATED
             if mkbrr_result.torrent_path:
-                print_success(f"Torrent: {mkbrr_result.torrent_path.name}")
+                self.say(print_success, f"Torrent: {mkbrr_result.torrent_path.name}")
 
                 # Extract and checkpoint infohash for idempotent upload checks
                 from shelfr.utils.torrent import extract_infohash
@@ -407,11 +592,11 @@ def process_single_release(
         # ---------------------------------------------------------------------
         # 3b. Generate MAM fast-upload JSON (saved with torrent file)
         # ---------------------------------------------------------------------
-        if not skip_metadata and (release.audnex_metadata or release.mediainfo_data):
+        if not self.skip_metadata and (release.audnex_metadata or release.mediainfo_data):
             logger.debug("Step 3b: Generating MAM fast-upload JSON")
             mam_json_path = generate_mam_json_for_release(release, output_dir=release_output_dir)
             if mam_json_path:
-                print_success(f"MAM JSON: {mam_json_path.name}")
+                self.say(print_success, f"MAM JSON: {mam_json_path.name}")
 
         # ---------------------------------------------------------------------
         # 3c. Pre-Upload Validation
@@ -428,12 +613,18 @@ def process_single_release(
                         errors=[check.message],
                     )
                 elif check.severity == "warning":
-                    print_warning(f"Pre-upload: {check.message}")
+                    self.say(print_warning, f"Pre-upload: {check.message}")
+
+    def upload(self) -> None:
+        """Add the torrent to qBittorrent and mark the release processed."""
+        release = self.release
+        settings = self.settings
+        staging_dir = self._require_staging_dir()
 
         # ---------------------------------------------------------------------
         # 4. Upload to qBittorrent
         # ---------------------------------------------------------------------
-        notify(ProgressStage.UPLOAD, "Uploading to qBittorrent...")
+        self.notify(ProgressStage.UPLOAD, "Uploading to qBittorrent...")
         logger.debug("Step 4: Uploading to qBittorrent")
 
         if release.torrent_path is None:
@@ -457,6 +648,9 @@ def process_single_release(
             # No save_path configured - let qBittorrent use its default
             qb_save_path = None
 
+        # Persist batched checkpoints before the step that can't be rolled back
+        flush_state()
+
         success, infohash = _upload_torrent_with_retry(
             torrent_path=release.torrent_path,
             save_path=qb_save_path,
@@ -486,42 +680,184 @@ def process_single_release(
         # Format the qBittorrent success message with explicit labels
         qb_category = settings.qbittorrent.category or "audiobooks"
         hash_short = infohash[:8] + "…" + infohash[-4:] if infohash else "?"
-        print_success(f"Uploaded to qBittorrent (category={qb_category}, hash={hash_short})")
+        self.say(
+            print_success, f"Uploaded to qBittorrent (category={qb_category}, hash={hash_short})"
+        )
 
         # ---------------------------------------------------------------------
         # 5. Mark as complete
         # ---------------------------------------------------------------------
         release.status = ReleaseStatus.COMPLETE
         mark_processed(release, infohash=infohash)
+        # Persist the processed record too, so a crash can't cause a re-upload
+        flush_state()
+
+    def complete(self) -> ProcessingResult:
+        """Report success once every stage has run."""
+        duration = time.time() - self.start_time
+        self.notify(
+            ProgressStage.COMPLETE, f"Completed in {duration:.1f}s", timings=dict(self.timings)
+        )
 
-        duration = time.time() - start_time
-        notify(ProgressStage.COMPLETE, f"Completed in {duration:.1f}s")
-
-        return ProcessingResult(
-            release=release,
+        self.result = ProcessingResult(
+            release=self.release,
             success=True,
-            torrent_path=release.torrent_path,
+            torrent_path=self.release.torrent_path,
             duration_seconds=duration,
         )
+        return self.result
 
-    except Exception as e:
-        duration = time.time() - start_time
-        error_msg = str(e)
+    def fail(self, error: Exception) -> ProcessingResult:
+        """Record a failure: notify, mark failed in state and build the result."""
+        release = self.release
+        duration = time.time() - self.start_time
+        error_msg = str(error)
 
-        notify(ProgressStage.FAILED, error_msg, error=error_msg)
-        print_error(f"Failed: {error_msg}")
+        self.notify(ProgressStage.FAILED, error_msg, error=error_msg, timings=dict(self.timings))
+        self.say(print_error, f"Failed: {error_msg}")
         logger.debug(f"Full error for {release.display_name}: {error_msg}")
 
         release.status = ReleaseStatus.FAILED
         release.error = error_msg
         mark_failed(release, error_msg)
 
-        return ProcessingResult(
+        self.result = ProcessingResult(
             release=release,
             success=False,
             error=error_msg,
             duration_seconds=duration,
         )
+        return self.result
+
+    def _require_staging_dir(self) -> Path:
+        if self.staging_dir is None:
+            raise StagingError(
+                f"Internal error: {self.release.display_name} was not staged",
+                details={"asin": self.release.asin},
+            )
+        return self.staging_dir
+
+
+def process_single_release(
+    release: AudiobookRelease,
+    skip_metadata: bool = False,
+    preset: str | None = None,
+    progress_callback: ProgressCallback | None = None,
+    release_index: int = 0,
+    release_total: int = 0,
+) -> ProcessingResult:
+    """
+    Process a single release through the full pipeline.
+
+    Steps:
+    1. Stage (hardlink + rename)
+    2. Fetch metadata (optional)
+    3. Create torrent
+    4. Upload to qBittorrent
+    5. Mark as processed
+
+    Args:
+        release: AudiobookRelease to process
+        skip_metadata: Skip Audnex/MediaInfo fetching
+        preset: Override mkbrr preset
+        progress_callback: Optional callback for progress updates
+        release_index: Current release number (1-based) for progress
+        release_total: Total releases being processed
+
+    Returns:
+        ProcessingResult with success/failure info
+    """
+    run = _ReleaseRun(
+        release,
+        skip_metadata=skip_metadata,
+        preset=preset,
+        progress_callback=progress_callback,
+        release_index=release_index,
+        release_total=release_total,
+        batch_state=True,
+    )
+    logger.debug(f"Processing: {release.display_name}")
+
+    for stage in PIPELINE_STAGES:
+        if not run.run_stage(stage):
+            break
+
+    assert run.result is not None
+    return run.result
+
+
+# =============================================================================
+# Pipelined Execution
+# =============================================================================
+
+
+def _serialized(callback: ProgressCallback | None) -> ProgressCallback | None:
+    """Wrap a progress callback so worker threads never call it concurrently."""
+    if callback is None:
+        return None
+    lock = threading.Lock()
+
+    def call(info: ProgressInfo) -> None:
+        with lock:
+            callback(info)
+
+    return call
+
+
+def _run_pipelined(
+    releases: Iterable[tuple[int, AudiobookRelease]],
+    config: PipelineConfig,
+    *,
+    skip_metadata: bool = False,
+    progress_callback: ProgressCallback | None = None,
+    release_total: Callable[[], int] = lambda: 0,
+) -> list[ProcessingResult]:
+    """
+    Process releases with the stages overlapping across releases.
+
+    Staging, metadata, torrent and upload each run on their own worker threads
+    with a bounded queue in front (sized by ``config``), so release N+1's
+    Audnex fetch runs while release N's torrent is hashed. Each release still
+    goes through the stages in order with the same checkpoints as
+    process_single_release(), and its progress events arrive in the same
+    order; events from different releases interleave. Callbacks are never
+    called concurrently, and console lines are tagged with their release
+    (see _release_label()).
+
+    Args:
+        releases: (index, release) pairs, consumed as queue space frees up
+        config: Per-stage worker counts and queue sizes
+        skip_metadata: Skip Audnex/MediaInfo fetching
+        progress_callback: Optional callback for progress updates
+        release_total: Current release total for progress (grows when streaming)
+
+    Returns:
+        ProcessingResult for each release, in input order
+    """
+    callback = _serialized(progress_callback)
+    runs = (
+        _ReleaseRun(
+            release,
+            skip_metadata=skip_metadata,
+            progress_callback=callback,
+            release_index=i,
+            release_total=release_total(),
+            output_label=_release_label(i, release),
+        )
+        for i, release in releases
+    )
+
+    def stage(name: str) -> Stage[_ReleaseRun]:
+        stage_config: PipelineStageConfig = getattr(config, name)
+        return Stage(
+            name,
+            lambda run: run.run_stage(name),
+            workers=stage_config.workers,
+            queue_size=stage_config.queue_size,
+        )
+
+    executor = StagePipeline([stage(name) for name in PIPELINE_STAGES])
+    return [run.result for run in executor.run(runs) if run.result is not None]
 
 
 # =============================================================================
@@ -535,20 +871,60 @@ def full_run(
     dry_run: bool = False,
     verbose: bool = False,
     progress_callback: ProgressCallback | None = None,
+    stream: bool = False,
+    pipeline: bool | None = None,
 ) -> PipelineResult:
     """
     Run the complete pipeline from Libation scan to qBittorrent upload.
 
+    Every stage is timed; spans go to a JSONL trace under
+    ``log_dir()/traces`` (not written in dry-run mode) and per-stage
+    p50/p95 are shown in the summary and returned in
+    ``PipelineResult.stage_timings``.
+
     Args:
         skip_scan: Skip Libation scan step
         skip_metadata: Skip metadata fetching
         dry_run: Show what would happen without making changes
         verbose: Enable verbose mode (pass through Libation progress if on TTY)
         progress_callback: Optional callback for progress updates
+        stream: Process releases as discovery yields them instead of waiting
+            for the full library walk. ``ProgressInfo.release_total`` is then
+            the number of releases discovered so far.
+        pipeline: Run stages concurrently (see _run_pipelined()). None uses
+            the ``pipeline.enabled`` setting.
 
     Returns:
         PipelineResult with statistics
     """
+    trace = RunTrace() if dry_run else RunTrace.for_run()
+    with trace:
+        result = _full_run(
+            trace,
+            skip_scan=skip_scan,
+            skip_metadata=skip_metadata,
+            dry_run=dry_run,
+            verbose=verbose,
+            progress_callback=progress_callback,
+            stream=stream,
+            pipeline=pipeline,
+        )
+    result.stage_timings = trace.stage_timings()
+    result.trace_path = trace.path
+    return result
+
+
+def _full_run(
+    trace: RunTrace,
+    skip_scan: bool = False,
+    skip_metadata: bool = False,
+    dry_run: bool = False,
+    verbose: bool = False,
+    progress_callback: ProgressCallback | None = None,
+    stream: bool = False,
+    pipeline: bool | None = None,
+) -> PipelineResult:
+    """Body of full_run(), run with ``trace`` as the active run trace."""
     start_time = time.time()
 
     def notify(stage: ProgressStage, message: str = "", **extra: Any) -> None:
@@ -604,7 +980,8 @@ def full_run(
         print_step(1, 4, "Libation Scan")
         if not dry_run:
             # Step 1a: Run scan to index new books from Audible
-            scan_result = run_scan()
+            with span("scan"):
+                scan_result = run_scan()
             if not scan_result.success:
                 print_warning(f"Libation scan returned non-zero: {scan_result.returncode}")
             else:
@@ -620,11 +997,12 @@ def full_run(
                     # Use progress-aware liberate function
                     # - Normal mode: Rich spinner, logs to file
                     # - Verbose + TTY: Pass through Libation's native progress bar
-                    liberate_result = run_liberate_with_progress(
-                        pending_count=status.not_liberated,
-                        console=console,
-                        verbose=verbose,
-                    )
+                    with span("liberate", pending=status.not_liberated):
+                        liberate_result = run_liberate_with_progress(
+                            pending_count=status.not_liberated,
+                            console=console,
+                            verbose=verbose,
+                        )
                     if not liberate_result.success:
                         print_warning(
                             f"Libation liberate returned non-zero: {liberate_result.returncode}"
@@ -676,7 +1054,8 @@ def full_run(
                 # Status check failed - fall back to always running liberate
                 print_warning(f"Could not check Libation status: {e}")
                 print_info("Running liberate anyway (fallback)...")
-                fallback_result = run_liberate()
+                with span("liberate", fallback=True):
+                    fallback_result = run_liberate()
                 if not fallback_result.success:
                     print_warning(
                         f"Libation liberate returned non-zero: {fallback_result.returncode}"
@@ -693,126 +1072,187 @@ def full_run(
     step_num = 1 if skip_scan else 2
     print_step(step_num, 4 if not skip_scan else 3, "Discovering Releases")
 
-    from shelfr.discovery import get_new_releases
+    from shelfr.discovery import get_new_releases, iter_releases
 
-    try:
-        settings = get_settings()
-        releases = get_new_releases(
-            settings.paths.library_root,
-            settings.paths.state_file,
-        )
-    except NotImplementedError:
-        logger.warning("Discovery not yet implemented - no releases to process")
-        releases = []
+    settings = get_settings()
+    feed: ReleaseFeed | None = None
+    releases: Iterable[AudiobookRelease]
+
+    if stream:
+        # Walk on a background thread; the loop below starts on the first release
+        feed = ReleaseFeed(iter_releases(settings.paths.library_root, new_only=True))
+        releases = feed
+        console.print("[dim]Streaming discovery: releases are processed as they are found[/]")
+    else:
+        try:
+            with span("discovery"):
+                release_list = get_new_releases(
+                    settings.paths.library_root,
+                    settings.paths.state_file,
+                )
+        except NotImplementedError:
+            logger.warning("Discovery not yet implemented - no releases to process")
+            release_list = []
+
+        if not release_list:
+            console.print("[dim]No new releases found[/]")
+            return PipelineResult(
+                total=0,
+                successful=0,
+                failed=0,
+                skipped=0,
+                results=[],
+                duration_seconds=time.time() - start_time,
+            )
 
-    if not releases:
-        console.print("[dim]No new releases found[/]")
-        return PipelineResult(
-            total=0,
-            successful=0,
-            failed=0,
-            skipped=0,
-            results=[],
-            duration_seconds=time.time() - start_time,
-        )
+        console.print(f"Found [highlight]{len(release_list)}[/] new release(s)")
+        releases = release_list
 
-    console.print(f"Found [highlight]{len(releases)}[/] new release(s)")
+    def release_total() -> int:
+        """Releases discovered so far (final once the walk has finished)."""
+        return feed.discovered if feed else len(release_list)
 
     # -------------------------------------------------------------------------
     # 3. Process each release
     # -------------------------------------------------------------------------
-    results = []
+    results: list[ProcessingResult] = []
     skipped = 0
+    use_pipeline = settings.pipeline.enabled if pipeline is None else pipeline
+
+    def runnable() -> Iterator[tuple[int, AudiobookRelease]]:
+        """Yield (index, release) for releases that pass the skip/validation checks."""
+        nonlocal skipped
+        for i, release in enumerate(releases, 1):
+            # Pipeline workers print while later releases are pulled from the
+            # feed, so a header would sit above other releases' lines: tag them
+            label = _release_label(i, release) if use_pipeline and not dry_run else None
+
+            if label is None:
+                total_label = feed.total_label if feed else str(release_total())
+                console.print()  # Blank line before each release header
+                console.print(f"[bold cyan]── [{i}/{total_label}] {release.display_name} ──[/]")
+
+            # Check if already processed
+            identifier = release.asin or str(release.source_dir)
+            if identifier and is_processed(identifier):
+                _print_for_release(label, print_info, "Skipping (already processed)")
+                skipped += 1
+                continue
+
+            # Run validation (even in dry-run mode to show warnings)
+            processed_ids = get_processed_identifiers()
+            discovery_validator = DiscoveryValidation(processed_identifiers=processed_ids)
+            discovery_result = discovery_validator.validate(release)
+
+            # Log validation results
+            for check in discovery_result.checks:
+                if not check.passed and check.severity == "warning":
+                    _print_for_release(label, print_warning, f"Validation: {check.message}")
+
+            if not discovery_result.passed:
+                failed_checks = [
+                    c for c in discovery_result.checks if not c.passed and c.severity == "error"
+                ]
+                error_msgs = [c.message for c in failed_checks]
+                _print_for_release(
+                    label, print_error, "Validation failed: " + ", ".join(error_msgs)
+                )
+                skipped += 1
+                continue
+
+            if discovery_result.warning_count > 0:
+                _print_for_release(
+                    label,
+                    print_warning,
+                    f"Validation passed with {discovery_result.warning_count} warning(s)",
+                )
 
-    # Process each release
-    for i, release in enumerate(releases, 1):
-        console.print()  # Blank line before each release header
-        console.print(f"[bold cyan]── [{i}/{len(releases)}] {release.display_name} ──[/]")
-
-        # Check if already processed
-        identifier = release.asin or str(release.source_dir)
-        if identifier and is_processed(identifier):
-            print_info("Skipping (already processed)")
-            skipped += 1
-            continue
-
-        # Run validation (even in dry-run mode to show warnings)
-        processed_ids = get_processed_identifiers()
-        discovery_validator = DiscoveryValidation(processed_identifiers=processed_ids)
-        discovery_result = discovery_validator.validate(release)
-
-        # Log validation results
-        for check in discovery_result.checks:
-            if not check.passed and check.severity == "warning":
-                print_warning(f"Validation: {check.message}")
-
-        if not discovery_result.passed:
-            failed_checks = [
-                c for c in discovery_result.checks if not c.passed and c.severity == "error"
-            ]
-            error_msgs = [c.message for c in failed_checks]
-            print_error("Validation failed: " + ", ".join(error_msgs))
-            skipped += 1
-            continue
-
-        if discovery_result.warning_count > 0:
-            print_warning(f"Validation passed with {discovery_result.warning_count} warning(s)")
-
-        if dry_run:
-            # Show detailed dry-run info for each step
-            print_dry_run("Steps that would be performed:")
-
-            # Step 1: Stage - compute actual staging path (same logic as real run)
-            if release.source_dir:
-                seed_root = settings.paths.seed_root
-                try:
-                    mam_path = compute_staging_path(release)
-                    staging_dir = seed_root / mam_path.folder
-                    print_dry_run(f"STAGE → {staging_dir}")
-                    if mam_path.truncated:
-                        print_dry_run(f"  (truncated: dropped {mam_path.dropped_components})")
+            if dry_run:
+                # Show detailed dry-run info for each step
+                print_dry_run("Steps that would be performed:")
 
-                    # Show file renames
+                # Step 1: Stage - compute actual staging path (same logic as real run)
+                if release.source_dir:
+                    seed_root = settings.paths.seed_root
                     try:
-                        renames = preview_staging(release)
-                        for src_name, dst_name in renames:
-                            if src_name != dst_name:
-                                print_dry_run(f"  RENAME: {src_name} → {dst_name}")
-                            else:
-                                print_dry_run(f"  HARDLINK: {src_name}")
-                    except ValueError:
-                        pass  # Already handled above
-                except ValueError as e:
-                    # Missing ASIN or source_dir
-                    print_dry_run(f"STAGE → Error: {e}")
-
-            # Step 2: Metadata
-            if not skip_metadata:
-                if release.asin:
-                    print_dry_run(f"METADATA → Fetch Audnex for {release.asin}")
-                if release.main_m4b:
-                    print_dry_run(f"METADATA → MediaInfo on {release.main_m4b.name}")
-            else:
-                print_dry_run("METADATA → [SKIPPED]")
+                        mam_path = compute_staging_path(release)
+                        staging_dir = seed_root / mam_path.folder
+                        print_dry_run(f"STAGE → {staging_dir}")
+                        if mam_path.truncated:
+                            print_dry_run(f"  (truncated: dropped {mam_path.dropped_components})")
 
-            # Step 3: Torrent
-            print_dry_run(f"TORRENT → Create with preset '{settings.mkbrr.preset}'")
-
-            # Step 4: Upload
-            print_dry_run(f"UPLOAD → Add to qBittorrent ({settings.qbittorrent.category})")
-
-            # Step 5: Mark processed
-            print_dry_run(f"STATE → Mark {identifier} as processed")
-            continue
+                        # Show file renames
+                        try:
+                            renames = preview_staging(release)
+                            for src_name, dst_name in renames:
+                                if src_name != dst_name:
+                                    print_dry_run(f"  RENAME: {src_name} → {dst_name}")
+                                else:
+                                    print_dry_run(f"  HARDLINK: {src_name}")
+                        except ValueError:
+                            pass  # Already handled above
+                    except ValueError as e:
+                        # Missing ASIN or source_dir
+                        print_dry_run(f"STAGE → Error: {e}")
+
+                # Step 2: Metadata
+                if not skip_metadata:
+                    if release.asin:
+                        print_dry_run(f"METADATA → Fetch Audnex for {release.asin}")
+                    if release.main_m4b:
+                        print_dry_run(f"METADATA → MediaInfo on {release.main_m4b.name}")
+                else:
+                    print_dry_run("METADATA → [SKIPPED]")
+
+                # Step 3: Torrent
+                print_dry_run(f"TORRENT → Create with preset '{settings.mkbrr.preset}'")
+
+                # Step 4: Upload
+                print_dry_run(f"UPLOAD → Add to qBittorrent ({settings.qbittorrent.category})")
+
+                # Step 5: Mark processed
+                print_dry_run(f"STATE → Mark {identifier} as processed")
+                continue
+
+            yield i, release
+
+    # State is batched per stage inside each release (see _BATCHED_STAGES), never
+    # across the whole run, so the state lock is free during torrent creation
+    # and uploads
+    with feed or contextlib.nullcontext():
+        if use_pipeline:
+            results = _run_pipelined(
+                runnable(),
+                settings.pipeline,
+                skip_metadata=skip_metadata,
+                progress_callback=progress_callback,
+                release_total=release_total,
+            )
+        else:
+            for i, release in runnable():
+                result = process_single_release(
+                    release,
+                    skip_metadata=skip_metadata,
+                    progress_callback=progress_callback,
+                    release_index=i,
+                    release_total=release_total(),
+                )
+                results.append(result)
 
-        result = process_single_release(
-            release,
-            skip_metadata=skip_metadata,
-            progress_callback=progress_callback,
-            release_index=i,
-            release_total=len(releases),
+    if feed and not feed.discovered:
+        console.print("[dim]No new releases found[/]")
+        return PipelineResult(
+            total=0,
+            successful=0,
+            failed=0,
+            skipped=0,
+            results=[],
+            duration_seconds=time.time() - start_time,
         )
-        results.append(result)
+
+    # Fold this run's journaled state mutations back into the snapshot
+    if results:
+        compact_state()
 
     # -------------------------------------------------------------------------
     # Summary
@@ -820,6 +1260,7 @@ def full_run(
     duration = time.time() - start_time
     successful = sum(1 for r in results if r.success)
     failed = sum(1 for r in results if not r.success)
+    stage_timings = trace.stage_timings()
 
     notify(
         ProgressStage.COMPLETE,
@@ -827,12 +1268,13 @@ def full_run(
         successful=successful,
         failed=failed,
         skipped=skipped,
+        stage_timings={name: t.to_dict() for name, t in stage_timings.items()},
     )
 
     # Print workflow summary table (includes duration)
     print_workflow_summary(
         {
-            "discovered": len(releases),
+            "discovered": release_total(),
             "staged": successful,
             "metadata": successful if not skip_metadata else 0,
             "torrents": successful,
@@ -841,10 +1283,13 @@ def full_run(
             "errors": failed,
         },
         duration=duration,
+        timings=stage_timings,
     )
+    if trace.path is not None:
+        console.print(f"[dim]Trace: {trace.path}[/]")
 
     return PipelineResult(
-        total=len(releases),
+        total=release_total(),
         successful=successful,
         failed=failed,
         skipped=skipped,
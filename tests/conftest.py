@@ -2,9 +2,64 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shelfr.config import AudiobookshelfConfig, MediaInfoConfig
 from shelfr.utils.cmd import CmdResult
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep persistent caches (e.g. discovery) and run traces out of the user's dirs."""
+    monkeypatch.setenv("SHELFR_CACHE_DIR", str(tmp_path_factory.mktemp("shelfr-cache")))
+    monkeypatch.setenv("SHELFR_LOG_DIR", str(tmp_path_factory.mktemp("shelfr-log")))
+
+
+@pytest.fixture(autouse=True)
+def fresh_audnex_state() -> Iterator[None]:
+    """Don't let a (possibly mocked) shared Audnex client or region memory leak."""
+    from shelfr.metadata.audnex import client
+    from shelfr.metadata.audnex.http import close_audnex_clients
+
+    close_audnex_clients()
+    client._winning_regions.clear()
+    yield
+    close_audnex_clients()
+
+
+@pytest.fixture
+def cache_settings(tmp_path: Path) -> Iterator[MagicMock]:
+    """Real configs behind the SQLite caches' settings (shelfr.utils.sqlite_cache).
+
+    Every cache is enabled, as by default; the ABS library index lives in tmp_path.
+    """
+    settings = MagicMock()
+    settings.audiobookshelf = AudiobookshelfConfig(index_db=str(tmp_path / "data" / "abs_index.db"))
+    settings.mediainfo = MediaInfoConfig()
+    with patch("shelfr.utils.sqlite_cache.get_settings", return_value=settings):
+        yield settings
+
+
+@pytest.fixture
+def abs_config(cache_settings: MagicMock) -> AudiobookshelfConfig:
+    """AudiobookshelfConfig of cache_settings, to toggle the ABS caches."""
+    config: AudiobookshelfConfig = cache_settings.audiobookshelf
+    return config
+
+
+@pytest.fixture
+def mediainfo_config(cache_settings: MagicMock) -> MediaInfoConfig:
+    """MediaInfoConfig of cache_settings, to toggle the probe cache."""
+    config: MediaInfoConfig = cache_settings.mediainfo
+    return config
+
+
 def make_cmd_result(
     stdout: str = "",
     stderr: str = "",
@@ -1160,6 +1160,56 @@ class TestMatchSearchResults:
         assert match.asin == "B0AAAAAA03"
 
 
+class TestMatchSearchResultsBatch:
+    """Tests for match_search_results_batch()."""
+
+    RESULTS = [
+        {
+            "title": f"Series Name Vol. {n}",
+            "author": "Author",
+            "asin": f"B0AAAAAA0{n}",
+            "language": "English" if n != 4 else "Spanish",
+            "series": [{"series": "Series Name", "sequence": str(n)}],
+        }
+        for n in range(1, 6)
+    ] + [{"title": "No ASIN", "author": "Author", "asin": ""}]
+
+    FOLDERS: list[tuple[str, str | None]] = [
+        ("Series Name Vol. 2", "Author"),
+        ("Series Name Vol. 4", None),
+        ("Series Name", "Unknown"),
+        ("Something Else Entirely", "Nobody"),
+        ("", None),
+    ]
+
+    def test_same_matches_as_single_folder(self) -> None:
+        """Each folder gets exactly what match_search_results() returns for it."""
+        from shelfr.abs.asin import match_search_results, match_search_results_batch
+
+        batch = match_search_results_batch(self.RESULTS, self.FOLDERS)
+
+        assert batch == [match_search_results(self.RESULTS, t, a) for t, a in self.FOLDERS]
+        assert batch[0] is not None
+        assert batch[0].asin == "B0AAAAAA02"
+        assert batch[0].sequence == "2"
+        assert batch[3] is None
+
+    def test_pairwise_scoring_gives_same_matches(self) -> None:
+        """Without numpy the scores come pair by pair, with identical results."""
+        from shelfr.abs.asin import match_search_results_batch
+
+        expected = match_search_results_batch(self.RESULTS, self.FOLDERS)
+        with patch("shelfr.utils.fuzzy._numpy", return_value=None):
+            assert match_search_results_batch(self.RESULTS, self.FOLDERS) == expected
+
+    def test_no_usable_results(self) -> None:
+        """Results without valid ASINs match nothing."""
+        from shelfr.abs.asin import match_search_results_batch
+
+        assert match_search_results_batch([], self.FOLDERS[:2]) == [None, None]
+        assert match_search_results_batch(self.RESULTS[-1:], self.FOLDERS[:1]) == [None]
+
+
 class TestResolveAsinViaAbsSearch:
     """Tests for resolve_asin_via_abs_search()."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -98,11 +99,15 @@ class TestAbsClientInit:
         mock_config.host = "http://abs.local:13378"
         mock_config.api_key = "config-api-key"
         mock_config.timeout_seconds = 45
+        mock_config.page_size = 1000
+        mock_config.page_workers = 8
 
         client = AbsClient.from_config(mock_config)
         assert client.host == "http://abs.local:13378"
         assert client.api_key == "config-api-key"
         assert client.timeout == 45.0
+        assert client.page_size == 1000
+        assert client.page_workers == 8
 
 
 class TestAbsClientAuthorize:
@@ -263,6 +268,78 @@ class TestAbsClientLibraryItems:
         assert len(no_asin_items) >= 1
 
 
+def _paged_request(total: int, delays: dict[int, float] | None = None) -> Any:
+    """_request stand-in serving a library of `total` items page by page."""
+
+    def request(method: str, path: str, params: dict[str, Any]) -> MagicMock:
+        limit, page = params["limit"], params["page"]
+        time.sleep((delays or {}).get(page, 0))
+        ids = range(page * limit, min((page + 1) * limit, total))
+        response = MagicMock()
+        response.json.return_value = {
+            "results": [{"id": f"li_{i}", "libraryId": "lib_test"} for i in ids],
+            "total": total,
+        }
+        return response
+
+    return request
+
+
+class TestAbsClientAllLibraryItems:
+    """Test get_all_library_items() pagination."""
+
+    def test_pages_in_order(self, client: AbsClient) -> None:
+        """Later pages finishing first don't change the order."""
+        request = _paged_request(1050, delays={1: 0.05})
+
+        with patch.object(client, "_request", side_effect=request) as mock_request:
+            items = client.get_all_library_items("lib_test", batch_size=100, workers=4)
+
+        assert [item.id for item in items] == [f"li_{i}" for i in range(1050)]
+        assert mock_request.call_count == 11
+
+    def test_single_page(self, client: AbsClient) -> None:
+        """A library that fits in one page takes one request."""
+        with patch.object(client, "_request", side_effect=_paged_request(42)) as mock_request:
+            items = client.get_all_library_items("lib_test")
+
+        assert len(items) == 42
+        assert mock_request.call_args.kwargs["params"]["limit"] == client.page_size
+        assert mock_request.call_count == 1
+
+    def test_auth_error_on_later_page(self, client: AbsClient) -> None:
+        """Errors from concurrent pages are raised to the caller."""
+        serve = _paged_request(300)
+
+        def request(method: str, path: str, params: dict[str, Any]) -> MagicMock:
+            if params["page"] == 2:
+                raise AbsAuthError("Invalid API key or unauthorized access")
+            return serve(method, path, params)
+
+        with (
+            patch.object(client, "_request", side_effect=request),
+            pytest.raises(AbsAuthError),
+        ):
+            client.get_all_library_items("lib_test", batch_size=100)
+
+    def test_items_repeated_across_pages_dropped(self, client: AbsClient) -> None:
+        """An item shifted onto the next page while paging is kept once."""
+        serve = _paged_request(200)
+
+        def request(method: str, path: str, params: dict[str, Any]) -> MagicMock:
+            response = serve(method, path, params)
+            if params["page"] == 1:
+                response.json.return_value["results"].insert(
+                    0, {"id": "li_99", "libraryId": "lib_test"}
+                )
+            return response
+
+        with patch.object(client, "_request", side_effect=request):
+            items = client.get_all_library_items("lib_test", batch_size=100)
+
+        assert [item.id for item in items] == [f"li_{i}" for i in range(200)]
+
+
 class TestAbsClientErrors:
     """Test error handling."""
 
@@ -431,6 +508,18 @@ class TestAbsLibraryItem:
         assert item.isbn == "9781234567890"
         assert item.duration == 36000.0
 
+    def test_compact_storage(self) -> None:
+        """Items have no per-instance dict and share repeated strings."""
+        first = AbsLibraryItem.from_api_response(
+            {"id": "li_1", "media": {"metadata": {"authorName": "".join(["Test ", "Author"])}}}
+        )
+        second = AbsLibraryItem.from_api_response(
+            {"id": "li_2", "media": {"metadata": {"authorName": "".join(["Test ", "Author"])}}}
+        )
+
+        assert not hasattr(first, "__dict__")
+        assert first.author_name is second.author_name
+
     def test_from_api_response_minimal(self) -> None:
         """Test creating item with minimal fields."""
         data = {"id": "li_min", "media": {"metadata": {}}}
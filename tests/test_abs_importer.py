@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -581,6 +583,80 @@ class TestBuildTargetPath:
 # =============================================================================
 
 
+class TestFolderIndex:
+    """Author/series folder lookups are listed once and reused while unchanged."""
+
+    @staticmethod
+    def _age(folder: Path) -> None:
+        """Backdate a folder's mtime so its listing isn't within the racy window."""
+        import os
+        import time
+
+        old = time.time() - 60
+        os.utime(folder, (old, old))
+
+    def test_listing_reused_until_folder_changes(self, temp_library: Path) -> None:
+        import os
+        from unittest.mock import patch
+
+        from shelfr.abs.importer import _find_matching_author_folder
+
+        (temp_library / "Andy Weir").mkdir()
+        self._age(temp_library)
+
+        with patch("shelfr.abs.importer.os.scandir", wraps=os.scandir) as scandir:
+            assert _find_matching_author_folder(temp_library, "andy weir") == (
+                temp_library / "Andy Weir"
+            )
+            assert _find_matching_author_folder(temp_library, "Nobody") is None
+            assert scandir.call_count == 1
+
+            # Added outside shelfr: the root mtime changes, so it is listed again
+            (temp_library / "Terry Pratchett").mkdir()
+            assert _find_matching_author_folder(temp_library, "Terry Pratchett") is not None
+            assert scandir.call_count == 2
+
+    def test_recently_modified_folder_listed_again(self, temp_library: Path) -> None:
+        import os
+        from unittest.mock import patch
+
+        from shelfr.abs.importer import _find_matching_series_folder
+
+        author = temp_library / "Brandon Sanderson"
+        (author / "Mistborn Series").mkdir(parents=True)
+
+        with patch("shelfr.abs.importer.os.scandir", wraps=os.scandir) as scandir:
+            for _ in range(2):
+                folder, canonical = _find_matching_series_folder(author, "Mistborn")
+                assert folder == author / "Mistborn Series"
+                assert canonical == "Mistborn"
+            assert scandir.call_count == 2
+
+    def test_import_updates_listing_in_place(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        import os
+        from unittest.mock import patch
+
+        from shelfr.abs.importer import _find_matching_author_folder
+
+        (temp_library / "Andy Weir").mkdir()
+        self._age(temp_library)
+        assert _find_matching_author_folder(temp_library, "Andy Weir") is not None
+        folder = create_audiobook_folder(
+            temp_staging, "Martha Wells - All Systems Red [B06XTPPD8W]"
+        )
+
+        result = import_single(folder, temp_library, empty_asin_index)
+
+        assert result.status == "success"
+        with patch("shelfr.abs.importer.os.scandir", wraps=os.scandir) as scandir:
+            assert _find_matching_author_folder(temp_library, "Martha Wells") == (
+                temp_library / "Martha Wells"
+            )
+            scandir.assert_not_called()
+
+
 class TestValidateImportPrerequisites:
     """Tests for prerequisite validation."""
 
@@ -955,6 +1031,164 @@ class TestImportBatch:
 
         assert result.success_count == 1
 
+    def test_parallel_batch_matches_sequential(self, tmp_path: Path) -> None:
+        """Parallel import lands every book where a sequential run would, in input order."""
+        runs = {}
+        for workers in (1, 4):
+            staging = tmp_path / f"staging-{workers}"
+            library = tmp_path / f"library-{workers}"
+            library.mkdir()
+            folders = []
+            for a in range(3):
+                for b in range(4):
+                    folder = staging / f"Author {a}" / f"Saga {a}" / f"Book {b} [B0AUTH{a}{b:03d}]"
+                    folder.mkdir(parents=True)
+                    (folder / "audiobook.m4b").write_text("fake audio content")
+                    folders.append(folder)
+
+            result = import_batch(
+                staging_folders=folders,
+                library_root=library,
+                asin_index={},
+                staging_root=staging,
+                workers=workers,
+            )
+
+            assert [r.staging_path for r in result.results] == folders
+            runs[workers] = [
+                (r.status, r.target_path.relative_to(library) if r.target_path else None)
+                for r in result.results
+            ]
+
+        assert runs[4] == runs[1]
+        assert all(status == "success" for status, _ in runs[4])
+
+    @staticmethod
+    def _track_target_paths(peak: dict[str, int], overall: dict[str, int]) -> Callable[..., Path]:
+        """build_target_path() wrapper recording concurrent calls per author."""
+        import threading
+        import time
+
+        guard = threading.Lock()
+        active: dict[str, int] = {}
+
+        def tracked(library_root: Path, parsed: ParsedFolderName, *args: Any) -> Path:
+            author = parsed.author.casefold().rstrip(".")
+            with guard:
+                active[author] = active.get(author, 0) + 1
+                peak[author] = max(peak.get(author, 0), active[author])
+                overall["active"] += 1
+                overall["peak"] = max(overall["peak"], overall["active"])
+            time.sleep(0.05)
+            with guard:
+                active[author] -= 1
+                overall["active"] -= 1
+            return build_target_path(library_root, parsed, *args)
+
+        return tracked
+
+    def test_parallel_batch_serializes_books_by_author(
+        self, temp_staging: Path, temp_library: Path
+    ) -> None:
+        """Books for one author folder never reach their target path at the same time."""
+        from unittest.mock import patch
+
+        peak: dict[str, int] = {}
+        overall = {"active": 0, "peak": 0}
+
+        # "Author A" and "author a." share one author folder
+        names = [f"Author {c} - Book {i} [B0AUTH{c}{i:03d}]" for c in "ABC" for i in range(3)]
+        names.append("author a. - Book 9 [B0AUTHA009]")
+        folders = [create_audiobook_folder(temp_staging, name) for name in names]
+        progress: list[int] = []
+
+        with (
+            patch(
+                "shelfr.abs.importer.build_target_path",
+                side_effect=self._track_target_paths(peak, overall),
+            ),
+            patch(
+                "shelfr.abs.importer.enrich_from_audnex",
+                side_effect=lambda parsed, asin: (parsed, None, None),
+            ),
+        ):
+            result = import_batch(
+                staging_folders=folders,
+                library_root=temp_library,
+                asin_index={},
+                workers=4,
+                progress_callback=lambda current, total, folder: progress.append(current),
+            )
+
+        assert result.success_count == len(folders)
+        assert [r.staging_path for r in result.results] == folders
+        assert sorted(progress) == list(range(1, len(folders) + 1))
+        assert peak == {"author a": 1, "author b": 1, "author c": 1}
+        assert overall["peak"] > 1
+
+    def test_parallel_batch_locks_resolved_author(
+        self, temp_staging: Path, temp_library: Path
+    ) -> None:
+        """Author-less books lock the author they resolve to, not one shared key."""
+        from unittest.mock import MagicMock, patch
+
+        from shelfr.abs.asin import AsinResolution
+
+        peak: dict[str, int] = {}
+        overall = {"active": 0, "peak": 0}
+        authors = {f"Title {c}{i}": f"Author {c}" for c in "AB" for i in range(3)}
+        folders = [create_audiobook_folder(temp_staging, title) for title in authors]
+
+        def search(client: object, title: str, *args: object, **kwargs: object) -> AsinResolution:
+            return AsinResolution(
+                asin=f"B0{title[-2:]}000000"[:10],
+                source="abs_search",
+                resolved_author=authors[title],
+            )
+
+        with (
+            patch(
+                "shelfr.abs.importer.resolve_asin_from_folder_cached",
+                return_value=AsinResolution(asin=None, source="unknown"),
+            ),
+            patch("shelfr.abs.importer.resolve_asin_via_abs_search", side_effect=search),
+            patch(
+                "shelfr.abs.importer.build_target_path",
+                side_effect=self._track_target_paths(peak, overall),
+            ),
+            patch(
+                "shelfr.abs.importer.enrich_from_audnex",
+                side_effect=lambda parsed, asin: (parsed, None, None),
+            ),
+        ):
+            result = import_batch(
+                staging_folders=folders,
+                library_root=temp_library,
+                asin_index={},
+                abs_client=MagicMock(),
+                workers=4,
+            )
+
+        assert result.success_count == len(folders)
+        assert {r.target_path.parent.name for r in result.results if r.target_path} == {
+            "Author A",
+            "Author B",
+        }
+        assert peak == {"author a": 1, "author b": 1}
+        assert overall["peak"] > 1
+
+    def test_workers_must_be_positive(
+        self, temp_staging: Path, temp_library: Path, empty_asin_index: dict[str, AsinEntry]
+    ) -> None:
+        """workers < 1 is rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            import_batch(
+                staging_folders=[],
+                library_root=temp_library,
+                asin_index=empty_asin_index,
+                workers=0,
+            )
+
 
 # =============================================================================
 # Tests: BatchImportResult
@@ -0,0 +1,305 @@
+"""Tests for the multi-valued ASIN index and its persistent store."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shelfr.abs.asin import (
+    AsinEntry,
+    AsinIndex,
+    AsinResolution,
+    build_asin_index,
+    resolve_asin_via_library_index,
+)
+from shelfr.abs.client import AbsLibraryItem
+from shelfr.abs.importer import import_single
+from shelfr.abs.library_index import LibraryIndex, get_library_index
+from shelfr.config import AudiobookshelfConfig
+
+
+def _item(
+    n: int,
+    *,
+    asin: str | None = None,
+    title: str | None = None,
+    author: str = "Andy Weir",
+    series: str | None = None,
+    updated_at: int | None = None,
+    path: str | None = None,
+) -> AbsLibraryItem:
+    return AbsLibraryItem(
+        id=f"li_{n}",
+        library_id="lib_test",
+        path=path or f"/audiobooks/{author}/Book {n}",
+        rel_path=f"{author}/Book {n}",
+        is_missing=False,
+        media_type="book",
+        title=title or f"Book {n}",
+        subtitle=None,
+        author_name=author,
+        narrator_name=None,
+        series_name=series,
+        asin=asin if asin is not None else f"B0INDEX{n:03d}",
+        isbn=None,
+        duration=3600.0,
+        size=1000,
+        added_at=1000 + n,
+        updated_at=updated_at if updated_at is not None else 1000 + n,
+    )
+
+
+def _entry(n: int, asin: str = "B0DUPLICAT", **kwargs: str | None) -> AsinEntry:
+    return AsinEntry(
+        asin=asin,
+        path=str(kwargs.get("path") or f"/audiobooks/Copy {n}"),
+        library_item_id=f"li_{n}",
+        title=str(kwargs.get("title") or "Project Hail Mary"),
+        author=kwargs.get("author", "Andy Weir"),
+        series=kwargs.get("series"),
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> LibraryIndex:
+    return LibraryIndex(tmp_path / "data" / "abs_index.db")
+
+
+class TestAsinIndex:
+    """Tests for the in-memory AsinIndex."""
+
+    def test_keeps_every_copy(self) -> None:
+        index = AsinIndex()
+        first, second = _entry(1), _entry(2)
+        index.add(first)
+        index.add(second)
+
+        assert index["B0DUPLICAT"] is first
+        assert index.copies("B0DUPLICAT") == [first, second]
+        assert (len(index), index.copy_count) == (1, 2)
+
+    def test_remove_promotes_next_copy(self) -> None:
+        index = AsinIndex()
+        first, second = _entry(1), _entry(2)
+        index.add(first)
+        index.add(second)
+
+        index.remove(first)
+        assert index["B0DUPLICAT"] is second
+
+        index.remove(second)
+        assert "B0DUPLICAT" not in index
+        assert index.copies("B0DUPLICAT") == []
+        assert index.candidates("Project Hail Mary") == []
+
+    def test_candidates_by_title_series_and_author(self) -> None:
+        index = AsinIndex()
+        by_title = _entry(1, "B0TITLE001", title="Project Hail Mary: A Novel", author="Other")
+        by_series = _entry(
+            2, "B0SERIES01", title="Adachi and Shimamura Vol. 3", series="Adachi and Shimamura #3"
+        )
+        by_author = _entry(3, "B0AUTHOR01", title="The Martian")
+        unrelated = _entry(4, "B0UNRELATE", title="Dune", author="Frank Herbert")
+        for entry in (by_title, by_series, by_author, unrelated):
+            index.add(entry)
+
+        assert index.candidates("Project Hail Mary") == [by_title]
+        assert index.candidates("Adachi and Shimamura (Light Novel) Vol. 7") == [by_series]
+        assert by_author in index.candidates("Artemis", "Andy Weir")
+        assert unrelated not in index.candidates("Artemis", "Andy Weir")
+
+    def test_match_prefers_matching_volume(self) -> None:
+        index = AsinIndex()
+        for volume in (6, 7, 8):
+            index.add(
+                _entry(
+                    volume,
+                    f"B0VOLUME0{volume}",
+                    title=f"Adachi and Shimamura Vol. {volume}",
+                    author="Hitoma Iruma",
+                    series=f"Adachi and Shimamura #{volume}",
+                )
+            )
+
+        match = index.match("Adachi and Shimamura Vol. 7", "Hitoma Iruma")
+
+        assert match is not None
+        assert match.asin == "B0VOLUME07"
+
+    @pytest.mark.parametrize(
+        "title",
+        ["Overlord Vol 8", "Overlord, Vol. 14: The Witch of the Falling Kingdom", "Overlord"],
+    )
+    def test_match_rejects_other_volume(self, title: str) -> None:
+        index = AsinIndex()
+        for volume in (1, 7):
+            index.add(
+                _entry(
+                    volume,
+                    f"B0OVERLRD{volume}",
+                    title=f"Overlord, Vol. {volume}",
+                    author="Kugane Maruyama",
+                    series=f"Overlord #{volume}",
+                )
+            )
+
+        assert index.match(title, "Kugane Maruyama") is None
+
+    def test_match_without_volume_on_either_side(self) -> None:
+        index = AsinIndex()
+        index.add(_entry(1, "B08G9PRS1K"))
+
+        match = index.match("Project Hail Mary", "Andy Weir")
+
+        assert match is not None
+        assert match.asin == "B08G9PRS1K"
+
+    def test_plain_dict_never_matches(self) -> None:
+        resolution = resolve_asin_via_library_index({"B0DUPLICAT": _entry(1)}, "Project Hail Mary")
+
+        assert not resolution.found
+
+
+class TestLibraryIndex:
+    """Tests for the SQLite-backed LibraryIndex."""
+
+    def test_sync_is_incremental(self, store: LibraryIndex) -> None:
+        items = [_item(n) for n in range(5)]
+        assert store.sync("http://abs", "lib_test", items).added == 5
+
+        items[1] = _item(1, title="Book 1 (Retagged)", updated_at=9000)
+        del items[4]
+        stats = store.sync("http://abs", "lib_test", [*items, _item(7)])
+
+        assert (stats.added, stats.updated, stats.removed, stats.unchanged) == (1, 1, 1, 3)
+        index = store.load("http://abs", "lib_test")
+        assert sorted(index) == [
+            "B0INDEX000",
+            "B0INDEX001",
+            "B0INDEX002",
+            "B0INDEX003",
+            "B0INDEX007",
+        ]
+        assert index["B0INDEX001"].title == "Book 1 (Retagged)"
+
+    def test_copies_and_secondary_lookups(self, store: LibraryIndex) -> None:
+        store.sync(
+            "http://abs",
+            "lib_test",
+            [
+                _item(1, asin="B0DUPLICAT", title="Project Hail Mary"),
+                _item(2, asin="B0DUPLICAT", title="Project Hail Mary"),
+                _item(3, title="Red Rising", author="Pierce Brown", series="Red Rising Saga #1"),
+                _item(4, asin="", title="No ASIN", path="/audiobooks/Nobody/No ASIN"),
+            ],
+        )
+
+        copies = store.copies("http://abs", "lib_test", "B0DUPLICAT")
+        assert [entry.library_item_id for entry in copies] == ["li_2", "li_1"]
+        assert len(store.by_author("http://abs", "lib_test", "ANDY  WEIR")) == 2
+        assert store.by_series("http://abs", "lib_test", "Red Rising Saga")[0].asin == "B0INDEX003"
+        assert len(store.by_title("http://abs", "lib_test", "Project Hail Mary: A Novel")) == 2
+        assert store.by_title("http://abs", "lib_test", "No ASIN") == []
+        assert store.by_author("http://other", "lib_test", "Andy Weir") == []
+
+    def test_build_asin_index_uses_store(self, abs_config: AudiobookshelfConfig) -> None:
+        client = MagicMock()
+        client.host = "http://abs"
+        client.get_library_items_cached.return_value = [
+            _item(1, asin="B0DUPLICAT"),
+            _item(2, asin="B0DUPLICAT"),
+            _item(3),
+        ]
+
+        index = build_asin_index(client, "lib_test")
+
+        assert isinstance(index, AsinIndex)
+        assert len(index.copies("B0DUPLICAT")) == 2
+        store = get_library_index()
+        assert store is not None
+        assert (
+            store.sync("http://abs", "lib_test", client.get_library_items_cached()).unchanged == 3
+        )
+
+    def test_disabled(self, abs_config: AudiobookshelfConfig) -> None:
+        abs_config.index_enabled = False
+
+        assert get_library_index() is None
+
+
+class TestImportSingleWithIndex:
+    """import_single() resolves and compares against all copies."""
+
+    @pytest.fixture(autouse=True)
+    def _no_folder_asin(self) -> Iterator[None]:
+        with patch(
+            "shelfr.abs.importer.resolve_asin_from_folder_cached",
+            return_value=AsinResolution(asin=None, source="unknown"),
+        ):
+            yield
+
+    def test_asinless_copy_matched_locally(self, tmp_path: Path) -> None:
+        existing = tmp_path / "library" / "Andy Weir" / "Project Hail Mary"
+        existing.mkdir(parents=True)
+        index = AsinIndex()
+        index.add(_entry(1, "B08G9PRS1K", path=str(existing)))
+        staging = tmp_path / "staging" / "Andy Weir - Project Hail Mary"
+        staging.mkdir(parents=True)
+        (staging / "audiobook.m4b").write_text("audio")
+
+        abs_client = MagicMock()
+        result = import_single(
+            staging, tmp_path / "library", index, abs_client=abs_client, dry_run=True
+        )
+
+        assert result.status == "duplicate"
+        assert result.asin == "B08G9PRS1K"
+        abs_client.search_books.assert_not_called()
+
+    def test_new_volume_of_series_falls_through_to_abs_search(self, tmp_path: Path) -> None:
+        index = AsinIndex()
+        for volume in (1, 7):
+            index.add(
+                _entry(
+                    volume,
+                    f"B0OVERLRD{volume}",
+                    path=str(tmp_path / "library" / f"Overlord {volume}"),
+                    title=f"Overlord, Vol. {volume}",
+                    author="Kugane Maruyama",
+                    series=f"Overlord #{volume}",
+                )
+            )
+        staging = tmp_path / "staging" / "Kugane Maruyama - Overlord Vol 8"
+        staging.mkdir(parents=True)
+        (staging / "audiobook.m4b").write_text("audio")
+
+        abs_client = MagicMock()
+        with patch(
+            "shelfr.abs.importer.resolve_asin_via_abs_search",
+            return_value=AsinResolution(asin=None, source="unknown"),
+        ) as abs_search:
+            result = import_single(
+                staging, tmp_path / "library", index, abs_client=abs_client, dry_run=True
+            )
+
+        abs_search.assert_called_once()
+        assert result.status != "duplicate"
+        assert result.asin not in ("B0OVERLRD1", "B0OVERLRD7")
+
+    def test_duplicate_found_past_stale_copy(self, tmp_path: Path) -> None:
+        existing = tmp_path / "library" / "Andy Weir" / "Project Hail Mary"
+        existing.mkdir(parents=True)
+        index = AsinIndex()
+        index.add(_entry(1, "B08G9PRS1K", path=str(tmp_path / "gone")))
+        index.add(_entry(2, "B08G9PRS1K", path=str(existing)))
+        staging = tmp_path / "staging" / "Andy Weir - Project Hail Mary (2021) {ASIN.B08G9PRS1K}"
+        staging.mkdir(parents=True)
+        (staging / "audiobook.m4b").write_text("audio")
+
+        result = import_single(staging, tmp_path / "library", index, dry_run=True)
+
+        assert result.status == "duplicate"
+        assert str(existing) in (result.error or "")
@@ -0,0 +1,205 @@
+"""Tests for the per-folder ASIN resolution cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from shelfr.abs.asin import AsinResolution, resolve_asin_via_abs_search
+from shelfr.abs.rename import parse_candidate, resolve_asin_cascade
+from shelfr.abs.resolution_cache import (
+    ResolutionCache,
+    cached_resolution,
+    folder_signature,
+    get_resolution_cache,
+    open_resolution_cache,
+)
+from shelfr.cli import app
+from shelfr.config import AudiobookshelfConfig
+
+FOUND = AsinResolution(asin="B08G9PRS1K", source="mediainfo", source_detail="audiobook.m4b")
+MISS = AsinResolution(asin=None, source="unknown")
+RESULTS: list[dict[str, Any]] = [
+    {"asin": "B08G9PRS1K", "title": "Project Hail Mary", "author": "Andy Weir"}
+]
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "library" / "Andy Weir - Project Hail Mary"
+    folder.mkdir(parents=True)
+    (folder / "audiobook.m4b").write_text("audio")
+    return folder
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResolutionCache:
+    return ResolutionCache(tmp_path / "cache" / "asin_resolution.db")
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFolderSignature:
+    """Tests for folder_signature()."""
+
+    def test_changes_with_audio_and_sidecars(self, folder: Path) -> None:
+        original = folder_signature(folder)
+        assert original is not None
+
+        (folder / "cover.jpg").write_text("image")
+        assert folder_signature(folder) == original
+
+        _touch(folder / "audiobook.m4b")
+        touched = folder_signature(folder)
+        assert touched != original
+
+        (folder / "metadata.json").write_text("{}")
+        assert folder_signature(folder) not in (original, touched)
+
+    def test_missing_folder(self, tmp_path: Path) -> None:
+        assert folder_signature(tmp_path / "gone") is None
+
+
+class TestResolutionCache:
+    """Tests for ResolutionCache."""
+
+    def test_round_trip_per_signature(self, cache: ResolutionCache, folder: Path) -> None:
+        cache.put(folder, "local", "sig-1", FOUND)
+
+        hit = cache.get(folder, "local", "sig-1")
+        assert hit is not None
+        assert (hit.asin, hit.source, hit.confidence) == ("B08G9PRS1K", "mediainfo", 1.0)
+        assert cache.get(folder, "local", "sig-2") is None
+        assert cache.get(folder, "abs_search", "sig-1") is None
+
+    def test_prune_changed_and_missing_folders(
+        self, cache: ResolutionCache, folder: Path, tmp_path: Path
+    ) -> None:
+        signature = folder_signature(folder)
+        assert signature is not None
+        cache.put(folder, "local", signature, FOUND)
+        cache.put(tmp_path / "gone", "local", signature, FOUND)
+        assert cache.prune() == 1
+
+        _touch(folder / "audiobook.m4b")
+        assert cache.prune(dry_run=True) == 1
+        assert cache.prune() == 1
+        assert cache.stats().entries == 0
+
+
+class TestCachedResolution:
+    """Tests for cached_resolution()."""
+
+    def test_unchanged_folder_reused(self, abs_config: AudiobookshelfConfig, folder: Path) -> None:
+        resolve = MagicMock(return_value=FOUND)
+
+        assert cached_resolution(folder, "local", resolve).asin == "B08G9PRS1K"
+        assert cached_resolution(folder, "local", resolve).asin == "B08G9PRS1K"
+        assert resolve.call_count == 1
+
+        _touch(folder / "audiobook.m4b")
+        cached_resolution(folder, "local", resolve)
+        assert resolve.call_count == 2
+
+    def test_misses_cached_unless_told_not_to(
+        self, abs_config: AudiobookshelfConfig, folder: Path
+    ) -> None:
+        resolve = MagicMock(return_value=MISS)
+
+        cached_resolution(folder, "abs_search", resolve, cache_misses=False)
+        cached_resolution(folder, "abs_search", resolve, cache_misses=False)
+        assert resolve.call_count == 2
+
+        cached_resolution(folder, "local", resolve)
+        cached_resolution(folder, "local", resolve)
+        assert resolve.call_count == 3
+
+    def test_disabled(self, abs_config: AudiobookshelfConfig, folder: Path) -> None:
+        abs_config.resolution_cache_enabled = False
+        resolve = MagicMock(return_value=FOUND)
+
+        cached_resolution(folder, "local", resolve)
+        cached_resolution(folder, "local", resolve)
+
+        assert get_resolution_cache() is None
+        assert resolve.call_count == 2
+
+
+class TestAbsSearchStage:
+    """resolve_asin_via_abs_search(folder=...) caches matches with their confidence."""
+
+    def test_match_reused_at_same_or_lower_threshold(
+        self, abs_config: AudiobookshelfConfig, folder: Path
+    ) -> None:
+        client = MagicMock()
+        client.search_books.return_value = RESULTS
+
+        first = resolve_asin_via_abs_search(
+            client, "Project Hail Mary", "Andy Weir", 0.75, folder=folder
+        )
+        second = resolve_asin_via_abs_search(
+            client, "Project Hail Mary", "Andy Weir", 0.5, folder=folder
+        )
+
+        assert first.asin == second.asin == "B08G9PRS1K"
+        assert second.confidence is not None and second.confidence >= 0.75
+        assert client.search_books.call_count == 1
+
+    def test_hit_below_threshold_searches_again(
+        self, abs_config: AudiobookshelfConfig, folder: Path, cache: ResolutionCache
+    ) -> None:
+        signature = folder_signature(folder)
+        assert signature is not None
+        weak = AsinResolution(asin="B0WEAKMATC", source="abs_search", confidence=0.6)
+        client = MagicMock()
+        client.search_books.return_value = RESULTS
+
+        with patch("shelfr.abs.resolution_cache.get_resolution_cache", return_value=cache):
+            cache.put(folder, "abs_search", signature, weak)
+            resolution = resolve_asin_via_abs_search(
+                client, "Project Hail Mary", "Andy Weir", 0.75, folder=folder
+            )
+
+        assert resolution.asin == "B08G9PRS1K"
+        client.search_books.assert_called_once()
+
+
+class TestRenameCascade:
+    """resolve_asin_cascade() skips resolution of unchanged folders."""
+
+    def test_repeat_run_skips_local_resolution(
+        self, abs_config: AudiobookshelfConfig, folder: Path
+    ) -> None:
+        with (
+            patch("shelfr.abs.asin._get_mediainfo_binary", return_value="/usr/bin/mediainfo"),
+            patch(
+                "shelfr.abs.asin.resolve_asin_from_folder_with_mediainfo", return_value=FOUND
+            ) as resolve,
+        ):
+            first = resolve_asin_cascade(parse_candidate(folder))
+            second = resolve_asin_cascade(parse_candidate(folder))
+
+        assert first.asin_source == second.asin_source == "mediainfo"
+        assert second.parsed is not None and second.parsed.asin == "B08G9PRS1K"
+        assert resolve.call_count == 1
+
+
+class TestCacheCli:
+    """shelfr cache clear -e asin."""
+
+    def test_clear_endpoint(self, folder: Path) -> None:
+        cache = open_resolution_cache()
+        cache.put(folder, "local", "sig", FOUND)
+
+        result = CliRunner().invoke(app, ["cache", "clear", "-e", "asin"])
+
+        assert result.exit_code == 0, result.output
+        assert cache.stats().entries == 0
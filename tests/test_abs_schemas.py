@@ -16,6 +16,7 @@ from shelfr.schemas.abs import (
     AbsFolder,
     AbsLibrariesResponse,
     AbsLibraryItemSchema,
+    AbsLibraryItemsPage,
     AbsLibraryItemsResponse,
     AbsLibrarySchema,
     AbsLibrarySettings,
@@ -23,8 +24,10 @@ from shelfr.schemas.abs import (
     AbsSearchSeriesEntry,
     AbsUserPermissions,
     AbsUserSchema,
+    iter_library_items,
     validate_authorize_response,
     validate_libraries_response,
+    validate_library_items_page,
     validate_library_items_response,
     validate_search_books_response,
 )
@@ -318,6 +321,37 @@ class TestAbsLibraryItemsResponse:
         assert response.sort_by is None
 
 
+class TestLibraryItemsStreaming:
+    """Tests for validate_library_items_page() and iter_library_items()."""
+
+    def test_page_envelope(self, library_items_response: dict[str, Any]) -> None:
+        """The envelope is validated without the results."""
+        page = validate_library_items_page(library_items_response)
+        assert isinstance(page, AbsLibraryItemsPage)
+        assert page.total == library_items_response["total"]
+
+    def test_items_match_full_validation(self, library_items_response: dict[str, Any]) -> None:
+        """Items validated one by one equal the full response's items."""
+        expected = validate_library_items_response(library_items_response).results
+
+        items = list(iter_library_items(library_items_response))
+
+        assert items == expected
+
+    def test_raw_items_released(self, library_items_response: dict[str, Any]) -> None:
+        """Each raw item is dropped from the response once validated."""
+        items = iter_library_items(library_items_response)
+        next(items)
+
+        assert library_items_response["results"][0] is None
+        assert library_items_response["results"][1] is not None
+
+    def test_missing_results(self) -> None:
+        """A response without results is rejected."""
+        with pytest.raises(ValueError, match="no results"):
+            list(iter_library_items({"total": 0}))
+
+
 class TestAbsUserPermissions:
     """Tests for AbsUserPermissions schema."""
 
@@ -0,0 +1,131 @@
+"""Tests for the ABS metadata search cache and search_books() deduplication."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shelfr.abs.client import AbsClient
+from shelfr.abs.search_cache import SearchCache, get_search_cache
+from shelfr.config import AudiobookshelfConfig
+
+RESULTS: list[dict[str, Any]] = [{"title": "Wizard's First Rule", "asin": "B002V0QK4C"}]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SearchCache:
+    return SearchCache(tmp_path / "cache" / "abs_search.db", ttl=3600)
+
+
+def _response(results: Any) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = results
+    return response
+
+
+class TestSearchCache:
+    """Tests for SearchCache."""
+
+    def test_round_trip_with_normalized_key(self, cache: SearchCache) -> None:
+        cache.put("http://abs", "audible", "Wizard's First Rule", "Terry Goodkind", RESULTS)
+
+        assert cache.get("http://abs", "audible", "  wizard's   FIRST rule", "terry goodkind") == (
+            RESULTS
+        )
+        assert cache.get("http://abs", "google", "Wizard's First Rule", "Terry Goodkind") is None
+        assert cache.get("http://other", "audible", "Wizard's First Rule", "Terry Goodkind") is None
+
+    def test_empty_results_cached(self, cache: SearchCache) -> None:
+        cache.put("http://abs", "audible", "Nothing Matches", None, [])
+
+        assert cache.get("http://abs", "audible", "Nothing Matches", None) == []
+
+    def test_expired_entries(self, cache: SearchCache) -> None:
+        cache.put("http://abs", "audible", "Old", None, RESULTS)
+        cache.put("http://abs", "audible", "New", None, RESULTS)
+        with patch("shelfr.abs.search_cache.time.time", return_value=time.time() + 7200):
+            assert cache.get("http://abs", "audible", "Old", None) is None
+            assert cache.stats().expired == 2
+            assert cache.prune(dry_run=True) == 2
+            assert cache.prune() == 2
+        assert cache.stats().entries == 0
+
+    def test_clear(self, cache: SearchCache) -> None:
+        cache.put("http://abs", "audible", "Title", None, RESULTS)
+
+        assert cache.clear() == 1
+        assert cache.get("http://abs", "audible", "Title", None) is None
+
+
+class TestSearchBooks:
+    """search_books() goes through the cache, single-flight and the host cap."""
+
+    def test_repeat_search_served_from_cache(self, abs_config: AudiobookshelfConfig) -> None:
+        client = AbsClient(host="http://abs.local", api_key="key")
+
+        with patch.object(client, "_request", return_value=_response(RESULTS)) as request:
+            assert client.search_books("Wizard's First Rule", "Terry Goodkind") == RESULTS
+            assert client.search_books("wizard's first rule", "Terry  Goodkind") == RESULTS
+
+        request.assert_called_once()
+
+    def test_unexpected_response_not_cached(self, abs_config: AudiobookshelfConfig) -> None:
+        client = AbsClient(host="http://abs.local", api_key="key")
+
+        with patch.object(client, "_request", return_value=_response({"error": "x"})) as request:
+            assert client.search_books("Title") == []
+            assert client.search_books("Title") == []
+
+        assert request.call_count == 2
+
+    def test_disabled(self, abs_config: AudiobookshelfConfig) -> None:
+        abs_config.search_cache_enabled = False
+
+        assert get_search_cache() is None
+
+    def test_concurrent_identical_searches_share_one_request(self) -> None:
+        client = AbsClient(host="http://flight.local", api_key="key")
+        release = threading.Event()
+
+        def request(*args: Any, **kwargs: Any) -> MagicMock:
+            release.wait(timeout=5)
+            return _response(RESULTS)
+
+        with patch.object(client, "_request", side_effect=request) as mock_request:
+            threading.Timer(0.2, release.set).start()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: client.search_books("Title", "Author"), range(8)))
+
+        assert results == [RESULTS] * 8
+        mock_request.assert_called_once()
+
+    def test_concurrency_capped_per_host(self) -> None:
+        client = AbsClient(host="http://capped.local", api_key="key", search_concurrency=2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def request(*args: Any, **kwargs: Any) -> MagicMock:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return _response(RESULTS)
+
+        with (
+            patch.object(client, "_request", side_effect=request) as mock_request,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            list(pool.map(lambda n: client.search_books(f"Title {n}"), range(8)))
+
+        assert mock_request.call_count == 8
+        assert peak == 2
@@ -0,0 +1,198 @@
+"""Tests for the persistent ABS library snapshot."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from shelfr.abs.client import AbsClient, AbsLibraryItem
+from shelfr.abs.snapshot import LibrarySnapshot, get_library_snapshot, refresh_snapshot
+from shelfr.cli import app
+from shelfr.config import AudiobookshelfConfig
+
+
+def _item(n: int, updated_at: int | None = None, title: str | None = None) -> AbsLibraryItem:
+    return AbsLibraryItem(
+        id=f"li_{n}",
+        library_id="lib_test",
+        path=f"/audiobooks/Author/Book {n}",
+        rel_path=f"Author/Book {n}",
+        is_missing=False,
+        media_type="book",
+        title=title or f"Book {n}",
+        subtitle=None,
+        author_name="Author",
+        narrator_name=None,
+        series_name=None,
+        asin=f"B0SNAP{n:04d}",
+        isbn=None,
+        duration=3600.0,
+        size=1000,
+        added_at=1000 + n,
+        updated_at=updated_at if updated_at is not None else 1000 + n,
+    )
+
+
+class FakeServer:
+    """Stands in for AbsClient's listing methods over an in-memory library."""
+
+    def __init__(self, items: list[AbsLibraryItem], page_size: int = 10) -> None:
+        self.items = {item.id: item for item in items}
+        self.host = "http://abs.local"
+        self.page_size = page_size
+        self.pages_fetched = 0
+        self.full_listings = 0
+
+    def get_library_items(
+        self, library_id: str, limit: int, page: int, sort: str, desc: bool
+    ) -> tuple[list[AbsLibraryItem], int]:
+        assert (sort, desc) == ("updatedAt", True)
+        self.pages_fetched += 1
+        ordered = sorted(self.items.values(), key=lambda item: item.updated_at, reverse=True)
+        return ordered[page * limit : (page + 1) * limit], len(ordered)
+
+    def get_all_library_items(self, library_id: str) -> list[AbsLibraryItem]:
+        self.full_listings += 1
+        return sorted(self.items.values(), key=lambda item: item.added_at, reverse=True)
+
+
+@pytest.fixture
+def snapshot(tmp_path: Path) -> LibrarySnapshot:
+    return LibrarySnapshot(tmp_path / "cache" / "abs_library.db")
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer([_item(n) for n in range(25)])
+
+
+def _refresh(server: FakeServer, snapshot: LibrarySnapshot) -> list[AbsLibraryItem]:
+    return refresh_snapshot(server, snapshot, "lib_test")  # type: ignore[arg-type]
+
+
+class TestRefreshSnapshot:
+    """Tests for refresh_snapshot()."""
+
+    def test_first_refresh_lists_everything(
+        self, server: FakeServer, snapshot: LibrarySnapshot
+    ) -> None:
+        items = _refresh(server, snapshot)
+
+        assert len(items) == 25
+        assert server.full_listings == 1
+        assert snapshot.items(server.host, "lib_test") == items
+
+    def test_unchanged_library_takes_one_page(
+        self, server: FakeServer, snapshot: LibrarySnapshot
+    ) -> None:
+        first = _refresh(server, snapshot)
+
+        second = _refresh(server, snapshot)
+
+        assert second == first
+        assert server.full_listings == 1
+        assert server.pages_fetched == 1
+
+    def test_added_and_edited_items_merged(
+        self, server: FakeServer, snapshot: LibrarySnapshot
+    ) -> None:
+        _refresh(server, snapshot)
+        server.items["li_3"] = _item(3, updated_at=5000, title="Book 3 (Retagged)")
+        server.items["li_99"] = _item(99, updated_at=5001)
+
+        items = _refresh(server, snapshot)
+
+        assert server.full_listings == 1
+        assert len(items) == 26
+        assert items[0].id == "li_99"  # newest addedAt first
+        assert next(item for item in items if item.id == "li_3").title == "Book 3 (Retagged)"
+
+    def test_changes_spanning_pages(self, server: FakeServer, snapshot: LibrarySnapshot) -> None:
+        _refresh(server, snapshot)
+        for n in range(100, 115):
+            server.items[f"li_{n}"] = _item(n, updated_at=5000 + n)
+
+        items = _refresh(server, snapshot)
+
+        assert len(items) == 40
+        assert server.full_listings == 1
+        assert server.pages_fetched == 2
+
+    def test_deletion_triggers_full_listing(
+        self, server: FakeServer, snapshot: LibrarySnapshot
+    ) -> None:
+        _refresh(server, snapshot)
+        del server.items["li_7"]
+
+        items = _refresh(server, snapshot)
+
+        assert server.full_listings == 2
+        assert "li_7" not in {item.id for item in items}
+        assert snapshot.count(server.host, "lib_test") == 24
+
+    def test_full_refresh(self, server: FakeServer, snapshot: LibrarySnapshot) -> None:
+        _refresh(server, snapshot)
+
+        refresh_snapshot(server, snapshot, "lib_test", full=True)  # type: ignore[arg-type]
+
+        assert server.full_listings == 2
+
+    def test_snapshots_keyed_by_host(self, server: FakeServer, snapshot: LibrarySnapshot) -> None:
+        _refresh(server, snapshot)
+
+        assert not snapshot.exists("http://other.local", "lib_test")
+
+
+class TestClientIntegration:
+    """get_library_items_cached() goes through the snapshot when enabled."""
+
+    def test_cached_listing_uses_snapshot(
+        self, abs_config: AudiobookshelfConfig, server: FakeServer
+    ) -> None:
+        client = AbsClient(host=server.host, api_key="key", page_size=10)
+        with (
+            patch.object(client, "get_all_library_items", side_effect=server.get_all_library_items),
+            patch.object(client, "get_library_items", side_effect=server.get_library_items),
+        ):
+            assert len(client.get_library_items_cached("lib_test")) == 25
+            client.clear_cache()
+            assert len(client.get_library_items_cached("lib_test")) == 25
+
+        assert server.full_listings == 1
+        assert server.pages_fetched == 1
+
+    def test_broken_snapshot_falls_back_to_listing(
+        self, abs_config: AudiobookshelfConfig, server: FakeServer
+    ) -> None:
+        snapshot = get_library_snapshot()
+        assert snapshot is not None
+        snapshot.path.parent.mkdir(parents=True, exist_ok=True)
+        snapshot.path.write_bytes(b"not a database" * 100)
+        client = AbsClient(host=server.host, api_key="key", page_size=10)
+
+        with patch.object(
+            client, "get_all_library_items", side_effect=server.get_all_library_items
+        ):
+            items = client.get_library_items_cached("lib_test")
+
+        assert len(items) == 25
+        assert server.full_listings == 1
+
+    def test_disabled(self, abs_config: AudiobookshelfConfig) -> None:
+        abs_config.snapshot_enabled = False
+
+        assert get_library_snapshot() is None
+
+    def test_cache_clear_abs(self, abs_config: AudiobookshelfConfig, server: FakeServer) -> None:
+        snapshot = get_library_snapshot()
+        assert snapshot is not None
+        _refresh(server, snapshot)
+
+        result = CliRunner().invoke(app, ["cache", "clear", "--endpoint", "abs"])
+
+        assert result.exit_code == 0
+        assert "Removed 25 cache entries" in result.output
+        assert not snapshot.exists(server.host, "lib_test")
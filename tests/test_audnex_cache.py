@@ -0,0 +1,276 @@
+"""Tests for the Audnex response disk cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from shelfr.cli import app
+from shelfr.config import AudnexConfig
+from shelfr.metadata.audnex import fetch_audnex_author, fetch_audnex_book, fetch_audnex_chapters
+from shelfr.metadata.audnex.cache import AudnexCache, get_audnex_cache
+
+BOOK = {"asin": "B09TEST123", "title": "Test Book", "authors": [{"name": "Test Author"}]}
+DAY = 86400
+
+
+def _response(status: int, data: dict[str, Any] | None = None, **headers: str) -> httpx.Response:
+    request = httpx.Request("GET", "https://api.audnex.us/books/B09TEST123")
+    return httpx.Response(status, json=data, headers=headers, request=request)
+
+
+class FakeAudnex:
+    """Stand-in for httpx.Client that answers from a queue of responses."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        self.responses = list(responses)
+        self.requests: list[tuple[str, dict[str, str], dict[str, str]]] = []
+
+    def __call__(self, **kwargs: Any) -> MagicMock:
+        client = MagicMock()
+        client.is_closed = False
+
+        def get(
+            url: str, params: dict[str, str], headers: dict[str, str], **kwargs: Any
+        ) -> httpx.Response:
+            self.requests.append((url, params, dict(headers)))
+            return self.responses.pop(0)
+
+        client.get.side_effect = get
+        return client
+
+
+@pytest.fixture
+def audnex_config() -> Iterator[AudnexConfig]:
+    """Real AudnexConfig behind both the client's and the cache's get_settings."""
+    config = AudnexConfig(regions=["us", "uk"])
+    settings = MagicMock()
+    settings.audnex = config
+    with (
+        patch("shelfr.metadata.audnex.client.get_settings", return_value=settings),
+        patch("shelfr.metadata.audnex.cache.get_settings", return_value=settings),
+    ):
+        yield config
+
+
+def _fake_client(*responses: httpx.Response) -> tuple[FakeAudnex, Any]:
+    fake = FakeAudnex(*responses)
+    return fake, patch("shelfr.metadata.audnex.client.httpx.Client", side_effect=fake)
+
+
+class TestAudnexCache:
+    """Tests for AudnexCache storage and maintenance."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        cache = AudnexCache(tmp_path, ttl=DAY, negative_ttl=3600)
+        cache.put("book", "b09test123", "US", BOOK, etag='"v1"')
+
+        entry = cache.get("book", "B09TEST123", "us")
+
+        assert entry is not None
+        assert entry.data == BOOK
+        assert entry.etag == '"v1"'
+        assert cache.is_fresh(entry)
+        assert (tmp_path / "book" / "us" / "B09TEST123.json").exists()
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_negative_entry_uses_its_own_ttl(self, tmp_path: Path) -> None:
+        cache = AudnexCache(tmp_path, ttl=DAY, negative_ttl=3600)
+        entry = cache.put_missing("author", "B000AUTH01", "uk")
+
+        assert entry.negative
+        assert cache.is_fresh(entry, now=entry.fetched_at + 3599)
+        assert not cache.is_fresh(entry, now=entry.fetched_at + 3601)
+        assert entry.revalidation_headers() == {}
+
+    def test_revalidation_headers(self, tmp_path: Path) -> None:
+        cache = AudnexCache(tmp_path, ttl=DAY, negative_ttl=3600)
+        entry = cache.put(
+            "book", "B09TEST123", "us", BOOK, etag='"v1"', last_modified="Mon, 01 Jan 2024"
+        )
+
+        assert entry.revalidation_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+    def test_corrupt_or_foreign_version_is_a_miss(self, tmp_path: Path) -> None:
+        cache = AudnexCache(tmp_path, ttl=DAY, negative_ttl=3600)
+        path = cache.path_for("book", "B09TEST123", "us")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert cache.get("book", "B09TEST123", "us") is None
+
+        path.write_text(json.dumps({"version": 0, "status": 200}))
+        assert cache.get("book", "B09TEST123", "us") is None
+
+    def test_stats_prune_and_clear(self, tmp_path: Path) -> None:
+        cache = AudnexCache(tmp_path, ttl=DAY, negative_ttl=3600)
+        cache.put("book", "B000000001", "us", BOOK)
+        expired = cache.put("book", "B000000002", "us", BOOK)
+        expired.fetched_at = time.time() - 2 * DAY
+        cache._write(expired)
+        cache.put_missing("chapters", "B000000003", "uk")
+        cache.put("author", "B000AUTH01", "us", {"asin": "B000AUTH01"})
+
+        stats = cache.stats()
+        assert stats.entries == 4
+        assert stats.negative == 1
+        assert stats.expired == 1
+        assert stats.by_endpoint == {"book": 2, "chapters": 1, "author": 1}
+        assert stats.size_bytes > 0
+
+        assert cache.prune(dry_run=True) == 1
+        assert cache.stats().entries == 4
+        assert cache.prune() == 1
+        assert cache.get("book", "B000000002", "us") is None
+
+        assert cache.clear("chapters") == 1
+        assert cache.clear() == 2
+        assert cache.stats().entries == 0
+
+
+class TestGetAudnexCache:
+    """Tests for the shared cache instance."""
+
+    def test_disabled_returns_none(self, audnex_config: AudnexConfig) -> None:
+        audnex_config.cache_enabled = False
+        assert get_audnex_cache() is None
+
+    def test_shared_until_config_changes(self, audnex_config: AudnexConfig) -> None:
+        first = get_audnex_cache()
+        assert get_audnex_cache() is first
+
+        audnex_config.cache_ttl_days = 1
+        second = get_audnex_cache()
+        assert second is not first
+        assert second is not None
+        assert second.ttl == DAY
+
+
+class TestCachedFetches:
+    """Tests for the Audnex client going through the cache."""
+
+    def test_second_fetch_makes_no_request(self, audnex_config: AudnexConfig) -> None:
+        fake, client_patch = _fake_client(_response(200, BOOK, ETag='"v1"'))
+        with client_patch:
+            first = fetch_audnex_book("B09TEST123")
+            second = fetch_audnex_book("B09TEST123")
+
+        assert first == second == (BOOK, "us")
+        assert len(fake.requests) == 1
+
+    def test_404_is_cached_per_region(self, audnex_config: AudnexConfig) -> None:
+        """An ASIN only sold in the UK doesn't re-probe the US region."""
+        fake, client_patch = _fake_client(_response(404), _response(200, BOOK))
+        with client_patch:
+            assert fetch_audnex_book("B09TEST123") == (BOOK, "uk")
+            assert fetch_audnex_book("B09TEST123") == (BOOK, "uk")
+
+        assert [params["region"] for _, params, _ in fake.requests] == ["us", "uk"]
+
+    def test_errors_are_not_cached(self, audnex_config: AudnexConfig) -> None:
+        fake, client_patch = _fake_client(
+            _response(429), _response(429), _response(200, BOOK), _response(404)
+        )
+        with client_patch:
+            assert fetch_audnex_book("B09TEST123") == (None, None)
+            assert fetch_audnex_book("B09TEST123") == (BOOK, "us")
+
+        assert len(fake.requests) == 3
+
+    def test_expired_entry_revalidated_with_304(self, audnex_config: AudnexConfig) -> None:
+        cache = get_audnex_cache()
+        assert cache is not None
+        entry = cache.put(
+            "chapters", "B09TEST123", "us", {"chapters": []}, etag='"v1"', last_modified="x"
+        )
+        entry.fetched_at = time.time() - 60 * DAY
+        cache._write(entry)
+
+        fake, client_patch = _fake_client(_response(304))
+        with client_patch:
+            data = fetch_audnex_chapters("B09TEST123", region="us")
+
+        assert data == {"chapters": []}
+        assert fake.requests[0][2] == {"If-None-Match": '"v1"', "If-Modified-Since": "x"}
+        renewed = cache.get("chapters", "B09TEST123", "us")
+        assert renewed is not None
+        assert cache.is_fresh(renewed)
+
+    def test_author_cached(self, audnex_config: AudnexConfig) -> None:
+        author = {"asin": "B000AUTH01", "name": "Test Author"}
+        fake, client_patch = _fake_client(_response(200, author))
+        with client_patch:
+            assert fetch_audnex_author("B000AUTH01") == author
+            assert fetch_audnex_author("B000AUTH01") == author
+
+        assert len(fake.requests) == 1
+
+    def test_disabled_cache_always_fetches(self, audnex_config: AudnexConfig) -> None:
+        audnex_config.cache_enabled = False
+        fake, client_patch = _fake_client(_response(200, BOOK), _response(200, BOOK))
+        with client_patch:
+            fetch_audnex_book("B09TEST123")
+            fetch_audnex_book("B09TEST123")
+
+        assert len(fake.requests) == 2
+
+
+class TestCacheCli:
+    """Tests for the shelfr cache sub-app."""
+
+    @pytest.fixture
+    def cache(self, audnex_config: AudnexConfig) -> AudnexCache:
+        cache = get_audnex_cache()
+        assert cache is not None
+        cache.put("book", "B000000001", "us", BOOK)
+        cache.put_missing("book", "B000000002", "uk")
+        stale = cache.put("chapters", "B000000001", "us", {"chapters": []})
+        stale.fetched_at = time.time() - 60 * DAY
+        cache._write(stale)
+        return cache
+
+    def test_help(self) -> None:
+        result = CliRunner().invoke(app, ["cache", "--help"])
+        assert result.exit_code == 0
+        for command in ("stats", "prune", "clear"):
+            assert command in result.output
+
+    def test_stats_json(self, cache: AudnexCache) -> None:
+        result = CliRunner().invoke(app, ["cache", "stats", "--json"])
+
+        assert result.exit_code == 0
+        # Settings loading may log warnings ahead of the JSON
+        data = json.loads(result.output[result.output.index("{") :])
+        assert data["entries"] == 3
+        assert data["negative"] == 1
+        assert data["expired"] == 1
+        assert data["by_endpoint"]["book"] == 2
+
+    def test_prune_respects_dry_run(self, cache: AudnexCache) -> None:
+        result = CliRunner().invoke(app, ["--dry-run", "cache", "prune"])
+        assert result.exit_code == 0
+        assert cache.stats().entries == 3
+
+        result = CliRunner().invoke(app, ["cache", "prune"])
+        assert result.exit_code == 0
+        assert cache.stats().entries == 2
+
+    def test_clear_endpoint(self, cache: AudnexCache) -> None:
+        result = CliRunner().invoke(app, ["cache", "clear", "--endpoint", "book"])
+        assert result.exit_code == 0
+        assert cache.stats().by_endpoint == {"book": 0, "chapters": 1, "author": 0}
+
+    def test_clear_rejects_unknown_endpoint(self, cache: AudnexCache) -> None:
+        result = CliRunner().invoke(app, ["cache", "clear", "--endpoint", "series"])
+        assert result.exit_code == 1
+        assert cache.stats().entries == 3
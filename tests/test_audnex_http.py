@@ -0,0 +1,64 @@
+"""Tests for the shared Audnex HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from shelfr.cli._app import close_http_clients
+from shelfr.metadata.audnex.http import (
+    AUDNEX_LIMITS,
+    aclose_audnex_async_client,
+    close_audnex_clients,
+    get_audnex_async_client,
+    get_audnex_client,
+)
+
+
+class TestSyncClient:
+    """Tests for get_audnex_client()."""
+
+    def test_shared_between_calls(self) -> None:
+        client = get_audnex_client()
+
+        assert get_audnex_client() is client
+        assert isinstance(client, httpx.Client)
+        assert client._transport._pool._max_connections == AUDNEX_LIMITS.max_connections  # type: ignore[attr-defined]
+
+    def test_close_opens_new_client(self) -> None:
+        client = get_audnex_client()
+
+        close_audnex_clients()
+
+        assert client.is_closed
+        assert get_audnex_client() is not client
+
+    def test_cli_close_hook(self) -> None:
+        client = get_audnex_client()
+
+        close_http_clients()
+
+        assert client.is_closed
+
+
+class TestAsyncClient:
+    """Tests for get_audnex_async_client()."""
+
+    def test_shared_within_loop(self) -> None:
+        async def run() -> bool:
+            first = get_audnex_async_client()
+            same = get_audnex_async_client() is first
+            await aclose_audnex_async_client()
+            return same and first.is_closed
+
+        assert asyncio.run(run())
+
+    def test_new_client_per_loop(self) -> None:
+        async def grab() -> httpx.AsyncClient:
+            return get_audnex_async_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        assert first is not second
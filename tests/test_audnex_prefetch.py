@@ -0,0 +1,290 @@
+"""Tests for the async Audnex prefetcher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from shelfr.cli import app
+from shelfr.cli.metadata import PrefetchSource, _collect_asins
+from shelfr.config import AudnexConfig
+from shelfr.metadata.audnex.cache import get_audnex_cache
+from shelfr.metadata.audnex.prefetch import (
+    MAX_RETRY_AFTER,
+    PrefetchResult,
+    TokenBucket,
+    parse_retry_after,
+    prefetch_audnex,
+)
+
+# (path, region) -> list of responses served in turn (the last one repeats)
+Routes = dict[tuple[str, str], list[httpx.Response]]
+
+
+@pytest.fixture
+def audnex_config() -> Iterator[AudnexConfig]:
+    """Real AudnexConfig behind every get_settings the prefetcher touches."""
+    config = AudnexConfig(regions=["us", "uk"])
+    settings = MagicMock()
+    settings.audnex = config
+    with (
+        patch("shelfr.metadata.audnex.prefetch.get_settings", return_value=settings),
+        patch("shelfr.metadata.audnex.cache.get_settings", return_value=settings),
+        patch("shelfr.metadata.audnex.client.get_settings", return_value=settings),
+    ):
+        yield config
+
+
+def _run(asins: list[str], routes: Routes, **kwargs: Any) -> tuple[PrefetchResult, list[str]]:
+    """Prefetch against a mock transport; returns the result and requested paths."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = (request.url.path, request.url.params["region"])
+        requested.append(f"{key[0]}@{key[1]}")
+        queue = routes.get(key, [httpx.Response(404)])
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    async def main() -> PrefetchResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch(
+                "shelfr.metadata.audnex.prefetch.get_audnex_async_client", return_value=client
+            ):
+                return await prefetch_audnex(asins, **kwargs)
+
+    return asyncio.run(main()), requested
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_paces_requests(self) -> None:
+        async def take(n: int) -> float:
+            bucket = TokenBucket(rate=50, burst=1)
+            start = time.perf_counter()
+            for _ in range(n):
+                await bucket.acquire()
+            return time.perf_counter() - start
+
+        # First token is free, the next four wait 1/50s each
+        assert asyncio.run(take(5)) >= 0.07
+
+    def test_pause_holds_acquirers(self) -> None:
+        async def paused() -> float:
+            bucket = TokenBucket(rate=1000)
+            bucket.pause(0.1)
+            start = time.perf_counter()
+            await bucket.acquire()
+            return time.perf_counter() - start
+
+        assert asyncio.run(paused()) >= 0.09
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after()."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self) -> None:
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        seconds = parse_retry_after(when)
+        assert seconds is not None
+        assert 25 <= seconds <= 30
+
+    def test_invalid_or_missing(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_capped(self) -> None:
+        assert parse_retry_after("86400") == MAX_RETRY_AFTER
+
+
+class TestPrefetchAudnex:
+    """Tests for prefetch_audnex()."""
+
+    def test_warms_cache_across_regions(self, audnex_config: AudnexConfig) -> None:
+        routes: Routes = {
+            ("/books/B000000001", "us"): [httpx.Response(200, json={"asin": "B000000001"})],
+            ("/books/B000000001/chapters", "us"): [httpx.Response(200, json={"chapters": []})],
+            ("/books/B000000002", "uk"): [httpx.Response(200, json={"asin": "B000000002"})],
+            ("/books/B000000002/chapters", "uk"): [httpx.Response(200, json={"chapters": []})],
+        }
+
+        result, requested = _run(
+            ["B000000001", "b000000002", "B000000003", "B000000001"], routes, rate=100
+        )
+
+        assert result.found == {"B000000001": "us", "B000000002": "uk"}
+        assert result.not_found == ["B000000003"]
+        assert result.failed == {}
+        # The UK book's chapters go straight to the UK region
+        assert "/books/B000000002/chapters@us" not in requested
+
+        cache = get_audnex_cache()
+        assert cache is not None
+        entry = cache.get("chapters", "B000000002", "uk")
+        assert entry is not None
+        assert entry.data == {"chapters": []}
+
+    def test_second_run_is_served_from_cache(self, audnex_config: AudnexConfig) -> None:
+        routes: Routes = {
+            ("/books/B000000001", "us"): [httpx.Response(200, json={"asin": "B000000001"})],
+        }
+        _run(["B000000001"], routes, rate=100, chapters=False)
+
+        result, requested = _run(["B000000001"], routes, rate=100, chapters=False)
+
+        assert requested == []
+        assert result.cache_hits == 1
+
+    def test_retries_after_rate_limit(self, audnex_config: AudnexConfig) -> None:
+        routes: Routes = {
+            ("/books/B000000001", "us"): [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"asin": "B000000001"}),
+            ],
+        }
+
+        result, requested = _run(["B000000001"], routes, rate=100, chapters=False)
+
+        assert result.found == {"B000000001": "us"}
+        assert result.rate_limited == 1
+        assert requested == ["/books/B000000001@us", "/books/B000000001@us"]
+
+    def test_auth_error_fails_without_retry(self, audnex_config: AudnexConfig) -> None:
+        routes: Routes = {("/books/B000000001", "us"): [httpx.Response(403)]}
+
+        result, requested = _run(["B000000001"], routes, rate=100)
+
+        assert result.failed == {"B000000001": "HTTP 403"}
+        assert len(requested) == 1
+
+    def test_circuit_open_pauses_then_retries(self, audnex_config: AudnexConfig) -> None:
+        from shelfr.utils.circuit_breaker import CircuitOpenError
+
+        routes: Routes = {
+            ("/books/B000000001", "us"): [httpx.Response(200, json={"asin": "B000000001"})],
+        }
+        breaker = MagicMock()
+        breaker.__enter__.side_effect = [CircuitOpenError("audnex-api", 0.05), None]
+        breaker.__exit__.return_value = False
+
+        with patch("shelfr.metadata.audnex.prefetch.audnex_breaker", breaker):
+            start = time.perf_counter()
+            result, requested = _run(["B000000001"], routes, rate=100, chapters=False)
+
+        assert result.found == {"B000000001": "us"}
+        assert time.perf_counter() - start >= 0.04
+        assert len(requested) == 1
+
+    def test_rejects_zero_concurrency(self, audnex_config: AudnexConfig) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            asyncio.run(prefetch_audnex(["B000000001"], concurrency=0))
+
+
+class TestPrefetchCli:
+    """Tests for `shelfr metadata prefetch`."""
+
+    def test_help(self) -> None:
+        result = CliRunner().invoke(app, ["metadata", "prefetch", "--help"])
+        assert result.exit_code == 0
+        assert "--concurrency" in result.output
+
+    def test_dry_run(self) -> None:
+        with patch("shelfr.metadata.audnex.prefetch.prefetch_audnex") as prefetch:
+            result = CliRunner().invoke(app, ["--dry-run", "metadata", "prefetch", "B000000001"])
+
+        assert result.exit_code == 0
+        assert "Would prefetch" in result.output
+        prefetch.assert_not_called()
+
+    def test_prefetches_given_asins(self, audnex_config: AudnexConfig) -> None:
+        async def fake_prefetch(asins: list[str], **kwargs: Any) -> PrefetchResult:
+            for asin in asins:
+                kwargs["progress"](asin)
+            return PrefetchResult(found=dict.fromkeys(asins, "us"), requests=len(asins))
+
+        with patch("shelfr.metadata.audnex.prefetch.prefetch_audnex", fake_prefetch):
+            result = CliRunner().invoke(
+                app, ["metadata", "prefetch", "B000000001", "b000000002", "--rate", "2"]
+            )
+
+        assert result.exit_code == 0
+        assert "Prefetched 2 of 2" in result.output
+
+    def test_failures_exit_nonzero(self, audnex_config: AudnexConfig) -> None:
+        async def fake_prefetch(asins: list[str], **kwargs: Any) -> PrefetchResult:
+            return PrefetchResult(failed={"B000000001": "HTTP 403"})
+
+        with patch("shelfr.metadata.audnex.prefetch.prefetch_audnex", fake_prefetch):
+            result = CliRunner().invoke(app, ["metadata", "prefetch", "B000000001"])
+
+        assert result.exit_code == 1
+
+
+class TestCollectAsins:
+    """Tests for the ASIN sources of `shelfr metadata prefetch`."""
+
+    @pytest.fixture
+    def library_root(self, tmp_path: Path) -> Iterator[Path]:
+        """Staged book folders, each carrying its ASIN somewhere different."""
+        root = tmp_path / "library"
+        by_name = root / "Author" / "Named Book {ASIN.B0NAMED001}"
+        by_file = root / "Author" / "File Book"
+        by_sidecar = root / "Author" / "Sidecar Book"
+        unknown = root / "Author" / "Unknown Book"
+        for folder in (by_name, by_file, by_sidecar, unknown):
+            folder.mkdir(parents=True)
+        (by_name / "book.m4b").touch()
+        (by_file / "B0INFILE01.m4b").touch()
+        (by_sidecar / "book.m4b").touch()
+        (by_sidecar / "book.metadata.json").write_text(json.dumps({"asin": "B0SIDECAR1"}))
+        (unknown / "book.m4b").touch()
+
+        settings = MagicMock()
+        settings.paths.library_root = root
+        with (
+            patch("shelfr.config.get_settings", return_value=settings),
+            patch("shelfr.abs.asin._get_mediainfo_binary", return_value=None),
+        ):
+            yield root
+
+    def test_pending(self) -> None:
+        releases = [
+            MagicMock(asin="B0PENDING1"),
+            MagicMock(asin=None),
+            MagicMock(asin="B0PENDING1"),
+        ]
+        with patch("shelfr.discovery.get_new_releases", return_value=releases):
+            assert _collect_asins(PrefetchSource.PENDING) == ["B0PENDING1"]
+
+    def test_staged_resolves_beyond_folder_name(self, library_root: Path) -> None:
+        with patch("shelfr.discovery.get_new_releases") as pending:
+            asins = _collect_asins(PrefetchSource.STAGED)
+
+        assert sorted(asins) == ["B0INFILE01", "B0NAMED001", "B0SIDECAR1"]
+        pending.assert_not_called()
+
+    def test_all_dedupes_in_discovery_order(self, library_root: Path) -> None:
+        releases = [MagicMock(asin="B0SIDECAR1"), MagicMock(asin="B0PENDING1")]
+        with patch("shelfr.discovery.get_new_releases", return_value=releases):
+            asins = _collect_asins(PrefetchSource.ALL)
+
+        assert asins[:2] == ["B0SIDECAR1", "B0PENDING1"]
+        assert sorted(asins[2:]) == ["B0INFILE01", "B0NAMED001"]
@@ -434,6 +434,7 @@ class TestAbsImportCommand:
         # Unknown ASIN policy settings
         config.import_settings.unknown_asin_policy = "import"
         config.import_settings.quarantine_path = None
+        config.import_settings.workers = 1
         # Cleanup config - disabled by default for tests
         config.import_settings.cleanup = MagicMock()
         config.import_settings.cleanup.strategy = "none"
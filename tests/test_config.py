@@ -17,8 +17,10 @@ from shelfr.config import (
     MkbrrConfig,
     NamingConfig,
     PathsConfig,
+    PipelineConfig,
     QBittorrentConfig,
     _load_naming_config,
+    _parse_pipeline_config,
     clear_settings,
     load_settings,
     load_yaml_config,
@@ -102,6 +104,27 @@ class TestQBittorrentConfig:
         assert "shelfr" in config.tags
 
 
+class TestPipelineConfig:
+    """Tests for PipelineConfig parsing."""
+
+    def test_missing_section_uses_defaults(self) -> None:
+        """Test an absent pipeline section leaves the executor off."""
+        config = _parse_pipeline_config({})
+        assert config == PipelineConfig()
+        assert config.enabled is False
+
+    def test_partial_stage_override(self) -> None:
+        """Test stages not mentioned keep their defaults."""
+        config = _parse_pipeline_config(
+            {"enabled": True, "torrent": {"workers": 2}, "upload": {"queue_size": 8}}
+        )
+        assert config.enabled is True
+        assert config.torrent.workers == 2
+        assert config.torrent.queue_size == PipelineConfig().torrent.queue_size
+        assert config.upload.queue_size == 8
+        assert config.metadata.workers == 2
+
+
 class TestAudnexConfig:
     """Tests for AudnexConfig dataclass and region validation."""
 
@@ -314,6 +314,37 @@ class TestConfigSchemaLibation:
         assert "Invalid regex" in str(exc_info.value)
 
 
+class TestConfigSchemaPipeline:
+    """Tests for PipelineSchema validation."""
+
+    def test_defaults(self) -> None:
+        """Test pipeline is off by default with two metadata workers."""
+        data = {
+            "paths": {
+                "library_root": "/mnt/data/audiobooks",
+                "torrent_output": "/mnt/data/torrents",
+                "seed_root": "/mnt/data/seed",
+            },
+        }
+        schema = validate_config_yaml(data)
+        assert schema.pipeline.enabled is False
+        assert schema.pipeline.metadata.workers == 2
+        assert schema.pipeline.torrent.workers == 1
+
+    def test_zero_workers_rejected(self) -> None:
+        """Test a stage needs at least one worker."""
+        data = {
+            "paths": {
+                "library_root": "/mnt/data/audiobooks",
+                "torrent_output": "/mnt/data/torrents",
+                "seed_root": "/mnt/data/seed",
+            },
+            "pipeline": {"torrent": {"workers": 0}},
+        }
+        with pytest.raises(ValidationError):
+            validate_config_yaml(data)
+
+
 class TestAudiobookshelfSchema:
     """Tests for AudiobookshelfSchema validation."""
 
@@ -932,6 +932,19 @@ class TestPrintWorkflowSummary:
             call_str = str(mock_print.call_args)
             assert "12.5s" in call_str
 
+    def test_with_stage_timings(self) -> None:
+        """print_workflow_summary should add a timing table when timings are given."""
+        from shelfr.console import print_workflow_summary
+        from shelfr.utils.trace import StageTiming
+
+        timings = {"torrent": StageTiming(count=4, total=40.0, p50=9.5, p95=14.0, max=15.0)}
+        with patch.object(console, "print") as mock_print:
+            print_workflow_summary({"discovered": 4}, duration=50.0, timings=timings)
+            tables = [c.args[0] for c in mock_print.call_args_list if c.args]
+            assert any(getattr(t, "title", None) == "Stage Timings" for t in tables)
+            # Duration is still the last line
+            assert "50.0s" in str(mock_print.call_args)
+
 
 class TestPrintReleaseDetails:
     """Test print_release_details function."""
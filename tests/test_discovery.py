@@ -7,8 +7,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import shelfr.discovery as discovery_module
 from shelfr.discovery import (
     ASIN_PATTERN,
+    DiscoveryCache,
     build_release_from_dir,
     extract_asin_from_name,
     find_audiobook_dirs,
@@ -17,6 +19,7 @@ from shelfr.discovery import (
     get_release_by_asin,
     is_audiobook_dir,
     is_valid_asin,
+    iter_releases,
     load_metadata_json,
     parse_folder_name,
     print_release_summary,
@@ -471,6 +474,129 @@ class TestScanLibrary:
             assert len(releases) == 2
 
 
+class TestDiscoveryCache:
+    """Tests for the persistent discovery cache."""
+
+    @pytest.fixture
+    def library(self, tmp_path: Path):
+        """Create a two-book library and patch settings to match."""
+        mock_settings = MagicMock()
+        mock_settings.paths.library_root = tmp_path
+        mock_settings.mam.allowed_extensions = [".m4b"]
+
+        for asin in ("B09CACHE01", "B09CACHE02"):
+            book = tmp_path / "Author" / f"Book {{ASIN.{asin}}}"
+            book.mkdir(parents=True)
+            (book / "book.m4b").touch()
+            (book / f"Book {{ASIN.{asin}}}.metadata.json").write_text(
+                json.dumps({"asin": asin, "title": f"Title {asin}"})
+            )
+
+        with patch("shelfr.discovery.get_settings", return_value=mock_settings):
+            yield tmp_path
+
+    def _scan(self, root: Path, **kwargs) -> tuple[list[AudiobookRelease], int]:
+        with patch(
+            "shelfr.discovery.build_release_from_dir",
+            wraps=discovery_module.build_release_from_dir,
+        ) as build:
+            releases = scan_library(root, **kwargs)
+        return releases, build.call_count
+
+    def test_unchanged_folders_are_reused(self, library: Path) -> None:
+        first, built_first = self._scan(library)
+        second, built_second = self._scan(library)
+
+        assert built_first == 2
+        assert built_second == 0
+        assert sorted(r.title for r in second) == ["Title B09CACHE01", "Title B09CACHE02"]
+        assert all(r.main_m4b is not None and r.main_m4b.name == "book.m4b" for r in second)
+        assert {r.source_dir for r in second} == {r.source_dir for r in first}
+
+    def test_metadata_edit_invalidates(self, library: Path) -> None:
+        self._scan(library)
+        meta = next(library.glob("Author/*B09CACHE01*/*.metadata.json"))
+        meta.write_text(json.dumps({"asin": "B09CACHE01", "title": "Retitled Book"}))
+
+        releases, built = self._scan(library)
+
+        assert built == 1
+        assert "Retitled Book" in {r.title for r in releases}
+
+    def test_new_folder_is_built(self, library: Path) -> None:
+        self._scan(library)
+        book = library / "Author" / "Book {ASIN.B09CACHE03}"
+        book.mkdir()
+        (book / "book.m4b").touch()
+
+        releases, built = self._scan(library)
+
+        assert built == 1
+        assert len(releases) == 3
+
+    def test_use_cache_false(self, library: Path) -> None:
+        self._scan(library)
+        _, built = self._scan(library, use_cache=False)
+        assert built == 2
+
+    def test_removed_folders_are_pruned(self, library: Path) -> None:
+        self._scan(library)
+        for item in next(library.glob("Author/*B09CACHE02*")).iterdir():
+            item.unlink()
+        next(library.glob("Author/*B09CACHE02*")).rmdir()
+        self._scan(library)
+
+        cache = DiscoveryCache.for_library(library)
+        data = json.loads(cache.path.read_text())
+        assert len(data["entries"]) == 1
+
+    def test_corrupt_cache_is_ignored(self, library: Path) -> None:
+        self._scan(library)
+        DiscoveryCache.for_library(library).path.write_text("{not json")
+
+        releases, built = self._scan(library)
+
+        assert len(releases) == 2
+        assert built == 2
+
+
+class TestIterReleases:
+    """Tests for the streaming discovery generator."""
+
+    def test_yields_lazily(self, tmp_path: Path) -> None:
+        mock_settings = MagicMock()
+        mock_settings.mam.allowed_extensions = [".m4b"]
+        for asin in ("B09LAZY001", "B09LAZY002"):
+            book = tmp_path / "Author" / f"Book {{ASIN.{asin}}}"
+            book.mkdir(parents=True)
+            (book / "book.m4b").touch()
+
+        with patch("shelfr.discovery.get_settings", return_value=mock_settings):
+            releases = iter_releases(tmp_path)
+            first = next(releases)
+            assert first.asin in {"B09LAZY001", "B09LAZY002"}
+            releases.close()
+
+            # Stopping early must not prune folders the walk never reached
+            cache = DiscoveryCache.for_library(tmp_path)
+            assert len(json.loads(cache.path.read_text())["entries"]) == 1
+            assert len(list(iter_releases(tmp_path))) == 2
+
+    def test_new_only_filters_processed(self, tmp_path: Path) -> None:
+        mock_settings = MagicMock()
+        mock_settings.mam.allowed_extensions = [".m4b"]
+        for asin in ("B09NEW0001", "B09NEW0002"):
+            book = tmp_path / "Author" / f"Book {{ASIN.{asin}}}"
+            book.mkdir(parents=True)
+            (book / "book.m4b").touch()
+
+        with (
+            patch("shelfr.discovery.get_settings", return_value=mock_settings),
+            patch("shelfr.discovery.get_processed_identifiers", return_value={"B09NEW0001"}),
+        ):
+            assert [r.asin for r in iter_releases(tmp_path, new_only=True)] == ["B09NEW0002"]
+
+
 class TestGetNewReleases:
     """Tests for getting new (unprocessed) releases."""
 
@@ -14,6 +14,7 @@ from shelfr.utils.fuzzy import (
     normalize_author_name,
     normalize_series_name,
     partial_ratio,
+    similarity_matrix,
     similarity_ratio,
     weighted_ratio,
 )
@@ -377,6 +378,39 @@ class TestGroupSimilarSeries:
         assert "Sword Art Online" in groups or len(groups) == 2
 
 
+# =============================================================================
+# Batch Scoring Tests
+# =============================================================================
+
+
+class TestSimilarityMatrix:
+    """Test similarity_matrix function."""
+
+    QUERIES = ["sword art online", "", "reki kawahara"]
+    CHOICES = ["sword art online progressive", "kawahara reki", ""]
+
+    def test_matches_similarity_ratio(self):
+        """Every cell equals similarity_ratio of the pair (0 for empty strings)."""
+        matrix = similarity_matrix(self.QUERIES, self.CHOICES)
+
+        assert matrix == [[similarity_ratio(q, c) for c in self.CHOICES] for q in self.QUERIES]
+        assert matrix[2][1] == 100.0
+
+    def test_without_numpy(self):
+        """Pairwise fallback gives the same matrix."""
+        from unittest.mock import patch
+
+        with patch("shelfr.utils.fuzzy._numpy", return_value=None):
+            matrix = similarity_matrix(self.QUERIES, self.CHOICES)
+
+        assert matrix == similarity_matrix(self.QUERIES, self.CHOICES)
+
+    def test_empty_inputs(self):
+        """No choices gives empty rows; no queries gives no rows."""
+        assert similarity_matrix(["a", "b"], []) == [[], []]
+        assert similarity_matrix([], ["a"]) == []
+
+
 # =============================================================================
 # Edge Cases and Integration
 # =============================================================================
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -10,7 +13,7 @@ import pytest
 
 from shelfr.models import AudiobookRelease, ReleaseStatus
 from shelfr.validation import ValidationResult
-from shelfr.workflow import PipelineResult, full_run, process_single_release
+from shelfr.workflow import PipelineResult, ReleaseFeed, full_run, process_single_release
 
 
 def _create_passing_validation_result() -> ValidationResult:
@@ -19,6 +22,13 @@ def _create_passing_validation_result() -> ValidationResult:
     return result
 
 
+@pytest.fixture(autouse=True)
+def isolated_state_file(tmp_path: Path):
+    """Keep the pipeline's state batches and compaction off the real state file."""
+    with patch("shelfr.utils.state._get_state_file", return_value=tmp_path / "state.json"):
+        yield
+
+
 class TestProcessSingleRelease:
     """Integration tests for processing a single release through the pipeline."""
 
@@ -89,8 +99,15 @@ class TestProcessSingleRelease:
 
             mock_upload.return_value = (True, "abc123def456")
 
+            # Track upload, mark_processed and flush_state in call order
+            calls = Mock()
+            calls.attach_mock(mock_upload, "upload")
+            calls.attach_mock(mock_mark_processed, "mark_processed")
+
             # Act
-            result = process_single_release(release)
+            with patch("shelfr.workflow.flush_state") as mock_flush:
+                calls.attach_mock(mock_flush, "flush")
+                result = process_single_release(release)
 
             # Assert
             assert result.success
@@ -104,6 +121,11 @@ class TestProcessSingleRelease:
             mock_upload.assert_called_once()
             mock_mark_processed.assert_called_once_with(release, infohash="abc123def456")
 
+            # State is flushed on both sides of the upload
+            names = [name for name, _, _ in calls.mock_calls]
+            assert names[names.index("upload") - 1] == "flush"
+            assert names[names.index("mark_processed") + 1] == "flush"
+
     @patch("shelfr.workflow.get_processed_identifiers")
     @patch("shelfr.workflow.checkpoint_stage")
     @patch("shelfr.workflow.should_skip_stage", return_value=False)
@@ -310,6 +332,7 @@ class TestFullPipeline:
         """Test that full run skips already processed releases."""
         # Arrange - mock preflight validation to pass
         mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline.enabled = False
 
         mock_scan_result = MagicMock()
         mock_scan_result.success = True
@@ -354,6 +377,69 @@ class TestFullPipeline:
         # process_single_release should only be called for the new release
         mock_process.assert_called_once()
 
+    @patch("shelfr.workflow.PreflightValidation")
+    @patch("shelfr.workflow.get_settings")
+    @patch("shelfr.workflow.DiscoveryValidation")
+    @patch("shelfr.workflow.get_processed_identifiers")
+    @patch("shelfr.workflow.is_processed")
+    @patch("shelfr.workflow.process_single_release")
+    @patch("shelfr.discovery.iter_releases")
+    def test_full_run_streams_releases(
+        self,
+        mock_iter_releases: Mock,
+        mock_process: Mock,
+        mock_is_processed: Mock,
+        mock_get_processed_ids: Mock,
+        mock_discovery_validation: Mock,
+        mock_settings: Mock,
+        mock_preflight: Mock,
+    ) -> None:
+        """Test that stream mode processes releases yielded by iter_releases."""
+        mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline.enabled = False
+        mock_iter_releases.return_value = iter(
+            [
+                AudiobookRelease(title="First", asin="B000TEST06"),
+                AudiobookRelease(title="Second", asin="B000TEST07"),
+            ]
+        )
+        mock_is_processed.return_value = False
+        mock_get_processed_ids.return_value = set()
+        mock_discovery_validation.return_value.validate.return_value = MagicMock(
+            passed=True, warning_count=0, checks=[]
+        )
+        mock_process.return_value = MagicMock(success=True)
+
+        result = full_run(skip_scan=True, stream=True)
+
+        assert result.total == 2
+        assert result.successful == 2
+        assert mock_iter_releases.call_args.kwargs["new_only"] is True
+        processed = [c.args[0].asin for c in mock_process.call_args_list]
+        assert processed == ["B000TEST06", "B000TEST07"]
+        # Totals never lag behind the release being processed
+        for call in mock_process.call_args_list:
+            assert call.kwargs["release_total"] >= call.kwargs["release_index"]
+
+    @patch("shelfr.workflow.PreflightValidation")
+    @patch("shelfr.workflow.get_settings")
+    @patch("shelfr.discovery.iter_releases")
+    def test_full_run_stream_with_no_releases(
+        self,
+        mock_iter_releases: Mock,
+        mock_settings: Mock,
+        mock_preflight: Mock,
+    ) -> None:
+        """Test stream mode when discovery yields nothing."""
+        mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline.enabled = False
+        mock_iter_releases.return_value = iter([])
+
+        result = full_run(skip_scan=True, stream=True)
+
+        assert result.total == 0
+        assert result.results == []
+
     def test_full_run_dry_run_mode(self) -> None:
         """Test that dry run mode shows what would happen without making changes."""
         # This is a smoke test - just ensure dry run doesn't crash
@@ -374,6 +460,256 @@ class TestFullPipeline:
             mock_scan.assert_not_called()
             mock_liberate.assert_not_called()
 
+    @patch("shelfr.workflow.PreflightValidation")
+    @patch("shelfr.workflow.get_settings")
+    @patch("shelfr.workflow.DiscoveryValidation")
+    @patch("shelfr.discovery.get_new_releases")
+    def test_state_readable_by_other_process_during_run(
+        self,
+        mock_get_releases: Mock,
+        mock_discovery_validation: Mock,
+        mock_settings: Mock,
+        mock_preflight: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """Test that another process can read state while a release is hashed and uploaded."""
+        from shelfr.utils.state import checkpoint_stage, mark_processed
+        from shelfr.workflow import _ReleaseRun
+
+        mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline.enabled = False
+        mock_discovery_validation.return_value.validate.return_value = MagicMock(
+            passed=True, warning_count=0, checks=[]
+        )
+        mock_get_releases.return_value = [
+            AudiobookRelease(title="First", asin="B000LOCK01"),
+            AudiobookRelease(title="Second", asin="B000LOCK02"),
+        ]
+        reader = (
+            "import sys; from pathlib import Path; "
+            "from shelfr.utils.state import JsonStateStore; "
+            "print(','.join(sorted(JsonStateStore(Path(sys.argv[1])).load()['processed'])))"
+        )
+        seen: list[str] = []
+
+        def read_from_other_process() -> None:
+            # Times out (failing the test) if the run holds the state lock
+            done = subprocess.run(
+                [sys.executable, "-c", reader, str(tmp_path / "state.json")],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                check=True,
+            )
+            seen.append(done.stdout.strip())
+
+        def stage(run: _ReleaseRun) -> None:
+            run.staging_dir = tmp_path
+            checkpoint_stage(run.release, "staged")
+
+        def upload(run: _ReleaseRun) -> None:
+            read_from_other_process()
+            mark_processed(run.release, infohash="abc123")
+
+        with (
+            patch.object(_ReleaseRun, "validate", autospec=True),
+            patch.object(_ReleaseRun, "stage", autospec=True, side_effect=stage),
+            patch.object(_ReleaseRun, "fetch_metadata", autospec=True),
+            patch.object(
+                _ReleaseRun,
+                "create_torrent",
+                autospec=True,
+                side_effect=lambda run: read_from_other_process(),
+            ),
+            patch.object(_ReleaseRun, "upload", autospec=True, side_effect=upload),
+        ):
+            result = full_run(skip_scan=True)
+
+        assert result.successful == 2
+        # Each read sees the checkpoints written so far
+        assert seen == [
+            "B000LOCK01",
+            "B000LOCK01",
+            "B000LOCK01,B000LOCK02",
+            "B000LOCK01,B000LOCK02",
+        ]
+
+    @patch("shelfr.workflow.mark_failed")
+    @patch("shelfr.workflow.PreflightValidation")
+    @patch("shelfr.workflow.get_settings")
+    @patch("shelfr.workflow.DiscoveryValidation")
+    @patch("shelfr.workflow.get_processed_identifiers", return_value=set())
+    @patch("shelfr.workflow.is_processed", return_value=False)
+    @patch("shelfr.discovery.get_new_releases")
+    def test_full_run_pipelined(
+        self,
+        mock_get_releases: Mock,
+        mock_is_processed: Mock,
+        mock_get_processed_ids: Mock,
+        mock_discovery_validation: Mock,
+        mock_settings: Mock,
+        mock_preflight: Mock,
+        mock_mark_failed: Mock,
+    ) -> None:
+        """Test pipeline mode runs each release's stages in order and keeps results ordered."""
+        from shelfr.config import PipelineConfig
+        from shelfr.workflow import ProgressInfo, ProgressStage, _ReleaseRun
+
+        mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline = PipelineConfig(enabled=True)
+        mock_discovery_validation.return_value.validate.return_value = MagicMock(
+            passed=True, warning_count=0, checks=[]
+        )
+        releases = [AudiobookRelease(title=f"Book {n}", asin=f"B000PIPE0{n}") for n in range(4)]
+        mock_get_releases.return_value = releases
+
+        def stage(run: _ReleaseRun) -> None:
+            run.notify(ProgressStage.STAGING)
+            if run.release.asin == "B000PIPE01":
+                raise RuntimeError("hardlink failed")
+
+        def fetch(run: _ReleaseRun) -> None:
+            run.notify(ProgressStage.METADATA)
+
+        def torrent(run: _ReleaseRun) -> None:
+            run.notify(ProgressStage.TORRENT)
+
+        def upload(run: _ReleaseRun) -> None:
+            run.notify(ProgressStage.UPLOAD)
+
+        events: list[ProgressInfo] = []
+        with (
+            patch.object(_ReleaseRun, "validate", autospec=True),
+            patch.object(_ReleaseRun, "stage", autospec=True, side_effect=stage),
+            patch.object(_ReleaseRun, "fetch_metadata", autospec=True, side_effect=fetch),
+            patch.object(_ReleaseRun, "create_torrent", autospec=True, side_effect=torrent),
+            patch.object(_ReleaseRun, "upload", autospec=True, side_effect=upload),
+        ):
+            result = full_run(skip_scan=True, progress_callback=events.append)
+
+        assert [r.release.asin for r in result.results] == [r.asin for r in releases]
+        assert [r.success for r in result.results] == [True, False, True, True]
+        assert result.results[1].error == "hardlink failed"
+        mock_mark_failed.assert_called_once()
+
+        def stages_for(index: int) -> list[ProgressStage]:
+            return [e.stage for e in events if e.release_index == index]
+
+        assert stages_for(1) == [
+            ProgressStage.STAGING,
+            ProgressStage.METADATA,
+            ProgressStage.TORRENT,
+            ProgressStage.UPLOAD,
+            ProgressStage.COMPLETE,
+        ]
+        assert stages_for(2) == [ProgressStage.STAGING, ProgressStage.FAILED]
+        assert all(e.release_total == 4 for e in events if e.release_index)
+        # Each release reports its step timings; the run reports per-stage stats
+        complete = next(
+            e for e in events if e.release_index == 1 and e.stage == ProgressStage.COMPLETE
+        )
+        assert set(complete.extra["timings"]) == {
+            "validation",
+            "staging",
+            "metadata",
+            "torrent",
+            "upload",
+        }
+        assert result.stage_timings["staging"].count == 4
+        assert result.stage_timings["upload"].count == 3
+        assert "p95" in events[-1].extra["stage_timings"]["torrent"]
+        assert result.trace_path is not None
+        assert result.trace_path.exists()
+
+    @patch("shelfr.workflow.PreflightValidation")
+    @patch("shelfr.workflow.get_settings")
+    @patch("shelfr.workflow.DiscoveryValidation")
+    @patch("shelfr.workflow.get_processed_identifiers", return_value=set())
+    @patch("shelfr.workflow.is_processed", return_value=False)
+    @patch("shelfr.discovery.get_new_releases")
+    def test_full_run_pipelined_tags_release_output(
+        self,
+        mock_get_releases: Mock,
+        mock_is_processed: Mock,
+        mock_get_processed_ids: Mock,
+        mock_discovery_validation: Mock,
+        mock_settings: Mock,
+        mock_preflight: Mock,
+    ) -> None:
+        """Test pipeline mode tags each worker's lines with their release, not a header."""
+        from shelfr.config import PipelineConfig
+        from shelfr.workflow import _ReleaseRun
+
+        mock_preflight.return_value.validate.return_value = _create_passing_validation_result()
+        mock_settings.return_value.pipeline = PipelineConfig(enabled=True)
+        mock_discovery_validation.return_value.validate.return_value = MagicMock(
+            passed=True, warning_count=0, checks=[]
+        )
+        mock_get_releases.return_value = [
+            AudiobookRelease(title=f"Book {n}", asin=f"B000TAGS0{n}") for n in range(3)
+        ]
+
+        def report(step: str) -> Callable[[_ReleaseRun], None]:
+            return lambda run: run.say(print_lines.append, f"{step} {run.release.asin}")
+
+        print_lines: list[str] = []
+        with (
+            patch("shelfr.workflow.console") as mock_console,
+            patch.object(_ReleaseRun, "validate", autospec=True),
+            patch.object(_ReleaseRun, "stage", autospec=True, side_effect=report("Staged")),
+            patch.object(_ReleaseRun, "fetch_metadata", autospec=True),
+            patch.object(
+                _ReleaseRun, "create_torrent", autospec=True, side_effect=report("Torrent")
+            ),
+            patch.object(_ReleaseRun, "upload", autospec=True, side_effect=report("Uploaded")),
+        ):
+            result = full_run(skip_scan=True)
+
+        assert result.successful == 3
+        assert len(print_lines) == 9
+        for line in print_lines:
+            n = line[-1]
+            assert line.startswith(f"[cyan][{int(n) + 1}] Book {n}[/] ")
+        headers = [c for c in mock_console.print.call_args_list if c.args and "──" in c.args[0]]
+        assert headers == []
+
+
+class TestReleaseFeed:
+    """Tests for the background discovery feed used by full_run(stream=True)."""
+
+    def test_yields_in_order_and_counts(self) -> None:
+        releases = [AudiobookRelease(asin=f"B000FEED0{i}") for i in range(3)]
+
+        with ReleaseFeed(iter(releases)) as feed:
+            assert [r.asin for r in feed] == ["B000FEED00", "B000FEED01", "B000FEED02"]
+
+        assert feed.discovered == 3
+        assert feed.done is True
+        assert feed.total_label == "3"
+
+    def test_reraises_discovery_error(self) -> None:
+        def broken():
+            yield AudiobookRelease(asin="B000FEED10")
+            raise OSError("share went away")
+
+        with ReleaseFeed(broken()) as feed, pytest.raises(OSError, match="share went away"):
+            list(feed)
+
+    def test_early_exit_closes_generator(self) -> None:
+        closed = []
+
+        def endless():
+            try:
+                while True:
+                    yield AudiobookRelease(asin="B000FEED20")
+            finally:
+                closed.append(True)
+
+        with ReleaseFeed(endless()) as feed:
+            next(iter(feed))
+
+        assert closed == [True]
+
 
 class TestConfigurationValidation:
     """Integration tests for configuration validation."""
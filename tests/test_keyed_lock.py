@@ -0,0 +1,64 @@
+"""Tests for per-key mutual exclusion."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from shelfr.utils.keyed_lock import KeyedLock
+
+
+def _max_concurrency(locks: KeyedLock, keys: list[str]) -> dict[str, int]:
+    """Hold each key from its own thread; return the most holders seen per key."""
+    guard = threading.Lock()
+    active: dict[str, int] = dict.fromkeys(keys, 0)
+    peak: dict[str, int] = dict.fromkeys(keys, 0)
+
+    def work(key: str) -> None:
+        with locks.hold(key):
+            with guard:
+                active[key] += 1
+                peak[key] = max(peak[key], active[key])
+            time.sleep(0.02)
+            with guard:
+                active[key] -= 1
+
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        list(pool.map(work, keys))
+    return peak
+
+
+class TestKeyedLock:
+    """Tests for KeyedLock."""
+
+    def test_same_key_serialized(self) -> None:
+        locks = KeyedLock()
+
+        assert _max_concurrency(locks, ["a"] * 6) == {"a": 1}
+        assert locks.in_use() == 0
+
+    def test_different_keys_concurrent(self) -> None:
+        locks = KeyedLock()
+        inside = threading.Barrier(2, timeout=5)
+
+        def work(key: str) -> None:
+            with locks.hold(key):
+                inside.wait()  # Both threads inside at once, or BrokenBarrierError
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(work, ["a", "b"]))
+        assert locks.in_use() == 0
+
+    def test_released_on_exception(self) -> None:
+        locks = KeyedLock()
+
+        try:
+            with locks.hold("a"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        with locks.hold("a"):
+            assert locks.in_use() == 1
+        assert locks.in_use() == 0
@@ -0,0 +1,204 @@
+"""Tests for batched MediaInfo probing."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shelfr.config import MediaInfoConfig
+from shelfr.metadata.mediainfo.batch import _split_output, probe_many
+from shelfr.metadata.mediainfo.cache import ProbeCache
+
+# Prints one MediaInfo document per file (an array for several); fails on "bad" files.
+# part3.mp3 carries an Audible CDEK tag.
+FAKE_MEDIAINFO = """#!{python}
+import json, pathlib, sys
+
+files = [a for a in sys.argv[1:] if not a.startswith("--")]
+with open({log!r}, "a") as log:
+    log.write(json.dumps(files) + "\\n")
+if any("bad" in f for f in files):
+    sys.exit(1)
+docs = []
+for f in files:
+    general = {{"@type": "General", "Title": pathlib.Path(f).name}}
+    if pathlib.Path(f).name == "part3.mp3":
+        general["CDEK"] = "B0BATCH003"
+    audio = {{"@type": "Audio", "SamplingRate": "44100"}}
+    docs.append({{"media": {{"@ref": f, "track": [general, audio]}}}})
+print(json.dumps(docs if len(docs) > 1 else docs[0]))
+"""
+
+
+class FakeMediainfo:
+    """A mediainfo stand-in that records each invocation."""
+
+    def __init__(self, root: Path) -> None:
+        self.log = root / "calls.jsonl"
+        self.binary = root / "mediainfo"
+        self.binary.write_text(FAKE_MEDIAINFO.format(python=sys.executable, log=str(self.log)))
+        self.binary.chmod(0o755)
+
+    @property
+    def calls(self) -> list[list[str]]:
+        if not self.log.exists():
+            return []
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+
+@pytest.fixture
+def fake(tmp_path: Path) -> FakeMediainfo:
+    return FakeMediainfo(tmp_path)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ProbeCache:
+    return ProbeCache(tmp_path / "cache" / "mediainfo.db")
+
+
+@pytest.fixture
+def mediainfo_config(cache_settings: MagicMock, fake: FakeMediainfo) -> Iterator[MediaInfoConfig]:
+    """Probe cache enabled and the fake binary configured."""
+    config = MediaInfoConfig(binary=str(fake.binary))
+    cache_settings.mediainfo = config
+    with patch("shelfr.metadata.mediainfo.batch.get_settings", return_value=cache_settings):
+        yield config
+
+
+def _files(folder: Path, count: int, prefix: str = "part") -> list[Path]:
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(1, count + 1):
+        path = folder / f"{prefix}{i}.mp3"
+        path.write_bytes(bytes([i]) * (100 + i))
+        paths.append(path)
+    return paths
+
+
+class TestProbeMany:
+    """Tests for probe_many()."""
+
+    def test_one_call_per_chunk(
+        self, fake: FakeMediainfo, cache: ProbeCache, tmp_path: Path
+    ) -> None:
+        paths = _files(tmp_path / "book", 5)
+
+        results = probe_many(paths, chunk_size=2, binary=str(fake.binary), cache=cache)
+
+        assert list(results) == paths
+        assert all(
+            data is not None and data["media"]["track"][0]["Title"] == path.name
+            for path, data in results.items()
+        )
+        assert sorted(len(call) for call in fake.calls) == [1, 2, 2]
+
+    def test_results_are_cached(
+        self, fake: FakeMediainfo, cache: ProbeCache, tmp_path: Path
+    ) -> None:
+        paths = _files(tmp_path / "book", 3)
+        probe_many(paths, binary=str(fake.binary), cache=cache)
+
+        again = probe_many(paths, binary=str(fake.binary), cache=cache)
+
+        assert len(fake.calls) == 1
+        assert all(data is not None for data in again.values())
+
+    def test_hardlinks_probed_once(
+        self, fake: FakeMediainfo, cache: ProbeCache, tmp_path: Path
+    ) -> None:
+        (seed,) = _files(tmp_path / "seed", 1)
+        link = tmp_path / "library.mp3"
+        os.link(seed, link)
+
+        results = probe_many([seed, link], binary=str(fake.binary), cache=cache)
+
+        assert fake.calls == [[str(seed)]]
+        assert results[link] == results[seed]
+
+    def test_failed_chunk_retried_singly(
+        self, fake: FakeMediainfo, cache: ProbeCache, tmp_path: Path
+    ) -> None:
+        paths = [*_files(tmp_path / "book", 2), *_files(tmp_path / "book", 1, prefix="bad")]
+
+        results = probe_many(paths, binary=str(fake.binary), cache=cache)
+
+        assert results[paths[2]] is None
+        assert results[paths[0]] is not None
+        assert results[paths[1]] is not None
+        assert len(fake.calls) == 4  # the chunk, then each file
+
+    def test_missing_file_not_probed(
+        self, fake: FakeMediainfo, cache: ProbeCache, tmp_path: Path
+    ) -> None:
+        missing = tmp_path / "missing.mp3"
+
+        assert probe_many([missing], binary=str(fake.binary), cache=cache) == {missing: None}
+        assert fake.calls == []
+
+    def test_rejects_bad_chunk_size(self, cache: ProbeCache) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            probe_many([], chunk_size=0, cache=cache)
+
+    def test_split_output_by_position(self, tmp_path: Path) -> None:
+        chunk = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+        stdout = json.dumps(
+            [{"media": {"@ref": "/other/a.mp3"}}, {"media": {"@ref": "/other/b.mp3"}}]
+        )
+
+        results = _split_output(stdout, chunk)
+
+        assert results[chunk[1]] == {"media": {"@ref": "/other/b.mp3"}}
+
+
+class TestCallSites:
+    """ASIN resolution and trump checks batch their probes."""
+
+    def test_asin_resolution_batches_multi_file_books(
+        self, fake: FakeMediainfo, mediainfo_config: MediaInfoConfig, tmp_path: Path
+    ) -> None:
+        from shelfr.abs.asin import resolve_asin_from_folder_with_mediainfo
+
+        folder = tmp_path / "Some Book"
+        _files(folder, 6)
+
+        with patch("shelfr.abs.asin._get_mediainfo_binary", return_value=str(fake.binary)):
+            result = resolve_asin_from_folder_with_mediainfo(folder)
+
+        assert result.asin == "B0BATCH003"
+        assert result.source == "mediainfo"
+        assert len(fake.calls) == 1
+
+    def test_trump_prefetch_batches_folders(
+        self, fake: FakeMediainfo, mediainfo_config: MediaInfoConfig, tmp_path: Path
+    ) -> None:
+        from shelfr.abs.trumping import extract_trumpable_meta, prefetch_trumpable_meta
+
+        folders = []
+        for i in range(6):
+            folder = tmp_path / f"Book {i}"
+            _files(folder, 1)
+            folders.append(folder)
+
+        with patch("shelfr.abs.trumping._get_mediainfo_binary", return_value=str(fake.binary)):
+            assert prefetch_trumpable_meta(folders) == 6
+            metas = [extract_trumpable_meta(folder, "B0BATCH001") for folder in folders]
+
+        assert len(fake.calls) == 1
+        assert all(meta.sample_rate_hz == 44100 for meta in metas)
+
+    def test_trump_prefetch_skips_a_few_folders(
+        self, fake: FakeMediainfo, mediainfo_config: MediaInfoConfig, tmp_path: Path
+    ) -> None:
+        from shelfr.abs.trumping import prefetch_trumpable_meta
+
+        folder = tmp_path / "Book"
+        _files(folder, 1)
+
+        assert prefetch_trumpable_meta([folder]) == 0
+        assert fake.calls == []
@@ -0,0 +1,175 @@
+"""Tests for the persistent MediaInfo probe cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from shelfr.cli import app
+from shelfr.config import MediaInfoConfig
+from shelfr.metadata.mediainfo.cache import (
+    ProbeCache,
+    cached_probe,
+    get_probe_cache,
+    probe_key,
+)
+
+SAMPLE: dict[str, Any] = {"media": {"track": [{"@type": "General", "Format": "MPEG-4"}]}}
+
+
+@pytest.fixture
+def audio_file(tmp_path: Path) -> Path:
+    path = tmp_path / "seed" / "Book.m4b"
+    path.parent.mkdir()
+    path.write_bytes(b"\x00" * 64)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ProbeCache:
+    return ProbeCache(tmp_path / "cache" / "mediainfo.db")
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestProbeCache:
+    """Tests for ProbeCache."""
+
+    def test_round_trip(self, cache: ProbeCache, audio_file: Path) -> None:
+        assert cache.get(audio_file) is None
+
+        assert cache.put(audio_file, SAMPLE)
+
+        assert cache.get(audio_file) == SAMPLE
+
+    def test_hardlink_shares_entry(
+        self, cache: ProbeCache, audio_file: Path, tmp_path: Path
+    ) -> None:
+        library_copy = tmp_path / "library" / "Book.m4b"
+        library_copy.parent.mkdir()
+        os.link(audio_file, library_copy)
+
+        cache.put(audio_file, SAMPLE)
+
+        assert cache.get(library_copy) == SAMPLE
+
+    def test_modified_file_misses(self, cache: ProbeCache, audio_file: Path) -> None:
+        cache.put(audio_file, SAMPLE)
+
+        _touch(audio_file, audio_file.stat().st_mtime_ns + 1_000_000_000)
+
+        assert cache.get(audio_file) is None
+
+    def test_not_stored_if_file_changed_while_probing(
+        self, cache: ProbeCache, audio_file: Path
+    ) -> None:
+        key = probe_key(audio_file)
+        audio_file.write_bytes(b"\x01" * 128)
+
+        assert not cache.put(audio_file, SAMPLE, key)
+        assert cache.get(audio_file) is None
+
+    def test_missing_file(self, cache: ProbeCache, tmp_path: Path) -> None:
+        missing = tmp_path / "missing.m4b"
+
+        assert cache.get(missing) is None
+        assert not cache.put(missing, SAMPLE)
+
+    def test_prune_removes_changed_and_deleted(
+        self, cache: ProbeCache, audio_file: Path, tmp_path: Path
+    ) -> None:
+        other = tmp_path / "other.m4b"
+        other.write_bytes(b"\x02" * 32)
+        kept = tmp_path / "kept.m4b"
+        kept.write_bytes(b"\x03" * 32)
+        for path in (audio_file, other, kept):
+            cache.put(path, SAMPLE)
+        other.unlink()
+        _touch(audio_file, audio_file.stat().st_mtime_ns + 1_000_000_000)
+
+        assert cache.prune(dry_run=True) == 2
+        assert cache.stats().entries == 3
+        assert cache.prune() == 2
+        assert cache.stats().entries == 1
+        assert cache.get(kept) == SAMPLE
+
+    def test_clear(self, cache: ProbeCache, audio_file: Path) -> None:
+        cache.put(audio_file, SAMPLE)
+
+        assert cache.clear() == 1
+        assert cache.get(audio_file) is None
+
+    def test_stats_without_database(self, cache: ProbeCache) -> None:
+        assert cache.stats().entries == 0
+        assert not cache.path.exists()
+
+
+class TestCachedProbe:
+    """Tests for cached_probe() and get_probe_cache()."""
+
+    def test_probes_once(self, mediainfo_config: MediaInfoConfig, audio_file: Path) -> None:
+        probe = MagicMock(return_value=SAMPLE)
+
+        assert cached_probe(audio_file, probe) == SAMPLE
+        assert cached_probe(audio_file, probe) == SAMPLE
+
+        probe.assert_called_once()
+
+    def test_failures_not_cached(self, mediainfo_config: MediaInfoConfig, audio_file: Path) -> None:
+        probe = MagicMock(side_effect=[None, SAMPLE])
+
+        assert cached_probe(audio_file, probe) is None
+        assert cached_probe(audio_file, probe) == SAMPLE
+
+    def test_disabled(self, mediainfo_config: MediaInfoConfig, audio_file: Path) -> None:
+        mediainfo_config.cache_enabled = False
+        probe = MagicMock(return_value=SAMPLE)
+
+        cached_probe(audio_file, probe)
+        cached_probe(audio_file, probe)
+
+        assert get_probe_cache() is None
+        assert probe.call_count == 2
+
+    def test_run_mediainfo_uses_cache(
+        self, mediainfo_config: MediaInfoConfig, audio_file: Path
+    ) -> None:
+        from shelfr.metadata.mediainfo import run_mediainfo
+
+        completed = subprocess.CompletedProcess([], 0, stdout=json.dumps(SAMPLE), stderr="")
+        with (
+            patch("shelfr.metadata.mediainfo.extractor.get_settings") as settings,
+            patch(
+                "shelfr.metadata.mediainfo.extractor._run_mediainfo_subprocess",
+                return_value=completed,
+            ) as run,
+        ):
+            settings.return_value.mediainfo = mediainfo_config
+            assert run_mediainfo(audio_file) == SAMPLE
+            assert run_mediainfo(audio_file) == SAMPLE
+
+        run.assert_called_once()
+
+
+class TestCacheCli:
+    """Tests for the MediaInfo side of `shelfr cache`."""
+
+    def test_clear_mediainfo(self, mediainfo_config: MediaInfoConfig, audio_file: Path) -> None:
+        cache = get_probe_cache()
+        assert cache is not None
+        cache.put(audio_file, SAMPLE)
+
+        result = CliRunner().invoke(app, ["cache", "clear", "--endpoint", "mediainfo"])
+
+        assert result.exit_code == 0
+        assert "Removed 1 cache entries" in result.output
+        assert cache.get(audio_file) is None
@@ -20,6 +20,7 @@ from shelfr.metadata import (
     build_mam_json,
     detect_audio_format,
     fetch_audnex_book,
+    fetch_audnex_chapters,
     render_bbcode_description,
     run_mediainfo,
     save_audnex_json,
@@ -50,6 +51,7 @@ class TestFetchAudnexBook:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["us"]
+        mock_settings.audnex.hedge_regions = 1
 
         with (
             patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
@@ -76,6 +78,7 @@ class TestFetchAudnexBook:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["us"]
+        mock_settings.audnex.hedge_regions = 1
 
         with (
             patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
@@ -92,10 +95,11 @@ class TestFetchAudnexBook:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["uk", "us"]  # UK first, US second
+        mock_settings.audnex.hedge_regions = 1
 
         call_count = 0
 
-        def mock_get(url, params=None):
+        def mock_get(url, params=None, **kwargs):
             nonlocal call_count
             call_count += 1
             response = MagicMock()
@@ -135,6 +139,7 @@ class TestFetchAudnexBook:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["us", "uk"]
+        mock_settings.audnex.hedge_regions = 1
 
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -1385,6 +1390,7 @@ class TestFetchAudnexEdgeCases:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["us"]
+        mock_settings.audnex.hedge_regions = 1
 
         with (
             patch("shelfr.metadata.audnex.client.httpx.Client") as mock_client_class,
@@ -1409,6 +1415,7 @@ class TestFetchAudnexEdgeCases:
         mock_settings.audnex.base_url = "https://api.audnex.us"
         mock_settings.audnex.timeout_seconds = 30
         mock_settings.audnex.regions = ["us"]
+        mock_settings.audnex.hedge_regions = 1
 
         with (
             patch("shelfr.metadata.audnex.client.httpx.Client") as mock_client_class,
@@ -1432,6 +1439,121 @@ class TestFetchAudnexEdgeCases:
         assert region is None
 
 
+class TestHedgedRegionProbing:
+    """Tests for hedged region lookups and the remembered winning region."""
+
+    @staticmethod
+    def _regions(answers: dict[str, tuple[float, dict | None]], calls: list[str]):
+        import threading
+        import time
+
+        lock = threading.Lock()
+
+        def try_region(region: str) -> dict | None:
+            with lock:
+                calls.append(region)
+            delay, data = answers[region]
+            time.sleep(delay)
+            return data
+
+        return try_region
+
+    def test_first_hit_by_priority_not_by_speed(self):
+        from shelfr.metadata.audnex.client import _probe_regions_hedged
+
+        calls: list[str] = []
+        try_region = self._regions(
+            {"us": (0.1, {"region": "us"}), "uk": (0.0, {"region": "uk"})}, calls
+        )
+
+        data, region = _probe_regions_hedged(["us", "uk"], try_region, width=2, delay=0)
+
+        assert region == "us"
+        assert data == {"region": "us"}
+        assert calls == ["us", "uk"]
+
+    def test_misses_overlap(self):
+        import time
+
+        from shelfr.metadata.audnex.client import _probe_regions_hedged
+
+        calls: list[str] = []
+        try_region = self._regions(
+            {"us": (0.2, None), "uk": (0.2, None), "jp": (0.2, {"region": "jp"})}, calls
+        )
+
+        start = time.perf_counter()
+        data, region = _probe_regions_hedged(["us", "uk", "jp"], try_region, width=3, delay=0)
+
+        assert region == "jp"
+        assert time.perf_counter() - start < 0.5  # Not 3 x 0.2s in turn
+
+    def test_delay_skips_hedge_on_fast_hit(self):
+        from shelfr.metadata.audnex.client import _probe_regions_hedged
+
+        calls: list[str] = []
+        try_region = self._regions({"us": (0.0, {"region": "us"}), "uk": (0.0, None)}, calls)
+
+        _probe_regions_hedged(["us", "uk"], try_region, width=2, delay=1.0)
+
+        assert calls == ["us"]
+
+    def test_width_limits_requests_in_flight(self):
+        import threading
+        import time
+
+        from shelfr.metadata.audnex.client import _probe_regions_hedged
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        def try_region(region: str) -> dict | None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return None
+
+        result = _probe_regions_hedged(["us", "uk", "au", "ca"], try_region, width=2, delay=0)
+
+        assert result == (None, None)
+        assert peak == 2
+
+    def test_winning_region_used_first_for_chapters(self):
+        mock_settings = MagicMock()
+        mock_settings.audnex.base_url = "https://api.audnex.us"
+        mock_settings.audnex.timeout_seconds = 30
+        mock_settings.audnex.regions = ["us", "uk"]
+        mock_settings.audnex.hedge_regions = 2
+        mock_settings.audnex.hedge_delay_ms = 0
+
+        requested: list[str] = []
+
+        def mock_get(url, params=None, **kwargs):
+            requested.append(params["region"])
+            response = MagicMock()
+            response.status_code = 200 if params["region"] == "uk" else 404
+            response.json.return_value = {"asin": "B0UKONLY01", "chapters": []}
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = mock_get
+
+        with (
+            patch("shelfr.metadata.audnex.client.httpx.Client", return_value=mock_client),
+            patch("shelfr.metadata.audnex.client.get_settings", return_value=mock_settings),
+        ):
+            _, region = fetch_audnex_book("B0UKONLY01")
+            requested.clear()
+            fetch_audnex_chapters("B0UKONLY01")
+
+        assert region == "uk"
+        assert requested == ["uk"]
+
+
 class TestRunMediainfoEdgeCases:
     """Additional tests for run_mediainfo."""
 
@@ -0,0 +1,327 @@
+"""Tests for the in-process MP4/M4B header reader."""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from shelfr.metadata.mediainfo import (
+    _extract_audio_info,
+    _parse_chapters_from_mediainfo,
+    detect_audio_format,
+)
+from shelfr.metadata.mediainfo.mp4 import native_mediainfo, read_mp4_mediainfo
+
+# =============================================================================
+# MP4 builder
+# =============================================================================
+
+
+def box(kind: str, *payload: bytes) -> bytes:
+    body = b"".join(payload)
+    return struct.pack(">I4s", 8 + len(body), kind.encode("latin-1")) + body
+
+
+def full(kind: str, *payload: bytes, version: int = 0) -> bytes:
+    return box(kind, bytes([version, 0, 0, 0]), *payload)
+
+
+def bits(*fields: tuple[int, int]) -> bytes:
+    """Pack (value, width) fields MSB first, zero-padded to a byte."""
+    value = width = 0
+    for field_value, field_width in fields:
+        value = (value << field_width) | field_value
+        width += field_width
+    pad = -width % 8
+    return (value << pad).to_bytes((width + pad) // 8, "big")
+
+
+def descriptor(tag: int, payload: bytes) -> bytes:
+    return bytes([tag, len(payload)]) + payload
+
+
+def esds(asc: bytes, avg_bitrate: int = 0, max_bitrate: int = 0) -> bytes:
+    dec_config = (
+        bytes([0x40, 0x15, 0, 0, 0])
+        + struct.pack(">II", max_bitrate, avg_bitrate)
+        + descriptor(0x05, asc)
+    )
+    es = struct.pack(">HB", 1, 0) + descriptor(0x04, dec_config)
+    return full("esds", descriptor(0x03, es))
+
+
+def audio_entry(kind: str, child: bytes, channels: int = 2, rate: int = 44100) -> bytes:
+    fields = bytes(6) + struct.pack(">H", 1) + bytes(8)
+    fields += struct.pack(">HHHHI", channels, 16, 0, 0, rate << 16)
+    return box(kind, fields, child)
+
+
+def dec3(joc: bool) -> bytes:
+    # 768 kbps, one independent substream: acmod 7 (L R C Ls Rs) + LFE
+    payload = bits((768, 13), (0, 3), (0, 2), (16, 5), (0, 1), (0, 1), (0, 3), (7, 3), (1, 1),
+                   (0, 3), (0, 4), (0, 1))  # fmt: skip
+    if joc:
+        payload += bits((0, 7), (1, 1), (16, 8))
+    return box("dec3", payload)
+
+
+def trak(
+    track_id: int,
+    handler: str,
+    timescale: int,
+    duration: int,
+    stbl: bytes,
+    tref: bytes = b"",
+    language: str = "eng",
+) -> bytes:
+    packed = sum((ord(c) - 0x60) << shift for c, shift in zip(language, (10, 5, 0), strict=True))
+    tkhd = full("tkhd", struct.pack(">III", 0, 0, track_id), bytes(68))
+    mdhd = full("mdhd", struct.pack(">IIIIHH", 0, 0, timescale, duration, packed, 0))
+    hdlr = full("hdlr", bytes(4), handler.encode(), bytes(12), b"\x00")
+    return box("trak", tkhd, tref, box("mdia", mdhd, hdlr, box("minf", box("stbl", stbl))))
+
+
+def ilst_item(atom: str, value: str) -> bytes:
+    data = box("data", struct.pack(">II", 1, 0), value.encode())
+    return box(atom, data)
+
+
+def freeform(name: str, value: str) -> bytes:
+    return box(
+        "----",
+        full("mean", b"com.apple.iTunes"),
+        full("name", name.encode()),
+        box("data", struct.pack(">II", 1, 0), value.encode()),
+    )
+
+
+def build_m4b(
+    path: Path,
+    sample_entry: bytes,
+    *,
+    chapters: list[tuple[int, str]] | None = None,
+    chpl: list[tuple[int, str]] | None = None,
+    tags: bytes = b"",
+    seconds: int = 3600,
+    sample_count: int = 100,
+    sample_size: int = 4500,
+) -> Path:
+    """Write ftyp, mdat (chapter text samples), moov. Chapter starts are in ms."""
+    ftyp = box("ftyp", b"M4B ", struct.pack(">I", 0), b"M4B mp42isom")
+    samples = [struct.pack(">H", len(t.encode())) + t.encode() for _, t in chapters or []]
+    mdat = box("mdat", *samples, bytes(sample_size * sample_count))
+    mdat_payload = len(ftyp) + 8
+
+    audio_stbl = (
+        full("stsd", struct.pack(">I", 1), sample_entry)
+        + full("stts", struct.pack(">III", 1, sample_count, 1024))
+        + full("stsz", struct.pack(">II", sample_size, sample_count))
+    )
+    traks = b""
+    tref = b""
+    if chapters:
+        starts = [start for start, _ in chapters]
+        deltas = [b - a for a, b in zip(starts, [*starts[1:], seconds * 1000], strict=True)]
+        stts = b"".join(struct.pack(">II", 1, d) for d in deltas)
+        stsz = b"".join(struct.pack(">I", len(s)) for s in samples)
+        text_stbl = (
+            full("stsd", struct.pack(">I", 1), box("text", bytes(8)))
+            + full("stts", struct.pack(">I", len(deltas)), stts)
+            + full("stsc", struct.pack(">IIII", 1, 1, len(samples), 1))
+            + full("stsz", struct.pack(">II", 0, len(samples)), stsz)
+            + full("stco", struct.pack(">II", 1, mdat_payload))
+        )
+        traks += trak(2, "text", 1000, seconds * 1000, text_stbl)
+        tref = box("tref", box("chap", struct.pack(">I", 2)))
+
+    udta_children = b""
+    if chpl:
+        entries = b"".join(
+            struct.pack(">QB", start * 10_000, len(t.encode())) + t.encode() for start, t in chpl
+        )
+        udta_children += full("chpl", bytes(4), bytes([len(chpl)]), entries, version=1)
+    if tags:
+        udta_children += full(
+            "meta", full("hdlr", bytes(4), b"mdirappl", bytes(9)), box("ilst", tags)
+        )
+
+    mvhd = full("mvhd", struct.pack(">IIII", 0, 0, 1000, seconds * 1000), bytes(80))
+    audio_trak = trak(1, "soun", 44100, 44100 * seconds, audio_stbl, tref)
+    moov = box(
+        "moov", mvhd, audio_trak, traks, box("udta", udta_children) if udta_children else b""
+    )
+    path.write_bytes(ftyp + mdat + moov)
+    return path
+
+
+AAC_LC = audio_entry("mp4a", esds(bits((2, 5), (4, 4), (2, 4)), 64000, 64000))
+
+
+def _track(data: dict, kind: str) -> dict:
+    return next(t for t in data["media"]["track"] if t["@type"] == kind)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestReadMp4Mediainfo:
+    """Tests for read_mp4_mediainfo()."""
+
+    def test_aac_lc(self, tmp_path: Path) -> None:
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "book.m4b", AAC_LC))
+
+        assert data is not None
+        general = _track(data, "General")
+        audio = _track(data, "Audio")
+        assert general["FileExtension"] == "m4b"
+        assert general["Duration"] == "3600.000"
+        assert audio["Format"] == "AAC"
+        assert audio["Format_AdditionalFeatures"] == "LC"
+        assert audio["CodecID"] == "mp4a-40-2"
+        assert audio["Channels"] == "2"
+        assert audio["SamplingRate"] == "44100"
+        assert audio["BitRate_Mode"] == "CBR"
+        assert audio["BitRate"] == "1000"  # 450,000 bytes over an hour
+        assert audio["Language"] == "en"
+
+    def test_dolby_atmos(self, tmp_path: Path) -> None:
+        entry = audio_entry("ec-3", dec3(joc=True), channels=2, rate=48000)
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "atmos.m4b", entry))
+
+        assert data is not None
+        audio = _track(data, "Audio")
+        assert audio["Format"] == "E-AC-3"
+        assert audio["CodecID"] == "ec-3"
+        assert audio["Format_AdditionalFeatures"] == "JOC"
+        assert audio["Channels"] == "6"
+        assert audio["ChannelLayout"] == "L R C LFE Ls Rs"
+        assert audio["BitRate"] == "768000"
+
+        fmt = detect_audio_format(data)
+        assert fmt is not None
+        assert fmt.is_dolby_atmos
+        assert fmt.channels == 6
+
+    def test_plain_eac3_is_not_atmos(self, tmp_path: Path) -> None:
+        entry = audio_entry("ec-3", dec3(joc=False), rate=48000)
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "ddp.m4b", entry))
+
+        fmt = detect_audio_format(data)
+        assert fmt is not None
+        assert not fmt.is_dolby_atmos
+
+    def test_xhe_aac(self, tmp_path: Path) -> None:
+        entry = audio_entry("mp4a", esds(bits((31, 5), (10, 6), (0, 5))))
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "usac.m4b", entry))
+
+        assert data is not None
+        assert _track(data, "Audio")["CodecID"] == "mp4a-40-42"
+        fmt = detect_audio_format(data)
+        assert fmt is not None
+        assert fmt.is_xhe_aac
+
+    def test_chapter_track(self, tmp_path: Path) -> None:
+        path = build_m4b(
+            tmp_path / "book.m4b",
+            AAC_LC,
+            chapters=[(0, "Opening Credits"), (95_500, "Chapter 1"), (3_723_000, "Chapter 2")],
+            seconds=7200,
+        )
+
+        data = read_mp4_mediainfo(path)
+
+        assert data is not None
+        assert _track(data, "General")["MenuCount"] == "1"
+        assert _track(data, "Menu")["extra"] == {
+            "_00_00_00_000": "Opening Credits",
+            "_00_01_35_500": "Chapter 1",
+            "_01_02_03_000": "Chapter 2",
+        }
+        chapters = _parse_chapters_from_mediainfo(data)
+        assert [c.title for c in chapters] == ["Opening Credits", "Chapter 1", "Chapter 2"]
+
+    def test_nero_chapters(self, tmp_path: Path) -> None:
+        path = build_m4b(tmp_path / "book.m4b", AAC_LC, chpl=[(0, "Intro"), (60_000, "One")])
+
+        data = read_mp4_mediainfo(path)
+
+        assert data is not None
+        assert _track(data, "Menu")["extra"] == {"_00_00_00_000": "Intro", "_00_01_00_000": "One"}
+
+    def test_tags(self, tmp_path: Path) -> None:
+        tags = (
+            ilst_item("©nam", "The Book")
+            + ilst_item("©ART", "Jane Author")
+            + ilst_item("CDEK", "B0CDEK0001")
+            + freeform("ASIN", "B0FREE0001")
+        )
+
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "book.m4b", AAC_LC, tags=tags))
+
+        assert data is not None
+        general = _track(data, "General")
+        assert general["Title"] == "The Book"
+        assert general["Performer"] == "Jane Author"
+        assert general["extra"] == {"CDEK": "B0CDEK0001", "ASIN": "B0FREE0001"}
+
+    def test_audio_info_for_bbcode(self, tmp_path: Path) -> None:
+        data = read_mp4_mediainfo(build_m4b(tmp_path / "book.m4b", AAC_LC, seconds=22290))
+
+        assert data is not None
+        info = _extract_audio_info(data)
+        assert info["container"] == "M4B"
+        assert info["codec"] == "AAC LC (CBR ~0 kb/s)"
+        assert info["sample_rate"] == "44.1 kHz"
+        assert info["duration_human"] == "6h 11m"
+
+    @pytest.mark.parametrize("content", [b"", b"ID3\x03" + bytes(64), b"\x00\x00\x00\x10ftypM4B "])
+    def test_not_mp4_or_truncated(self, tmp_path: Path, content: bytes) -> None:
+        path = tmp_path / "bad.m4b"
+        path.write_bytes(content)
+
+        assert read_mp4_mediainfo(path) is None
+
+
+class TestNativeMediainfo:
+    """Tests for native_mediainfo() and its call sites."""
+
+    def test_other_containers_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "book.mp3"
+        path.write_bytes(b"ID3")
+
+        assert native_mediainfo(path) is None
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        path = build_m4b(tmp_path / "book.m4b", AAC_LC)
+        with patch("shelfr.metadata.mediainfo.mp4.get_settings") as settings:
+            settings.return_value.mediainfo.native_mp4 = False
+            assert native_mediainfo(path) is None
+
+    def test_asin_without_subprocess(self, tmp_path: Path) -> None:
+        from shelfr.abs.asin import extract_asin_from_mediainfo
+
+        path = build_m4b(tmp_path / "book.m4b", AAC_LC, tags=ilst_item("CDEK", "B0CDEK0001"))
+        with patch("shelfr.abs.asin.subprocess.run") as run:
+            assert extract_asin_from_mediainfo(path) == "B0CDEK0001"
+        run.assert_not_called()
+
+    def test_trumpable_meta_without_subprocess(self, tmp_path: Path) -> None:
+        from shelfr.abs.trumping import extract_trumpable_meta
+
+        folder = tmp_path / "Book {ASIN.B0CDEK0001}"
+        folder.mkdir()
+        build_m4b(folder / "book.m4b", AAC_LC, chpl=[(0, "Intro")])
+        with patch("shelfr.abs.trumping.subprocess.run") as run:
+            meta = extract_trumpable_meta(folder, "B0CDEK0001")
+        run.assert_not_called()
+
+        assert meta.sample_rate_hz == 44100
+        assert meta.duration_sec == 3600
+        assert meta.has_chapters
+        assert meta.is_stereo
+        assert meta.language == "en"
@@ -0,0 +1,141 @@
+"""Tests for the bounded multi-stage thread pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from shelfr.utils.pipeline import Stage, StagePipeline
+
+
+class TestStage:
+    """Tests for Stage validation."""
+
+    def test_rejects_zero_workers(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            Stage("hash", lambda item: True, workers=0)
+
+    def test_rejects_zero_queue_size(self) -> None:
+        with pytest.raises(ValueError, match="queue_size"):
+            Stage("hash", lambda item: True, queue_size=0)
+
+
+class TestStagePipeline:
+    """Tests for StagePipeline.run."""
+
+    def test_runs_every_stage_in_order(self) -> None:
+        log: list[tuple[str, int]] = []
+        lock = threading.Lock()
+
+        def record(name: str) -> Stage[int]:
+            def func(item: int) -> bool:
+                with lock:
+                    log.append((name, item))
+                return True
+
+            return Stage(name, func)
+
+        pipeline = StagePipeline([record("a"), record("b"), record("c")])
+
+        assert pipeline.run(range(5)) == [0, 1, 2, 3, 4]
+        for item in range(5):
+            assert [name for name, i in log if i == item] == ["a", "b", "c"]
+
+    def test_results_keep_input_order_with_parallel_workers(self) -> None:
+        def slow_for_low(item: int) -> bool:
+            time.sleep(0.02 if item < 3 else 0)
+            return True
+
+        pipeline = StagePipeline([Stage("work", slow_for_low, workers=4, queue_size=8)])
+
+        assert pipeline.run(range(8)) == list(range(8))
+
+    def test_stages_overlap_across_items(self) -> None:
+        """Item 2 enters the first stage while item 1 is still in the second."""
+        second_started = threading.Event()
+        overlapped = threading.Event()
+
+        def first(item: int) -> bool:
+            # Item 1 holds the second stage until item 2 gets here
+            if item == 2 and second_started.wait(timeout=2):
+                overlapped.set()
+            return True
+
+        def second(item: int) -> bool:
+            if item == 1:
+                second_started.set()
+                overlapped.wait(timeout=2)
+            return True
+
+        StagePipeline([Stage("first", first), Stage("second", second)]).run([1, 2])
+
+        assert overlapped.is_set()
+
+    def test_false_stops_item_early(self) -> None:
+        reached_last: list[int] = []
+
+        pipeline = StagePipeline(
+            [
+                Stage("filter", lambda item: item % 2 == 0),
+                Stage("last", lambda item: reached_last.append(item) is None),
+            ]
+        )
+
+        assert pipeline.run(range(4)) == [0, 1, 2, 3]
+        assert reached_last == [0, 2]
+
+    def test_bounded_queue_applies_backpressure(self) -> None:
+        fed = 0
+        release = threading.Event()
+
+        def items() -> Iterator[int]:
+            nonlocal fed
+            for i in range(20):
+                fed += 1
+                yield i
+
+        def blocked(item: int) -> bool:
+            release.wait(timeout=2)
+            return True
+
+        pipeline = StagePipeline([Stage("blocked", blocked, queue_size=2)])
+        runner = threading.Thread(target=pipeline.run, args=(items(),))
+        runner.start()
+        time.sleep(0.1)
+        # One item in the worker, two queued, one waiting on a full queue
+        assert fed <= 4
+        release.set()
+        runner.join(timeout=5)
+        assert fed == 20
+
+    def test_stage_exception_is_reraised(self) -> None:
+        def boom(item: int) -> bool:
+            if item == 1:
+                raise RuntimeError("stage failed")
+            return True
+
+        pipeline = StagePipeline([Stage("boom", boom), Stage("after", lambda item: True)])
+
+        with pytest.raises(RuntimeError, match="stage failed"):
+            pipeline.run(range(10))
+
+    def test_input_exception_stops_pipeline(self) -> None:
+        def items() -> Iterator[int]:
+            yield 1
+            raise OSError("walk failed")
+
+        pipeline = StagePipeline([Stage("work", lambda item: True)])
+
+        with pytest.raises(OSError, match="walk failed"):
+            pipeline.run(items())
+
+    def test_empty_input(self) -> None:
+        pipeline = StagePipeline([Stage("a", lambda item: True, workers=3)])
+        assert pipeline.run([]) == []
+
+    def test_requires_a_stage(self) -> None:
+        with pytest.raises(ValueError):
+            StagePipeline([])
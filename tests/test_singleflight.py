@@ -0,0 +1,68 @@
+"""Tests for single-flight call deduplication."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shelfr.utils.singleflight import SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight[int], count: int, fn: object) -> list[object]:
+    """Call flight.do("key", fn) from `count` threads while fn blocks."""
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(flight.do, "key", fn) for _ in range(count)]  # type: ignore[arg-type]
+        return [f.exception() or f.result() for f in futures]
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_run(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def work() -> int:
+            nonlocal calls
+            calls += 1
+            release.wait(timeout=5)
+            return 42
+
+        threading.Timer(0.2, release.set).start()
+        results = _run_concurrently(flight, 8, work)
+
+        assert results == [42] * 8
+        assert calls == 1
+        assert flight.in_flight() == 0
+
+    def test_exception_shared_then_forgotten(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+
+        def fail() -> int:
+            release.wait(timeout=5)
+            raise RuntimeError("boom")
+
+        threading.Timer(0.2, release.set).start()
+        results = _run_concurrently(flight, 4, fail)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.do("key", lambda: 7) == 7
+
+    def test_sequential_calls_run_again(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+
+    def test_leader_exception_raised(self) -> None:
+        flight: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError, match="bad"):
+            flight.do("key", fail)
@@ -0,0 +1,55 @@
+"""Tests for the shared SQLite cache plumbing."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from shelfr.config import AudiobookshelfConfig
+from shelfr.exceptions import ConfigurationError
+from shelfr.utils.sqlite_cache import SharedCache, SqliteCache
+
+
+class Notes(SqliteCache):
+    schema = ("CREATE TABLE IF NOT EXISTS notes (text TEXT NOT NULL)",)
+
+    def add(self, text: str) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT INTO notes (text) VALUES (?)", (text,))
+
+
+def test_creates_database_with_schema(tmp_path: Path) -> None:
+    notes = Notes(tmp_path / "cache" / "notes.db")
+    assert notes.size_bytes() == 0
+
+    notes.add("hello")
+
+    assert notes.path.exists()
+    assert notes.size_bytes() > 0
+
+
+def test_shared_cache_follows_config(tmp_path: Path, abs_config: AudiobookshelfConfig) -> None:
+    paths = iter([tmp_path / "a.db", tmp_path / "a.db", tmp_path / "b.db"])
+    shared = SharedCache("audiobookshelf", "snapshot_enabled", lambda: Notes(next(paths)))
+
+    first = shared.get()
+    assert first is not None
+    assert shared.get() is first
+    # Rebuilt when the path changes
+    third = shared.get()
+    assert third is not None
+    assert third.path == tmp_path / "b.db"
+
+    abs_config.snapshot_enabled = False
+    assert shared.get() is None
+
+
+def test_shared_cache_without_settings(tmp_path: Path) -> None:
+    opener = MagicMock()
+    shared = SharedCache("audiobookshelf", "snapshot_enabled", opener)
+
+    with patch(
+        "shelfr.utils.sqlite_cache.get_settings", side_effect=ConfigurationError("no config")
+    ):
+        assert shared.get() is None
+    opener.assert_not_called()
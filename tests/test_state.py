@@ -9,13 +9,17 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import shelfr.utils.state as state_module
 from shelfr.models import AudiobookRelease, ReleaseStatus
 from shelfr.utils.state import (
     ALLOWED_TRANSITIONS,
     InvalidStatusTransitionError,
+    _journal_path,
     checkpoint_stage,
     clear_failed,
+    compact_state,
     find_stale_entries,
+    flush_state,
     get_checkpoint,
     get_failed_identifiers,
     get_infohash,
@@ -27,8 +31,11 @@ from shelfr.utils.state import (
     mark_failed,
     mark_processed,
     prune_stale_entries,
+    read_state,
     save_state,
     should_skip_stage,
+    state_batch,
+    update_state,
     validate_status_transition,
 )
 
@@ -1523,3 +1530,258 @@ class TestSchemaMigration:
             assert "first_failed_at" in state["failed"][key]
             assert "error_type" in state["failed"][key]
             assert "author" in state["failed"][key]
+
+
+# =============================================================================
+# Mutation Journal Tests
+# =============================================================================
+
+
+class TestStateJournal:
+    """Tests for the JSONL mutation journal on the JSON backend."""
+
+    def test_update_appends_instead_of_rewriting(self, mock_settings, temp_state_file):
+        """Test that mutations go to the journal and leave the snapshot untouched."""
+        snapshot_before = temp_state_file.read_text()
+        release = AudiobookRelease(asin="B09JOURNAL1", title="Journal Book")
+
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            mark_processed(release)
+            checkpoint_stage(release, "metadata")
+            assert is_processed("B09JOURNAL1") is True
+            assert get_checkpoint("B09JOURNAL1", "metadata") is not None
+
+        assert temp_state_file.read_text() == snapshot_before
+        journal_lines = _journal_path(temp_state_file).read_text().splitlines()
+        # Header plus one record per mutation
+        assert len(journal_lines) == 3
+        assert json.loads(journal_lines[1])["identifier"] == "B09JOURNAL1"
+
+    def test_noop_update_writes_nothing(self, mock_settings, temp_state_file):
+        """Test that an update that changes nothing does not start a journal."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            assert clear_failed("B09MISSING") is False
+
+        assert not _journal_path(temp_state_file).exists()
+
+    def test_compacts_after_threshold(self, mock_settings, temp_state_file):
+        """Test that the snapshot is rewritten every JOURNAL_COMPACT_EVERY records."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            patch("shelfr.utils.state.JOURNAL_COMPACT_EVERY", 3),
+        ):
+            for i in range(3):
+                mark_processed(AudiobookRelease(asin=f"B09COMPACT{i}", title="Book"))
+
+        assert not _journal_path(temp_state_file).exists()
+        saved = json.loads(temp_state_file.read_text())
+        assert set(saved["processed"]) == {"B09COMPACT0", "B09COMPACT1", "B09COMPACT2"}
+
+    def test_compact_state(self, mock_settings, temp_state_file):
+        """Test that compact_state folds the journal into the snapshot."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            mark_failed(AudiobookRelease(asin="B09FOLD123", title="Book"), "err")
+            compact_state()
+
+        assert not _journal_path(temp_state_file).exists()
+        saved = json.loads(temp_state_file.read_text())
+        assert "B09FOLD123" in saved["failed"]
+
+    def test_replays_deletes(self, mock_settings, temp_state_file):
+        """Test that journaled deletions are replayed."""
+        temp_state_file.write_text(
+            json.dumps({"version": 2, "processed": {}, "failed": {"B09GONE123": {"error": "x"}}})
+        )
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            assert clear_failed("B09GONE123") is True
+            assert is_failed("B09GONE123") is False
+
+    def test_torn_record_is_ignored(self, mock_settings, temp_state_file):
+        """Test that a partial trailing record from a crash is dropped on replay."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            mark_processed(AudiobookRelease(asin="B09WHOLE12", title="Book"))
+            with open(_journal_path(temp_state_file), "a") as f:
+                f.write('{"bucket": "processed", "identifier": "B09TORN')
+
+            assert get_processed_identifiers() == {"B09WHOLE12"}
+
+    def test_stale_journal_is_ignored(self, mock_settings, temp_state_file):
+        """Test that a journal is discarded once the snapshot is replaced."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            mark_processed(AudiobookRelease(asin="B09STALE12", title="Book"))
+
+            # Snapshot replaced behind the journal's back (e.g. hand edit)
+            temp_state_file.write_text(
+                json.dumps({"version": 2, "processed": {"B09EDITED1": {}}, "failed": {}})
+            )
+
+            assert get_processed_identifiers() == {"B09EDITED1"}
+
+
+class TestStateBatch:
+    """Tests for state_batch() and flush_state()."""
+
+    def test_single_journal_write_per_flush(self, mock_settings, temp_state_file):
+        """Test that a batch journals all its mutations once on exit."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            patch("shelfr.utils.state._append_journal", wraps=state_module._append_journal) as app,
+        ):
+            with state_batch():
+                for i in range(5):
+                    mark_processed(AudiobookRelease(asin=f"B09BATCH0{i}", title="Book"))
+                assert app.call_count == 0
+
+            assert app.call_count == 1
+            assert len(get_processed_identifiers()) == 5
+
+    def test_reads_see_batched_writes(self, mock_settings, temp_state_file):
+        """Test that lookups inside a batch see unflushed mutations."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            state_batch(),
+        ):
+            release = AudiobookRelease(asin="B09BATCHRD", title="Book")
+            release.status = ReleaseStatus.STAGED
+            checkpoint_stage(release, "staged")
+
+            assert get_checkpoint("B09BATCHRD", "staged") is not None
+            assert not _journal_path(temp_state_file).exists()
+
+    def test_load_state_returns_copy(self, mock_settings, temp_state_file):
+        """Test that mutating load_state() output doesn't leak into the batch."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            state_batch(),
+        ):
+            load_state()["processed"]["B09LEAKED1"] = {}
+            assert is_processed("B09LEAKED1") is False
+
+    def test_flush_state_persists(self, mock_settings, temp_state_file):
+        """Test that flush_state() writes pending mutations mid-batch."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            state_batch(),
+        ):
+            mark_failed(AudiobookRelease(asin="B09FLUSH12", title="Book"), "err")
+            flush_state()
+
+            journal = _journal_path(temp_state_file).read_text()
+            assert "B09FLUSH12" in journal
+
+    def test_flush_state_outside_batch_is_noop(self, mock_settings, temp_state_file):
+        """Test that flush_state() without a batch does nothing."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            flush_state()
+
+        assert not _journal_path(temp_state_file).exists()
+
+    def test_failed_update_rolls_back(self, mock_settings, temp_state_file):
+        """Test that an update raising inside a batch leaves the state untouched."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            with state_batch():
+                mark_processed(AudiobookRelease(asin="B09ROLLBK1", title="Book"))
+
+                def _explode(state: dict) -> None:
+                    del state["processed"]["B09ROLLBK1"]
+                    raise RuntimeError("boom")
+
+                with pytest.raises(RuntimeError):
+                    update_state(_explode, keys=["B09ROLLBK1"])
+                assert is_processed("B09ROLLBK1") is True
+
+            assert is_processed("B09ROLLBK1") is True
+
+    def test_flushes_on_exception(self, mock_settings, temp_state_file):
+        """Test that mutations made before an error in the body are persisted."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            with pytest.raises(RuntimeError), state_batch():
+                mark_processed(AudiobookRelease(asin="B09CRASH12", title="Book"))
+                raise RuntimeError("boom")
+
+            assert is_processed("B09CRASH12") is True
+
+    def test_nested_batch_joins_outer(self, mock_settings, temp_state_file):
+        """Test that a nested state_batch() reuses the outer session."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            state_batch() as outer,
+            state_batch() as inner,
+        ):
+            assert inner is outer
+
+
+class TestStateReadCache:
+    """Tests for the mtime-validated read cache."""
+
+    def test_repeated_lookups_parse_once(self, mock_settings, temp_state_file):
+        """Test that lookups reuse the parsed state while the file is unchanged."""
+        temp_state_file.write_text(
+            json.dumps({"version": 2, "processed": {"B09CACHE01": {}}, "failed": {}})
+        )
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            patch(
+                "shelfr.utils.state._load_state_unsafe", wraps=state_module._load_state_unsafe
+            ) as load,
+        ):
+            assert is_processed("B09CACHE01") is True
+            assert is_failed("B09CACHE01") is False
+            assert get_checkpoint("B09CACHE01", "staged") is None
+            assert get_stats() == {"processed": 1, "failed": 0}
+
+        assert load.call_count == 1
+
+    def test_writes_refresh_cache(self, mock_settings, temp_state_file):
+        """Test that update_state() writes are visible without re-parsing."""
+        with (
+            patch("shelfr.utils.state.get_settings", return_value=mock_settings),
+            patch(
+                "shelfr.utils.state._load_state_unsafe", wraps=state_module._load_state_unsafe
+            ) as load,
+        ):
+            assert is_processed("B09CACHE02") is False
+            mark_processed(AudiobookRelease(asin="B09CACHE02", title="Book"))
+            assert is_processed("B09CACHE02") is True
+
+        assert load.call_count == 1
+
+    def test_external_change_invalidates(self, mock_settings, temp_state_file):
+        """Test that a file replaced by another process is re-read."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            assert is_processed("B09CACHE03") is False
+
+            other = temp_state_file.with_suffix(".other")
+            other.write_text(
+                json.dumps({"version": 2, "processed": {"B09CACHE03": {}}, "failed": {}})
+            )
+            other.replace(temp_state_file)
+
+            assert is_processed("B09CACHE03") is True
+
+    def test_load_state_returns_copy(self, mock_settings, temp_state_file):
+        """Test that mutating load_state() output doesn't corrupt the cache."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            load_state()["processed"]["B09CACHE04"] = {}
+            assert is_processed("B09CACHE04") is False
+
+    def test_read_state_shares_cache(self, mock_settings, temp_state_file):
+        """Test that read_state() reuses the cached state and sees writes."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            assert "B09CACHE05" not in read_state()["processed"]
+            mark_processed(AudiobookRelease(asin="B09CACHE05", title="Book"))
+            with patch(
+                "shelfr.utils.state._load_state_unsafe", wraps=state_module._load_state_unsafe
+            ) as load:
+                first = read_state()
+                assert "B09CACHE05" in first["processed"]
+                assert read_state()["processed"] is first["processed"]
+
+        assert load.call_count == 0
+
+    def test_read_state_is_read_only(self, mock_settings, temp_state_file):
+        """Test that the read_state() view can't be reassigned."""
+        with patch("shelfr.utils.state.get_settings", return_value=mock_settings):
+            view = read_state()
+            with pytest.raises(TypeError):
+                view["processed"] = {}  # type: ignore[index]
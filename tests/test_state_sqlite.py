@@ -0,0 +1,215 @@
+"""Tests for the SQLite (WAL) state backend."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shelfr.models import AudiobookRelease, ReleaseStatus
+from shelfr.utils.state import (
+    JsonStateStore,
+    checkpoint_stage,
+    clear_failed,
+    get_checkpoint,
+    get_infohash,
+    get_processed_identifiers,
+    get_state_store,
+    get_stats,
+    is_failed,
+    is_processed,
+    load_state,
+    mark_failed,
+    mark_processed,
+    state_batch,
+    update_state,
+)
+from shelfr.utils.state_sqlite import SqliteStateStore
+
+
+@pytest.fixture
+def db_file(tmp_path: Path) -> Path:
+    return tmp_path / "processed.db"
+
+
+@pytest.fixture
+def sqlite_settings(db_file: Path):
+    """Patch settings so the state file points at a SQLite database."""
+    settings = MagicMock()
+    settings.paths.state_file = db_file
+    with patch("shelfr.utils.state.get_settings", return_value=settings):
+        yield settings
+
+
+class TestBackendSelection:
+    """Tests for choosing the store by state file suffix."""
+
+    @pytest.mark.parametrize("name", ["state.db", "state.sqlite", "state.SQLITE3"])
+    def test_sqlite_suffixes(self, tmp_path: Path, name: str) -> None:
+        settings = MagicMock()
+        settings.paths.state_file = tmp_path / name
+        with patch("shelfr.utils.state.get_settings", return_value=settings):
+            assert isinstance(get_state_store(), SqliteStateStore)
+
+    def test_json_default(self, tmp_path: Path) -> None:
+        settings = MagicMock()
+        settings.paths.state_file = tmp_path / "processed.json"
+        with patch("shelfr.utils.state.get_settings", return_value=settings):
+            assert isinstance(get_state_store(), JsonStateStore)
+
+
+class TestSqliteStore:
+    """Tests for the public state API on the SQLite backend."""
+
+    def test_empty_state(self, sqlite_settings) -> None:
+        state = load_state()
+        assert state["version"] == 2
+        assert state["processed"] == {}
+        assert state["failed"] == {}
+
+    def test_uses_wal(self, sqlite_settings, db_file: Path) -> None:
+        load_state()
+        conn = sqlite3.connect(db_file)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_mark_processed_and_lookup(self, sqlite_settings) -> None:
+        release = AudiobookRelease(asin="B0SQLITE01", title="Book", author="Author")
+        mark_processed(release, infohash="abc123")
+
+        assert is_processed("B0SQLITE01") is True
+        assert get_infohash("B0SQLITE01") == "abc123"
+        assert get_processed_identifiers() == {"B0SQLITE01"}
+        assert get_state_store().find_by_infohash("abc123") == "B0SQLITE01"
+
+    def test_mark_failed_then_processed(self, sqlite_settings) -> None:
+        release = AudiobookRelease(asin="B0SQLITE02", title="Book")
+        mark_failed(release, "boom")
+        mark_failed(release, "boom again")
+
+        state = load_state()
+        assert state["failed"]["B0SQLITE02"]["retry_count"] == 2
+        assert is_failed("B0SQLITE02") is True
+
+        mark_processed(release)
+        assert is_failed("B0SQLITE02") is False
+        assert get_stats() == {"processed": 1, "failed": 0}
+
+    def test_checkpoint_stage(self, sqlite_settings) -> None:
+        release = AudiobookRelease(asin="B0SQLITE03", title="Book")
+        release.status = ReleaseStatus.STAGED
+        checkpoint_stage(release, "staged")
+
+        assert get_checkpoint("B0SQLITE03", "staged") is not None
+        assert get_checkpoint("B0SQLITE03", "torrent") is None
+        assert get_state_store().identifiers_with_status("STAGED") == {"B0SQLITE03"}
+
+    def test_clear_failed(self, sqlite_settings) -> None:
+        mark_failed(AudiobookRelease(asin="B0SQLITE04", title="Book"), "err")
+        assert clear_failed("B0SQLITE04") is True
+        assert clear_failed("B0SQLITE04") is False
+
+    def test_keyed_update_leaves_other_rows(self, sqlite_settings) -> None:
+        mark_processed(AudiobookRelease(asin="B0KEEP0001", title="Keep"))
+        seen: list[set[str]] = []
+
+        def _touch(state: dict) -> None:
+            seen.append(set(state["processed"]))
+            state["processed"]["B0NEW00001"] = {"title": "New"}
+
+        update_state(_touch, keys=["B0NEW00001"])
+
+        # Only the requested key is loaded, and untouched rows survive the write
+        assert seen == [set()]
+        assert get_processed_identifiers() == {"B0KEEP0001", "B0NEW00001"}
+
+    def test_unkeyed_update_deletes(self, sqlite_settings) -> None:
+        mark_processed(AudiobookRelease(asin="B0DEL00001", title="Gone"))
+
+        def _drop(state: dict) -> None:
+            state["processed"].clear()
+
+        update_state(_drop)
+        assert get_processed_identifiers() == set()
+
+    def test_failed_update_rolls_back(self, sqlite_settings) -> None:
+        mark_processed(AudiobookRelease(asin="B0ROLL0001", title="Book"))
+
+        def _explode(state: dict) -> None:
+            del state["processed"]["B0ROLL0001"]
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            update_state(_explode)
+        assert is_processed("B0ROLL0001") is True
+
+
+class TestSqliteBatch:
+    """Tests for state_batch() on the SQLite backend."""
+
+    def test_commits_on_exit(self, sqlite_settings, db_file: Path) -> None:
+        with state_batch():
+            mark_processed(AudiobookRelease(asin="B0BATCH001", title="Book"))
+            assert is_processed("B0BATCH001") is True
+
+        conn = sqlite3.connect(db_file)
+        try:
+            rows = conn.execute("SELECT identifier FROM entries").fetchall()
+        finally:
+            conn.close()
+        assert rows == [("B0BATCH001",)]
+
+    def test_failed_update_rolls_back_savepoint(self, sqlite_settings) -> None:
+        with state_batch():
+            mark_processed(AudiobookRelease(asin="B0BATCH002", title="Book"))
+
+            def _explode(state: dict) -> None:
+                del state["processed"]["B0BATCH002"]
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError):
+                update_state(_explode, keys=["B0BATCH002"])
+
+        assert is_processed("B0BATCH002") is True
+
+
+class TestJsonMigration:
+    """Tests for the one-shot import of an existing JSON state file."""
+
+    def test_imports_sibling_json(self, sqlite_settings, db_file: Path) -> None:
+        json_file = db_file.with_suffix(".json")
+        json_file.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "processed": {"B0OLDSTATE": {"title": "Old", "status": "COMPLETE"}},
+                    "failed": {"B0OLDFAIL1": {"error": "x", "failed_at": "2024-01-01T00:00:00"}},
+                }
+            )
+        )
+
+        state = load_state()
+
+        assert state["processed"]["B0OLDSTATE"]["checkpoints"] == {}
+        assert state["failed"]["B0OLDFAIL1"]["first_failed_at"] == "2024-01-01T00:00:00"
+        conn = sqlite3.connect(db_file)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        finally:
+            conn.close()
+        assert meta["migrated_from"] == str(json_file)
+
+    def test_migration_runs_once(self, sqlite_settings, db_file: Path) -> None:
+        json_file = db_file.with_suffix(".json")
+        json_file.write_text(json.dumps({"version": 2, "processed": {"B0ONCE0001": {}}}))
+
+        load_state()
+        get_state_store().save({"processed": {}, "failed": {}})
+
+        # The JSON file is still there, but it must not be imported again
+        assert get_processed_identifiers() == set()
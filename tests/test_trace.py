@@ -0,0 +1,131 @@
+"""Tests for run traces and timed spans."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from shelfr.utils.trace import RunTrace, active_trace, percentile, span
+
+
+class TestPercentile:
+    """Tests for percentile()."""
+
+    def test_empty(self) -> None:
+        assert percentile([], 50) == 0.0
+
+    def test_single_value(self) -> None:
+        assert percentile([3.0], 95) == 3.0
+
+    def test_interpolates(self) -> None:
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 50) == pytest.approx(2.5)
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 100) == 4.0
+
+
+class TestRunTrace:
+    """Tests for RunTrace."""
+
+    def _lines(self, path: Path) -> list[dict[str, object]]:
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    def test_spans_written_as_jsonl(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.jsonl"
+        with RunTrace(path) as trace:
+            with span("staging", asin="B000TEST01"):
+                pass
+            with span("upload"):
+                pass
+
+        lines = self._lines(path)
+        assert [line["span"] for line in lines] == ["staging", "upload"]
+        assert lines[0]["asin"] == "B000TEST01"
+        assert lines[0]["ok"] is True
+        assert {line["run"] for line in lines} == {trace.run_id}
+
+    def test_failed_span_records_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.jsonl"
+        with RunTrace(path), pytest.raises(ValueError), span("torrent"):
+            raise ValueError("mkbrr failed")
+
+        (line,) = self._lines(path)
+        assert line["ok"] is False
+        assert line["error"] == "ValueError: mkbrr failed"
+
+    def test_stage_timings(self) -> None:
+        trace = RunTrace()
+        with trace:
+            for _ in range(3):
+                with span("metadata"):
+                    pass
+
+        timings = trace.stage_timings()
+        assert list(timings) == ["metadata"]
+        assert timings["metadata"].count == 3
+        assert timings["metadata"].p50 <= timings["metadata"].p95 <= timings["metadata"].max
+        assert set(timings["metadata"].to_dict()) == {"count", "total", "p50", "p95", "max"}
+
+    def test_span_without_trace_only_times(self) -> None:
+        assert active_trace() is None
+        with span("staging") as current:
+            pass
+        assert current.duration is not None
+        assert active_trace() is None
+
+    def test_spans_from_threads(self) -> None:
+        trace = RunTrace()
+
+        def work() -> None:
+            for _ in range(50):
+                with span("hash"):
+                    pass
+
+        with trace:
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert trace.stage_timings()["hash"].count == 200
+
+    def test_unwritable_path_keeps_stats(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        trace = RunTrace(blocker / "run.jsonl")
+
+        with trace, span("scan"):
+            pass
+
+        assert trace.stage_timings()["scan"].count == 1
+
+    def test_for_run_prunes_old_traces(self, tmp_path: Path) -> None:
+        for n in range(5):
+            (tmp_path / f"run-2020010{n}T000000000000Z.jsonl").write_text("")
+
+        trace = RunTrace.for_run(tmp_path, keep=3)
+
+        remaining = sorted(p.name for p in tmp_path.glob("run-*.jsonl"))
+        assert remaining == [
+            "run-20200103T000000000000Z.jsonl",
+            "run-20200104T000000000000Z.jsonl",
+        ]
+        assert trace.path is not None
+        assert trace.path.parent == tmp_path
+
+    def test_for_run_defaults_to_log_dir(self) -> None:
+        from shelfr.paths import log_dir
+
+        trace = RunTrace.for_run()
+
+        assert trace.path is not None
+        assert trace.path.parent == log_dir() / "traces"
+
+    def test_exit_clears_active_trace(self) -> None:
+        with RunTrace() as trace:
+            assert active_trace() is trace
+        assert active_trace() is None
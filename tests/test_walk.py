@@ -0,0 +1,94 @@
+"""Tests for the scandir-based audio folder walker."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from shelfr.utils.walk import walk_audio_folders
+
+AUDIO = frozenset({".m4b", ".mp3"})
+
+
+def _book(path: Path, *names: str) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (path / name).touch()
+    return path
+
+
+class TestWalkAudioFolders:
+    """Tests for walk_audio_folders."""
+
+    def test_returns_folders_with_listing(self, tmp_path: Path) -> None:
+        book = _book(tmp_path / "Author" / "Book", "book.m4b", "cover.jpg", "x.metadata.json")
+
+        folders = walk_audio_folders(tmp_path, AUDIO)
+
+        assert [f.path for f in folders] == [book]
+        assert sorted(folders[0].files) == ["book.m4b", "cover.jpg", "x.metadata.json"]
+        assert folders[0].audio_files == ("book.m4b",)
+
+    def test_extension_match_is_case_insensitive(self, tmp_path: Path) -> None:
+        book = _book(tmp_path / "Book", "BOOK.M4B")
+        assert [f.path for f in walk_audio_folders(tmp_path, AUDIO)] == [book]
+
+    def test_stop_at_match(self, tmp_path: Path) -> None:
+        outer = _book(tmp_path / "Book", "book.m4b")
+        inner = _book(outer / "Bonus", "bonus.mp3")
+
+        assert [f.path for f in walk_audio_folders(tmp_path, AUDIO)] == [outer]
+        found = walk_audio_folders(tmp_path, AUDIO, stop_at_match=False)
+        assert [f.path for f in found] == [outer, inner]
+
+    def test_max_depth(self, tmp_path: Path) -> None:
+        _book(tmp_path / "a" / "b" / "c" / "d", "deep.m4b")
+        shallow = _book(tmp_path / "a" / "b" / "c2", "shallow.m4b")
+
+        assert [f.path for f in walk_audio_folders(tmp_path, AUDIO, max_depth=3)] == [shallow]
+
+    def test_include_root(self, tmp_path: Path) -> None:
+        _book(tmp_path, "root.mp3")
+
+        assert walk_audio_folders(tmp_path, AUDIO) == []
+        assert [f.path for f in walk_audio_folders(tmp_path, AUDIO, include_root=True)] == [
+            tmp_path
+        ]
+
+    def test_files_named_like_dirs_are_not_walked(self, tmp_path: Path) -> None:
+        (tmp_path / "notes.m4b.txt").touch()
+        assert walk_audio_folders(tmp_path, AUDIO) == []
+
+    def test_threaded_walk_matches_sequential(self, tmp_path: Path) -> None:
+        for author in range(5):
+            for book in range(4):
+                _book(tmp_path / f"Author {author}" / f"Book {book}", "book.m4b")
+
+        sequential = walk_audio_folders(tmp_path, AUDIO)
+        threaded = walk_audio_folders(tmp_path, AUDIO, workers=4)
+
+        assert len(sequential) == 20
+        assert threaded == sequential
+
+    def test_symlink_cycle_terminates(self, tmp_path: Path) -> None:
+        book = _book(tmp_path / "Author" / "Book", "book.m4b")
+        os.symlink(tmp_path / "Author", tmp_path / "Author" / "loop")
+
+        found = walk_audio_folders(tmp_path, AUDIO, stop_at_match=False)
+
+        assert book in [f.path for f in found]
+
+    def test_missing_root(self, tmp_path: Path) -> None:
+        assert walk_audio_folders(tmp_path / "missing", AUDIO) == []
+
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root ignores directory permissions")
+    def test_unreadable_subdir_is_skipped(self, tmp_path: Path) -> None:
+        book = _book(tmp_path / "Readable", "book.m4b")
+        locked = _book(tmp_path / "Locked" / "Book", "book.m4b").parent
+        locked.chmod(0)
+        try:
+            assert [f.path for f in walk_audio_folders(tmp_path, AUDIO)] == [book]
+        finally:
+            locked.chmod(0o755)